@@ -93,6 +93,7 @@ def connect(
     sanitize_formulas: bool = True,
     credential: Credential = None,
     warn_rows: int | None = None,
+    statement_cache_size: int = 128,
     **backend_options: Any,
 ) -> ExcelConnection:
     return ExcelConnection(
@@ -106,6 +107,7 @@ def connect(
         sanitize_formulas=sanitize_formulas,
         credential=credential,
         warn_rows=warn_rows,
+        statement_cache_size=statement_cache_size,
         **backend_options,
     )
 
@@ -0,0 +1,263 @@
+"""``asyncio`` interface to excel-dbapi.
+
+``connect()`` returns an ``AsyncConnection`` whose cursors are awaited
+instead of called::
+
+    conn = await excel_dbapi.aio.connect("msgraph://drives/.../items/...",
+                                         credential=cred)
+    async with conn:
+        cur = conn.cursor()
+        await cur.execute("SELECT * FROM Sheet1 WHERE id > ?", (10,))
+        async for row in cur:
+            ...
+
+The SQL executor is synchronous, so each statement runs on a worker
+thread.  For Graph DSNs the HTTP requests it makes are sent by an
+``AsyncGraphClient`` on the event loop, with ``asyncio.sleep`` back-off:
+worker threads only wait for them, and one loop drives the I/O of many
+workbooks at once.  Local workbooks are read and written on the worker
+thread.  Statements on the same connection run one at a time, in the order
+they were awaited.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from types import TracebackType
+from typing import Any, Optional, Type, TypeVar
+
+from .connection import Credential, ExcelConnection
+from .cursor import ExcelCursor
+from .engines.registry import get_engine, resolve_engine_from_dsn
+from .engines.result import Description
+
+R = TypeVar("R")
+
+
+class AsyncConnection:
+    """Awaitable wrapper around an ``ExcelConnection``."""
+
+    def __init__(self, connection: ExcelConnection) -> None:
+        self._connection = connection
+        self._lock = asyncio.Lock()
+
+    async def _run(self, func: Callable[..., R], *args: Any) -> R:
+        """Run *func* on a worker thread, one call per connection at a time."""
+        async with self._lock:
+            return await asyncio.to_thread(func, *args)
+
+    @property
+    def sync_connection(self) -> ExcelConnection:
+        """The underlying blocking connection."""
+        return self._connection
+
+    @property
+    def closed(self) -> bool:
+        return self._connection.closed
+
+    @property
+    def autocommit(self) -> bool:
+        return self._connection.autocommit
+
+    async def set_autocommit(self, value: bool) -> None:
+        """Switch autocommit; switching it on saves pending changes."""
+        await self._run(setattr, self._connection, "autocommit", value)
+
+    @property
+    def engine_name(self) -> str:
+        return self._connection.engine_name
+
+    def cursor(self) -> AsyncCursor:
+        return AsyncCursor(self, self._connection.cursor())
+
+    async def commit(self) -> None:
+        await self._run(self._connection.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self._connection.rollback)
+
+    async def close(self) -> None:
+        if self._connection.closed:
+            return
+        await self._run(self._connection.close)
+
+    def __repr__(self) -> str:
+        return f"<AsyncConnection {self._connection!r}>"
+
+    async def __aenter__(self) -> AsyncConnection:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+
+class AsyncCursor:
+    """Awaitable wrapper around an ``ExcelCursor``.
+
+    ``execute()`` and ``executemany()`` run on the connection's worker
+    thread.  Result rows are held in memory once a statement completes, so
+    the fetch methods and ``async for`` never block.
+    """
+
+    def __init__(self, connection: AsyncConnection, cursor: ExcelCursor) -> None:
+        self.connection = connection
+        self._cursor = cursor
+
+    @property
+    def closed(self) -> bool:
+        return self._cursor.closed
+
+    @property
+    def description(self) -> Description | None:
+        return self._cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self) -> int | None:
+        return self._cursor.lastrowid
+
+    @property
+    def arraysize(self) -> int:
+        return self._cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, value: int) -> None:
+        self._cursor.arraysize = value
+
+    async def execute(
+        self, query: str, params: Sequence[Any] | None = None
+    ) -> AsyncCursor:
+        await self.connection._run(self._cursor.execute, query, params)
+        return self
+
+    async def executemany(
+        self, query: str, seq_of_params: Iterable[Sequence[Any]]
+    ) -> AsyncCursor:
+        await self.connection._run(self._cursor.executemany, query, seq_of_params)
+        return self
+
+    async def fetchone(self) -> Optional[tuple[Any, ...]]:
+        return self._cursor.fetchone()
+
+    async def fetchmany(self, size: Optional[int] = None) -> list[tuple[Any, ...]]:
+        return self._cursor.fetchmany(size)
+
+    async def fetchall(self) -> list[tuple[Any, ...]]:
+        return self._cursor.fetchall()
+
+    async def close(self) -> None:
+        self._cursor.close()
+
+    def __aiter__(self) -> AsyncCursor:
+        return self
+
+    async def __anext__(self) -> tuple[Any, ...]:
+        row = self._cursor.fetchone()
+        if row is None:
+            raise StopAsyncIteration
+        return row
+
+    async def __aenter__(self) -> AsyncCursor:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+
+async def connect(
+    file_path: str,
+    engine: str | None = None,
+    autocommit: bool = True,
+    create: bool = False,
+    backup: bool = False,
+    backup_dir: str | None = None,
+    data_only: bool = True,
+    sanitize_formulas: bool = True,
+    credential: Credential = None,
+    warn_rows: int | None = None,
+    statement_cache_size: int = 128,
+    **backend_options: Any,
+) -> AsyncConnection:
+    """Open a workbook like ``excel_dbapi.connect()`` without blocking the loop.
+
+    For Graph DSNs, ``transport`` must be an ``httpx.AsyncBaseTransport``.
+    """
+    close_client = None
+    if resolve_engine_from_dsn(file_path) == "graph":
+        backend_options, close_client = _async_graph_options(
+            file_path, credential, backend_options
+        )
+
+    def open_connection() -> ExcelConnection:
+        return ExcelConnection(
+            file_path,
+            engine=engine,
+            autocommit=autocommit,
+            create=create,
+            backup=backup,
+            backup_dir=backup_dir,
+            data_only=data_only,
+            sanitize_formulas=sanitize_formulas,
+            credential=credential,
+            warn_rows=warn_rows,
+            statement_cache_size=statement_cache_size,
+            **backend_options,
+        )
+
+    try:
+        connection = await asyncio.to_thread(open_connection)
+    except BaseException:
+        if close_client is not None:
+            await close_client()
+        raise
+    return AsyncConnection(connection)
+
+
+def _async_graph_options(
+    file_path: str, credential: Credential, backend_options: dict[str, Any]
+) -> tuple[dict[str, Any], Callable[[], Awaitable[None]]]:
+    """Return Graph *backend_options* that send requests on the running loop.
+
+    The backend is given a session of an ``AsyncGraphClient`` built from the
+    HTTP options; the client is closed with the backend, or with the
+    returned coroutine function if the connection cannot be opened.
+    """
+    get_engine("graph")  # Raises if the graph extra is not installed.
+    from .engines.graph.auth import normalize_token_provider
+    from .engines.graph.client import AsyncGraphClient, LoopGraphClient
+    from .engines.graph.locator import parse_msgraph_dsn
+    from .engines.graph.session import AsyncWorkbookSession, LoopWorkbookSession
+
+    locator = parse_msgraph_dsn(file_path)
+    token_provider = normalize_token_provider(credential)
+    options = dict(backend_options)
+    http_options = {
+        key: options.pop(key)
+        for key in ("transport", "timeout", "max_retries", "backoff_factor")
+        if key in options
+    }
+    client = AsyncGraphClient(token_provider, **http_options)
+    session = AsyncWorkbookSession(
+        client, locator, persist_changes=not options.get("readonly", True)
+    )
+    options["session"] = LoopWorkbookSession(
+        session, LoopGraphClient(client, asyncio.get_running_loop())
+    )
+    return options, client.aclose
+
+
+__all__ = ["AsyncConnection", "AsyncCursor", "connect"]
@@ -18,7 +18,7 @@ import warnings
 
 from .engines.base import WorkbookBackend
 from .engines.registry import get_engine, resolve_engine_from_dsn
-from .executor import SharedExecutor
+from .parser.cache import StatementCache
 from .engines.result import ExecutionResult
 from .exceptions import (
     BackendOperationError,
@@ -111,6 +111,7 @@ class ExcelConnection:
         sanitize_formulas: bool = True,
         credential: Credential = None,
         warn_rows: int | None = None,
+        statement_cache_size: int = 128,
         **backend_options: Any,
     ):
         """
@@ -132,6 +133,8 @@ class ExcelConnection:
                 be interpreted as formulas by spreadsheet applications.
                 This defends against formula injection (OWASP CSV Injection).
             credential: Optional credential / token provider for cloud backends.
+            statement_cache_size: Maximum number of parsed statements kept in
+                the connection's LRU statement cache. ``0`` disables caching.
             **backend_options: Extra keyword arguments forwarded to the backend.
         """
         self._data_only = data_only
@@ -144,6 +147,9 @@ class ExcelConnection:
 
         self.file_path: str = location
         self.closed: bool = False
+        self.statement_cache: StatementCache | None = (
+            StatementCache(statement_cache_size) if statement_cache_size != 0 else None
+        )
         self._autocommit: bool = autocommit
 
         try:
@@ -219,10 +225,10 @@ class ExcelConnection:
                 f"transactions (autocommit=False)"
             )
 
-        self._executor = SharedExecutor(
-            self.engine,
+        self._executor = self.engine.create_executor(
             sanitize_formulas=sanitize_formulas,
             connection=self,
+            statement_cache=self.statement_cache,
         )
         if not self._autocommit:
             try:
@@ -359,34 +365,68 @@ class ExcelConnection:
         last_rowid: int | None = None
         last_action: str | None = None
 
-        iter_params = iter(seq_of_params)
-        while True:
-            try:
-                params = next(iter_params)
-            except StopIteration:
-                break
-            except Error as exc:
-                if supports_transactions and snapshot is not None:
-                    self._safe_restore(snapshot, exc)
+        # Iterations share sheet reads until one of them writes the sheet,
+        # and plain INSERT ... VALUES rows are appended in one batch at the end.
+        with self._executor.sheet_cache(), self._executor.insert_batch() as inserts:
+            iter_params = iter(seq_of_params)
+            while True:
+                try:
+                    params = next(iter_params)
+                except StopIteration:
+                    break
+                except Error as exc:
+                    if supports_transactions and snapshot is not None:
+                        self._safe_restore(snapshot, exc)
+                        raise
+                    # Without a snapshot the parameter sets already consumed
+                    # stay applied, as if each had run on its own.
+                    inserts.flush()
+                    if total_rowcount > 0:
+                        raise type(exc)(
+                            f"{exc}. Backend '{backend_name}' does not support transactional "
+                            "executemany rollback; partial writes may have occurred."
+                        ) from exc
                     raise
-                if total_rowcount > 0:
+                except Exception as exc:
+                    if supports_transactions and snapshot is not None:
+                        self._safe_restore(snapshot, exc)
+                    else:
+                        inserts.flush()
+                    mapped = map_exception(exc)
+                    if total_rowcount > 0:
+                        raise type(mapped)(
+                            f"{mapped}. Backend '{backend_name}' does not support transactional "
+                            "executemany rollback; partial writes may have occurred."
+                        ) from exc
+                    raise mapped from exc
+                try:
+                    result = self._executor.execute_with_params(query, tuple(params))
+                except Error as exc:
+                    if supports_transactions:
+                        self._safe_restore(snapshot, exc)
+                        raise
+                    # As for a failing iterator, the sets that ran stay applied.
+                    inserts.flush()
                     raise type(exc)(
                         f"{exc}. Backend '{backend_name}' does not support transactional "
                         "executemany rollback; partial writes may have occurred."
                     ) from exc
-                raise
-            except Exception as exc:
-                if supports_transactions and snapshot is not None:
-                    self._safe_restore(snapshot, exc)
-                mapped = map_exception(exc)
-                if total_rowcount > 0:
+                except Exception as exc:
+                    mapped = map_exception(exc)
+                    if supports_transactions:
+                        self._safe_restore(snapshot, exc)
+                        raise mapped from exc
+                    inserts.flush()
                     raise type(mapped)(
                         f"{mapped}. Backend '{backend_name}' does not support transactional "
                         "executemany rollback; partial writes may have occurred."
                     ) from exc
-                raise mapped from exc
+                total_rowcount += result.rowcount
+                last_rowid = result.lastrowid
+                last_action = result.action
+
             try:
-                result = self._executor.execute_with_params(query, tuple(params))
+                flushed_rowid = inserts.flush()
             except Error as exc:
                 if supports_transactions:
                     self._safe_restore(snapshot, exc)
@@ -404,9 +444,8 @@ class ExcelConnection:
                     f"{mapped}. Backend '{backend_name}' does not support transactional "
                     "executemany rollback; partial writes may have occurred."
                 ) from exc
-            total_rowcount += result.rowcount
-            last_rowid = result.lastrowid
-            last_action = result.action
+            if flushed_rowid is not None:
+                last_rowid = flushed_rowid
 
         if self.autocommit and last_action is not None:
             try:
@@ -440,7 +479,7 @@ class ExcelConnection:
 
     def _ensure_write_lock_for_query(self, query: str) -> None:
         action = query.strip().split(None, 1)[0].upper() if query.strip() else ""
-        if action in _MUTATING_ACTIONS:
+        if action in _MUTATING_ACTIONS and not self.engine.readonly:
             self.engine.ensure_write_lock()
             self._create_backup_if_needed()
 
@@ -1,10 +1,12 @@
-from .base import TableData, WorkbookBackend
+from .base import ColumnarTableData, RowFilter, TableData, WorkbookBackend
 from .registry import get_engine, register_engine, resolve_engine_from_dsn
 from .result import ExecutionResult
 
 __all__ = [
     "WorkbookBackend",
     "TableData",
+    "ColumnarTableData",
+    "RowFilter",
     "ExecutionResult",
     "register_engine",
     "get_engine",
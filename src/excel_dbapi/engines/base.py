@@ -1,12 +1,25 @@
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass
 import errno
 import os
-from typing import Any
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Iterator,
+    NamedTuple,
+    Protocol,
+    Sequence,
+)
 import warnings
 
 from ..exceptions import BackendOperationError
 
+if TYPE_CHECKING:
+    from ..executor import SharedExecutor
+
 
 @dataclass
 class TableData:
@@ -14,6 +27,145 @@ class TableData:
     rows: list[list[Any]]
 
 
+# Integers beyond 2**53 lose precision as floats; keeping them out of typed
+# arrays lets numeric comparisons on ``array('q')`` columns stay exact.
+_EXACT_INT_LIMIT = 2**53
+
+
+def _pack_column(values: list[Any]) -> Sequence[Any]:
+    """Store a homogeneous numeric column as a typed array.
+
+    ``int`` columns become ``array('q')`` and ``float`` columns (without NaN)
+    become ``array('d')``; anything else, including columns with ``None`` or
+    ``bool`` values, stays a plain list.
+    """
+    if not values:
+        return values
+    first_type = type(values[0])
+    if first_type is int:
+        if all(
+            type(value) is int and -_EXACT_INT_LIMIT <= value <= _EXACT_INT_LIMIT
+            for value in values
+        ):
+            return array("q", values)
+    elif first_type is float:
+        if all(type(value) is float and value == value for value in values):
+            return array("d", values)
+    return values
+
+
+class ColumnarTableData(TableData):
+    """Column-oriented :class:`TableData`.
+
+    Values are stored as one sequence per header (see :func:`_pack_column`).
+    ``rows`` is built on first access and from then on is the authoritative
+    copy, since callers may mutate it in place; ``columns`` is ``None`` after
+    that point.
+    """
+
+    def __init__(self, headers: list[str], columns: list[Sequence[Any]]) -> None:
+        if len(columns) != len(headers):
+            raise BackendOperationError(
+                "Columnar table data needs exactly one column per header"
+            )
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise BackendOperationError("Columnar table data has ragged columns")
+        self.headers = headers
+        self._columns: list[Sequence[Any]] | None = columns
+        self._rows: list[list[Any]] | None = None
+        self._row_count = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(cls, headers: list[str], rows: list[list[Any]]) -> "ColumnarTableData":
+        width = len(headers)
+        columns: list[list[Any]] = [[] for _ in range(width)]
+        for row in rows:
+            for index in range(width):
+                columns[index].append(row[index] if index < len(row) else None)
+        return cls(headers, [_pack_column(column) for column in columns])
+
+    @property
+    def columns(self) -> list[Sequence[Any]] | None:
+        return self._columns
+
+    @property
+    def row_count(self) -> int:
+        if self._rows is not None:
+            return len(self._rows)
+        return self._row_count
+
+    @property
+    def rows(self) -> list[list[Any]]:
+        if self._rows is None:
+            columns = self._columns or []
+            self._rows = [list(values) for values in zip(*columns)]
+            self._columns = None
+        return self._rows
+
+    @rows.setter
+    def rows(self, value: list[list[Any]]) -> None:
+        self._rows = value
+        self._columns = None
+
+    def iter_rows(self) -> Iterator[list[Any]]:
+        """Yield rows without materializing :attr:`rows`."""
+        if self._columns is None:
+            return iter(self.rows)
+        return (list(values) for values in zip(*self._columns))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(headers={self.headers!r}, "
+            f"row_count={self.row_count})"
+        )
+
+
+def _projected_ordinals(headers: list[str], columns: Collection[str]) -> list[int]:
+    """Positions of the *headers* named in *columns*, compared case-insensitively.
+
+    The first column is kept when nothing matches so the row count survives
+    (``SELECT COUNT(*)`` references no column at all).
+    """
+    wanted = {column.casefold() for column in columns}
+    ordinals = [
+        index for index, header in enumerate(headers) if header.casefold() in wanted
+    ]
+    if not ordinals and headers:
+        ordinals.append(0)
+    return ordinals
+
+
+ColumnSelector = Callable[[Callable[[int], Sequence[Any]], int], "list[int] | None"]
+
+
+class RowFilter(Protocol):
+    """Row filter that the executor pushes down into :meth:`WorkbookBackend.read_sheet`.
+
+    Backends bind it to the sheet headers once they have read them.
+    """
+
+    def bind(self, headers: list[str]) -> Callable[[Sequence[Any]], bool]:
+        """Return a test over one row's values, given in header order."""
+        ...
+
+    def bind_columns(self, headers: list[str]) -> ColumnSelector:
+        """Return a column-wise variant of the filter.
+
+        The returned callable takes a column accessor (column index to that
+        column's values) and the row count, and returns the matching row
+        positions, or ``None`` if the filter must be evaluated row by row.
+        """
+        ...
+
+
+class _UndoMarker(NamedTuple):
+    """Position in a backend's undo log, returned by ``snapshot()``."""
+
+    generation: int
+    position: int
+
+
 class WorkbookBackend(ABC):
     file_path: str
     create: bool
@@ -31,6 +183,41 @@ class WorkbookBackend(ABC):
         """Whether the backend supports commit/rollback transactions."""
         ...
 
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether :meth:`iter_sheet` yields rows lazily instead of materializing them."""
+        return False
+
+    @property
+    def supports_predicate_pushdown(self) -> bool:
+        """Whether :meth:`read_sheet` and :meth:`iter_sheet` accept ``predicate``.
+
+        Backends that report ``True`` drop rows rejected by the
+        :class:`RowFilter` while reading, so those rows are never converted
+        or counted against ``max_memory_mb``.
+        """
+        return False
+
+    @property
+    def supports_versioning(self) -> bool:
+        """Whether every write through the backend changes :meth:`sheet_version`.
+
+        Backends that report ``True`` call :meth:`_sheet_changed` on each
+        mutation, which lets the executor reuse a converted sheet for as
+        long as its version is unchanged.  Otherwise every read goes to the
+        backend.
+        """
+        return False
+
+    @property
+    def supports_projection_pushdown(self) -> bool:
+        """Whether :meth:`read_sheet` and :meth:`iter_sheet` accept ``columns``.
+
+        Backends that report ``True`` return only the headers named in
+        ``columns`` (see :func:`_projected_ordinals`) with the matching values.
+        """
+        return False
+
     def __init__(
         self,
         file_path: str,
@@ -55,6 +242,11 @@ class WorkbookBackend(ABC):
         self._warn_rows_emitted: set[str] = set()
         self._row_warning_emitted: set[tuple[str, int]] = set()
         self._memory_warning_emitted: set[tuple[str, int]] = set()
+        self._undo_log: list[Callable[[], None]] | None = None
+        self._undo_generation = 0
+        self._change_count = 0
+        self._sheet_versions: dict[str, int] = {}
+        self._workbook_version = 0
 
     @staticmethod
     def _normalize_warn_rows(value: Any) -> int | None:
@@ -240,6 +432,66 @@ class WorkbookBackend(ABC):
         if approx_bytes > limit_bytes:
             raise OperationalError("Sheet exceeds max_memory_mb limit")
 
+    # Undo log
+    #
+    # Backends can implement ``snapshot()``/``restore()`` as a logical undo
+    # log instead of copying the workbook: each mutating call records a
+    # closure that reverts it, ``snapshot()`` returns the current log
+    # position and ``restore()`` runs the closures recorded after it, newest
+    # first.  Nothing is recorded until the first snapshot, and a save or
+    # load discards the log and invalidates outstanding markers.
+
+    def _begin_undo(self) -> _UndoMarker:
+        if self._undo_log is None:
+            self._undo_log = []
+        return _UndoMarker(self._undo_generation, len(self._undo_log))
+
+    @property
+    def _recording_undo(self) -> bool:
+        return self._undo_log is not None
+
+    def _record_undo(self, inverse: Callable[[], None]) -> None:
+        if self._undo_log is not None:
+            self._undo_log.append(inverse)
+
+    def _undo_to(self, marker: _UndoMarker) -> None:
+        log = self._undo_log
+        if (
+            log is None
+            or marker.generation != self._undo_generation
+            or marker.position > len(log)
+        ):
+            raise BackendOperationError("Snapshot is no longer valid")
+        while len(log) > marker.position:
+            log.pop()()
+
+    def _reset_undo(self) -> None:
+        self._undo_log = None
+        self._undo_generation += 1
+
+    # Change tracking.  Every write to a sheet gives it a new version, so
+    # callers can keep a converted copy of a sheet for as long as its
+    # version is unchanged.  ``load()`` and ``restore()`` change them all.
+
+    def sheet_version(self, sheet_name: str) -> int:
+        """Counter that changes whenever *sheet_name* is written through the backend.
+
+        Versions only increase, and a dropped and re-created sheet gets a
+        new one.  Only meaningful when :attr:`supports_versioning` is true;
+        changes made behind the backend's back (for example to the object
+        returned by :meth:`get_workbook`) are not tracked.
+        """
+        return max(self._sheet_versions.get(sheet_name, 0), self._workbook_version)
+
+    def _sheet_changed(self, sheet_name: str | None = None) -> None:
+        """Give *sheet_name*, or every sheet when ``None``, a new version."""
+        self._change_count += 1
+        if sheet_name is None:
+            self._sheet_versions.clear()
+            self._workbook_version = self._change_count
+        else:
+            self._sheet_versions[sheet_name] = self._change_count
+
     @abstractmethod
     def load(self) -> None:
         pass
@@ -261,9 +513,37 @@ class WorkbookBackend(ABC):
         pass
 
     @abstractmethod
-    def read_sheet(self, sheet_name: str) -> TableData:
+    def read_sheet(
+        self,
+        sheet_name: str,
+        *,
+        predicate: RowFilter | None = None,
+        columns: Collection[str] | None = None,
+    ) -> TableData:
         pass
 
+    def iter_sheet(
+        self,
+        sheet_name: str,
+        *,
+        predicate: RowFilter | None = None,
+        columns: Collection[str] | None = None,
+    ) -> tuple[list[str], Iterator[list[Any]]]:
+        """Return the sheet headers and an iterator over its data rows.
+
+        The default implementation materializes :meth:`read_sheet` and applies
+        *predicate* afterwards.  Backends that can read lazily override this
+        and report ``supports_streaming``.
+        """
+        if columns is not None:
+            data = self.read_sheet(sheet_name, columns=columns)
+        else:
+            data = self.read_sheet(sheet_name)
+        if predicate is None:
+            return data.headers, iter(data.rows)
+        test = predicate.bind(data.headers)
+        return data.headers, (row for row in data.rows if test(row))
+
     @abstractmethod
     def write_sheet(self, sheet_name: str, data: TableData) -> None:
         pass
@@ -272,6 +552,22 @@ class WorkbookBackend(ABC):
     def append_row(self, sheet_name: str, row: list[Any]) -> int:
         pass
 
+    def append_rows(
+        self, sheet_name: str, rows: Sequence[list[Any]]
+    ) -> tuple[int, int]:
+        """Append *rows* in order and return the first and last row numbers.
+
+        Row numbers are 1-based sheet rows, as returned by :meth:`append_row`.
+        The default appends one row at a time; backends override it with a
+        single batched write.
+        """
+        if not rows:
+            raise BackendOperationError("append_rows requires at least one row")
+        first_row = last_row = self.append_row(sheet_name, rows[0])
+        for row in rows[1:]:
+            last_row = self.append_row(sheet_name, row)
+        return first_row, last_row
+
     @abstractmethod
     def create_sheet(self, name: str, headers: list[str]) -> None:
         pass
@@ -283,6 +579,17 @@ class WorkbookBackend(ABC):
     def close(self) -> None:
         self._release_lock()
 
+    def create_executor(self, **options: Any) -> "SharedExecutor":
+        """Executor that runs SQL statements against this backend.
+
+        *options* are the keyword arguments of
+        :class:`~excel_dbapi.executor.SharedExecutor`.  Backends that can run
+        some statements natively return a subclass.
+        """
+        from ..executor import SharedExecutor
+
+        return SharedExecutor(self, **options)
+
     def get_workbook(self) -> Any:
         from ..exceptions import NotSupportedError
 
@@ -1,5 +1,7 @@
 """Microsoft Graph API engine for excel-dbapi (v1.3 — read/write)."""
 
 from .backend import GraphBackend
+from .client import AsyncGraphClient
+from .session import AsyncWorkbookSession
 
-__all__ = ["GraphBackend"]
+__all__ = ["AsyncGraphClient", "AsyncWorkbookSession", "GraphBackend"]
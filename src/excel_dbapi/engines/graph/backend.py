@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import math
+import re
 import sys
-from typing import Any, cast
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Collection, Generator, Iterator, Sequence, cast
 from urllib.parse import quote
 
 import httpx
 
 from ...exceptions import BackendOperationError, NotSupportedError, OperationalError
-from ..base import TableData, WorkbookBackend, _normalize_headers
+from ..base import (
+    RowFilter,
+    TableData,
+    WorkbookBackend,
+    _normalize_headers,
+    _projected_ordinals,
+)
 from .auth import TokenProvider, normalize_token_provider
-from .client import GraphClient
+from .client import GraphClient, LoopGraphClient
 from .locator import GraphWorkbookLocator, parse_msgraph_dsn
-from .session import WorkbookSession
+from .session import LoopWorkbookSession, WorkbookSession
 
 
 def _col_letter(index: int) -> str:
@@ -40,10 +51,82 @@ def _col_letter(index: int) -> str:
     return result
 
 
+_CELL_RANGE = re.compile(r"\$?([A-Z]+)\$?(\d+)(?::\$?[A-Z]+\$?\d+)?", re.IGNORECASE)
+
+
+def _range_origin(address: Any) -> tuple[int, int] | None:
+    """Return the (1-based row, 0-based column) of the top-left cell of *address*.
+
+    ``None`` unless *address* is an ``A1``-style cell or range, optionally
+    prefixed with its sheet name.
+    """
+    if not isinstance(address, str):
+        return None
+    match = _CELL_RANGE.fullmatch(address.rsplit("!", 1)[-1])
+    if match is None:
+        return None
+    col = 0
+    for char in match.group(1).upper():
+        col = col * 26 + (ord(char) - ord("A") + 1)
+    return int(match.group(2)), col - 1
+
+
 def _encode_path_segment(value: str) -> str:
     return quote(value, safe="")
 
 
+def _has_value(value: Any) -> bool:
+    return value is not None and value != ""
+
+
+# Text Excel may store as something else: dates, times, fractions and
+# month names next to a number.
+_DATE_LIKE = re.compile(r"^[\d\s/:.\-]+(\s*[ap]m?)?$", re.IGNORECASE)
+_MONTH_NAME = re.compile(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)", re.I)
+
+
+def _round_trips(value: Any) -> bool:
+    """Whether Excel reads *value* back unchanged after it is written.
+
+    Excel coerces what it is given: numeric and date text becomes a number,
+    ``"TRUE"`` a boolean, and ``=...`` a formula's result.  Only ``None``,
+    booleans, finite numbers Excel holds exactly and plain text are safe to
+    cache as sent.
+    """
+    if value is None or isinstance(value, bool):
+        return True
+    if isinstance(value, int):
+        return abs(value) <= 2**53
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if not isinstance(value, str):
+        return False
+    text = value.strip()
+    if not text:
+        return value == ""
+    if text[0] in "=+-@'#" or text.upper() in ("TRUE", "FALSE"):
+        return False
+    try:
+        float(text.replace(",", "").replace("%", "").replace("$", ""))
+    except ValueError:
+        if not any(char.isdigit() for char in text):
+            return True
+        return not (_DATE_LIKE.match(text) or _MONTH_NAME.search(text))
+    return False
+
+
+def _patched_row(old_row: list[Any], new_row: list[Any]) -> list[Any]:
+    """Cell values after a range ``PATCH`` of *new_row* over *old_row*.
+
+    ``null`` in a PATCH leaves the cell unchanged, and empty cells read
+    back as ``""``.
+    """
+    return [
+        (old_row[index] if index < len(old_row) else "") if value is None else value
+        for index, value in enumerate(new_row)
+    ]
+
+
 class GraphBackend(WorkbookBackend):
     """Backend that accesses Excel data via Microsoft Graph API.
 
@@ -60,14 +143,52 @@ class GraphBackend(WorkbookBackend):
     - ``timeout`` (float, default 30.0): HTTP request timeout in seconds.
     - ``max_retries`` (int, default 3): Number of retries for retryable GETs.
     - ``backoff_factor`` (float, default 0.5): Exponential retry backoff factor.
+    - ``read_block_rows`` (int, default 5000): Sheets taller than this are read
+      as row blocks of this size; ``0`` reads every sheet in one request.
+    - ``read_workers`` (int, default 4): Row blocks downloaded concurrently.
+    - ``read_ahead`` (bool, default False): Stream rows to the executor from
+      the first block while later blocks download.
+    - ``write_block_cells`` (int, default 20000): Full rewrites are written as
+      row blocks of at most this many cells.
+    - ``write_workers`` (int, default 4): Row blocks written concurrently
+      under ``conflict_strategy="force"``.
+    - ``session`` (LoopWorkbookSession, optional): Session, and with it the
+      client, to send requests with instead of a new ``GraphClient``;
+      ``excel_dbapi.aio`` passes one that runs them on its event loop.
+      ``timeout``, ``max_retries`` and ``backoff_factor`` are then those of
+      its client.
+
+    ``usedRange`` values are cached per worksheet with the response's ETag
+    and revalidated with ``If-None-Match``; a ``304 Not Modified`` reuses the
+    cached matrix.  The used range's row and column counts are tracked
+    separately, so appends do not download the sheet to find the next row.
     """
 
     @property
     def supports_transactions(self) -> bool:
         return False
+
+    @property
+    def supports_predicate_pushdown(self) -> bool:
+        return True
+
+    @property
+    def supports_versioning(self) -> bool:
+        return True
+
+    @property
+    def supports_projection_pushdown(self) -> bool:
+        return True
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self._read_ahead
+
     _CONFLICT_STRATEGIES = frozenset({"fail", "force"})
     _WRITE_METHODS = frozenset({"POST", "PATCH", "PUT", "DELETE"})
     _FULL_REWRITE_THRESHOLD = 0.5
+    _BATCH_LIMIT = 20  # Graph's maximum number of requests per $batch
+    _READ_ATTEMPTS = 3  # Block reads of a sheet that keeps changing
 
     def __init__(
         self,
@@ -83,6 +204,12 @@ class GraphBackend(WorkbookBackend):
         max_retries: int = 3,
         backoff_factor: float = 0.5,
         conflict_strategy: str = "fail",
+        read_block_rows: int = 5000,
+        read_workers: int = 4,
+        read_ahead: bool = False,
+        write_block_cells: int = 20000,
+        write_workers: int = 4,
+        session: LoopWorkbookSession | None = None,
         **options: Any,
     ) -> None:
         if create:
@@ -111,25 +238,54 @@ class GraphBackend(WorkbookBackend):
             f"Expected one of: {allowed}")
         self._conflict_strategy = conflict_strategy
         self._etag: str | None = None
+        if read_block_rows < 0 or read_workers < 1:
+            raise BackendOperationError(
+                "read_block_rows must be >= 0 and read_workers >= 1, got "
+                f"{read_block_rows!r} and {read_workers!r}"
+            )
+        self._read_block_rows = read_block_rows
+        self._read_workers = read_workers
+        self._read_ahead = read_ahead
+        if write_block_cells < 1 or write_workers < 1:
+            raise BackendOperationError(
+                "write_block_cells and write_workers must be >= 1, got "
+                f"{write_block_cells!r} and {write_workers!r}"
+            )
+        self._write_block_cells = write_block_cells
+        self._write_workers = write_workers
 
         self._locator: GraphWorkbookLocator = parse_msgraph_dsn(file_path)
         self._token_provider: TokenProvider = normalize_token_provider(credential)
-        self._client: GraphClient = GraphClient(
-            self._token_provider,
-            transport=transport,
-            timeout=timeout,
-            max_retries=max_retries,
-            backoff_factor=backoff_factor,
-        )
-        self._session: WorkbookSession = WorkbookSession(
-            self._client,
-            self._locator,
-            persist_changes=not readonly,
-        )
+        self._client: GraphClient | LoopGraphClient
+        self._session: WorkbookSession | LoopWorkbookSession
+        if session is not None:
+            self._client = session.client
+            self._session = session
+        else:
+            self._client = GraphClient(
+                self._token_provider,
+                transport=transport,
+                timeout=timeout,
+                max_retries=max_retries,
+                backoff_factor=backoff_factor,
+            )
+            self._session = WorkbookSession(
+                self._client,
+                self._locator,
+                persist_changes=not readonly,
+            )
 
         # Cache: name → worksheet id
         self._sheet_ids: dict[str, str] = {}
         self._sheets_loaded: bool = False
+        # Cache: worksheet id → (ETag, usedRange values)
+        self._used_ranges: dict[str, tuple[str, list[list[Any]]]] = {}
+        # Cache: worksheet id → (ETag, used rows, used columns)
+        self._extents: dict[str, tuple[str, int, int]] = {}
+        # Cache: worksheet id → (ETag, first row, first column) of the used range
+        self._origins: dict[str, tuple[str | None, int, int]] = {}
+        # Held while an expired session is reopened; block reads run on threads.
+        self._reopen_lock = threading.Lock()
 
     @property
     def readonly(self) -> bool:
@@ -151,6 +307,7 @@ class GraphBackend(WorkbookBackend):
 
     def restore(self, snapshot: Any) -> None:
         """Close current session and clear cached data."""
+        self._sheet_changed()
         self._session.close()
         self._sheets_loaded = False
         self._sheet_ids.clear()
@@ -160,26 +317,38 @@ class GraphBackend(WorkbookBackend):
         self._load_sheets()
         return list(self._sheet_ids.keys())
 
-    def read_sheet(self, sheet_name: str) -> TableData:
+    def read_sheet(
+        self,
+        sheet_name: str,
+        *,
+        predicate: RowFilter | None = None,
+        columns: Collection[str] | None = None,
+    ) -> TableData:
         self._ensure_session()
         self._load_sheets()
         ws_id = self._sheet_ids.get(sheet_name)
         if ws_id is None:
             raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
 
-        path = (
-            f"{self._locator.item_path}/workbook"
-            f"/worksheets/{_encode_path_segment(ws_id)}/usedRange(valuesOnly=true)?$select=values"
-        )
-        resp = self._session_aware_request("GET", path)
-        values = resp.json().get("values", [])
-
+        values = self._read_values(ws_id)
         if not values:
             return TableData(headers=[], rows=[])
 
         headers = _normalize_headers(values[0])
-        rows = [list(row) for row in values[1:]]
-        self._check_row_limit(sheet_name, len(rows))
+        self._check_row_limit(sheet_name, len(values) - 1)
+        data_rows: list[list[Any]] = values[1:]
+        if columns is not None:
+            ordinals = _projected_ordinals(headers, columns)
+            if len(ordinals) < len(headers):
+                headers = [headers[ordinal] for ordinal in ordinals]
+                data_rows = [
+                    [row[ordinal] for ordinal in ordinals] for row in data_rows
+                ]
+        if predicate is not None:
+            test = predicate.bind(headers)
+            rows = [list(row) for row in data_rows if test(row)]
+        else:
+            rows = [list(row) for row in data_rows]
         approx_bytes = sys.getsizeof(headers)
         for row in rows:
             approx_bytes += sys.getsizeof(row)
@@ -187,6 +356,76 @@ class GraphBackend(WorkbookBackend):
         self._check_memory_limit(sheet_name, approx_bytes)
         return TableData(headers=headers, rows=rows)
 
+    def iter_sheet(
+        self,
+        sheet_name: str,
+        *,
+        predicate: RowFilter | None = None,
+        columns: Collection[str] | None = None,
+    ) -> tuple[list[str], Iterator[list[Any]]]:
+        """Return the headers and rows of *sheet_name*, streaming large sheets.
+
+        With ``read_ahead``, a sheet taller than ``read_block_rows`` yields
+        the rows of its first block while the following blocks download.
+        Other sheets are read with :meth:`read_sheet`.
+        """
+        if not self._read_ahead:
+            return super().iter_sheet(sheet_name, predicate=predicate, columns=columns)
+        self._ensure_session()
+        self._load_sheets()
+        ws_id = self._sheet_ids.get(sheet_name)
+        if ws_id is None:
+            raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
+
+        plan = self._plan_read(ws_id)
+        if not isinstance(plan, tuple):
+            return super().iter_sheet(sheet_name, predicate=predicate, columns=columns)
+        origin, row_count, col_count = plan
+        self._check_row_limit(sheet_name, row_count - 1)
+        blocks = self._iter_blocks(ws_id, origin, row_count, col_count)
+        first_block, first_etag = next(blocks)
+        headers = _normalize_headers(first_block[0])
+        ordinals: list[int] | None = None
+        if columns is not None:
+            ordinals = _projected_ordinals(headers, columns)
+            if len(ordinals) < len(headers):
+                headers = [headers[ordinal] for ordinal in ordinals]
+            else:
+                ordinals = None
+        test = predicate.bind(headers) if predicate is not None else None
+
+        def rows() -> Iterator[list[Any]]:
+            approx_bytes = sys.getsizeof(headers)
+            try:
+                block = first_block[1:]
+                while True:
+                    for raw in block:
+                        row = (
+                            [raw[ordinal] for ordinal in ordinals]
+                            if ordinals is not None
+                            else list(raw)
+                        )
+                        if test is not None and not test(row):
+                            continue
+                        approx_bytes += sys.getsizeof(row)
+                        approx_bytes += sum(sys.getsizeof(value) for value in row)
+                        self._check_memory_limit(sheet_name, approx_bytes)
+                        yield row
+                    next_block = next(blocks, None)
+                    if next_block is None:
+                        return
+                    # Rows already yielded cannot be read again.
+                    if next_block[1] != first_etag:
+                        raise OperationalError(
+                            f"Sheet '{sheet_name}' changed while it was read "
+                            "in row blocks"
+                        )
+                    block = next_block[0]
+            finally:
+                blocks.close()
+
+        return headers, rows()
+
     # -- Mutating operations -------------------------------------------------
 
     def write_sheet(self, sheet_name: str, data: TableData) -> None:
@@ -197,9 +436,10 @@ class GraphBackend(WorkbookBackend):
         ws_id = self._sheet_ids.get(sheet_name)
         if ws_id is None:
             raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
+        self._sheet_changed(sheet_name)
 
         # Read old used range to know both old row count and column width
-        old_values = self._read_used_range(ws_id)
+        old_values = self._read_values(ws_id)
         old_row_count = len(old_values) if old_values else 0
         old_col_count = len(old_values[0]) if old_values else 0
 
@@ -227,17 +467,27 @@ class GraphBackend(WorkbookBackend):
         old_col_count: int,
         num_cols: int,
     ) -> None:
-        """Rewrite sheet matrix and clear stale tails/columns."""
+        """Rewrite sheet matrix and clear stale tails/columns.
+
+        The matrix is written in row blocks of at most ``write_block_cells``
+        cells; see :meth:`_send_blocks`.
+        """
         new_row_count = len(matrix)  # header + data rows
         last_col = _col_letter(num_cols - 1) if num_cols > 0 else "A"
 
+        blocks: list[tuple[str, str, Any]] = []
         if num_cols > 0 and new_row_count > 0:
-            address = f"A1:{last_col}{new_row_count}"
-            patch_path = (
-                f"{self._locator.item_path}/workbook"
-                f"/worksheets/{_encode_path_segment(ws_id)}/range(address='{address}')"
-            )
-            self._session_aware_request("PATCH", patch_path, json={"values": matrix})
+            block_rows = max(1, self._write_block_cells // num_cols)
+            for start in range(0, new_row_count, block_rows):
+                end = min(start + block_rows, new_row_count)
+                address = f"A{start + 1}:{last_col}{end}"
+                patch_path = (
+                    f"{self._locator.item_path}/workbook"
+                    f"/worksheets/{_encode_path_segment(ws_id)}/range(address='{address}')"
+                )
+                blocks.append(("PATCH", patch_path, {"values": matrix[start:end]}))
+
+        requests: list[tuple[str, str, Any]] = []
 
         max_col_count = max(old_col_count, num_cols) if old_col_count else num_cols
         tail_last_col = _col_letter(max_col_count - 1) if max_col_count > 0 else "A"
@@ -248,9 +498,7 @@ class GraphBackend(WorkbookBackend):
                 f"{self._locator.item_path}/workbook"
                 f"/worksheets/{_encode_path_segment(ws_id)}/range(address='{tail_address}')/clear"
             )
-            self._session_aware_request(
-                "POST", clear_path, json={"applyTo": "Contents"}
-            )
+            requests.append(("POST", clear_path, {"applyTo": "Contents"}))
 
         if old_col_count > num_cols and new_row_count > 0:
             right_start_col = _col_letter(num_cols)
@@ -260,9 +508,51 @@ class GraphBackend(WorkbookBackend):
                 f"{self._locator.item_path}/workbook"
                 f"/worksheets/{_encode_path_segment(ws_id)}/range(address='{right_address}')/clear"
             )
-            self._session_aware_request(
-                "POST", clear_right_path, json={"applyTo": "Contents"}
-            )
+            requests.append(("POST", clear_right_path, {"applyTo": "Contents"}))
+
+        # The result depends on how the service trims the used range, so
+        # the next read fetches it again.
+        if len(blocks) > 1:
+            self._used_ranges.pop(ws_id, None)
+            self._extents.pop(ws_id, None)
+            self._send_blocks(blocks)
+            self._send_writes(ws_id, requests)
+        else:
+            self._send_writes(ws_id, blocks + requests)
+
+    def _send_blocks(self, requests: Sequence[tuple[str, str, Any]]) -> None:
+        """Send the row-block PATCHes of a rewrite.
+
+        Under ``conflict_strategy="fail"`` the blocks are sent one after
+        another, each with ``If-Match`` set to the ETag the previous one
+        returned: a change made by another session between two blocks fails
+        the rewrite instead of being absorbed.  Otherwise they run
+        concurrently on up to ``write_workers`` threads.  A PATCH of fixed
+        values is idempotent, so throttled and transient failures are
+        retried per block.
+        """
+        if self._conflict_strategy == "fail":
+            for method, path, body in requests:
+                self._session_aware_request(method, path, json=body, idempotent=True)
+            return
+        with ThreadPoolExecutor(max_workers=self._write_workers) as pool:
+            futures = [
+                pool.submit(
+                    self._session_aware_request,
+                    method,
+                    path,
+                    json=body,
+                    idempotent=True,
+                )
+                for method, path, body in requests
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
     def _try_patch_changed_rows(
         self,
@@ -300,6 +590,7 @@ class GraphBackend(WorkbookBackend):
 
         row_groups = self._group_consecutive(changed_rows)
         last_col = _col_letter(num_cols - 1)
+        requests: list[tuple[str, str, Any]] = []
         for start_row, end_row in row_groups:
             values = [
                 matrix[row_number - 1] for row_number in range(start_row, end_row + 1)
@@ -309,7 +600,20 @@ class GraphBackend(WorkbookBackend):
                 f"{self._locator.item_path}/workbook"
                 f"/worksheets/{_encode_path_segment(ws_id)}/range(address='{address}')"
             )
-            self._session_aware_request("PATCH", patch_path, json={"values": values})
+            requests.append(("PATCH", patch_path, {"values": values}))
+
+        def patch(cached: list[list[Any]]) -> None:
+            for row_number in changed_rows:
+                cached[row_number - 1] = _patched_row(
+                    cached[row_number - 1], matrix[row_number - 1]
+                )
+
+        cacheable = all(
+            _round_trips(value)
+            for row_number in changed_rows
+            for value in matrix[row_number - 1]
+        )
+        self._send_writes(ws_id, requests, patch if cacheable else None)
         return True
 
     def _try_delete_rows(
@@ -339,13 +643,21 @@ class GraphBackend(WorkbookBackend):
         row_groups = self._group_consecutive(deleted_sheet_rows)
         last_col = _col_letter(num_cols - 1)
 
+        # Bottom-up, so the row numbers of later groups stay valid.
+        requests: list[tuple[str, str, Any]] = []
         for start_row, end_row in reversed(row_groups):
             address = f"A{start_row}:{last_col}{end_row}"
             delete_path = (
                 f"{self._locator.item_path}/workbook"
                 f"/worksheets/{_encode_path_segment(ws_id)}/range(address='{address}')/delete"
             )
-            self._session_aware_request("POST", delete_path, json={"shift": "Up"})
+            requests.append(("POST", delete_path, {"shift": "Up"}))
+
+        def delete(cached: list[list[Any]]) -> None:
+            for start_row, end_row in reversed(row_groups):
+                del cached[start_row - 1 : end_row]
+
+        self._send_writes(ws_id, requests, delete)
         return True
 
     @staticmethod
@@ -395,41 +707,76 @@ class GraphBackend(WorkbookBackend):
     def append_row(self, sheet_name: str, row: list[Any]) -> int:
         """Append a single row to *sheet_name* and return the 1-based row index."""
         self._ensure_writable("append_row")
+        return self._append_values(sheet_name, [row])[0]
+
+    def append_rows(
+        self, sheet_name: str, rows: Sequence[list[Any]]
+    ) -> tuple[int, int]:
+        """Append *rows* to *sheet_name* with a single range PATCH."""
+        self._ensure_writable("append_rows")
+        if not rows:
+            raise BackendOperationError("append_rows requires at least one row")
+        return self._append_values(sheet_name, rows)
+
+    def _append_values(
+        self, sheet_name: str, rows: Sequence[list[Any]]
+    ) -> tuple[int, int]:
         self._ensure_session()
         self._load_sheets()
         ws_id = self._sheet_ids.get(sheet_name)
         if ws_id is None:
             raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
+        self._sheet_changed(sheet_name)
 
-        # Single read to get both row count and header width
-        values = self._read_used_range(ws_id)
-        if not values:
+        used_rows, used_cols = self._used_range_extent(ws_id)
+        if used_rows == 0:
             # Empty sheet — write to row 1
             next_row = 1
-            num_cols = len(row)
+            num_cols = max(len(row) for row in rows)
         else:
-            next_row = len(values) + 1  # 1-based; usedRange includes header
-            num_cols = len(values[0])
+            next_row = used_rows + 1  # 1-based; usedRange includes header
+            num_cols = used_cols
 
         last_col = _col_letter(num_cols - 1) if num_cols > 0 else "A"
+        last_row = next_row + len(rows) - 1
 
-        # Pad/trim row to header width
-        padded = list(row) + [None] * (num_cols - len(row))
-        row_values = [padded[:num_cols]]
+        # Pad/trim rows to header width
+        row_values = [
+            (list(row) + [None] * (num_cols - len(row)))[:num_cols] for row in rows
+        ]
 
-        address = f"A{next_row}:{last_col}{next_row}"
+        address = f"A{next_row}:{last_col}{last_row}"
         patch_path = (
             f"{self._locator.item_path}/workbook"
             f"/worksheets/{_encode_path_segment(ws_id)}/range(address='{address}')"
         )
-        self._session_aware_request("PATCH", patch_path, json={"values": row_values})
-        return next_row
+
+        def append(cached: list[list[Any]]) -> None:
+            cached.extend(_patched_row([], row) for row in row_values)
+
+        cacheable = all(_round_trips(value) for row in row_values for value in row)
+
+        # The used range only grows to the new rows if the last one holds a
+        # value, and to their width if a column was not there before.
+        extent: tuple[int, int] | None = None
+        if any(_has_value(value) for value in row_values[-1]) and (
+            used_rows > 0 or any(_has_value(row[-1]) for row in row_values if row)
+        ):
+            extent = (last_row, num_cols)
+        self._send_writes(
+            ws_id,
+            [("PATCH", patch_path, {"values": row_values})],
+            append if cacheable else None,
+            extent,
+        )
+        return next_row, last_row
 
     def create_sheet(self, name: str, headers: list[str]) -> None:
         """Create a new worksheet and write the header row."""
         self._ensure_writable("create_sheet")
         self._ensure_session()
 
+        self._sheet_changed(name)
         # POST to add worksheet
         ws_path = f"{self._locator.item_path}/workbook/worksheets/add"
         resp = self._session_aware_request("POST", ws_path, json={"name": name})
@@ -460,8 +807,11 @@ class GraphBackend(WorkbookBackend):
         ws_id = self._sheet_ids.get(name)
         if ws_id is None:
             raise BackendOperationError(f"Sheet '{name}' not found in Excel")
+        self._sheet_changed(name)
 
         delete_path = f"{self._locator.item_path}/workbook/worksheets/{_encode_path_segment(ws_id)}"
+        self._used_ranges.pop(ws_id, None)
+        self._extents.pop(ws_id, None)
         self._session_aware_request("DELETE", delete_path)
 
         # Invalidate cache
@@ -493,6 +843,8 @@ class GraphBackend(WorkbookBackend):
         Stale-session recovery is attempted for all HTTP methods.  The retry
         targets the *session infrastructure* (expired session ID), not
         transient server errors — so it is safe even for mutating methods.
+        Requests may run on several threads; the session is reopened once
+        for all of them.
         """
         method_upper = method.upper()
         dispatch = {
@@ -511,6 +863,7 @@ class GraphBackend(WorkbookBackend):
             headers["If-Match"] = self._etag
         if headers:
             kwargs["headers"] = headers
+        session_id = self._client.session_id
         try:
             response = send(path, **kwargs)
             self._update_etag_from_response(response)
@@ -527,13 +880,109 @@ class GraphBackend(WorkbookBackend):
             if not self._is_session_error(exc):
                 raise
         # Session expired — reopen and retry once
+        with self._reopen_lock:
+            if self._client.session_id == session_id:
+                self._reopen_session()
+        response = send(path, **kwargs)
+        self._update_etag_from_response(response)
+        return response
+
+    def _reopen_session(self) -> None:
         self._session.reopen()
         self._sheets_loaded = False
         self._sheet_ids.clear()
         self._load_sheets()
-        response = send(path, **kwargs)
-        self._update_etag_from_response(response)
-        return response
+
+    def _send_writes(
+        self,
+        ws_id: str,
+        requests: Sequence[tuple[str, str, Any]],
+        change: Callable[[list[list[Any]]], None] | None = None,
+        extent: tuple[int, int] | None = None,
+    ) -> None:
+        """Send write *requests* ``(method, path, json)`` to *ws_id* in order.
+
+        A single request is sent directly.  More are coalesced into JSON
+        ``$batch`` calls of up to ``_BATCH_LIMIT`` requests.  The cached
+        usedRange of *ws_id* is updated with *change* afterwards, and its
+        extent set to *extent* (rows, columns); either is dropped when not
+        given.
+        """
+        entry = self._used_ranges.pop(ws_id, None)
+        self._extents.pop(ws_id, None)
+        if not requests:
+            return
+        if len(requests) == 1:
+            method, path, body = requests[0]
+            response = self._session_aware_request(method, path, json=body)
+        else:
+            for start in range(0, len(requests), self._BATCH_LIMIT):
+                response = self._send_batch(
+                    requests[start : start + self._BATCH_LIMIT]
+                )
+        # Cached state is only carried forward when the write was
+        # conditional on it (If-Match) and the new ETag is known.
+        etag = response.headers.get("ETag")
+        if not etag or self._conflict_strategy != "fail":
+            return
+        if extent is not None:
+            self._extents[ws_id] = (etag, *extent)
+        if entry is not None and change is not None:
+            self._update_used_range(ws_id, etag, entry[1], change)
+
+    def _send_batch(self, requests: Sequence[tuple[str, str, Any]]) -> httpx.Response:
+        """Send *requests* as one ``$batch`` call and return the last response.
+
+        Each request ``dependsOn`` the one before it, so Graph runs them in
+        order and skips the rest (``424 Failed Dependency``) after a failure.
+        Under ``conflict_strategy="fail"`` the first request carries
+        ``If-Match``; the later ones only run if it succeeded.  The first
+        failed request is raised as ``OperationalError``.
+        """
+        entries: list[dict[str, Any]] = []
+        for index, (method, path, body) in enumerate(requests, start=1):
+            entry: dict[str, Any] = {
+                "id": str(index),
+                "method": method,
+                "url": path,
+                "body": body,
+            }
+            if index > 1:
+                entry["dependsOn"] = [str(index - 1)]
+            entries.append(entry)
+
+        for attempt in range(2):
+            if self._conflict_strategy == "fail" and self._etag is not None:
+                entries[0]["headers"] = {"If-Match": self._etag}
+            responses = self._client.batch(entries)
+            for response in responses:
+                if response.is_success:
+                    self._update_etag_from_response(response)
+            failed = next(
+                (
+                    (entry, response)
+                    for entry, response in zip(entries, responses)
+                    if not response.is_success
+                ),
+                None,
+            )
+            if failed is None:
+                return responses[-1]
+            entry, response = failed
+            error = OperationalError(
+                f"Graph API error {response.status_code} in $batch request "
+                f"{entry['id']} ({entry['method']} {entry['url']}): {response.text}"
+            )
+            if response.status_code == 412 and self._conflict_strategy == "fail":
+                raise OperationalError(
+                    "Concurrent modification detected: workbook was modified by another session"
+                ) from error
+            # Nothing ran when the first request hit an expired session.
+            if attempt == 0 and entry is entries[0] and self._is_session_error(error):
+                self._reopen_session()
+                continue
+            raise error
+        raise AssertionError("unreachable")  # pragma: no cover
 
     def _prime_workbook_etag(self) -> None:
         if self._conflict_strategy != "fail":
@@ -592,17 +1041,208 @@ class GraphBackend(WorkbookBackend):
 
     def _used_range_row_count(self, ws_id: str) -> int:
         """Return the total number of used rows (including header) for a worksheet."""
-        values = self._read_used_range(ws_id)
-        return len(values) if values else 0
+        return self._used_range_extent(ws_id)[0]
+
+    def _used_range_extent(
+        self, ws_id: str, *, revalidate: bool = False
+    ) -> tuple[int, int]:
+        """Return the (rows, columns) of the used range of *ws_id*.
+
+        Under ``conflict_strategy="fail"`` an extent recorded at the current
+        workbook ETag is returned without a request: the write it is needed
+        for is sent with ``If-Match`` and fails if the workbook has changed.
+        Otherwise, and always with *revalidate*, only the range's size and
+        address are fetched, revalidated with ``If-None-Match`` when the
+        origin of the range is known at the cached ETag.
+        """
+        cached = self._extents.get(ws_id)
+        if (
+            not revalidate
+            and cached is not None
+            and self._conflict_strategy == "fail"
+            and cached[0] == self._etag
+        ):
+            return cached[1], cached[2]
+        path = (
+            f"{self._locator.item_path}/workbook"
+            f"/worksheets/{_encode_path_segment(ws_id)}/usedRange(valuesOnly=true)"
+            "?$select=address,rowCount,columnCount"
+        )
+        origin = self._origins.get(ws_id)
+        headers = (
+            {"If-None-Match": cached[0]}
+            if cached is not None
+            and (not revalidate or (origin is not None and origin[0] == cached[0]))
+            else {}
+        )
+        resp = self._session_aware_request("GET", path, headers=headers)
+        if resp.status_code == 304 and cached is not None:
+            return cached[1], cached[2]
+        payload = resp.json()
+        rows = int(payload.get("rowCount", 0))
+        cols = int(payload.get("columnCount", 0))
+        etag = resp.headers.get("ETag")
+        first = _range_origin(payload.get("address"))
+        if etag:
+            self._extents[ws_id] = (etag, rows, cols)
+        else:
+            self._extents.pop(ws_id, None)
+        if first is not None:
+            self._origins[ws_id] = (etag, *first)
+        else:
+            self._origins.pop(ws_id, None)
+        return rows, cols
+
+    def _read_values(self, ws_id: str) -> list[list[Any]]:
+        """Return the usedRange values of *ws_id*, read in row blocks if tall.
+
+        Blocks answered at different ETags were read across a change to the
+        workbook; the sheet is then read again, up to ``_READ_ATTEMPTS``
+        times.  The result is shared with the cache and must not be modified.
+        """
+        for _ in range(self._READ_ATTEMPTS):
+            plan = self._plan_read(ws_id)
+            if not isinstance(plan, tuple):
+                return plan
+            values: list[list[Any]] = []
+            etags: set[str | None] = set()
+            for block, etag in self._iter_blocks(ws_id, *plan):
+                values.extend(block)
+                etags.add(etag)
+            extent = self._extents.get(ws_id)
+            probed = extent[0] if extent is not None else None
+            if etags == {None}:
+                return values
+            # Only cache blocks that were all read at the probed version.
+            if probed is not None and etags == {probed}:
+                self._used_ranges[ws_id] = (probed, values)
+                return values
+        raise OperationalError(
+            f"Worksheet {ws_id!r} kept changing while it was read in row blocks"
+        )
+
+    def _plan_read(
+        self, ws_id: str
+    ) -> list[list[Any]] | tuple[tuple[int, int], int, int]:
+        """Return the values of *ws_id*, or how to read it in row blocks.
+
+        A sheet not known to be taller than ``read_block_rows`` is read with
+        one usedRange request.  Otherwise its size is probed first, which
+        also revalidates values cached at the same ETag.  A tall sheet is
+        returned as the (row, column) of its used range's top-left cell and
+        its (rows, columns); one whose address could not be parsed is read
+        with one usedRange request as well.
+        """
+        block_rows = self._read_block_rows
+        known = self._extents.get(ws_id)
+        if block_rows == 0 or (known is not None and known[1] <= block_rows):
+            return self._read_used_range(ws_id)
+        row_count, col_count = self._used_range_extent(ws_id, revalidate=True)
+        extent = self._extents.get(ws_id)
+        cached = self._used_ranges.get(ws_id)
+        if extent is not None and cached is not None and cached[0] == extent[0]:
+            return cached[1]
+        origin = self._origins.get(ws_id)
+        probed = extent[0] if extent is not None else None
+        if row_count <= block_rows or origin is None or origin[0] != probed:
+            return self._read_used_range(ws_id)
+        return origin[1:], row_count, col_count
+
+    def _iter_blocks(
+        self, ws_id: str, origin: tuple[int, int], row_count: int, col_count: int
+    ) -> Generator[tuple[list[list[Any]], str | None], None, None]:
+        """Yield the row blocks of a *row_count* x *col_count* used range.
+
+        *origin* is the (1-based row, 0-based column) of its top-left cell.
+        Blocks are yielded in order with the ETag of their response.  Up to
+        ``read_workers`` of them download concurrently, ahead of the block
+        being consumed; closing the iterator cancels the ones not started.
+        """
+        block_rows = self._read_block_rows
+        first_row, first_col = origin
+        first_letter = _col_letter(first_col)
+        last_letter = _col_letter(first_col + max(col_count, 1) - 1)
+        sheet_path = (
+            f"{self._locator.item_path}/workbook"
+            f"/worksheets/{_encode_path_segment(ws_id)}"
+        )
+
+        def fetch(start: int) -> tuple[list[list[Any]], str | None]:
+            end = min(start + block_rows - 1, row_count)
+            address = (
+                f"{first_letter}{first_row + start - 1}:"
+                f"{last_letter}{first_row + end - 1}"
+            )
+            resp = self._session_aware_request(
+                "GET", f"{sheet_path}/range(address='{address}')?$select=values"
+            )
+            values = cast(list[list[Any]], resp.json().get("values", []))
+            return values, resp.headers.get("ETag")
+
+        starts = iter(range(1, row_count + 1, block_rows))
+        pool = ThreadPoolExecutor(max_workers=self._read_workers)
+        pending: deque[Future[tuple[list[list[Any]], str | None]]] = deque()
+        try:
+            for start in starts:
+                pending.append(pool.submit(fetch, start))
+                if len(pending) == self._read_workers:
+                    break
+            while pending:
+                block = pending.popleft().result()
+                start = next(starts, 0)
+                if start:
+                    pending.append(pool.submit(fetch, start))
+                yield block
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
     def _read_used_range(self, ws_id: str) -> list[list[Any]]:
-        """Return raw values matrix from usedRange, or empty list."""
+        """Return raw values matrix from usedRange, or empty list.
+
+        A matrix fetched before is revalidated with ``If-None-Match`` and
+        reused on ``304 Not Modified``.  The result is shared with the cache
+        and must not be modified.
+        """
         path = (
             f"{self._locator.item_path}/workbook"
             f"/worksheets/{_encode_path_segment(ws_id)}/usedRange(valuesOnly=true)?$select=values"
         )
-        resp = self._session_aware_request("GET", path)
-        return cast(list[list[Any]], resp.json().get("values", []))
+        cached = self._used_ranges.get(ws_id)
+        headers = {"If-None-Match": cached[0]} if cached is not None else {}
+        resp = self._session_aware_request("GET", path, headers=headers)
+        if resp.status_code == 304 and cached is not None:
+            return cached[1]
+        values = cast(list[list[Any]], resp.json().get("values", []))
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._used_ranges[ws_id] = (etag, values)
+            self._extents[ws_id] = (etag, len(values), len(values[0]) if values else 0)
+        else:
+            self._used_ranges.pop(ws_id, None)
+            self._extents.pop(ws_id, None)
+        return values
+
+    def _update_used_range(
+        self,
+        ws_id: str,
+        etag: str,
+        values: list[list[Any]],
+        change: Callable[[list[list[Any]]], None],
+    ) -> None:
+        """Apply a write just made to *ws_id* to its cached usedRange *values*.
+
+        The values and their extent are cached again at *etag*, the ETag the
+        write returned, unless the used range may have shrunk.
+        """
+        change(values)
+        if values and (
+            not any(_has_value(value) for value in values[-1])
+            or not any(_has_value(row[-1]) for row in values if row)
+        ):
+            self._extents.pop(ws_id, None)
+            return
+        self._used_ranges[ws_id] = (etag, values)
+        self._extents[ws_id] = (etag, len(values), len(values[0]) if values else 0)
 
     def close(self) -> None:
         """Close session and HTTP client."""
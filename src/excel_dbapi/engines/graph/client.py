@@ -1,9 +1,10 @@
-"""Synchronous HTTP client for Microsoft Graph API with retry logic."""
+"""HTTP clients (blocking and asyncio) for Microsoft Graph API with retry logic."""
 
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Any
+from typing import Any, Coroutine, Sequence, TypeVar
 
 import httpx
 
@@ -16,6 +17,9 @@ _DEFAULT_MAX_RETRIES = 3
 _DEFAULT_BACKOFF_FACTOR = 0.5  # seconds
 _MAX_RETRY_AFTER = 60.0  # cap Retry-After to prevent excessive waits
 _SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_NOT_MODIFIED = 304
+
+R = TypeVar("R")
 
 
 def _parse_retry_after(value: str | None) -> float | None:
@@ -31,32 +35,20 @@ def _parse_retry_after(value: str | None) -> float | None:
     return None
 
 
-class GraphClient:
-    """Thin synchronous wrapper around ``httpx.Client`` for Graph API calls.
+class _GraphClientBase:
+    """Token, session header, ``$batch`` and error handling shared by clients.
 
-    Features:
-    - Bearer token injection via ``TokenProvider``
-    - Workbook session header injection
-    - Retry with exponential back-off on 429/503/504 (safe methods only)
-    - Exception translation to DB-API ``OperationalError``
+    Subclasses own the ``httpx`` client and the retry loop, since those
+    differ between blocking and ``asyncio`` I/O.
     """
 
     def __init__(
         self,
         token_provider: TokenProvider,
         *,
-        transport: httpx.BaseTransport | None = None,
-        timeout: float = 30.0,
-        max_retries: int = _DEFAULT_MAX_RETRIES,
-        backoff_factor: float = _DEFAULT_BACKOFF_FACTOR,
+        max_retries: int,
+        backoff_factor: float,
     ) -> None:
-        kwargs: dict[str, Any] = {
-            "base_url": _BASE_URL,
-            "timeout": timeout,
-        }
-        if transport is not None:
-            kwargs["transport"] = transport
-        self._http = httpx.Client(**kwargs)
         self._token_provider = token_provider
         self._session_id: str | None = None
         self._max_retries = max(0, max_retries)
@@ -72,23 +64,6 @@ class GraphClient:
     def session_id(self, value: str | None) -> None:
         self._session_id = value
 
-    # -- public request helpers ----------------------------------------------
-
-    def get(self, path: str, **kwargs: Any) -> httpx.Response:
-        return self._request("GET", path, **kwargs)
-
-    def post(self, path: str, **kwargs: Any) -> httpx.Response:
-        return self._request("POST", path, **kwargs)
-
-    def patch(self, path: str, **kwargs: Any) -> httpx.Response:
-        return self._request("PATCH", path, **kwargs)
-
-    def delete(self, path: str, **kwargs: Any) -> httpx.Response:
-        return self._request("DELETE", path, **kwargs)
-
-    def close(self) -> None:
-        self._http.close()
-
     # -- internals -----------------------------------------------------------
 
     def _build_headers(self) -> dict[str, str]:
@@ -113,15 +88,161 @@ class GraphClient:
         """Only retry safe (idempotent read) methods automatically."""
         return method.upper() in _SAFE_METHODS
 
+    def _backoff(self, attempt: int) -> float:
+        return self._backoff_factor * float(2**attempt)
+
+    def _retry_wait(self, resp: httpx.Response, attempt: int) -> float:
+        retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+        return retry_after if retry_after is not None else self._backoff(attempt)
+
     @staticmethod
     def _format_error_message(status_code: int, message: str, body: str) -> str:
         if body:
             return f"Graph API error {status_code}: {message}. Response body: {body}"
         return f"Graph API error {status_code}: {message}"
 
-    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+    def _raise_for_status(self, resp: httpx.Response) -> None:
+        """Translate a non-retryable error response to a DB-API exception."""
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            if resp.status_code == 401:
+                raise InterfaceError(
+                    self._format_error_message(
+                        401,
+                        "Authentication expired or invalid. Re-authenticate and retry.",
+                        resp.text,
+                    )
+                ) from exc
+            if resp.status_code == 403:
+                raise InterfaceError(
+                    self._format_error_message(
+                        403,
+                        "Insufficient permissions to access workbook. Check Graph API scopes: Files.ReadWrite.All",
+                        resp.text,
+                    )
+                ) from exc
+            if resp.status_code == 404:
+                raise OperationalError(
+                    self._format_error_message(
+                        404,
+                        "Workbook not found. Check drive_id and item_id.",
+                        resp.text,
+                    )
+                ) from exc
+            raise OperationalError(
+                f"Graph API error {resp.status_code}: {resp.text}"
+            ) from exc
+
+    def _batch_entries(
+        self, requests: Sequence[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        entries: list[dict[str, Any]] = []
+        for request in requests:
+            entry = dict(request)
+            headers = dict(entry.get("headers", {}))
+            if self._session_id is not None:
+                headers["workbook-session-id"] = self._session_id
+            if "body" in entry:
+                headers.setdefault("Content-Type", "application/json")
+            entry["headers"] = headers
+            entries.append(entry)
+        return entries
+
+    @staticmethod
+    def _batch_responses(
+        entries: list[dict[str, Any]], resp: httpx.Response
+    ) -> list[httpx.Response]:
+        by_id: dict[str, dict[str, Any]] = {
+            str(item.get("id")): item for item in resp.json().get("responses", [])
+        }
+        responses: list[httpx.Response] = []
+        for entry in entries:
+            item = by_id.get(str(entry["id"]))
+            if item is None:
+                raise OperationalError(
+                    f"Graph API $batch response is missing request {entry['id']}"
+                )
+            kwargs: dict[str, Any] = {"headers": item.get("headers") or {}}
+            if item.get("body") is not None:
+                kwargs["json"] = item["body"]
+            responses.append(httpx.Response(int(item["status"]), **kwargs))
+        return responses
+
+
+class GraphClient(_GraphClientBase):
+    """Thin synchronous wrapper around ``httpx.Client`` for Graph API calls.
+
+    Features:
+    - Bearer token injection via ``TokenProvider``
+    - Workbook session header injection
+    - Retry with exponential back-off on 429/503/504 (safe methods, or any
+      request passed ``idempotent=True``)
+    - Exception translation to DB-API ``OperationalError``
+    - ``304 Not Modified`` answers to conditional requests are returned as-is
+    - JSON ``$batch`` requests via ``batch()``
+    """
+
+    def __init__(
+        self,
+        token_provider: TokenProvider,
+        *,
+        transport: httpx.BaseTransport | None = None,
+        timeout: float = 30.0,
+        max_retries: int = _DEFAULT_MAX_RETRIES,
+        backoff_factor: float = _DEFAULT_BACKOFF_FACTOR,
+    ) -> None:
+        super().__init__(
+            token_provider, max_retries=max_retries, backoff_factor=backoff_factor
+        )
+        kwargs: dict[str, Any] = {
+            "base_url": _BASE_URL,
+            "timeout": timeout,
+        }
+        if transport is not None:
+            kwargs["transport"] = transport
+        self._http = httpx.Client(**kwargs)
+
+    # -- public request helpers ----------------------------------------------
+
+    def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return self._request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        return self._request("POST", path, **kwargs)
+
+    def patch(self, path: str, **kwargs: Any) -> httpx.Response:
+        return self._request("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs: Any) -> httpx.Response:
+        return self._request("DELETE", path, **kwargs)
+
+    def batch(self, requests: Sequence[dict[str, Any]]) -> list[httpx.Response]:
+        """Send *requests* as one JSON ``$batch`` call.
+
+        Each request is a batch entry with ``id``, ``method`` and ``url``
+        (relative to the API root) and optional ``headers``, ``body`` and
+        ``dependsOn``.  Graph does not apply the outer request's headers to
+        the entries, so the workbook session header is added to each one.
+
+        Returns one response per request, in request order.  Failed entries
+        are returned like successful ones; only a failure of the ``$batch``
+        call itself raises.
+        """
+        entries = self._batch_entries(requests)
+        resp = self._request("POST", "/$batch", json={"requests": entries})
+        return self._batch_responses(entries, resp)
+
+    def close(self) -> None:
+        self._http.close()
+
+    # -- internals -----------------------------------------------------------
+
+    def _request(
+        self, method: str, path: str, *, idempotent: bool = False, **kwargs: Any
+    ) -> httpx.Response:
         headers = {**self._build_headers(), **kwargs.pop("headers", {})}
-        can_retry = self._is_retryable(method)
+        can_retry = idempotent or self._is_retryable(method)
         last_exc: Exception | None = None
         max_attempts = (self._max_retries + 1) if can_retry else 1
 
@@ -131,41 +252,14 @@ class GraphClient:
             except httpx.TransportError as exc:
                 last_exc = exc
                 if can_retry and attempt < self._max_retries:
-                    time.sleep(self._backoff_factor * (2**attempt))
+                    time.sleep(self._backoff(attempt))
                     continue
                 raise OperationalError(f"Graph API request failed: {exc}") from exc
 
+            if resp.status_code == _NOT_MODIFIED:
+                return resp
             if resp.status_code not in _RETRYABLE:
-                try:
-                    resp.raise_for_status()
-                except httpx.HTTPStatusError as exc:
-                    if resp.status_code == 401:
-                        raise InterfaceError(
-                            self._format_error_message(
-                                401,
-                                "Authentication expired or invalid. Re-authenticate and retry.",
-                                resp.text,
-                            )
-                        ) from exc
-                    if resp.status_code == 403:
-                        raise InterfaceError(
-                            self._format_error_message(
-                                403,
-                                "Insufficient permissions to access workbook. Check Graph API scopes: Files.ReadWrite.All",
-                                resp.text,
-                            )
-                        ) from exc
-                    if resp.status_code == 404:
-                        raise OperationalError(
-                            self._format_error_message(
-                                404,
-                                "Workbook not found. Check drive_id and item_id.",
-                                resp.text,
-                            )
-                        ) from exc
-                    raise OperationalError(
-                        f"Graph API error {resp.status_code}: {resp.text}"
-                    ) from exc
+                self._raise_for_status(resp)
                 return resp
 
             # Retryable status — only retry safe methods
@@ -174,14 +268,8 @@ class GraphClient:
                     f"Graph API error {resp.status_code} on {method} (not retried): {resp.text}"
                 )
 
-            retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
-            wait = (
-                retry_after
-                if retry_after is not None
-                else self._backoff_factor * (2**attempt)
-            )
             if attempt < self._max_retries:
-                time.sleep(wait)
+                time.sleep(self._retry_wait(resp, attempt))
             else:
                 raise OperationalError(
                     f"Graph API error {resp.status_code} after {self._max_retries} retries"
@@ -189,3 +277,155 @@ class GraphClient:
 
         # Should not reach here, but satisfy type checker
         raise last_exc or RuntimeError("Unexpected retry loop exit")  # pragma: no cover
+
+
+class AsyncGraphClient(_GraphClientBase):
+    """``asyncio`` counterpart of ``GraphClient`` built on ``httpx.AsyncClient``.
+
+    Requests, retries and ``$batch`` calls behave exactly as in
+    ``GraphClient``, but back-off waits use ``asyncio.sleep`` so one event
+    loop can keep many workbooks in flight.  The token provider is still
+    called synchronously; providers that cache tokens return immediately.
+    """
+
+    def __init__(
+        self,
+        token_provider: TokenProvider,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+        timeout: float = 30.0,
+        max_retries: int = _DEFAULT_MAX_RETRIES,
+        backoff_factor: float = _DEFAULT_BACKOFF_FACTOR,
+    ) -> None:
+        super().__init__(
+            token_provider, max_retries=max_retries, backoff_factor=backoff_factor
+        )
+        kwargs: dict[str, Any] = {
+            "base_url": _BASE_URL,
+            "timeout": timeout,
+        }
+        if transport is not None:
+            kwargs["transport"] = transport
+        self._http = httpx.AsyncClient(**kwargs)
+
+    # -- public request helpers ----------------------------------------------
+
+    async def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self._request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self._request("POST", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self._request("PATCH", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self._request("DELETE", path, **kwargs)
+
+    async def batch(self, requests: Sequence[dict[str, Any]]) -> list[httpx.Response]:
+        """Send *requests* as one JSON ``$batch`` call; see ``GraphClient.batch``."""
+        entries = self._batch_entries(requests)
+        resp = await self._request("POST", "/$batch", json={"requests": entries})
+        return self._batch_responses(entries, resp)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncGraphClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    # -- internals -----------------------------------------------------------
+
+    async def _request(
+        self, method: str, path: str, *, idempotent: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        headers = {**self._build_headers(), **kwargs.pop("headers", {})}
+        can_retry = idempotent or self._is_retryable(method)
+        last_exc: Exception | None = None
+        max_attempts = (self._max_retries + 1) if can_retry else 1
+
+        for attempt in range(max_attempts):
+            try:
+                resp = await self._http.request(method, path, headers=headers, **kwargs)
+            except httpx.TransportError as exc:
+                last_exc = exc
+                if can_retry and attempt < self._max_retries:
+                    await asyncio.sleep(self._backoff(attempt))
+                    continue
+                raise OperationalError(f"Graph API request failed: {exc}") from exc
+
+            if resp.status_code == _NOT_MODIFIED:
+                return resp
+            if resp.status_code not in _RETRYABLE:
+                self._raise_for_status(resp)
+                return resp
+
+            if not can_retry:
+                raise OperationalError(
+                    f"Graph API error {resp.status_code} on {method} (not retried): {resp.text}"
+                )
+
+            if attempt < self._max_retries:
+                await asyncio.sleep(self._retry_wait(resp, attempt))
+            else:
+                raise OperationalError(
+                    f"Graph API error {resp.status_code} after {self._max_retries} retries"
+                )
+
+        raise last_exc or RuntimeError("Unexpected retry loop exit")  # pragma: no cover
+
+
+class LoopGraphClient:
+    """Blocking view of an ``AsyncGraphClient`` for threads off its event loop.
+
+    Each call schedules the client's coroutine on *loop* and waits for its
+    result, so HTTP I/O and back-off waits run on the event loop while the
+    calling thread (the SQL executor in ``excel_dbapi.aio``) only waits.
+    Calls from the loop's own thread would deadlock and raise
+    ``InterfaceError`` instead.
+    """
+
+    def __init__(
+        self, client: AsyncGraphClient, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        self._client = client
+        self._loop = loop
+
+    @property
+    def session_id(self) -> str | None:
+        return self._client.session_id
+
+    def run(self, coro: Coroutine[Any, Any, R]) -> R:
+        """Run *coro* on the client's event loop and return its result."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            coro.close()
+            raise InterfaceError(
+                "Blocking Graph request made on the event loop thread; "
+                "run it with asyncio.to_thread()"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return self.run(self._client.get(path, **kwargs))
+
+    def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        return self.run(self._client.post(path, **kwargs))
+
+    def patch(self, path: str, **kwargs: Any) -> httpx.Response:
+        return self.run(self._client.patch(path, **kwargs))
+
+    def delete(self, path: str, **kwargs: Any) -> httpx.Response:
+        return self.run(self._client.delete(path, **kwargs))
+
+    def batch(self, requests: Sequence[dict[str, Any]]) -> list[httpx.Response]:
+        return self.run(self._client.batch(requests))
+
+    def close(self) -> None:
+        self.run(self._client.aclose())
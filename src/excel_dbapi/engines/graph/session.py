@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from .client import GraphClient
+from .client import AsyncGraphClient, GraphClient, LoopGraphClient
 from .locator import GraphWorkbookLocator
 
 
@@ -69,3 +69,87 @@ class WorkbookSession:
     def _close_remote(self) -> None:
         path = f"{self._locator.item_path}/workbook/closeSession"
         self._client.post(path, json={})
+
+
+class AsyncWorkbookSession:
+    """``asyncio`` counterpart of ``WorkbookSession`` for ``AsyncGraphClient``."""
+
+    def __init__(
+        self,
+        client: AsyncGraphClient,
+        locator: GraphWorkbookLocator,
+        *,
+        persist_changes: bool = False,
+    ) -> None:
+        self._client = client
+        self._locator = locator
+        self._persist_changes = persist_changes
+        self._open = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    async def ensure_open(self) -> None:
+        """Open a workbook session if not already open."""
+        if self._open:
+            return
+        path = f"{self._locator.item_path}/workbook/createSession"
+        resp = await self._client.post(
+            path, json={"persistChanges": self._persist_changes}
+        )
+        self._client.session_id = resp.json()["id"]
+        self._open = True
+
+    async def reopen(self) -> None:
+        """Close (if open) and open a fresh session."""
+        await self.close()
+        await self.ensure_open()
+
+    async def close(self) -> None:
+        """Close the current session (no-op if already closed)."""
+        if not self._open:
+            return
+        try:
+            await self._close_remote()
+        except Exception:  # noqa: BLE001 — best-effort close
+            pass
+        self._client.session_id = None
+        self._open = False
+
+    async def __aenter__(self) -> AsyncWorkbookSession:
+        await self.ensure_open()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _close_remote(self) -> None:
+        path = f"{self._locator.item_path}/workbook/closeSession"
+        await self._client.post(path, json={})
+
+
+class LoopWorkbookSession:
+    """Blocking view of an ``AsyncWorkbookSession``; see ``LoopGraphClient``."""
+
+    def __init__(self, session: AsyncWorkbookSession, client: LoopGraphClient) -> None:
+        self._session = session
+        self._client = client
+
+    @property
+    def client(self) -> LoopGraphClient:
+        """The client the session's requests are sent with."""
+        return self._client
+
+    @property
+    def is_open(self) -> bool:
+        return self._session.is_open
+
+    def ensure_open(self) -> None:
+        self._client.run(self._session.ensure_open())
+
+    def reopen(self) -> None:
+        self._client.run(self._session.reopen())
+
+    def close(self) -> None:
+        self._client.run(self._session.close())
@@ -0,0 +1,371 @@
+"""Save an ``.xlsx`` package by rewriting only the worksheets that changed.
+
+An ``.xlsx`` file is a ZIP archive of XML parts.  :func:`splice_worksheets`
+serializes the changed worksheets with openpyxl's worksheet writer and builds
+a new archive in which every other member (the other worksheets, shared
+strings, styles, the workbook part, ...) is copied from the current file
+byte-for-byte, compressed data included.
+
+openpyxl writes cell text as inline strings, so rewritten sheets never touch
+the shared strings part.  The remaining coupling is through the style table:
+a rewritten sheet refers to ``cellXfs`` entries by position, which is only
+safe while the workbook's style list is exactly the one in the file.  When
+that, or anything else the copied parts depend on, cannot be guaranteed the
+function returns ``False`` and the caller saves the whole workbook instead.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+import posixpath
+import struct
+from typing import BinaryIO, Collection, NamedTuple
+from xml.etree import ElementTree
+import zipfile
+import zlib
+
+from openpyxl.workbook.workbook import Workbook
+from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.worksheet.worksheet import Worksheet
+
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_END_RECORD = struct.Struct("<IHHHHIIH")
+_LOCAL_SIGNATURE = 0x04034B50
+_CENTRAL_SIGNATURE = 0x02014B50
+_END_SIGNATURE = 0x06054B50
+_DESCRIPTOR_SIGNATURE = 0x08074B50
+_ZIP64_LIMIT = 0xFFFFFFFF
+_HAS_DESCRIPTOR = 0x08
+_UTF8_NAMES = 0x800
+_COPY_CHUNK = 1 << 20
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_RELATIONSHIP_ID = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+)
+_PACKAGE_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_OFFICE_DOCUMENT = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+
+
+class _Member(NamedTuple):
+    name: str
+    central_record: bytes
+    local_offset: int
+    compressed_size: int
+    flags: int
+
+
+def splice_worksheets(
+    workbook: Workbook, source: str, target: str, dirty: Collection[str]
+) -> bool:
+    """Write *workbook* to *target*, re-serializing only the *dirty* sheets.
+
+    *source* must hold the workbook as of the last load or save, with the
+    same sheets in the same order.  Returns ``False`` without a usable
+    *target* when the package cannot be spliced.
+    """
+    with open(source, "rb") as handle:
+        members = _central_directory(handle)
+        if members is None:
+            return False
+        try:
+            archive = zipfile.ZipFile(handle)
+        except zipfile.BadZipFile:
+            return False
+        with archive:
+            try:
+                replacements = _render_dirty_sheets(workbook, archive, dirty)
+            except ElementTree.ParseError:
+                return False
+        if replacements is None:
+            return False
+        with open(target, "wb") as out:
+            return _write_archive(handle, out, members, replacements)
+
+
+def _render_dirty_sheets(
+    workbook: Workbook, archive: zipfile.ZipFile, dirty: Collection[str]
+) -> dict[str, bytes] | None:
+    names = set(archive.namelist())
+    if "xl/calcChain.xml" in names:
+        # The calculation chain lists formula cells; rewritten sheets may
+        # no longer have them where it says.
+        return None
+    parts = _sheet_parts(archive, names)
+    if parts is None or [title for title, _ in parts] != workbook.sheetnames:
+        return None
+    part_by_title = dict(parts)
+
+    replacements: dict[str, bytes] = {}
+    for title in dirty:
+        part = part_by_title.get(title)
+        worksheet = workbook[title]
+        if (
+            part is None
+            or part not in names
+            or not isinstance(worksheet, Worksheet)
+            or _relationships_path(part) in names
+            or not _writes_without_relationships(worksheet)
+        ):
+            return None
+        writer = WorksheetWriter(worksheet, out=BytesIO())
+        writer.write()
+        if len(writer._rels) or worksheet._comments:
+            return None
+        replacements[part] = writer.read()
+
+    # Checked after writing: serializing cells registers their styles.
+    if not _styles_match(workbook, archive, names):
+        return None
+    return replacements
+
+
+def _writes_without_relationships(worksheet: Worksheet) -> bool:
+    """Whether the sheet carries nothing that lives in a related part."""
+    return not (
+        worksheet._charts
+        or worksheet._images
+        or worksheet._pivots
+        or worksheet.tables
+        or worksheet.legacy_drawing is not None
+        or worksheet.conditional_formatting
+    )
+
+
+def _styles_match(
+    workbook: Workbook, archive: zipfile.ZipFile, names: set[str]
+) -> bool:
+    if "xl/styles.xml" not in names:
+        return False
+    cell_xfs = ElementTree.fromstring(archive.read("xl/styles.xml")).find(
+        f"{_MAIN_NS}cellXfs"
+    )
+    if cell_xfs is None:
+        return False
+    styles = workbook._cell_styles
+    return len(cell_xfs.findall(f"{_MAIN_NS}xf")) == len(styles) and len(
+        set(styles)
+    ) == len(styles)
+
+
+def _sheet_parts(
+    archive: zipfile.ZipFile, names: set[str]
+) -> list[tuple[str, str]] | None:
+    """Sheet titles in workbook order with the archive member holding each."""
+    if "_rels/.rels" not in names:
+        return None
+    workbook_part = None
+    for relationship in _relationships(archive.read("_rels/.rels")):
+        if relationship[1] == _OFFICE_DOCUMENT:
+            workbook_part = _resolve_target("", relationship[2])
+    if workbook_part is None or workbook_part not in names:
+        return None
+    rels_path = _relationships_path(workbook_part)
+    if rels_path not in names:
+        return None
+    targets = {
+        rel_id: _resolve_target(posixpath.dirname(workbook_part), target)
+        for rel_id, _, target in _relationships(archive.read(rels_path))
+    }
+    sheets = ElementTree.fromstring(archive.read(workbook_part)).find(
+        f"{_MAIN_NS}sheets"
+    )
+    if sheets is None:
+        return None
+    parts: list[tuple[str, str]] = []
+    for sheet in sheets.findall(f"{_MAIN_NS}sheet"):
+        target = targets.get(sheet.get(_RELATIONSHIP_ID, ""))
+        if target is None:
+            return None
+        parts.append((sheet.get("name", ""), target))
+    return parts
+
+
+def _relationships(xml: bytes) -> list[tuple[str, str, str]]:
+    return [
+        (element.get("Id", ""), element.get("Type", ""), element.get("Target", ""))
+        for element in ElementTree.fromstring(xml).findall(
+            f"{_PACKAGE_NS}Relationship"
+        )
+    ]
+
+
+def _resolve_target(base: str, target: str) -> str:
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(posixpath.join(base, target))
+
+
+def _relationships_path(part: str) -> str:
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def _central_directory(handle: BinaryIO) -> list[_Member] | None:
+    """Raw central directory records of the archive, or ``None`` for ZIP64."""
+    handle.seek(0, 2)
+    size = handle.tell()
+    tail_size = min(size, _END_RECORD.size + 0xFFFF)
+    handle.seek(size - tail_size)
+    tail = handle.read(tail_size)
+    position = tail.rfind(struct.pack("<I", _END_SIGNATURE))
+    if position < 0 or len(tail) - position < _END_RECORD.size:
+        return None
+    _, disk, start_disk, disk_entries, entries, directory_size, directory_offset, _ = (
+        _END_RECORD.unpack_from(tail, position)
+    )
+    if (
+        disk
+        or start_disk
+        or disk_entries != entries
+        or _ZIP64_LIMIT in (directory_size, directory_offset)
+    ):
+        return None
+    handle.seek(directory_offset)
+    directory = handle.read(directory_size)
+
+    members: list[_Member] = []
+    offset = 0
+    for _ in range(entries):
+        if len(directory) - offset < _CENTRAL_HEADER.size:
+            return None
+        fields = _CENTRAL_HEADER.unpack_from(directory, offset)
+        if fields[0] != _CENTRAL_SIGNATURE:
+            return None
+        flags, compressed_size, file_size = fields[3], fields[8], fields[9]
+        name_size, extra_size, comment_size = fields[10], fields[11], fields[12]
+        local_offset = fields[16]
+        if _ZIP64_LIMIT in (compressed_size, file_size, local_offset):
+            return None
+        name_start = offset + _CENTRAL_HEADER.size
+        end = name_start + name_size + extra_size + comment_size
+        raw_name = directory[name_start : name_start + name_size]
+        name = raw_name.decode("utf-8" if flags & _UTF8_NAMES else "cp437")
+        members.append(
+            _Member(name, directory[offset:end], local_offset, compressed_size, flags)
+        )
+        offset = end
+    return members
+
+
+def _write_archive(
+    source: BinaryIO,
+    out: BinaryIO,
+    members: list[_Member],
+    replacements: dict[str, bytes],
+) -> bool:
+    directory: list[bytes] = []
+    for member in members:
+        offset = out.tell()
+        if offset >= _ZIP64_LIMIT:
+            return False
+        payload = replacements.get(member.name)
+        if payload is None:
+            if not _copy_member(source, out, member):
+                return False
+            record = member.central_record
+            directory.append(record[:42] + struct.pack("<I", offset) + record[46:])
+        else:
+            directory.append(_write_member(out, member, payload, offset))
+
+    directory_offset = out.tell()
+    if directory_offset >= _ZIP64_LIMIT:
+        return False
+    for record in directory:
+        out.write(record)
+    out.write(
+        _END_RECORD.pack(
+            _END_SIGNATURE,
+            0,
+            0,
+            len(directory),
+            len(directory),
+            out.tell() - directory_offset,
+            directory_offset,
+            0,
+        )
+    )
+    return True
+
+
+def _copy_member(source: BinaryIO, out: BinaryIO, member: _Member) -> bool:
+    """Copy the local header, data and descriptor of *member* unchanged."""
+    source.seek(member.local_offset)
+    header = source.read(_LOCAL_HEADER.size)
+    if len(header) < _LOCAL_HEADER.size:
+        return False
+    fields = _LOCAL_HEADER.unpack(header)
+    if fields[0] != _LOCAL_SIGNATURE:
+        return False
+    remaining = fields[9] + fields[10] + member.compressed_size
+    if member.flags & _HAS_DESCRIPTOR:
+        source.seek(member.local_offset + _LOCAL_HEADER.size + remaining)
+        signature = source.read(4)
+        remaining += 16 if signature == struct.pack("<I", _DESCRIPTOR_SIGNATURE) else 12
+        source.seek(member.local_offset + _LOCAL_HEADER.size)
+    out.write(header)
+    while remaining:
+        chunk = source.read(min(remaining, _COPY_CHUNK))
+        if not chunk:
+            return False
+        out.write(chunk)
+        remaining -= len(chunk)
+    return True
+
+
+def _write_member(out: BinaryIO, member: _Member, payload: bytes, offset: int) -> bytes:
+    """Write *payload* deflated under *member*'s name; return its directory record."""
+    fields = _CENTRAL_HEADER.unpack_from(member.central_record)
+    version_made_by, mod_time, mod_date, external_attributes = (
+        fields[1],
+        fields[5],
+        fields[6],
+        fields[15],
+    )
+    name = member.name.encode("utf-8")
+    flags = 0 if name.isascii() else _UTF8_NAMES
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    data = compressor.compress(payload) + compressor.flush()
+    crc = zlib.crc32(payload)
+    out.write(
+        _LOCAL_HEADER.pack(
+            _LOCAL_SIGNATURE,
+            20,
+            flags,
+            zipfile.ZIP_DEFLATED,
+            mod_time,
+            mod_date,
+            crc,
+            len(data),
+            len(payload),
+            len(name),
+            0,
+        )
+    )
+    out.write(name)
+    out.write(data)
+    return (
+        _CENTRAL_HEADER.pack(
+            _CENTRAL_SIGNATURE,
+            version_made_by,
+            20,
+            flags,
+            zipfile.ZIP_DEFLATED,
+            mod_time,
+            mod_date,
+            crc,
+            len(data),
+            len(payload),
+            len(name),
+            0,
+            0,
+            0,
+            0,
+            external_attributes,
+            offset,
+        )
+        + name
+    )
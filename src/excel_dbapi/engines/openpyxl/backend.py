@@ -2,25 +2,71 @@ from io import BytesIO
 import os
 import sys
 import tempfile
-from typing import Any, cast
+from typing import Any, Callable, Collection, Iterator, Sequence, cast
 
 from openpyxl import load_workbook
+from openpyxl.cell.cell import Cell
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.workbook.workbook import Workbook
 
-from ...exceptions import BackendOperationError
+from ...exceptions import BackendOperationError, NotSupportedError
 from ...executor import SharedExecutor
 from ..result import ExecutionResult
-from ..base import TableData, WorkbookBackend, _normalize_headers
+from ._splice import splice_worksheets
+from ..base import (
+    RowFilter,
+    TableData,
+    WorkbookBackend,
+    _UndoMarker,
+    _normalize_headers,
+    _projected_ordinals,
+)
 
 
 class OpenpyxlBackend(WorkbookBackend):
+    """Backend that reads and writes local ``.xlsx`` files with openpyxl.
+
+    Pass ``readonly=True`` (via ``backend_options`` or ``connect()``) to open
+    the workbook with openpyxl's read-only worksheets.  Rows are then streamed
+    from the file as queries consume them instead of loading the whole
+    workbook object model, and write operations are rejected.
+
+    Saving rewrites only the worksheets changed since the last load or save
+    and copies every other part of the file unchanged; see
+    :mod:`._splice`.  Anything the splice cannot vouch for (new or dropped
+    sheets, new cell styles, a restored snapshot, direct use of
+    :meth:`get_workbook`, :attr:`workbook` or :attr:`data`) falls back to a
+    full ``Workbook.save``.
+
+    Transactions use the undo log of :class:`WorkbookBackend`: ``snapshot()``
+    is a log position and ``restore()`` reverts the recorded writes, so
+    neither serializes the workbook.  Once the workbook has been handed out
+    that way, changes can bypass the log and snapshots go back to being
+    full in-memory copies.
+    """
 
     @property
     def readonly(self) -> bool:
-        return False
+        return self._readonly
 
     @property
     def supports_transactions(self) -> bool:
+        return not self._readonly
+
+    @property
+    def supports_streaming(self) -> bool:
+        return True
+
+    @property
+    def supports_predicate_pushdown(self) -> bool:
+        return True
+
+    @property
+    def supports_versioning(self) -> bool:
+        return True
+
+    @property
+    def supports_projection_pushdown(self) -> bool:
         return True
 
     def __init__(
@@ -30,8 +76,14 @@ class OpenpyxlBackend(WorkbookBackend):
         data_only: bool = True,
         create: bool = False,
         sanitize_formulas: bool = True,
+        readonly: bool = False,
         **options: Any,
     ) -> None:
+        if readonly and create:
+            raise NotSupportedError(
+                "openpyxl backend cannot create workbooks in read-only mode "
+                "(create=True, readonly=True)"
+            )
         super().__init__(
             file_path,
             data_only=data_only,
@@ -40,23 +92,66 @@ class OpenpyxlBackend(WorkbookBackend):
             **options,
         )
         self._data_only = data_only
-        self.workbook: Workbook | None = None
-        self.data: dict[str, Any] = {}
+        self._readonly = readonly
+        if readonly:
+            # Nothing is ever written back, so there is nothing to lock.
+            self._file_locking_enabled = False
+        self._workbook: Workbook | None = None
+        self._data: dict[str, Any] = {}
+        # Sheets changed since the file was last read or written; ``None``
+        # when the workbook may differ in ways only a full save captures.
+        self._dirty_sheets: set[str] | None = None
+        self._workbook_exposed = False
         self.load()
 
+    @property
+    def workbook(self) -> Workbook | None:
+        """The openpyxl workbook; reading it counts as :meth:`get_workbook`."""
+        self._expose_workbook()
+        return self._workbook
+
+    @workbook.setter
+    def workbook(self, workbook: Workbook | None) -> None:
+        self._expose_workbook()
+        self._workbook = workbook
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Worksheets by title; reading it counts as :meth:`get_workbook`."""
+        self._expose_workbook()
+        return self._data
+
+    @data.setter
+    def data(self, data: dict[str, Any]) -> None:
+        self._expose_workbook()
+        self._data = data
+
     def load(self) -> None:
         if self.create and (
             not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0
         ):
-            self.workbook = Workbook()
-            self.workbook.save(self.file_path)
+            self._workbook = Workbook()
+            self._workbook.save(self.file_path)
         else:
-            self.workbook = load_workbook(self.file_path, data_only=self._data_only)
-        self.data = {sheet: self.workbook[sheet] for sheet in self.workbook.sheetnames}
+            self._workbook = load_workbook(
+                self.file_path,
+                read_only=self._readonly,
+                data_only=self._data_only,
+            )
+        self._data = {
+            sheet: self._workbook[sheet] for sheet in self._workbook.sheetnames
+        }
+        self._dirty_sheets = set()
+        self._reset_undo()
+        self._sheet_changed()
 
     def save(self) -> None:
-        if self.workbook is None:
+        self._ensure_writable("save")
+        if self._workbook is None:
             raise BackendOperationError("Workbook is not loaded")
+        dirty = self._dirty_sheets
+        if dirty is not None and not dirty:
+            return
         directory = os.path.dirname(self.file_path) or "."
         temp_file = None
         try:
@@ -65,62 +160,131 @@ class OpenpyxlBackend(WorkbookBackend):
             ) as handle:
                 temp_file = handle.name
             os.chmod(temp_file, 0o600)
-            self.workbook.save(temp_file)
+            if dirty is None or not splice_worksheets(
+                self._workbook, self.file_path, temp_file, dirty
+            ):
+                self._workbook.save(temp_file)
             os.replace(temp_file, self.file_path)
+            self._dirty_sheets = set()
+            self._reset_undo()
         finally:
             if temp_file and os.path.exists(temp_file):
                 os.unlink(temp_file)
 
-    def snapshot(self) -> BytesIO:
-        if self.workbook is None:
+    def snapshot(self) -> Any:
+        self._ensure_writable("snapshot")
+        if self._workbook is None:
             raise BackendOperationError("Workbook is not loaded")
+        if not self._workbook_exposed:
+            return self._begin_undo()
         buffer = BytesIO()
-        self.workbook.save(buffer)
+        self._workbook.save(buffer)
         buffer.seek(0)
         return buffer
 
     def restore(self, snapshot: Any) -> None:
+        self._ensure_writable("restore")
+        self._sheet_changed()
+        if isinstance(snapshot, _UndoMarker):
+            self._undo_to(snapshot)
+            return
         snapshot.seek(0)
-        self.workbook = load_workbook(snapshot, data_only=self._data_only)
-        self.data = {sheet: self.workbook[sheet] for sheet in self.workbook.sheetnames}
+        self._workbook = load_workbook(snapshot, data_only=self._data_only)
+        self._data = {
+            sheet: self._workbook[sheet] for sheet in self._workbook.sheetnames
+        }
+        self._dirty_sheets = None
+        # The log refers to worksheets of the replaced workbook.
+        self._reset_undo()
 
     def list_sheets(self) -> list[str]:
-        return list(self.data.keys())
+        return list(self._data.keys())
+
+    def read_sheet(
+        self,
+        sheet_name: str,
+        *,
+        predicate: RowFilter | None = None,
+        columns: Collection[str] | None = None,
+    ) -> TableData:
+        headers, rows = self.iter_sheet(
+            sheet_name, predicate=predicate, columns=columns
+        )
+        return TableData(headers=headers, rows=list(rows))
 
-    def read_sheet(self, sheet_name: str) -> TableData:
-        ws = self.data.get(sheet_name)
+    def iter_sheet(
+        self,
+        sheet_name: str,
+        *,
+        predicate: RowFilter | None = None,
+        columns: Collection[str] | None = None,
+    ) -> tuple[list[str], Iterator[list[Any]]]:
+        ws = self._data.get(sheet_name)
         if ws is None:
             raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
         row_iter = ws.iter_rows(values_only=True)
         first_row = next(row_iter, None)
         if first_row is None:
-            return TableData(headers=[], rows=[])
+            return [], iter(())
 
         # Trim trailing None/empty columns left by in-place column deletion.
         raw_headers = list(first_row)
         while raw_headers and (raw_headers[-1] is None or (isinstance(raw_headers[-1], str) and raw_headers[-1].strip() == "")):
             raw_headers.pop()
         if not raw_headers:
-            return TableData(headers=[], rows=[])
-        num_cols = len(raw_headers)
+            return [], iter(())
         headers = _normalize_headers(raw_headers)
-        table_rows: list[list[Any]] = []
-        approx_bytes = sys.getsizeof(headers)
+        num_cols = len(headers)
+        positions: list[int] | None = None
+        if columns is not None:
+            ordinals = _projected_ordinals(headers, columns)
+            if len(ordinals) < len(headers):
+                # Read only the column window spanning the projection.
+                first, last = ordinals[0], ordinals[-1]
+                row_iter = ws.iter_rows(
+                    min_row=2, min_col=first + 1, max_col=last + 1, values_only=True
+                )
+                num_cols = last - first + 1
+                positions = [ordinal - first for ordinal in ordinals]
+                headers = [headers[ordinal] for ordinal in ordinals]
+        test = predicate.bind(headers) if predicate is not None else None
+        return headers, self._iter_rows(
+            sheet_name, row_iter, num_cols, headers, test, positions
+        )
 
+    def _iter_rows(
+        self,
+        sheet_name: str,
+        row_iter: Iterator[tuple[Any, ...]],
+        num_cols: int,
+        headers: list[str],
+        test: Callable[[Sequence[Any]], bool] | None = None,
+        positions: list[int] | None = None,
+    ) -> Iterator[list[Any]]:
+        approx_bytes = sys.getsizeof(headers)
         for index, row in enumerate(row_iter, start=1):
-            row_values = list(row)[:num_cols]
-            table_rows.append(row_values)
+            row_values = list(row[:num_cols])
+            if len(row_values) < num_cols:
+                # Read-only worksheets do not pad rows to the sheet dimensions.
+                row_values.extend([None] * (num_cols - len(row_values)))
+            if positions is not None:
+                row_values = [row_values[position] for position in positions]
             self._check_row_limit(sheet_name, index)
+            if test is not None and not test(row_values):
+                continue
             approx_bytes += sys.getsizeof(row_values)
             approx_bytes += sum(sys.getsizeof(value) for value in row_values)
             self._check_memory_limit(sheet_name, approx_bytes)
-
-        return TableData(headers=headers, rows=table_rows)
+            yield row_values
 
     def write_sheet(self, sheet_name: str, data: TableData) -> None:
-        ws = self.data.get(sheet_name)
+        self._ensure_writable("write_sheet")
+        ws = self._data.get(sheet_name)
         if ws is None:
             raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
+        self._mark_dirty(sheet_name)
+        if self._recording_undo:
+            self._record_undo(_cells_restorer(ws))
         # Write in-place to preserve cell formatting (fonts, borders, fills).
         # Step 1: Write header row.
         for col_idx, header in enumerate(data.headers, start=1):
@@ -142,34 +306,104 @@ class OpenpyxlBackend(WorkbookBackend):
             ws.delete_rows(new_max_row + 1, ws.max_row - new_max_row)
 
     def append_row(self, sheet_name: str, row: list[Any]) -> int:
-        ws = self.data.get(sheet_name)
+        self._ensure_writable("append_row")
+        ws = self._data.get(sheet_name)
         if ws is None:
             raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
+        self._mark_dirty(sheet_name)
+        first_row = ws._current_row + 1
         ws.append(row)
+        self._record_undo(_rows_remover(ws, first_row, len(row)))
         return cast(int, ws.max_row)
 
+    def append_rows(
+        self, sheet_name: str, rows: Sequence[list[Any]]
+    ) -> tuple[int, int]:
+        self._ensure_writable("append_rows")
+        ws = self._data.get(sheet_name)
+        if ws is None:
+            raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
+        if not rows:
+            raise BackendOperationError("append_rows requires at least one row")
+        self._mark_dirty(sheet_name)
+        appended_from = ws._current_row + 1
+        append = ws.append
+        append(rows[0])
+        first_row = cast(int, ws.max_row)
+        for row in rows[1:]:
+            append(row)
+        self._record_undo(
+            _rows_remover(ws, appended_from, max(len(row) for row in rows))
+        )
+        return first_row, cast(int, ws.max_row)
+
     def create_sheet(self, name: str, headers: list[str]) -> None:
-        if self.workbook is None:
+        self._ensure_writable("create_sheet")
+        if self._workbook is None:
             raise BackendOperationError("Workbook is not loaded")
-        if name in self.data:
+        if name in self._data:
             raise BackendOperationError(f"Sheet '{name}' already exists")
-        ws = self.workbook.create_sheet(title=name)
+        self._dirty_sheets = None
+        self._sheet_changed(name)
+        ws = self._workbook.create_sheet(title=name)
         ws.append(headers)
-        self.data[name] = ws
+        self._data[name] = ws
+        self._record_undo(lambda: self._remove_sheet(ws))
 
     def drop_sheet(self, name: str) -> None:
-        if self.workbook is None:
+        self._ensure_writable("drop_sheet")
+        if self._workbook is None:
             raise BackendOperationError("Workbook is not loaded")
-        ws = self.data.get(name)
+        ws = self._data.get(name)
         if ws is None:
             raise BackendOperationError(f"Sheet '{name}' not found in Excel")
-        self.workbook.remove(ws)
-        del self.data[name]
+        self._dirty_sheets = None
+        self._sheet_changed(name)
+        index = self._workbook._sheets.index(ws)
+        self._remove_sheet(ws)
+        self._record_undo(lambda: self._insert_sheet(ws, index))
+
+    def _remove_sheet(self, ws: Any) -> None:
+        assert self._workbook is not None
+        self._workbook.remove(ws)
+        del self._data[ws.title]
+
+    def _insert_sheet(self, ws: Any, index: int) -> None:
+        assert self._workbook is not None
+        self._workbook._sheets.insert(index, ws)
+        self._data = {
+            sheet: self._workbook[sheet] for sheet in self._workbook.sheetnames
+        }
 
     def get_workbook(self) -> Any:
-        if self.workbook is None:
+        if self._workbook is None:
             raise BackendOperationError("Workbook is not loaded")
-        return self.workbook
+        self._expose_workbook()
+        return self._workbook
+
+    def _expose_workbook(self) -> None:
+        # The caller may change anything, so the next save writes it all and
+        # later snapshots cannot rely on the undo log.
+        self._dirty_sheets = None
+        self._workbook_exposed = True
+
+    def close(self) -> None:
+        if self._readonly and self._workbook is not None:
+            # Read-only workbooks keep the archive open until closed.
+            self._workbook.close()
+        super().close()
+
+    def _mark_dirty(self, sheet_name: str) -> None:
+        self._sheet_changed(sheet_name)
+        if self._dirty_sheets is not None:
+            self._dirty_sheets.add(sheet_name)
+
+    def _ensure_writable(self, operation: str) -> None:
+        """Raise NotSupportedError if the workbook was opened read-only."""
+        if self._readonly:
+            raise NotSupportedError(
+                f"{operation} is not supported by the read-only openpyxl backend"
+            )
 
     def execute(self, query: str) -> ExecutionResult:
         return SharedExecutor(
@@ -182,3 +416,46 @@ class OpenpyxlBackend(WorkbookBackend):
         return SharedExecutor(
             self, sanitize_formulas=self.sanitize_formulas
         ).execute_with_params(query, params)
+
+
+def _cells_restorer(ws: Any) -> Callable[[], None]:
+    """Return a closure that puts the cells of *ws* back as they are now."""
+    saved = [
+        (
+            key,
+            cell,
+            cell._value if isinstance(cell, Cell) else None,
+            cell.data_type,
+            None if cell._style is None else StyleArray(cell._style),
+        )
+        for key, cell in ws._cells.items()
+    ]
+    current_row = ws._current_row
+
+    def restore() -> None:
+        cells: dict[tuple[int, int], Any] = {}
+        for (row, column), cell, value, data_type, style in saved:
+            cell.row, cell.column = row, column
+            if isinstance(cell, Cell):
+                cell._value = value
+                cell.data_type = data_type
+            cell._style = style
+            cells[row, column] = cell
+        ws._cells = cells
+        ws._current_row = current_row
+
+    return restore
+
+
+def _rows_remover(ws: Any, first_row: int, width: int) -> Callable[[], None]:
+    """Return a closure that removes the rows appended to *ws* from *first_row*."""
+    last_row = ws._current_row
+
+    def remove() -> None:
+        cells = ws._cells
+        for row in range(first_row, last_row + 1):
+            for column in range(1, width + 1):
+                cells.pop((row, column), None)
+        ws._current_row = first_row - 1
+
+    return remove
@@ -0,0 +1,732 @@
+"""Vectorized execution of single-sheet statements on the pandas backend.
+
+:class:`PandasExecutor` runs the common single-sheet statements as column
+operations on the sheet's DataFrame instead of interpreting them row by row:
+
+* ``WHERE`` trees of comparisons, ``IN``, ``BETWEEN`` and ``IS [NOT] NULL``
+  against literals become a pair of boolean masks (the rows where the
+  condition is TRUE and the rows where it is FALSE; the others are NULL),
+  combined under three-valued logic;
+* ``GROUP BY`` keys are factorized into group numbers in order of first
+  appearance, and ``COUNT``, ``SUM``, ``AVG``, ``MIN`` and ``MAX`` are
+  reduced per group number;
+* ``ORDER BY`` is a stable :func:`numpy.lexsort` of the matching rows;
+* ``UPDATE`` masks the assigned columns and ``DELETE`` keeps the unmasked
+  rows, and either replaces the sheet's DataFrame.
+
+Results are exactly those of :class:`SharedExecutor`, which compares, sorts
+and aggregates Python values with its own coercion rules.  A statement is
+only vectorized where the column operation provably agrees with those rules:
+a comparison only where ``SharedExecutor._literal_comparison`` (which also
+drives the compiled and columnar WHERE evaluators) pairs the literal with the
+column in the form the column already holds, such as numeric columns against
+literals compared as floats and string columns against literals compared as
+text; integer sums that are exact in floating point; and so on.  Everything
+else, including a statement that touches a single column of another type,
+runs on :class:`SharedExecutor` unchanged.
+"""
+
+from __future__ import annotations
+
+import operator
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ...executor import SharedExecutor
+from ...executor._affinity import MIXED, NUMERIC, TEXT
+from ...executor._compiler import COMPARISON_OPERATORS
+from ...sanitize import sanitize_cell_value
+from ..base import _EXACT_INT_LIMIT, _normalize_headers, _projected_ordinals
+from ..result import Description, ExecutionResult
+
+if TYPE_CHECKING:
+    from .backend import PandasBackend
+
+Mask = npt.NDArray[np.bool_]
+Positions = npt.NDArray[np.intp]
+
+# Column kinds the vectorized path understands.
+_NUMBER = "number"
+"""``int``, ``uint`` or ``float`` dtype; NaN is NULL."""
+_STRING = "string"
+"""``object`` dtype holding only strings and NULLs."""
+
+_AGGREGATES = frozenset({"COUNT", "SUM", "AVG", "MIN", "MAX"})
+
+
+class _Truth(NamedTuple):
+    """Three-valued result of a condition; rows in neither mask are NULL."""
+
+    true: Mask
+    false: Mask
+
+
+def _column_kind(series: pd.Series) -> str | None:
+    kind = series.dtype.kind
+    if kind in "iuf":
+        return _NUMBER
+    if kind == "O" and pd.api.types.infer_dtype(series, skipna=True) == "string":
+        return _STRING
+    return None
+
+
+def _rewritable(frame: pd.DataFrame) -> bool:
+    """Whether rebuilding *frame* from its row values would keep every dtype.
+
+    ``write_sheet`` re-infers column dtypes from the row values, which turns
+    an ``object`` column of numbers into a numeric one.  Frames with such
+    columns are left to :class:`SharedExecutor` so both paths store the same
+    values.
+    """
+    for _, series in frame.items():
+        kind = series.dtype.kind
+        if kind in "iufbM":
+            continue
+        if kind != "O" or pd.api.types.infer_dtype(series, skipna=True) not in {
+            "string",
+            "empty",
+        }:
+            return False
+    return True
+
+
+def _has_negative_zero(values: npt.NDArray[Any]) -> bool:
+    """``-0.0`` equals ``0.0`` but prints differently; pandas may pick either."""
+    return bool(np.any((values == 0) & np.signbit(values)))
+
+
+class _SheetColumns:
+    """Typed views of a sheet's columns, each computed on first use."""
+
+    def __init__(
+        self, frame: pd.DataFrame, headers: list[str], source_refs: set[str]
+    ) -> None:
+        self.frame = frame
+        self.headers = headers
+        self.row_count = len(frame.index)
+        self._ordinals = SharedExecutor._scoped_column_ordinals(headers, source_refs)
+        self._nulls: dict[int, Mask] = {}
+        self._kinds: dict[int, str | None] = {}
+
+    def ordinal(self, reference: Any) -> int | None:
+        """Ordinal of a column name or column node, resolved like a row lookup."""
+        if isinstance(reference, dict):
+            if reference.get("type") != "column":
+                return None
+            reference = SharedExecutor._source_key(reference)
+        if not isinstance(reference, str):
+            return None
+        return SharedExecutor._columnar_ordinal(reference, self._ordinals)
+
+    def series(self, ordinal: int) -> pd.Series:
+        return self.frame.iloc[:, ordinal]
+
+    def kind(self, ordinal: int) -> str | None:
+        if ordinal not in self._kinds:
+            self._kinds[ordinal] = _column_kind(self.series(ordinal))
+        return self._kinds[ordinal]
+
+    def nulls(self, ordinal: int) -> Mask:
+        cached = self._nulls.get(ordinal)
+        if cached is None:
+            cached = self._nulls[ordinal] = self.series(ordinal).isna().to_numpy()
+        return cached
+
+    def numbers(self, ordinal: int) -> npt.NDArray[np.float64]:
+        """Values of a numeric column as floats (NaN where NULL)."""
+        values: npt.NDArray[np.float64] = self.series(ordinal).to_numpy(
+            dtype=np.float64
+        )
+        return values
+
+    def texts(self, ordinal: int) -> npt.NDArray[np.object_]:
+        """Values of a string column with ``""`` where NULL."""
+        values: npt.NDArray[np.object_] = self.series(ordinal).to_numpy(
+            dtype=object, copy=True
+        )
+        values[self.nulls(ordinal)] = ""
+        return values
+
+
+class PandasExecutor(SharedExecutor):
+    """:class:`SharedExecutor` that runs simple statements on DataFrames.
+
+    See the module docstring for what is vectorized; any other statement
+    is executed by the base class.
+    """
+
+    def __init__(self, backend: PandasBackend, **options: Any) -> None:
+        super().__init__(backend, **options)
+        self._frames = backend
+
+    def execute(
+        self,
+        parsed: dict[str, Any],
+        *,
+        _reset_subquery_cache: bool = True,
+    ) -> ExecutionResult:
+        result = self._execute_vectorized(parsed)
+        if result is not None:
+            if _reset_subquery_cache:
+                self._subquery_cache.clear()
+            return result
+        return super().execute(parsed, _reset_subquery_cache=_reset_subquery_cache)
+
+    def _execute_vectorized(self, parsed: dict[str, Any]) -> ExecutionResult | None:
+        action = parsed.get("action")
+        if action not in {"SELECT", "UPDATE", "DELETE"}:
+            return None
+        if parsed.get("ctes") or self._outer_row_stack:
+            return None
+        if action == "SELECT" and (
+            parsed.get("joins") is not None
+            or parsed.get("distinct")
+            or parsed.get("having")
+        ):
+            return None
+        table = parsed.get("table")
+        if not isinstance(table, str) or self._resolve_cte_name(table) is not None:
+            return None
+        sheet_name = self._resolve_sheet_name(table)
+        if sheet_name is None:
+            return None
+        self._ensure_writable(action)
+
+        frame = self._frames.read_frame(sheet_name)
+        headers = _normalize_headers([str(column) for column in frame.columns])
+        if not headers:
+            return None
+        if action == "SELECT":
+            source_refs: set[str] = set()
+            from_entry = parsed.get("from")
+            if isinstance(from_entry, dict):
+                for key in ("table", "ref"):
+                    if isinstance(from_entry.get(key), str):
+                        source_refs.add(from_entry[key])
+            return self._select(
+                parsed, table, sheet_name, _SheetColumns(frame, headers, source_refs)
+            )
+        if not _rewritable(frame):
+            return None
+        self._frames.check_frame_memory(sheet_name, frame)
+        sheet = _SheetColumns(frame, headers, {table})
+        if action == "UPDATE":
+            return self._update(parsed, sheet_name, headers, sheet)
+        return self._delete(parsed, sheet_name, headers, sheet)
+
+    # -- WHERE -------------------------------------------------------------
+
+    def _matching_rows(self, where: Any, sheet: _SheetColumns) -> Mask | None:
+        """Rows where *where* is TRUE, or ``None`` if it cannot be vectorized."""
+        if not where:
+            return np.ones(sheet.row_count, dtype=bool)
+        truth = self._where(where, sheet)
+        return None if truth is None else truth.true
+
+    def _where(self, node: dict[str, Any], sheet: _SheetColumns) -> _Truth | None:
+        node_type = node.get("type")
+        if node_type == "exists":
+            return None
+        if node_type == "not":
+            inner = self._where(node["operand"], sheet)
+            return None if inner is None else _Truth(inner.false, inner.true)
+        if "conditions" in node:
+            parts: list[_Truth] = []
+            for condition in node["conditions"]:
+                part = self._where(condition, sheet)
+                if part is None:
+                    return None
+                parts.append(part)
+            if not parts:
+                return None
+            result = parts[0]
+            for conjunction, part in zip(node["conjunctions"], parts[1:]):
+                if conjunction == "AND":
+                    result = _Truth(result.true & part.true, result.false | part.false)
+                else:
+                    result = _Truth(result.true | part.true, result.false & part.false)
+            return result
+        return self._condition(node, sheet)
+
+    def _condition(
+        self, condition: dict[str, Any], sheet: _SheetColumns
+    ) -> _Truth | None:
+        """Masks for ``<column> <op> <literals>`` under ``_evaluate_condition``."""
+        ordinal = sheet.ordinal(condition.get("column"))
+        if ordinal is None:
+            return None
+        operator_name = condition.get("operator")
+        value = condition.get("value")
+        nulls = sheet.nulls(ordinal)
+        present = ~nulls
+        unknown = np.zeros(sheet.row_count, dtype=bool)
+
+        if operator_name in {"IS", "IS NOT"} and value is None:
+            if operator_name == "IS":
+                return _Truth(nulls, present)
+            return _Truth(present, nulls)
+
+        if operator_name in {"IN", "NOT IN"}:
+            candidates: tuple[Any, ...]
+            if value is None:
+                candidates = ()
+            elif isinstance(value, (list, tuple)):
+                candidates = tuple(value)
+            elif isinstance(value, dict) or isinstance(value, str):
+                return None
+            else:
+                candidates = (value,)
+            matched = np.zeros(sheet.row_count, dtype=bool)
+            has_null = False
+            for candidate in candidates:
+                if candidate is None:
+                    has_null = True
+                    continue
+                equal = self._compare(sheet, ordinal, operator.eq, candidate)
+                if equal is None:
+                    return None
+                matched |= equal
+            found = present & matched
+            # Without a match the result is NULL when the list holds NULL.
+            missed = unknown if has_null else present & ~matched
+            if operator_name == "IN":
+                return _Truth(found, missed)
+            return _Truth(missed, found)
+
+        if operator_name in {"BETWEEN", "NOT BETWEEN"}:
+            if not isinstance(value, (list, tuple)) or len(value) != 2:
+                return None
+            low, high = value
+            if isinstance(low, dict) or isinstance(high, dict):
+                return None
+            if low is None or high is None:
+                return _Truth(unknown, unknown)
+            above = self._compare(sheet, ordinal, operator.ge, low)
+            below = self._compare(sheet, ordinal, operator.le, high)
+            if above is None or below is None:
+                return None
+            inside = present & above & below
+            outside = present & ~(above & below)
+            if operator_name == "BETWEEN":
+                return _Truth(inside, outside)
+            return _Truth(outside, inside)
+
+        compare = (
+            COMPARISON_OPERATORS.get(operator_name)
+            if isinstance(operator_name, str)
+            else None
+        )
+        if compare is None:
+            return None
+        if value is None:
+            return _Truth(unknown, unknown)
+        matches = self._compare(sheet, ordinal, compare, value)
+        if matches is None:
+            return None
+        return _Truth(present & matches, present & ~matches)
+
+    def _compare(
+        self,
+        sheet: _SheetColumns,
+        ordinal: int,
+        compare: Callable[[Any, Any], Any],
+        literal: Any,
+    ) -> Mask | None:
+        """``<column> <op> <literal>`` for every row; only meaningful where not NULL.
+
+        Returns ``None`` unless the comparison is known to agree with
+        ``_coerce_for_compare`` for every value of the column: the literal
+        is paired with the column as ``_literal_comparison`` says, and the
+        column holds that form already.
+        """
+        if isinstance(literal, dict) or (
+            # A bare identifier that names a column reads that column.
+            isinstance(literal, str) and sheet.ordinal(literal) is not None
+        ):
+            return None
+        kind = sheet.kind(ordinal)
+        if kind == _NUMBER:
+            form = self._literal_comparison(literal, NUMERIC)
+            if form is not None and form[0] == NUMERIC:
+                return np.asarray(compare(sheet.numbers(ordinal), form[1]), dtype=bool)
+        elif kind == _STRING:
+            # String columns may hold numeric or date text, so only literals
+            # compared as text against any value are vectorized.
+            form = self._literal_comparison(literal, MIXED)
+            if form is not None and form[0] == TEXT:
+                return np.asarray(compare(sheet.texts(ordinal), form[1]), dtype=bool)
+        return None
+
+    # -- SELECT ------------------------------------------------------------
+
+    def _select(
+        self, parsed: dict[str, Any], table: str, sheet_name: str, sheet: _SheetColumns
+    ) -> ExecutionResult | None:
+        columns = parsed["columns"]
+        group_by = parsed.get("group_by")
+        where = parsed.get("where")
+        matching = self._matching_rows(where, sheet)
+        if matching is None:
+            return None
+        selection = np.flatnonzero(matching)
+        if self._frames.max_memory_mb is not None:
+            # Count what a pushed-down read would convert: the referenced
+            # columns of the matching rows.
+            part = sheet.frame
+            names = self._projection_columns(parsed, table)
+            if names is not None:
+                part = part.iloc[:, _projected_ordinals(sheet.headers, names)]
+            if where:
+                part = part.take(selection)
+            self._frames.check_frame_memory(sheet_name, part)
+        if group_by is not None or any(
+            self._is_aggregate_column(column) for column in columns
+        ):
+            if columns == ["*"]:
+                return None
+            return self._grouped_select(parsed, sheet, selection)
+        return self._plain_select(parsed, sheet, selection)
+
+    def _plain_select(
+        self, parsed: dict[str, Any], sheet: _SheetColumns, selection: Positions
+    ) -> ExecutionResult | None:
+        columns = parsed["columns"]
+        headers = sheet.headers
+        header_index = self._build_header_index(headers)
+        ordinals: list[int] = []
+        output_names: list[str] = []
+        if columns == ["*"]:
+            ordinals = list(range(len(headers)))
+            output_names = list(headers)
+        else:
+            for column in columns:
+                inner = self._unwrap_alias(column)
+                is_plain_column = (isinstance(inner, str) and inner != "*") or (
+                    isinstance(inner, dict) and inner.get("type") == "column"
+                )
+                if not is_plain_column:
+                    return None
+                ordinal = self._resolve_header_index(
+                    self._source_key(column), header_index
+                )
+                if ordinal is None:
+                    return None
+                ordinals.append(ordinal)
+                output_names.append(self._output_name(column))
+
+        offset, limit = self._resolve_pagination(parsed)
+        order_by = self._normalize_order_by(parsed.get("order_by"))
+        if order_by:
+            alias_map = self._build_alias_map(columns)
+            available = {header.casefold() for header in headers}
+            sort_keys: list[npt.NDArray[Any]] = []
+            for item in order_by:
+                name = str(item["column"])
+                name = alias_map.get(name, name)
+                ordinal = sheet.ordinal(name)
+                if name.casefold() not in available or ordinal is None:
+                    return None
+                keys = self._sort_keys(
+                    sheet, ordinal, selection, descending=item["direction"] == "DESC"
+                )
+                if keys is None:
+                    return None
+                sort_keys.extend(keys)
+            # lexsort is stable and takes its primary key last.
+            selection = selection[np.lexsort(sort_keys[::-1])]
+        selection = selection[offset : None if limit is None else offset + limit]
+
+        gathered = [
+            self._frames._column_values(sheet.series(ordinal).take(selection))
+            for ordinal in ordinals
+        ]
+        rows_out = list(zip(*gathered))
+        return self._result("SELECT", rows_out, output_names)
+
+    def _sort_keys(
+        self,
+        sheet: _SheetColumns,
+        ordinal: int,
+        selection: Positions,
+        *,
+        descending: bool,
+    ) -> list[npt.NDArray[Any]] | None:
+        """Null-placement and value keys that order rows like ``_order_by_key``.
+
+        NULLs sort last, or first under DESC.  A descending key is the
+        negated ascending one, so ties keep their input order either way.
+        """
+        nulls = sheet.nulls(ordinal)[selection]
+        kind = sheet.kind(ordinal)
+        values: npt.NDArray[Any]
+        if kind == _NUMBER:
+            values = sheet.numbers(ordinal)[selection]
+        elif kind == _STRING:
+            texts = sheet.texts(ordinal)[selection]
+            # Strings that look like numbers or dates sort as those.
+            present = pd.unique(texts[~nulls])
+            if len(present) and self._column_affinity(present) != TEXT:
+                return None
+            codes, _ = pd.factorize(texts, sort=True)
+            values = codes.astype(np.float64)
+        else:
+            return None
+        values = np.where(nulls, 0.0, values)
+        if descending:
+            return [~nulls, -values]
+        return [nulls, values]
+
+    def _grouped_select(
+        self, parsed: dict[str, Any], sheet: _SheetColumns, selection: Positions
+    ) -> ExecutionResult | None:
+        columns = parsed["columns"]
+        group_by = parsed.get("group_by") or []
+        headers = sheet.headers
+
+        key_sources: list[str] = []
+        key_ordinals: list[int] = []
+        for expression in group_by:
+            ordinal = sheet.ordinal(expression)
+            if ordinal is None or not self._groupable(sheet, ordinal):
+                return None
+            key_sources.append(self._source_key(expression))
+            key_ordinals.append(ordinal)
+
+        output_names: list[str] = []
+        output_sources: list[str] = []
+        aggregates: dict[str, tuple[str, int | None]] = {}
+        for column in columns:
+            inner = self._unwrap_alias(column)
+            if self._is_aggregate_column(inner):
+                func = str(inner["func"]).upper()
+                if (
+                    func not in _AGGREGATES
+                    or inner.get("distinct")
+                    or inner.get("filter") is not None
+                ):
+                    return None
+                arg = self._normalize_single_source_aggregate_arg(
+                    str(inner["arg"]), headers
+                )
+                arg_ordinal: int | None = None
+                if arg != "*":
+                    if arg not in headers:
+                        return None
+                    arg_ordinal = headers.index(arg)
+                elif func != "COUNT":
+                    return None
+                source = self._aggregate_label(inner)
+                aggregates[source] = (func, arg_ordinal)
+            else:
+                source = self._source_key(column)
+                if source not in key_sources:
+                    return None
+            output_names.append(self._output_name(column))
+            output_sources.append(source)
+
+        order_by = self._normalize_order_by(parsed.get("order_by"))
+        if order_by:
+            if not group_by:
+                return None
+            alias_map = self._build_alias_map(columns)
+            resolved_order_by: list[dict[str, Any]] = []
+            for item in order_by:
+                name = str(item["column"])
+                name = alias_map.get(name, name)
+                if name not in aggregates and name not in key_sources:
+                    return None
+                resolved_order_by.append(dict(item, column=name))
+            order_by = resolved_order_by
+        offset, limit = self._resolve_pagination(parsed)
+
+        # Group numbers in order of first appearance, like the dict of groups.
+        group_ids: Positions = np.zeros(len(selection), dtype=np.intp)
+        for ordinal in key_ordinals:
+            codes, uniques = pd.factorize(
+                sheet.series(ordinal).to_numpy()[selection], use_na_sentinel=False
+            )
+            group_ids, _ = pd.factorize(group_ids * len(uniques) + codes)
+        if group_by:
+            group_count = int(group_ids.max()) + 1 if len(selection) else 0
+        else:
+            group_count = 1
+
+        values_by_source: dict[str, list[Any]] = {}
+        for source, (func, arg_ordinal) in aggregates.items():
+            values = self._aggregate(
+                func, sheet, arg_ordinal, selection, group_ids, group_count
+            )
+            if values is None:
+                return None
+            values_by_source[source] = values
+        if key_ordinals:
+            _, first_positions = np.unique(group_ids, return_index=True)
+            first_rows = selection[first_positions]
+            for source, ordinal in zip(key_sources, key_ordinals):
+                values_by_source[source] = list(
+                    self._frames._column_values(sheet.series(ordinal).take(first_rows))
+                )
+
+        groups = [
+            {source: values[group] for source, values in values_by_source.items()}
+            for group in range(group_count)
+        ]
+        if order_by:
+            groups = self._apply_order_by(
+                groups,
+                order_by,
+                value_getter=lambda group, name: group[name],
+                limit=None if limit is None else offset + limit,
+            )
+        groups = groups[offset : None if limit is None else offset + limit]
+        rows_out = [
+            tuple(group[source] for source in output_sources) for group in groups
+        ]
+        return self._result("SELECT", rows_out, output_names)
+
+    @staticmethod
+    def _groupable(sheet: _SheetColumns, ordinal: int) -> bool:
+        kind = sheet.kind(ordinal)
+        if kind == _NUMBER:
+            return not _has_negative_zero(sheet.series(ordinal).to_numpy())
+        return kind == _STRING
+
+    def _aggregate(
+        self,
+        func: str,
+        sheet: _SheetColumns,
+        ordinal: int | None,
+        selection: Positions,
+        group_ids: Positions,
+        group_count: int,
+    ) -> list[Any] | None:
+        """Per-group values of an aggregate with ``_compute_aggregate`` semantics."""
+        if func == "COUNT":
+            if ordinal is None:
+                counted = group_ids
+            else:
+                counted = group_ids[~sheet.nulls(ordinal)[selection]]
+            return [int(count) for count in np.bincount(counted, minlength=group_count)]
+        assert ordinal is not None
+        if not len(selection):
+            return [None] * group_count
+        series = sheet.series(ordinal)
+        values = series.to_numpy()[selection]
+        kind = series.dtype.kind
+        if kind in "iu":
+            # Integers aggregate as floats; they must convert, and sum,
+            # exactly for the results to match.
+            magnitude = float(np.abs(values.astype(np.float64)).max())
+            if func in {"SUM", "AVG"}:
+                magnitude *= len(values)
+            if magnitude > _EXACT_INT_LIMIT:
+                return None
+        elif kind != "f" or func in {"SUM", "AVG"} or _has_negative_zero(values):
+            # Float sums depend on the order of additions.
+            return None
+
+        if func in {"SUM", "AVG"}:
+            sums = np.bincount(
+                group_ids, weights=values.astype(np.float64), minlength=group_count
+            ).tolist()
+            if func == "SUM":
+                return [float(total) for total in sums]
+            counts = np.bincount(group_ids, minlength=group_count).tolist()
+            return [total / count for total, count in zip(sums, counts)]
+        grouped = pd.Series(values).groupby(group_ids)
+        extremes = (grouped.min() if func == "MIN" else grouped.max()).tolist()
+        return [None if value != value else value for value in extremes]
+
+    # -- UPDATE / DELETE ---------------------------------------------------
+
+    def _update(
+        self,
+        parsed: dict[str, Any],
+        sheet_name: str,
+        headers: list[str],
+        sheet: _SheetColumns,
+    ) -> ExecutionResult | None:
+        header_index = self._build_header_index(headers)
+        # Literal assignments to the same column: the last one wins.
+        assignments: dict[int, Any] = {}
+        for update in parsed["set"]:
+            ordinal = self._resolve_header_index(update["column"], header_index)
+            if ordinal is None:
+                return None
+            raw_value = update["value"]
+            if isinstance(raw_value, dict):
+                if raw_value.get("type") != "literal":
+                    return None
+                value = raw_value.get("value")
+            elif isinstance(raw_value, str):
+                return None
+            else:
+                value = raw_value
+            if self.sanitize_formulas:
+                value = sanitize_cell_value(value)
+            kind = sheet.kind(ordinal)
+            if value is None:
+                fits = kind is not None
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                fits = kind == _NUMBER
+            else:
+                fits = isinstance(value, str) and kind == _STRING
+            if not fits:
+                return None
+            assignments[ordinal] = value
+
+        matching = self._matching_rows(parsed.get("where"), sheet)
+        if matching is None:
+            return None
+        arrays: dict[str, Any] = {}
+        for ordinal, header in enumerate(headers):
+            series = sheet.series(ordinal)
+            if ordinal in assignments and sheet.row_count and matching.all():
+                # A column rebuilt from one repeated value gets that value's
+                # dtype, as ``write_sheet`` would infer it.
+                series = pd.Series([assignments[ordinal]] * sheet.row_count)
+            elif ordinal in assignments:
+                series = series.mask(matching, assignments[ordinal])
+            arrays[header] = series.to_numpy()
+        self._frames.replace_frame(sheet_name, pd.DataFrame(arrays))
+        return self._result("UPDATE", [], [], rowcount=int(matching.sum()))
+
+    def _delete(
+        self,
+        parsed: dict[str, Any],
+        sheet_name: str,
+        headers: list[str],
+        sheet: _SheetColumns,
+    ) -> ExecutionResult | None:
+        matching = self._matching_rows(parsed.get("where"), sheet)
+        if matching is None:
+            return None
+        kept = ~matching
+        arrays = {
+            header: sheet.series(ordinal).to_numpy()[kept]
+            for ordinal, header in enumerate(headers)
+        }
+        self._frames.replace_frame(sheet_name, pd.DataFrame(arrays))
+        return self._result("DELETE", [], [], rowcount=int(matching.sum()))
+
+    @staticmethod
+    def _result(
+        action: str,
+        rows: list[tuple[Any, ...]],
+        names: list[str],
+        *,
+        rowcount: int | None = None,
+    ) -> ExecutionResult:
+        description: Description = [
+            (name, None, None, None, None, None, None) for name in names
+        ]
+        return ExecutionResult(
+            action=action,
+            rows=rows,
+            description=description,
+            rowcount=len(rows) if rowcount is None else rowcount,
+            lastrowid=None,
+        )
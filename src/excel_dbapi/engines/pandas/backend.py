@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Collection, Sequence
 import os
 import re
 import tempfile
@@ -6,12 +6,35 @@ import tempfile
 import pandas as pd
 
 from ...exceptions import BackendOperationError, DataError, NotSupportedError
-from ...executor import SharedExecutor
-from ..base import TableData, WorkbookBackend, _normalize_headers
+from ..base import (
+    ColumnarTableData,
+    RowFilter,
+    TableData,
+    WorkbookBackend,
+    _normalize_headers,
+    _pack_column,
+    _projected_ordinals,
+)
 from ..result import ExecutionResult
+from ._executor import PandasExecutor
 
 
 class PandasBackend(WorkbookBackend):
+    """Backend that holds each sheet of a local ``.xlsx`` file as a DataFrame.
+
+    Transactions use the undo log of :class:`WorkbookBackend` with
+    copy-on-write sheets: the first mutating call on a sheet after a
+    snapshot records the sheet's DataFrame and pending rows, and
+    ``restore()`` puts them back.  The backend replaces DataFrames rather
+    than modifying them in place, so the recorded frame is shared rather
+    than copied and untouched sheets cost nothing.  Frames reached through
+    :attr:`data` can be changed in place, so accessing it during a
+    transaction, and every snapshot after it was first accessed, records a
+    deep copy of every DataFrame instead.
+
+    Statements run on :class:`PandasExecutor`, which evaluates simple
+    single-sheet statements with DataFrame operations.
+    """
 
     @property
     def readonly(self) -> bool:
@@ -21,6 +44,18 @@ class PandasBackend(WorkbookBackend):
     def supports_transactions(self) -> bool:
         return True
 
+    @property
+    def supports_predicate_pushdown(self) -> bool:
+        return True
+
+    @property
+    def supports_versioning(self) -> bool:
+        return True
+
+    @property
+    def supports_projection_pushdown(self) -> bool:
+        return True
+
     def __init__(
         self,
         file_path: str,
@@ -42,10 +77,34 @@ class PandasBackend(WorkbookBackend):
             **options,
         )
         self._data_only = data_only
-        self.data: dict[str, pd.DataFrame] = {}
+        self._data: dict[str, pd.DataFrame] = {}
+        self._data_exposed = False
+        # Undo log position just after the latest copy of every sheet.
+        self._copied_at: tuple[int, int] | None = None
         self._pending_rows: dict[str, list[dict[str, Any]]] = {}
+        # Sheets whose state at the latest snapshot is already recorded.
+        self._preserved: set[str] = set()
         self.load()
 
+    @property
+    def data(self) -> dict[str, pd.DataFrame]:
+        """DataFrames by sheet name; see the class docstring for transactions."""
+        self._expose_data()
+        return self._data
+
+    @data.setter
+    def data(self, data: dict[str, pd.DataFrame]) -> None:
+        self._expose_data()
+        self._data = data
+
+    def _expose_data(self) -> None:
+        # The caller may now change frames in place, which the log cannot
+        # see: copy them unless a copy already covers every change since.
+        self._data_exposed = True
+        log = self._undo_log
+        if log is not None and self._copied_at != (self._undo_generation, len(log)):
+            self._preserve_all()
+
     def load(self) -> None:
         if self.create and (
             not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0
@@ -55,9 +114,11 @@ class PandasBackend(WorkbookBackend):
             wb = Workbook()
             wb.save(self.file_path)
             wb.close()
-        self.data = pd.read_excel(self.file_path, sheet_name=None)
-        for sheet_name, frame in self.data.items():
+        self._data = pd.read_excel(self.file_path, sheet_name=None)
+        for sheet_name, frame in self._data.items():
             self._validate_columns(sheet_name, frame.columns)
+        self._reset_undo()
+        self._sheet_changed()
 
     def _validate_columns(self, sheet_name: str, columns: pd.Index) -> None:
         normalized_headers: set[str] = set()
@@ -96,8 +157,8 @@ class PandasBackend(WorkbookBackend):
         pending = self._pending_rows.get(sheet_name)
         if not pending:
             return
-        frame = self.data[sheet_name]
-        self.data[sheet_name] = pd.concat(
+        frame = self._data[sheet_name]
+        self._data[sheet_name] = pd.concat(
             [frame, pd.DataFrame(pending)], ignore_index=True
         )
         del self._pending_rows[sheet_name]
@@ -114,90 +175,241 @@ class PandasBackend(WorkbookBackend):
                 temp_file = handle.name
             os.chmod(temp_file, 0o600)
             with pd.ExcelWriter(temp_file, engine="openpyxl") as writer:
-                for sheet_name, frame in self.data.items():
+                for sheet_name, frame in self._data.items():
                     frame.to_excel(writer, sheet_name=sheet_name, index=False)
             os.replace(temp_file, self.file_path)
+            self._reset_undo()
         finally:
             if temp_file and os.path.exists(temp_file):
                 os.unlink(temp_file)
 
-    def snapshot(self) -> dict[str, pd.DataFrame]:
-        for name in list(self._pending_rows):
-            self._flush_pending(name)
-        return {name: frame.copy(deep=True) for name, frame in self.data.items()}
+    def snapshot(self) -> Any:
+        self._preserved.clear()
+        marker = self._begin_undo()
+        if self._data_exposed:
+            self._preserve_all()
+        return marker
 
     def restore(self, snapshot: Any) -> None:
-        self._pending_rows.clear()
-        self.data = {name: frame.copy(deep=True) for name, frame in snapshot.items()}
+        self._undo_to(snapshot)
+        self._preserved.clear()
+        self._sheet_changed()
+
+    def _preserve(self, sheet_name: str) -> None:
+        """Record the state of *sheet_name* before its first change since the snapshot."""
+        if not self._recording_undo or sheet_name in self._preserved:
+            return
+        self._preserved.add(sheet_name)
+        order = list(self._data)
+        frame = self._data.get(sheet_name)
+        pending = self._pending_rows.get(sheet_name, [])
+        pending_count = len(pending)
+
+        def restore() -> None:
+            # Later changes to other sheets are already undone, so apart
+            # from this sheet the workbook holds the same sheets as when
+            # this was recorded.
+            data: dict[str, pd.DataFrame] = {}
+            for name in order:
+                if name == sheet_name:
+                    assert frame is not None
+                    data[name] = frame
+                elif name in self._data:
+                    data[name] = self._data[name]
+            self._data = data
+            if pending_count:
+                self._pending_rows[sheet_name] = pending[:pending_count]
+            else:
+                self._pending_rows.pop(sheet_name, None)
+
+        self._record_undo(restore)
+
+    def _preserve_all(self) -> None:
+        """Record deep copies of every sheet, for changes made through :attr:`data`."""
+        log = self._undo_log
+        if log is None:
+            return
+        frames = {name: frame.copy(deep=True) for name, frame in self._data.items()}
+        pending = {name: list(rows) for name, rows in self._pending_rows.items()}
+
+        def restore() -> None:
+            self._data = frames
+            self._pending_rows = pending
+
+        self._record_undo(restore)
+        self._copied_at = (self._undo_generation, len(log))
 
     def list_sheets(self) -> list[str]:
-        return list(self.data.keys())
+        return list(self._data.keys())
+
+    def read_frame(self, sheet_name: str) -> pd.DataFrame:
+        """Return the sheet's DataFrame with buffered rows included.
 
-    def read_sheet(self, sheet_name: str) -> TableData:
+        The frame is shared with the backend and must not be modified; use
+        :meth:`replace_frame` to change the sheet.  Unlike :meth:`read_sheet`
+        this does not apply ``max_memory_mb``; see :meth:`check_frame_memory`.
+        """
         self._flush_pending(sheet_name)
-        frame = self.data.get(sheet_name)
+        frame = self._data.get(sheet_name)
+        if frame is None:
+            raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
+        self._check_row_limit(sheet_name, len(frame.index))
+        return frame
+
+    def check_frame_memory(self, sheet_name: str, frame: pd.DataFrame) -> None:
+        """Apply ``max_memory_mb`` to the part of a sheet a statement converts."""
+        if self.max_memory_mb is not None:
+            self._check_memory_limit(
+                sheet_name, int(frame.memory_usage(index=True, deep=True).sum())
+            )
+
+    def replace_frame(self, sheet_name: str, frame: pd.DataFrame) -> None:
+        """Make *frame* the sheet's DataFrame, replacing its rows."""
+        if sheet_name not in self._data:
+            self._pending_rows.pop(sheet_name, None)
+            raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
+        self._preserve(sheet_name)
+        self._pending_rows.pop(sheet_name, None)
+        self._data[sheet_name] = frame
+        self._sheet_changed(sheet_name)
+
+    def read_sheet(
+        self,
+        sheet_name: str,
+        *,
+        predicate: RowFilter | None = None,
+        columns: Collection[str] | None = None,
+    ) -> TableData:
+        self._flush_pending(sheet_name)
+        frame = self._data.get(sheet_name)
         if frame is None:
             raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
 
         row_count = len(frame.index)
         self._check_row_limit(sheet_name, row_count)
-        approx_bytes = int(frame.memory_usage(index=True, deep=True).sum())
-        self._check_memory_limit(sheet_name, approx_bytes)
-
         headers = _normalize_headers([str(col) for col in frame.columns])
-        rows: list[list[Any]] = []
-        for row in frame.itertuples(index=False, name=None):
-            row_values: list[Any] = []
-            for value in row:
-                if pd.isna(value):
-                    row_values.append(None)
-                else:
-                    row_values.append(value)
-            rows.append(row_values)
-        return TableData(headers=headers, rows=rows)
+        if columns is not None:
+            ordinals = _projected_ordinals(headers, columns)
+            if len(ordinals) < len(headers):
+                frame = frame.iloc[:, ordinals]
+                headers = [headers[ordinal] for ordinal in ordinals]
+        if predicate is not None:
+            frame = frame.take(self._matching_positions(frame, headers, predicate))
+        self.check_frame_memory(sheet_name, frame)
+
+        column_values = [
+            self._column_values(frame.iloc[:, position])
+            for position in range(len(frame.columns))
+        ]
+        return ColumnarTableData(headers, column_values)
+
+    def _matching_positions(
+        self, frame: pd.DataFrame, headers: list[str], predicate: RowFilter
+    ) -> list[int]:
+        """Evaluate *predicate* against *frame* and return the kept row positions.
+
+        Only the columns the filter reads are converted when it can run column
+        by column; otherwise rows are converted one at a time for the test.
+        """
+        converted: dict[int, Sequence[Any]] = {}
+
+        def column(index: int) -> Sequence[Any]:
+            if index not in converted:
+                converted[index] = self._column_values(frame.iloc[:, index])
+            return converted[index]
+
+        positions = predicate.bind_columns(headers)(column, len(frame.index))
+        if positions is not None:
+            return positions
+        test = predicate.bind(headers)
+        return [
+            position
+            for position, row in enumerate(frame.itertuples(index=False, name=None))
+            if test([None if pd.isna(value) else value for value in row])
+        ]
+
+    @staticmethod
+    def _column_values(series: pd.Series) -> Sequence[Any]:
+        if series.dtype.kind in "iu":
+            # Integer dtypes cannot hold missing values.
+            return _pack_column(series.tolist())
+        return _pack_column([None if pd.isna(value) else value for value in series])
 
     def write_sheet(self, sheet_name: str, data: TableData) -> None:
-        self._pending_rows.pop(sheet_name, None)
-        if sheet_name not in self.data:
+        if sheet_name not in self._data:
+            self._pending_rows.pop(sheet_name, None)
             raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
-        self.data[sheet_name] = pd.DataFrame(data.rows, columns=pd.Series(data.headers))
+        self.replace_frame(
+            sheet_name, pd.DataFrame(data.rows, columns=pd.Series(data.headers))
+        )
 
     def append_row(self, sheet_name: str, row: list[Any]) -> int:
-        frame = self.data.get(sheet_name)
+        frame = self._data.get(sheet_name)
         if frame is None:
             raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
         row_data = {col: None for col in frame.columns}
         for idx, col in enumerate(frame.columns):
             if idx < len(row):
                 row_data[col] = row[idx]
+        self._preserve(sheet_name)
         self._pending_rows.setdefault(sheet_name, []).append(row_data)
+        self._sheet_changed(sheet_name)
         pending_count = len(self._pending_rows.get(sheet_name, []))
         return len(frame) + pending_count + 1
 
+    def append_rows(
+        self, sheet_name: str, rows: Sequence[list[Any]]
+    ) -> tuple[int, int]:
+        """Append *rows* to the sheet's DataFrame with a single concat."""
+        if sheet_name not in self._data:
+            raise BackendOperationError(f"Sheet '{sheet_name}' not found in Excel")
+        if not rows:
+            raise BackendOperationError("append_rows requires at least one row")
+        self._preserve(sheet_name)
+        self._flush_pending(sheet_name)
+        frame = self._data[sheet_name]
+        width = len(frame.columns)
+        batch = pd.DataFrame(
+            [list(row[:width]) + [None] * (width - len(row)) for row in rows],
+            columns=frame.columns,
+        )
+        self._data[sheet_name] = pd.concat([frame, batch], ignore_index=True)
+        self._sheet_changed(sheet_name)
+        first_row = len(frame) + 2  # 1-based, after the header row
+        return first_row, first_row + len(rows) - 1
+
     def create_sheet(self, name: str, headers: list[str]) -> None:
-        if name in self.data:
+        if name in self._data:
             raise BackendOperationError(f"Sheet '{name}' already exists")
-        self.data[name] = pd.DataFrame(columns=pd.Series(headers))
+        self._preserve(name)
+        self._data[name] = pd.DataFrame(columns=pd.Series(headers))
+        self._sheet_changed(name)
 
     def drop_sheet(self, name: str) -> None:
-        self._pending_rows.pop(name, None)
-        if name not in self.data:
+        if name not in self._data:
+            self._pending_rows.pop(name, None)
             raise BackendOperationError(f"Sheet '{name}' not found in Excel")
-        del self.data[name]
+        self._preserve(name)
+        self._pending_rows.pop(name, None)
+        del self._data[name]
+        self._sheet_changed(name)
 
     def get_workbook(self) -> Any:
         raise NotSupportedError(
             f"Backend '{type(self).__name__}' does not expose a workbook object"
         )
 
+    def create_executor(self, **options: Any) -> PandasExecutor:
+        return PandasExecutor(self, **options)
+
     def execute(self, query: str) -> ExecutionResult:
-        return SharedExecutor(
-            self, sanitize_formulas=self.sanitize_formulas
+        return self.create_executor(
+            sanitize_formulas=self.sanitize_formulas
         ).execute_with_params(query, None)
 
     def execute_with_params(
         self, query: str, params: tuple[Any, ...] | None = None
     ) -> ExecutionResult:
-        return SharedExecutor(
-            self, sanitize_formulas=self.sanitize_formulas
+        return self.create_executor(
+            sanitize_formulas=self.sanitize_formulas
         ).execute_with_params(query, params)
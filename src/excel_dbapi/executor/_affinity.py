@@ -0,0 +1,66 @@
+"""Per-column type affinity for comparison and sort-key dispatch.
+
+Comparing or ordering a value goes through ``_coerce_for_compare`` and
+``_sort_key``, which try the temporal form (parsing strings against several
+date formats) and then the numeric form of every value.  When every non-NULL
+value in a column is of one kind, the outcome of those attempts is known in
+advance.  :func:`infer_affinity` classifies a column once so callers can use a
+specialized coercion that skips the attempts that cannot succeed.
+
+Unlike ``reflection._infer_type``, which reports the dominant type of a
+sample, an affinity is exact: a single value of another kind makes the column
+``MIXED`` and callers fall back to the generic coercion.
+"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from typing import Any, Callable, Iterable
+
+NUMERIC = "numeric"
+"""Every non-NULL value is an ``int`` or ``float`` (never ``bool``)."""
+TEMPORAL = "temporal"
+"""Every non-NULL value is a ``date`` or ``datetime`` object."""
+TEXT = "text"
+"""Every non-NULL value is a string that parses as neither a number nor a date."""
+MIXED = "mixed"
+"""Anything else, including columns with no non-NULL values."""
+
+
+def infer_affinity(
+    values: Iterable[Any],
+    to_number: Callable[[Any], float | None],
+    parse_datetime: Callable[[str], Any],
+) -> str:
+    """Classify *values*; stops at the first value that makes them ``MIXED``.
+
+    Each distinct string is parsed once.
+    """
+    if isinstance(values, array):
+        # Typed column arrays only ever hold numbers.
+        return NUMERIC
+    found: str | None = None
+    plain_text: set[str] = set()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            return MIXED
+        if isinstance(value, (int, float)):
+            kind = NUMERIC
+        elif isinstance(value, date):
+            kind = TEMPORAL
+        elif isinstance(value, str):
+            if value not in plain_text:
+                if to_number(value) is not None or parse_datetime(value) is not None:
+                    return MIXED
+                plain_text.add(value)
+            kind = TEXT
+        else:
+            return MIXED
+        if found is None:
+            found = kind
+        elif found != kind:
+            return MIXED
+    return found if found is not None else MIXED
@@ -0,0 +1,552 @@
+"""Compile parsed WHERE and expression trees into Python closures.
+
+:class:`SharedExecutor` interprets the dict AST by walking it for every row.
+:class:`ExpressionCompiler` walks it once per statement instead: column
+lookups, operator dispatch and literal coercion are settled up front, and
+each row is then handled by a single call into nested closures.  Compiled
+closures follow the interpreter's semantics, including SQL three-valued
+logic and which rows raise errors; trees the compiler does not cover (such as
+subqueries) make it return ``None`` so callers keep using the interpreter.
+"""
+
+from __future__ import annotations
+
+from operator import add, eq, ge, gt, le, lt, mul, ne, sub, truediv
+import re
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..exceptions import CapabilityError, ProgrammingError, SqlSemanticError
+from ._affinity import MIXED
+from ._functions import _build_like_regex, _tv_and, _tv_or
+
+if TYPE_CHECKING:
+    from .core import SharedExecutor
+
+RowFunction = Callable[[Any], Any]
+Predicate = Callable[[Any], "bool | None"]
+ColumnGetterFactory = Callable[[str], "RowFunction | None"]
+
+COMPARISON_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "=": eq,
+    "==": eq,
+    "!=": ne,
+    "<>": ne,
+    ">": gt,
+    ">=": ge,
+    "<": lt,
+    "<=": le,
+}
+
+_ARITHMETIC_OPERATORS: dict[str, Callable[[float, float], float]] = {
+    "+": add,
+    "-": sub,
+    "*": mul,
+    "/": truediv,
+}
+
+_LIKE_OPERATORS = frozenset({"LIKE", "NOT LIKE", "ILIKE", "NOT ILIKE"})
+
+
+class _NotCompilable(Exception):
+    """Raised internally for trees that are left to the interpreter."""
+
+
+class _Constant:
+    """Row function that ignores the row; lets callers specialize on literals."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __call__(self, row: Any) -> Any:
+        return self.value
+
+
+def _raiser(factory: Callable[[], Exception]) -> RowFunction:
+    def raise_error(row: Any) -> Any:
+        raise factory()
+
+    return raise_error
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class ExpressionCompiler:
+    """Compile WHERE trees and scalar expressions for one row layout.
+
+    ``column_getter`` maps a column reference to a function that reads it
+    from a row, or returns ``None`` when the reference can never resolve
+    (the interpreter would see ``None`` for it on every row).
+    """
+
+    def __init__(
+        self, executor: SharedExecutor, column_getter: ColumnGetterFactory
+    ) -> None:
+        self._executor = executor
+        self._column_getter = column_getter
+
+    def where(self, node: dict[str, Any]) -> Predicate | None:
+        """Compile a WHERE/ON/HAVING tree into a three-valued predicate."""
+        try:
+            return self._where(node)
+        except _NotCompilable:
+            return None
+
+    def expression(self, expr: Any) -> RowFunction | None:
+        """Compile a scalar expression into a row function."""
+        try:
+            return self._expression(expr)
+        except _NotCompilable:
+            return None
+
+    def literal_test(
+        self, condition: dict[str, Any], affinity: str = MIXED
+    ) -> Callable[[Any], bool | None] | None:
+        """Compile ``<column> <op> <literals>`` into a test on the column value.
+
+        *affinity* is the type affinity of the column's values, which lets
+        the literal comparisons skip coercions those values cannot take.
+        Returns ``None`` when the condition involves anything other than its
+        column and literal operands.
+        """
+        if condition.get("type") == "exists" or "conditions" in condition:
+            return None
+        if not isinstance(condition.get("column"), str):
+            return None
+        try:
+            return self._condition(
+                condition, _identity, literal_only=True, affinity=affinity
+            )
+        except _NotCompilable:
+            return None
+
+    # -- WHERE trees -------------------------------------------------------
+
+    def _where(self, node: dict[str, Any]) -> Predicate:
+        node_type = node.get("type")
+        if node_type == "exists":
+            raise _NotCompilable
+        if node_type == "not":
+            inner = self._where(node["operand"])
+
+            def negate(row: Any) -> bool | None:
+                result = inner(row)
+                return None if result is None else not result
+
+            return negate
+        if "conditions" in node:
+            parts = [self._where(condition) for condition in node["conditions"]]
+            first = parts[0]
+            rest = [
+                (_tv_and if conjunction == "AND" else _tv_or, part)
+                for conjunction, part in zip(node["conjunctions"], parts[1:])
+            ]
+            if not rest:
+                return first
+
+            def combine(row: Any) -> bool | None:
+                result = first(row)
+                for combiner, part in rest:
+                    result = combiner(result, part(row))
+                return result
+
+            return combine
+        row_value = self._operand(node["column"], as_column=True)
+        return self._condition(node, row_value, literal_only=False)
+
+    def _condition(
+        self,
+        condition: dict[str, Any],
+        row_value: RowFunction,
+        *,
+        literal_only: bool,
+        affinity: str = MIXED,
+    ) -> Predicate:
+        operator = condition["operator"]
+        value = condition["value"]
+
+        def operand(raw: Any) -> RowFunction:
+            compiled = self._operand(raw, as_column=False)
+            if literal_only and not isinstance(compiled, _Constant):
+                raise _NotCompilable
+            return compiled
+
+        executor = self._executor
+        coerce_for_compare = executor._coerce_for_compare
+
+        if operator in {"IS", "IS NOT"} and value is None:
+            if operator == "IS":
+                return lambda row: row_value(row) is None
+            return lambda row: row_value(row) is not None
+
+        if operator in {"IN", "NOT IN"}:
+            if value is None:
+                raw_candidates: tuple[Any, ...] = ()
+            elif isinstance(value, (list, tuple)):
+                raw_candidates = tuple(value)
+            elif isinstance(value, dict) or type(value) is str:
+                # Subqueries and bare identifiers resolve to the candidate
+                # list per row; leave those to the interpreter.
+                raise _NotCompilable
+            else:
+                raw_candidates = (value,)
+            candidates = [operand(candidate) for candidate in raw_candidates]
+            found: bool = operator == "IN"
+
+            constants = [
+                candidate.value
+                for candidate in candidates
+                if isinstance(candidate, _Constant)
+            ]
+            if len(constants) == len(candidates):
+                coercers = [
+                    executor._compare_coercer(constant, affinity)
+                    for constant in constants
+                    if constant is not None
+                ]
+                missing: bool | None = (
+                    None if any(constant is None for constant in constants) else not found
+                )
+
+                def member_of_literals(row: Any) -> bool | None:
+                    item = row_value(row)
+                    if item is None:
+                        return None
+                    for coerce in coercers:
+                        left, right = coerce(item)
+                        if left == right:
+                            return found
+                    return missing
+
+                return member_of_literals
+
+            def member(row: Any) -> bool | None:
+                item = row_value(row)
+                if item is None:
+                    return None
+                has_null = False
+                for candidate in candidates:
+                    candidate_value = candidate(row)
+                    if candidate_value is None:
+                        has_null = True
+                        continue
+                    left, right = coerce_for_compare(item, candidate_value)
+                    if left == right:
+                        return found
+                return None if has_null else not found
+
+            return member
+
+        if operator in {"BETWEEN", "NOT BETWEEN"}:
+            if not isinstance(value, (list, tuple)) or len(value) != 2:
+                raise _NotCompilable
+            low = operand(value[0])
+            high = operand(value[1])
+            negated = operator == "NOT BETWEEN"
+
+            if isinstance(low, _Constant) and isinstance(high, _Constant):
+                if low.value is None or high.value is None:
+                    return lambda row: None
+                coerce_low = executor._compare_coercer(low.value, affinity)
+                coerce_high = executor._compare_coercer(high.value, affinity)
+
+                def between_literals(row: Any) -> bool | None:
+                    item = row_value(row)
+                    if item is None:
+                        return None
+                    left_low, right_low = coerce_low(item)
+                    left_high, right_high = coerce_high(item)
+                    inside = bool(left_low >= right_low and left_high <= right_high)
+                    return not inside if negated else inside
+
+                return between_literals
+
+            def between(row: Any) -> bool | None:
+                item = row_value(row)
+                if item is None:
+                    return None
+                low_value = low(row)
+                high_value = high(row)
+                if low_value is None or high_value is None:
+                    return None
+                left_low, right_low = coerce_for_compare(item, low_value)
+                left_high, right_high = coerce_for_compare(item, high_value)
+                inside = bool(left_low >= right_low and left_high <= right_high)
+                return not inside if negated else inside
+
+            return between
+
+        if operator in _LIKE_OPERATORS:
+            return self._like(condition, row_value, operand(value))
+
+        compare = COMPARISON_OPERATORS.get(operator) if isinstance(operator, str) else None
+        if compare is None:
+            # Unsupported operators raise from the interpreter.
+            raise _NotCompilable
+        other = operand(value)
+        if isinstance(other, _Constant):
+            if other.value is None:
+                return lambda row: None
+            coerce = executor._compare_coercer(other.value, affinity)
+
+            def compare_literal(row: Any) -> bool | None:
+                item = row_value(row)
+                if item is None:
+                    return None
+                left, right = coerce(item)
+                return bool(compare(left, right))
+
+            return compare_literal
+
+        def compare_values(row: Any) -> bool | None:
+            item = row_value(row)
+            other_value = other(row)
+            if item is None or other_value is None:
+                return None
+            left, right = coerce_for_compare(item, other_value)
+            return bool(compare(left, right))
+
+        return compare_values
+
+    def _like(
+        self,
+        condition: dict[str, Any],
+        row_value: RowFunction,
+        pattern_value: RowFunction,
+    ) -> Predicate:
+        operator = condition["operator"]
+        escape_value = condition.get("escape")
+        fold = operator in {"ILIKE", "NOT ILIKE"}
+        negated = operator in {"NOT LIKE", "NOT ILIKE"}
+
+        if isinstance(pattern_value, _Constant):
+            pattern = pattern_value.value
+            if pattern is None:
+                return lambda row: None
+            if not isinstance(pattern, str) or not (
+                escape_value is None
+                or (isinstance(escape_value, str) and len(escape_value) == 1)
+            ):
+                # These raise on the first non-NULL row; keep the interpreter's timing.
+                raise _NotCompilable
+            try:
+                regex = _build_like_regex(
+                    pattern.casefold() if fold else pattern, escape_value
+                )
+            except SqlSemanticError:
+                raise _NotCompilable from None
+            matcher = re.compile(regex).match
+
+            def like_literal(row: Any) -> bool | None:
+                item = row_value(row)
+                if item is None:
+                    return None
+                text = str(item)
+                is_match = matcher(text.casefold() if fold else text) is not None
+                return not is_match if negated else is_match
+
+            return like_literal
+
+        def like(row: Any) -> bool | None:
+            item = row_value(row)
+            if item is None:
+                return None
+            pattern = pattern_value(row)
+            if pattern is None:
+                return None
+            if not isinstance(pattern, str):
+                raise CapabilityError("Unsupported LIKE pattern type")
+            if escape_value is not None:
+                if not isinstance(escape_value, str) or len(escape_value) != 1:
+                    raise SqlSemanticError("ESCAPE requires a single character")
+            text = str(item)
+            if fold:
+                text = text.casefold()
+                pattern = pattern.casefold()
+            is_match = bool(re.match(_build_like_regex(pattern, escape_value), text))
+            return not is_match if negated else is_match
+
+        return like
+
+    def _operand(self, operand: Any, *, as_column: bool) -> RowFunction:
+        if isinstance(operand, dict):
+            if operand.get("type") in {"subquery", "exists"}:
+                raise _NotCompilable
+            return self._expression(operand)
+        if as_column:
+            return self._column(str(operand))
+        if type(operand) is str:
+            # A bare identifier reads the column when it holds a value and
+            # otherwise stands for the identifier text itself.
+            getter = self._column_getter(operand)
+            if getter is None:
+                return _Constant(operand)
+            text = operand
+
+            def identifier(row: Any) -> Any:
+                resolved = getter(row)
+                return resolved if resolved is not None else text
+
+            return identifier
+        return _Constant(operand)
+
+    def _column(self, name: str) -> RowFunction:
+        getter = self._column_getter(name)
+        return getter if getter is not None else _Constant(None)
+
+    # -- scalar expressions ------------------------------------------------
+
+    def _expression(self, expr: Any) -> RowFunction:
+        if isinstance(expr, str):
+            return self._column(expr)
+        if not isinstance(expr, dict):
+            return _Constant(expr)
+
+        executor = self._executor
+        expr_type = expr.get("type")
+        if expr_type == "alias":
+            return self._expression(expr.get("expression"))
+        if expr_type == "column":
+            source = expr.get("source", expr.get("table"))
+            if source is None:
+                return _raiser(
+                    lambda: ProgrammingError("Column expression is missing source/table")
+                )
+            return self._column(f"{source}.{expr['name']}")
+        if expr_type == "literal":
+            return _Constant(expr.get("value"))
+        if expr_type == "subquery":
+            raise _NotCompilable
+        if expr_type == "unary_op":
+            unary_op = expr.get("op")
+            if unary_op != "-":
+                return _raiser(
+                    lambda: ProgrammingError(f"Unsupported unary operator: {unary_op}")
+                )
+            return self._negation(self._expression(expr.get("operand")))
+        if expr_type == "binary_op":
+            return self._binary_op(
+                str(expr.get("op")),
+                self._expression(expr.get("left")),
+                self._expression(expr.get("right")),
+            )
+        if expr_type == "function":
+            args = expr.get("args")
+            arg_functions = [
+                self._expression(argument)
+                for argument in (args if isinstance(args, list) else [])
+            ]
+            function_name = str(expr.get("name", ""))
+            call_function = executor._call_function
+            return lambda row: call_function(
+                function_name, [argument(row) for argument in arg_functions]
+            )
+        if expr_type == "cast":
+            cast_value = self._expression(expr.get("value"))
+            target_type = str(expr.get("target_type", ""))
+            eval_cast = executor._eval_cast
+            return lambda row: eval_cast(cast_value(row), target_type)
+        if expr_type == "window_function":
+            return self._column(executor._source_key(expr))
+        if expr_type == "aggregate":
+            return _raiser(
+                lambda: ProgrammingError(
+                    "Aggregate expressions are not supported in row-level arithmetic"
+                )
+            )
+        if expr_type == "case":
+            return self._case(expr)
+        return _raiser(
+            lambda: ProgrammingError(f"Unsupported expression type: {expr_type}")
+        )
+
+    def _negation(self, operand: RowFunction) -> RowFunction:
+        to_number = self._executor._to_number
+
+        def negate(row: Any) -> Any:
+            value = operand(row)
+            if value is None:
+                return None
+            number = to_number(value)
+            if number is None:
+                raise ProgrammingError("Arithmetic expression requires numeric operands")
+            return -number
+
+        return negate
+
+    def _binary_op(
+        self, operator: str, left: RowFunction, right: RowFunction
+    ) -> RowFunction:
+        if operator == "||":
+
+            def concatenate(row: Any) -> Any:
+                left_value = left(row)
+                right_value = right(row)
+                if left_value is None or right_value is None:
+                    return None
+                return f"{left_value}{right_value}"
+
+            return concatenate
+
+        to_number = self._executor._to_number
+        arithmetic = _ARITHMETIC_OPERATORS.get(operator)
+        is_division = operator == "/"
+
+        def calculate(row: Any) -> Any:
+            left_value = left(row)
+            right_value = right(row)
+            if left_value is None or right_value is None:
+                return None
+            left_number = to_number(left_value)
+            right_number = to_number(right_value)
+            if left_number is None or right_number is None:
+                raise ProgrammingError("Arithmetic expression requires numeric operands")
+            if arithmetic is None:
+                raise ProgrammingError(f"Unsupported arithmetic operator: {operator}")
+            if is_division and right_number == 0:
+                raise ProgrammingError("Division by zero in arithmetic expression")
+            return arithmetic(left_number, right_number)
+
+        return calculate
+
+    def _case(self, expr: dict[str, Any]) -> RowFunction:
+        whens = [branch for branch in expr.get("whens", []) if isinstance(branch, dict)]
+        else_expr = expr.get("else")
+        otherwise = self._expression(else_expr) if else_expr is not None else None
+
+        if expr.get("mode", "searched") == "searched":
+            searched = [
+                (self._where(branch["condition"]), self._expression(branch["result"]))
+                for branch in whens
+                if isinstance(branch.get("condition"), dict)
+            ]
+
+            def searched_case(row: Any) -> Any:
+                for condition, result in searched:
+                    if condition(row) is True:
+                        return result(row)
+                return otherwise(row) if otherwise is not None else None
+
+            return searched_case
+
+        case_value = self._expression(expr.get("value"))
+        coerce_for_compare = self._executor._coerce_for_compare
+        simple = [
+            (self._expression(branch["match"]), self._expression(branch["result"]))
+            for branch in whens
+        ]
+
+        def simple_case(row: Any) -> Any:
+            value = case_value(row)
+            for match, result in simple:
+                match_value = match(row)
+                if value is not None and match_value is not None:
+                    left, right = coerce_for_compare(value, match_value)
+                    if left == right:
+                        return result(row)
+            return otherwise(row) if otherwise is not None else None
+
+        return simple_case
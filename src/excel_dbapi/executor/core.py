@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+from array import array
+import bisect
+from contextlib import contextmanager
 import copy
 from datetime import date, datetime, time
+import heapq
 import importlib
+import itertools
 import logging
 import re
 import warnings
-from typing import Any, Callable, Iterator, cast
+from typing import Any, Callable, Iterable, Iterator, NoReturn, Sequence, cast
 
-from ..engines.base import TableData, WorkbookBackend
+from ..engines.base import ColumnarTableData, TableData, WorkbookBackend
 from ..engines.result import Description, ExecutionResult
 from ..exceptions import (
     CapabilityError,
@@ -17,8 +22,11 @@ from ..exceptions import (
     SqlSemanticError,
 )
 from ..parser import _parse_column_expression, parse_sql
+from ..parser.cache import StatementCache
 from ..reflection import METADATA_SHEET
 from ..sanitize import sanitize_cell_value, sanitize_row
+from ._affinity import MIXED, NUMERIC, TEMPORAL, TEXT, infer_affinity
+from ._compiler import COMPARISON_OPERATORS, ExpressionCompiler
 from ._functions import (
     _build_like_regex,
     _READONLY_ACTIONS,
@@ -30,6 +38,269 @@ from ._functions import (
 
 _logger = logging.getLogger(__name__)
 
+# Marks join keys whose comparison semantics depend on the other operand.
+_AMBIGUOUS_KEY = object()
+
+
+class _Descending:
+    """Sort-key wrapper that inverts the ordering of a DESC ORDER BY item."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any) -> None:
+        self.key = key
+
+    def __lt__(self, other: _Descending) -> bool:
+        return bool(other.key < self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and bool(self.key == other.key)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class _PushdownFilter:
+    """``RowFilter`` handed to backends for a single-sheet SELECT's WHERE.
+
+    Rows are tested on their raw values with the compiled predicate, so a
+    backend can drop non-matching rows before it materializes or accounts for
+    them.  Only rows for which the WHERE is TRUE are kept.
+    """
+
+    def __init__(
+        self, executor: SharedExecutor, where: dict[str, Any], source_refs: set[str]
+    ) -> None:
+        self._executor = executor
+        self._where = where
+        self._source_refs = source_refs
+
+    def bind(self, headers: list[str]) -> Callable[[Sequence[Any]], bool]:
+        executor = self._executor
+        where = self._where
+        predicate = executor._row_values_compiler(headers, self._source_refs).where(
+            where
+        )
+        if predicate is not None:
+            compiled = predicate
+            return lambda values: compiled(values) is True
+        source_refs = self._source_refs
+
+        def interpret(values: Sequence[Any]) -> bool:
+            row = executor._build_scoped_row(
+                executor._row_from_values(headers, list(values)),
+                headers=headers,
+                source_refs=source_refs,
+            )
+            return executor._matches_where(row, where)
+
+        return interpret
+
+    def bind_columns(
+        self, headers: list[str]
+    ) -> Callable[[Callable[[int], Sequence[Any]], int], list[int] | None]:
+        executor = self._executor
+        where = self._where
+        ordinals = executor._scoped_column_ordinals(headers, self._source_refs)
+        correlated = bool(executor._outer_row_stack)
+
+        def select(
+            column: Callable[[int], Sequence[Any]], row_count: int
+        ) -> list[int] | None:
+            if correlated:
+                # Outer columns shadow case-insensitive matches; leave those
+                # scans to the row test.
+                return None
+            predicate = executor._compile_columnar_where(where, column, ordinals)
+            if predicate is None:
+                return None
+            positions = list(range(row_count))
+            return [
+                position
+                for position, matched in zip(positions, predicate(positions))
+                if matched is True
+            ]
+
+        return select
+
+
+class _ConflictIndex:
+    """Hash index over the ON CONFLICT target columns of an upsert.
+
+    Maps the ``_equality_key`` tuple of each row's target values to the
+    positions of the rows holding it, so the first conflicting row is found
+    with one lookup instead of comparing against every row.  Rows with a NULL
+    target value never conflict and are not indexed.  Keys whose comparison
+    depends on the other operand (``_AMBIGUOUS_KEY``) cannot be hashed: an
+    ambiguous incoming row is matched by a scan, and an ambiguous stored row
+    turns the index off for the rest of the statement.
+    """
+
+    def __init__(
+        self, executor: SharedExecutor, rows: list[list[Any]], target_indices: list[int]
+    ) -> None:
+        self._executor = executor
+        self._rows = rows
+        self._target_indices = target_indices
+        self._positions: dict[tuple[Any, ...], list[int]] | None = {}
+        for position in range(len(rows)):
+            self.add(position)
+
+    def _key(self, row: Sequence[Any]) -> Any:
+        parts: list[Any] = []
+        for target_index in self._target_indices:
+            value = row[target_index] if target_index < len(row) else None
+            part = self._executor._equality_key(value)
+            if part is None or part is _AMBIGUOUS_KEY:
+                return part
+            parts.append(part)
+        return tuple(parts)
+
+    def add(self, position: int) -> None:
+        """Index the row at *position* under its current target values."""
+        if self._positions is None:
+            return
+        key = self._key(self._rows[position])
+        if key is _AMBIGUOUS_KEY:
+            self._positions = None
+        elif key is not None:
+            bisect.insort(self._positions.setdefault(key, []), position)
+
+    def discard(self, position: int) -> None:
+        """Drop the row at *position* before its target values change."""
+        if self._positions is None:
+            return
+        key = self._key(self._rows[position])
+        if key is None or key is _AMBIGUOUS_KEY:
+            return
+        positions = self._positions.get(key)
+        if positions is not None and position in positions:
+            positions.remove(position)
+            if not positions:
+                del self._positions[key]
+
+    def find(self, incoming: Sequence[Any]) -> int | None:
+        """Position of the first row that conflicts with *incoming*."""
+        key = self._key(incoming)
+        if key is None:
+            return None
+        if self._positions is not None and key is not _AMBIGUOUS_KEY:
+            positions = self._positions.get(key)
+            return positions[0] if positions else None
+        return self._scan(incoming)
+
+    def _scan(self, incoming: Sequence[Any]) -> int | None:
+        coerce_for_compare = self._executor._coerce_for_compare
+        for position, existing_row in enumerate(self._rows):
+            for target_index in self._target_indices:
+                existing_value = (
+                    existing_row[target_index]
+                    if target_index < len(existing_row)
+                    else None
+                )
+                # SQL semantics: NULL never matches NULL for conflict detection
+                if existing_value is None:
+                    break
+                left, right = coerce_for_compare(
+                    existing_value, incoming[target_index]
+                )
+                if left != right:
+                    break
+            else:
+                return position
+        return None
+
+
+class _RunningAggregate:
+    """COUNT/SUM/AVG/MIN/MAX over a growing prefix of ordered rows.
+
+    Rows are added one at a time and :meth:`value` returns what
+    ``_compute_aggregate`` would return for all rows added so far, so a
+    running window aggregate takes one pass instead of one aggregate per
+    prefix.
+    """
+
+    def __init__(
+        self,
+        executor: SharedExecutor,
+        function_name: str,
+        arg: str,
+        *,
+        distinct: bool,
+        sort_key: Callable[[Any], Any],
+    ) -> None:
+        if function_name == "COUNT" and distinct and arg == "*":
+            raise SqlSemanticError("COUNT(DISTINCT *) is not supported")
+        self._executor = executor
+        self._function = function_name
+        self._arg = arg
+        self._distinct_values: set[Any] | None = (
+            set() if function_name == "COUNT" and distinct else None
+        )
+        self._sort_key = sort_key
+        self._count = 0
+        self._total: float = 0
+        self._numeric_count = 0
+        self._best: Any = None
+        self._best_key: Any = None
+
+    def add(self, row: dict[str, Any]) -> None:
+        if self._function == "COUNT" and self._arg == "*":
+            self._count += 1
+            return
+        value = self._executor._resolve_row_value(row, self._arg)
+        if value is None:
+            return
+        self._count += 1
+        if self._function == "COUNT":
+            if self._distinct_values is not None:
+                self._distinct_values.add(value)
+            return
+        if self._function in {"MIN", "MAX"}:
+            key = self._sort_key(value)
+            if (
+                self._count == 1
+                or (self._function == "MIN" and key < self._best_key)
+                or (self._function == "MAX" and key > self._best_key)
+            ):
+                self._best, self._best_key = value, key
+            return
+        numeric = self._executor._to_number(value)
+        if numeric is not None:
+            self._total += numeric
+            self._numeric_count += 1
+
+    def value(self) -> Any:
+        if self._function == "COUNT":
+            if self._distinct_values is not None:
+                return len(self._distinct_values)
+            return self._count
+        if self._function in {"MIN", "MAX"}:
+            return self._best
+        if not self._numeric_count:
+            return None
+        if self._function == "SUM":
+            return self._total
+        return self._total / self._numeric_count
+
+
+class _PendingInserts:
+    """Validated ``INSERT ... VALUES`` rows queued per sheet by ``insert_batch()``."""
+
+    def __init__(self, executor: SharedExecutor) -> None:
+        self._executor = executor
+        self._rows: dict[str, list[list[Any]]] = {}
+
+    def add(self, sheet_name: str, rows: list[list[Any]]) -> None:
+        self._rows.setdefault(sheet_name, []).extend(rows)
+
+    def flush(self) -> int | None:
+        """Append the queued rows, one batch per sheet; return the last row number."""
+        queued, self._rows = self._rows, {}
+        lastrowid: int | None = None
+        for sheet_name, rows in queued.items():
+            lastrowid = self._executor._append_insert_rows(sheet_name, rows)
+        return lastrowid
+
 
 class SharedExecutor:
     def __init__(
@@ -38,13 +309,106 @@ class SharedExecutor:
         *,
         sanitize_formulas: bool = True,
         connection: Any | None = None,
+        statement_cache: StatementCache | None = None,
     ):
         self.backend = backend
         self.sanitize_formulas = sanitize_formulas
         self._connection = connection
+        self._statement_cache = statement_cache
         self._subquery_cache: dict[int, Any] = {}
         self._outer_row_stack: list[dict[str, Any]] = []
         self._cte_tables: dict[str, TableData] = {}
+        # Sheets read while a statement runs, with the backend's version of
+        # the sheet at the time; ``None`` outside statements.  A ``None``
+        # entry records a filtered or projected scan of that version.
+        self._sheet_cache: dict[str, tuple[int, TableData | None]] | None = None
+        # Rows of plain INSERT ... VALUES statements run inside
+        # ``insert_batch()``; ``None`` outside one.
+        self._pending_inserts: _PendingInserts | None = None
+
+    @contextmanager
+    def insert_batch(self) -> Iterator[_PendingInserts]:
+        """Queue the rows of plain ``INSERT ... VALUES`` statements.
+
+        Inside the block such statements validate and sanitize their rows
+        but do not append them; ``flush()`` on the yielded queue appends
+        everything queued so far in one ``append_rows()`` call per sheet.
+        Rows still queued when the block exits are discarded.  The
+        connection wraps ``executemany()`` in one.
+        """
+        previous = self._pending_inserts
+        pending = self._pending_inserts = _PendingInserts(self)
+        try:
+            yield pending
+        finally:
+            self._pending_inserts = previous
+
+    @contextmanager
+    def sheet_cache(self) -> Iterator[None]:
+        """Share sheets read through :meth:`read_sheet` until the block exits.
+
+        Every statement runs inside one; the connection also wraps
+        ``executemany()`` so its iterations share reads.  Nested blocks use
+        the outermost cache.
+        """
+        if self._sheet_cache is not None:
+            yield
+            return
+        self._sheet_cache = {}
+        try:
+            yield
+        finally:
+            self._sheet_cache = None
+
+    def read_sheet(self, sheet_name: str) -> TableData:
+        """Contents of *sheet_name*, converted once per :meth:`sheet_cache` block.
+
+        A cached read is reused while the backend reports the same
+        :meth:`~excel_dbapi.engines.base.WorkbookBackend.sheet_version`, so
+        any write to the sheet makes the next read convert it again.  The
+        result is shared: callers that change it must write it back.
+        Backends without ``supports_versioning`` are read every time.
+        """
+        cache = self._sheet_cache
+        if cache is None or not self.backend.supports_versioning:
+            return self.backend.read_sheet(sheet_name)
+        data = self._cached_sheet(sheet_name)
+        if data is None:
+            version = self.backend.sheet_version(sheet_name)
+            data = self.backend.read_sheet(sheet_name)
+            cache[sheet_name] = (version, data)
+        return data
+
+    def _cached_sheet(self, sheet_name: str) -> TableData | None:
+        """Current contents of *sheet_name* if already read in this block."""
+        if self._sheet_cache is None or not self.backend.supports_versioning:
+            return None
+        entry = self._sheet_cache.get(sheet_name)
+        if entry is None or entry[0] != self.backend.sheet_version(sheet_name):
+            return None
+        return entry[1]
+
+    def _scanned_before(self, sheet_name: str) -> bool:
+        """Whether this version of *sheet_name* was already scanned in this block.
+
+        The first filtered or projected scan of a sheet version is only
+        recorded; a repeated one is better served by one cached full read.
+        Not under ``max_memory_mb``, where rows a pushed-down filter drops
+        must not count against the limit.
+        """
+        cache = self._sheet_cache
+        if (
+            cache is None
+            or not self.backend.supports_versioning
+            or self.backend.max_memory_mb is not None
+        ):
+            return False
+        version = self.backend.sheet_version(sheet_name)
+        entry = cache.get(sheet_name)
+        if entry is not None and entry[0] == version:
+            return True
+        cache[sheet_name] = (version, None)
+        return False
 
     def _write_metadata_for_headers(
         self,
@@ -153,7 +517,10 @@ class SharedExecutor:
         # so mutations are rejected before param-binding errors.
         first_word = query.strip().split(None, 1)[0].upper() if query.strip() else ""
         self._ensure_writable(first_word)
-        parsed = parse_sql(query, params)
+        if self._statement_cache is not None:
+            parsed = self._statement_cache.parse(query, params)
+        else:
+            parsed = parse_sql(query, params)
         return self.execute(parsed)
 
     def execute(
@@ -162,9 +529,13 @@ class SharedExecutor:
         *,
         _reset_subquery_cache: bool = True,
     ) -> ExecutionResult:
-        if _reset_subquery_cache:
-            self._subquery_cache.clear()
+        if not _reset_subquery_cache:
+            return self._execute_statement(parsed)
+        self._subquery_cache.clear()
+        with self.sheet_cache():
+            return self._execute_statement(parsed)
 
+    def _execute_statement(self, parsed: dict[str, Any]) -> ExecutionResult:
         ctes = parsed.get("ctes")
         if isinstance(ctes, list) and ctes:
             previous_ctes = dict(self._cte_tables)
@@ -196,45 +567,24 @@ class SharedExecutor:
         resolved_table = self._resolve_sheet_name(table)
 
         if action == "SELECT":
-            selected_table, selected_data = self._resolve_table_data(table)
-            if selected_table is None or selected_data is None:
-                available = self._available_table_names()
-                msg = f"Sheet '{table}' not found in Excel."
-                if available:
-                    msg += f" Available sheets: {available}"
-                raise SqlSemanticError(msg)
             if parsed.get("joins") is not None:
+                selected_table, selected_data = self._resolve_table_data(table)
+                if selected_table is None or selected_data is None:
+                    self._raise_table_not_found(table)
                 return self._execute_join_select(
                     action, parsed, selected_table, selected_data
                 )
-            if not selected_data.headers:
-                if parsed.get("columns") != ["*"]:
-                    raise SqlSemanticError(
-                        f"No columns defined in sheet '{selected_table}' — cannot resolve column references"
+            projection = self._projection_columns(parsed, table)
+            if projection is not None:
+                try:
+                    return self._execute_scan_select(
+                        action, parsed, table, projection
                     )
-                return ExecutionResult(
-                    action=action, rows=[], description=[], rowcount=0, lastrowid=None
-                )
-            headers = list(selected_data.headers)
-            source_refs: set[str] = set()
-            from_entry = parsed.get("from")
-            if isinstance(from_entry, dict):
-                table_name = from_entry.get("table")
-                if isinstance(table_name, str):
-                    source_refs.add(table_name)
-                ref_name = from_entry.get("ref")
-                if isinstance(ref_name, str):
-                    source_refs.add(ref_name)
-
-            rows = [
-                self._build_scoped_row(
-                    self._row_from_values(headers, list(row_values)),
-                    headers=headers,
-                    source_refs=source_refs,
-                )
-                for row_values in selected_data.rows
-            ]
-            return self._execute_select(action, parsed, headers, rows)
+                except SqlSemanticError:
+                    # Unknown-column errors list the sheet's columns; raise
+                    # them from a full read so the message is unchanged.
+                    pass
+            return self._execute_scan_select(action, parsed, table)
 
         if action == "UPDATE":
             if resolved_table is None:
@@ -258,11 +608,15 @@ class SharedExecutor:
                     )
 
             where = parsed.get("where")
+            predicate = None
             if where:
                 where = copy.deepcopy(where)
                 self._resolve_subqueries(where)
+                predicate = self._row_values_compiler(headers, {table}).where(where)
             rowcount = 0
             for row_values in table_data.rows:
+                if predicate is not None and predicate(row_values) is not True:
+                    continue
                 row_map = {
                     headers[col_index]: row_values[col_index]
                     if col_index < len(row_values)
@@ -274,7 +628,11 @@ class SharedExecutor:
                     headers=headers,
                     source_refs={table},
                 )
-                if where and not self._matches_where(scoped_row, where):
+                if (
+                    where
+                    and predicate is None
+                    and not self._matches_where(scoped_row, where)
+                ):
                     continue
                 for update in updates:
                     col_index = self._resolve_header_index(
@@ -348,26 +706,33 @@ class SharedExecutor:
                 )
             headers = list(table_data.headers)
             where = parsed.get("where")
+            predicate = None
             if where:
                 where = copy.deepcopy(where)
                 self._resolve_subqueries(where)
+                predicate = self._row_values_compiler(headers, {table}).where(where)
             rowcount = 0
             kept_rows: list[list[Any]] = []
             for row_values in table_data.rows:
-                row_map = {
-                    headers[col_index]: row_values[col_index]
-                    if col_index < len(row_values)
-                    else None
-                    for col_index in range(len(headers))
-                }
-                scoped_row = self._build_scoped_row(
-                    row_map,
-                    headers=headers,
-                    source_refs={table},
-                )
-                if where and not self._matches_where(scoped_row, where):
-                    kept_rows.append(row_values)
-                    continue
+                if predicate is not None:
+                    if predicate(row_values) is not True:
+                        kept_rows.append(row_values)
+                        continue
+                elif where:
+                    row_map = {
+                        headers[col_index]: row_values[col_index]
+                        if col_index < len(row_values)
+                        else None
+                        for col_index in range(len(headers))
+                    }
+                    scoped_row = self._build_scoped_row(
+                        row_map,
+                        headers=headers,
+                        source_refs={table},
+                    )
+                    if not self._matches_where(scoped_row, where):
+                        kept_rows.append(row_values)
+                        continue
                 if where is None:
                     rowcount += 1
                 else:
@@ -383,27 +748,16 @@ class SharedExecutor:
             )
 
         if action == "INSERT":
-            if resolved_table is None:
-                available = self.backend.list_sheets()
-                msg = f"Sheet '{table}' not found in Excel."
-                if available:
-                    msg += f" Available sheets: {available}"
-                raise SqlSemanticError(msg)
-            table_data = self.backend.read_sheet(resolved_table)
-            if not table_data.headers:
-                raise SqlSemanticError("Cannot insert into sheet without headers")
+            # ON CONFLICT changes the rows in place, so it needs its own copy.
+            resolved_table, table_data = self._insert_target(
+                table, resolved_table, shared=parsed.get("on_conflict") is None
+            )
             headers = list(table_data.headers)
             header_index = self._build_header_index(headers)
 
             values = parsed["values"]
             insert_columns = parsed.get("columns")
-
-            if insert_columns is not None:
-                missing = self._missing_headers(insert_columns, header_index)
-                if missing:
-                    raise SqlSemanticError(
-                        f"Unknown column(s): {', '.join(missing)}. Available columns: {headers}"
-                    )
+            self._check_insert_columns(insert_columns, headers, header_index)
 
             rows_to_insert: list[list[Any]]
             if isinstance(values, dict):
@@ -432,35 +786,9 @@ class SharedExecutor:
                 raise SqlSemanticError("Invalid INSERT values format")
 
             # Pre-validate ALL rows before appending any (atomicity guarantee)
-            expected_count = (
-                len(insert_columns) if insert_columns is not None else len(headers)
+            sanitized_rows = self._sanitize_insert_rows(
+                rows_to_insert, insert_columns, headers, header_index
             )
-            sanitized_rows: list[list[Any]] = []
-            for values_row in rows_to_insert:
-                if len(values_row) != expected_count:
-                    if insert_columns is None:
-                        raise SqlSemanticError(
-                            "INSERT values count does not match header count"
-                        )
-                    else:
-                        raise SqlSemanticError(
-                            "INSERT values count does not match column count"
-                        )
-                if insert_columns is None:
-                    row_values = list(values_row)
-                else:
-                    row_values = [None for _ in headers]
-                    for col, value in zip(insert_columns, values_row):
-                        col_index = self._resolve_header_index(col, header_index)
-                        if col_index is None:
-                            raise SqlSemanticError(
-                                f"Unknown column: {col}. Available columns: {headers}"
-                            )
-                        row_values[col_index] = value
-                sanitized_row = (
-                    sanitize_row(row_values) if self.sanitize_formulas else row_values
-                )
-                sanitized_rows.append(sanitized_row)
 
             on_conflict = parsed.get("on_conflict")
             if on_conflict is not None:
@@ -495,37 +823,12 @@ class SharedExecutor:
                             )
 
                 rowcount = 0
+                conflict_index = _ConflictIndex(self, table_data.rows, target_indices)
                 for sanitized_row in sanitized_rows:
-                    conflict_row: list[Any] | None = None
-                    for existing_row in table_data.rows:
-                        is_conflict = True
-                        for target_index in target_indices:
-                            existing_value = (
-                                existing_row[target_index]
-                                if target_index < len(existing_row)
-                                else None
-                            )
-                            incoming_value = (
-                                sanitized_row[target_index]
-                                if target_index < len(sanitized_row)
-                                else None
-                            )
-                            if existing_value is None or incoming_value is None:
-                                # SQL semantics: NULL never matches NULL for conflict detection
-                                is_conflict = False
-                                break
-                            left, right = self._coerce_for_compare(
-                                existing_value, incoming_value
-                            )
-                            if left != right:
-                                is_conflict = False
-                                break
-                        if is_conflict:
-                            conflict_row = existing_row
-                            break
-
-                    if conflict_row is None:
+                    conflict_position = conflict_index.find(sanitized_row)
+                    if conflict_position is None:
                         table_data.rows.append(list(sanitized_row))
+                        conflict_index.add(len(table_data.rows) - 1)
                         rowcount += 1
                         continue
 
@@ -537,6 +840,8 @@ class SharedExecutor:
                             f"Invalid ON CONFLICT action: {on_conflict.get('action')}"
                         )
 
+                    conflict_row = table_data.rows[conflict_position]
+                    conflict_index.discard(conflict_position)
                     row_map = self._row_from_values(headers, conflict_row)
                     excluded_map = self._row_from_values(headers, sanitized_row)
 
@@ -599,6 +904,7 @@ class SharedExecutor:
                                 [None] * (col_index - len(conflict_row) + 1)
                             )
                         conflict_row[col_index] = value
+                    conflict_index.add(conflict_position)
                     rowcount += 1
 
                 self.backend.write_sheet(resolved_table, table_data)
@@ -610,17 +916,23 @@ class SharedExecutor:
                     lastrowid=None,
                 )
 
-            # All rows validated — now append atomically
-            last_row = None
-            for sanitized_row in sanitized_rows:
-                last_row = self.backend.append_row(resolved_table, sanitized_row)
+            if self._pending_inserts is not None and isinstance(values, list):
+                self._pending_inserts.add(resolved_table, sanitized_rows)
+                return ExecutionResult(
+                    action=action,
+                    rows=[],
+                    description=[],
+                    rowcount=len(rows_to_insert),
+                    lastrowid=None,
+                )
 
+            # All rows validated — now append atomically
             return ExecutionResult(
                 action=action,
                 rows=[],
                 description=[],
                 rowcount=len(rows_to_insert),
-                lastrowid=last_row,
+                lastrowid=self._append_insert_rows(resolved_table, sanitized_rows),
             )
 
         if action == "CREATE":
@@ -870,6 +1182,89 @@ class SharedExecutor:
     def _has_header(column: str, header_index: dict[str, int]) -> bool:
         return SharedExecutor._resolve_header_index(column, header_index) is not None
 
+    def _insert_target(
+        self, table: str, resolved_table: str | None, *, shared: bool = True
+    ) -> tuple[str, TableData]:
+        """Resolved sheet name and current contents of an INSERT target.
+
+        With *shared* the contents may come from the statement's sheet cache
+        and must not be modified.
+        """
+        if resolved_table is None:
+            available = self.backend.list_sheets()
+            msg = f"Sheet '{table}' not found in Excel."
+            if available:
+                msg += f" Available sheets: {available}"
+            raise SqlSemanticError(msg)
+        table_data = (
+            self.read_sheet(resolved_table)
+            if shared
+            else self.backend.read_sheet(resolved_table)
+        )
+        if not table_data.headers:
+            raise SqlSemanticError("Cannot insert into sheet without headers")
+        return resolved_table, table_data
+
+    def _check_insert_columns(
+        self,
+        insert_columns: list[str] | None,
+        headers: list[str],
+        header_index: dict[str, int],
+    ) -> None:
+        if insert_columns is not None:
+            missing = self._missing_headers(insert_columns, header_index)
+            if missing:
+                raise SqlSemanticError(
+                    f"Unknown column(s): {', '.join(missing)}. Available columns: {headers}"
+                )
+
+    def _sanitize_insert_rows(
+        self,
+        rows_to_insert: list[list[Any]],
+        insert_columns: list[str] | None,
+        headers: list[str],
+        header_index: dict[str, int],
+    ) -> list[list[Any]]:
+        """Validate INSERT rows and lay them out in sheet column order."""
+        expected_count = (
+            len(insert_columns) if insert_columns is not None else len(headers)
+        )
+        sanitized_rows: list[list[Any]] = []
+        for values_row in rows_to_insert:
+            if len(values_row) != expected_count:
+                if insert_columns is None:
+                    raise SqlSemanticError(
+                        "INSERT values count does not match header count"
+                    )
+                else:
+                    raise SqlSemanticError(
+                        "INSERT values count does not match column count"
+                    )
+            if insert_columns is None:
+                row_values = list(values_row)
+            else:
+                row_values = [None for _ in headers]
+                for col, value in zip(insert_columns, values_row):
+                    col_index = self._resolve_header_index(col, header_index)
+                    if col_index is None:
+                        raise SqlSemanticError(
+                            f"Unknown column: {col}. Available columns: {headers}"
+                        )
+                    row_values[col_index] = value
+            sanitized_row = (
+                sanitize_row(row_values) if self.sanitize_formulas else row_values
+            )
+            sanitized_rows.append(sanitized_row)
+        return sanitized_rows
+
+    def _append_insert_rows(
+        self, resolved_table: str, sanitized_rows: list[list[Any]]
+    ) -> int | None:
+        """Append validated INSERT rows as one batch; return the last row number."""
+        if not sanitized_rows:
+            return None
+        return self.backend.append_rows(resolved_table, sanitized_rows)[1]
+
     @staticmethod
     def _missing_headers(
         columns: list[str],
@@ -1043,6 +1438,8 @@ class SharedExecutor:
                         order_parts.append(f"{order_sql} {direction}")
                     if order_parts:
                         spec_parts.append("ORDER BY " + ", ".join(order_parts))
+                if expression.get("frame") == "ROWS":
+                    spec_parts.append("ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW")
 
                 if spec_parts:
                     return f"{function_sql} OVER ({' '.join(spec_parts)})"
@@ -1382,9 +1779,15 @@ class SharedExecutor:
         *,
         value_getter: Callable[[Any, str], Any],
         available_columns: set[str] | None = None,
+        limit: int | None = None,
     ) -> list[Any]:
+        """Order *rows* by *order_by* (stable; NULLs last, first under DESC).
+
+        With *limit*, only the first *limit* rows of the ordering are
+        returned, selected with a bounded heap instead of a full sort.
+        """
         if not order_by:
-            return rows
+            return rows[:limit] if limit is not None else rows
         if available_columns is not None:
             available_columns_casefold = {
                 column_name.casefold() for column_name in available_columns
@@ -1395,17 +1798,82 @@ class SharedExecutor:
                     raise SqlSemanticError(
                         f"Unknown column: {col}. Available columns: {sorted(available_columns)}"
                     )
+        key, reverse = self._order_by_key(order_by, value_getter, rows)
+        if limit is not None and limit < len(rows):
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            return select(limit, rows, key=key)
         if len(rows) < 2:
             return rows
-        for item in reversed(order_by):
+        return self._sort_with_keys(rows, key, reverse)[0]
+
+    def _order_by_key(
+        self,
+        order_by: list[dict[str, Any]],
+        value_getter: Callable[[Any, str], Any],
+        rows: list[Any] | None = None,
+    ) -> tuple[Callable[[Any], tuple[Any, ...]], bool]:
+        """Composite sort key for *order_by* and whether to sort in reverse.
+
+        With a single direction the key is the plain tuple of ``_sort_key``
+        values and DESC becomes a reversed sort, which keeps ties in input
+        order just like the ascending one.  Mixed directions wrap the DESC
+        items so they compare inverted.  Given the *rows* to be ordered, each
+        item's key is specialized for the type affinity of its values; keys of
+        strings in mixed columns are computed once per distinct string.
+        """
+        directions = {item["direction"] == "DESC" for item in order_by}
+        uniform = len(directions) == 1
+        items: list[tuple[str, bool, Callable[[Any], tuple[int, Any]]]] = []
+        for item in order_by:
             col = str(item["column"])
-            reverse = item["direction"] == "DESC"
-            rows = sorted(
-                rows,
-                key=lambda r: self._sort_key(value_getter(r, col)),
-                reverse=reverse,
+            affinity = (
+                self._column_affinity(value_getter(row, col) for row in rows)
+                if rows is not None
+                else MIXED
+            )
+            items.append(
+                (
+                    col,
+                    not uniform and item["direction"] == "DESC",
+                    self._sort_key_function(affinity)
+                    if affinity != MIXED
+                    else self._cached_sort_key(),
+                )
+            )
+
+        def key(row: Any) -> tuple[Any, ...]:
+            return tuple(
+                _Descending(value_key(value_getter(row, col)))
+                if descending
+                else value_key(value_getter(row, col))
+                for col, descending, value_key in items
             )
-        return rows
+
+        return key, uniform and directions.pop()
+
+    def _cached_sort_key(self) -> Callable[[Any], tuple[int, Any]]:
+        """:meth:`_sort_key` that computes the key of each distinct string once."""
+        string_keys: dict[str, tuple[int, Any]] = {}
+        sort_key = self._sort_key
+
+        def value_key(value: Any) -> tuple[int, Any]:
+            if type(value) is not str:
+                return sort_key(value)
+            cached = string_keys.get(value)
+            if cached is None:
+                cached = string_keys[value] = sort_key(value)
+            return cached
+
+        return value_key
+
+    @staticmethod
+    def _sort_with_keys(
+        rows: list[Any], key: Callable[[Any], tuple[Any, ...]], reverse: bool
+    ) -> tuple[list[Any], list[tuple[Any, ...]]]:
+        """Sort *rows* in one stable pass; also return each sorted row's key."""
+        keys = [key(row) for row in rows]
+        order = sorted(range(len(rows)), key=keys.__getitem__, reverse=reverse)
+        return [rows[index] for index in order], [keys[index] for index in order]
 
     def _materialize_order_expression_columns(
         self,
@@ -1550,6 +2018,22 @@ class SharedExecutor:
         columns: list[Any],
         order_by: list[dict[str, Any]] | None,
     ) -> set[str]:
+        window_expressions = self._select_window_expressions(columns, order_by)
+        if not window_expressions:
+            return set()
+
+        for target_column, expression in window_expressions.items():
+            self._evaluate_window_expression(
+                rows, expression, target_column=target_column
+            )
+
+        return set(window_expressions.keys())
+
+    def _select_window_expressions(
+        self,
+        columns: list[Any],
+        order_by: list[dict[str, Any]] | None,
+    ) -> dict[str, dict[str, Any]]:
         window_expressions: dict[str, dict[str, Any]] = {}
 
         if columns != ["*"]:
@@ -1563,15 +2047,7 @@ class SharedExecutor:
                 if expression is not None:
                     self._collect_window_expressions(expression, window_expressions)
 
-        if not window_expressions:
-            return set()
-
-        for target_column, expression in window_expressions.items():
-            self._evaluate_window_expression(
-                rows, expression, target_column=target_column
-            )
-
-        return set(window_expressions.keys())
+        return window_expressions
 
     def _evaluate_window_expression(
         self,
@@ -1604,17 +2080,24 @@ class SharedExecutor:
         args = expression.get("args")
         args_list = args if isinstance(args, list) else []
 
+        # One key function for every partition so string keys are shared.
+        order_key = None
+        if order_by:
+            self._materialize_order_expression_columns(rows, order_by)
+            order_key = self._order_by_key(
+                order_by,
+                lambda candidate, column_name: self._resolve_row_value(
+                    candidate,
+                    column_name,
+                ),
+                rows,
+            )
         for partition_rows in partitions.values():
             ordered_rows = partition_rows
-            if order_by:
-                self._materialize_order_expression_columns(partition_rows, order_by)
-                ordered_rows = self._apply_order_by(
-                    partition_rows,
-                    order_by,
-                    value_getter=lambda candidate, column_name: self._resolve_row_value(
-                        candidate,
-                        column_name,
-                    ),
+            ordered_keys: list[tuple[Any, ...]] = []
+            if order_key is not None:
+                ordered_rows, ordered_keys = self._sort_with_keys(
+                    partition_rows, *order_key
                 )
 
             if function_name == "ROW_NUMBER":
@@ -1631,13 +2114,9 @@ class SharedExecutor:
                 previous_key: tuple[Any, ...] | None = None
                 rank = 1
                 dense_rank = 1
-                for position, row in enumerate(ordered_rows, start=1):
-                    current_key = tuple(
-                        self._sort_key(
-                            self._resolve_row_value(row, str(item["column"]))
-                        )
-                        for item in order_by
-                    )
+                for position, (row, current_key) in enumerate(
+                    zip(ordered_rows, ordered_keys), start=1
+                ):
                     if previous_key is None:
                         rank = 1
                         dense_rank = 1
@@ -1667,19 +2146,65 @@ class SharedExecutor:
                         row[target_column] = partition_value
                     continue
 
-                for position, row in enumerate(ordered_rows):
-                    frame_rows = ordered_rows[: position + 1]
-                    row[target_column] = self._compute_aggregate(
-                        function_name,
-                        arg,
-                        frame_rows,
-                        distinct=distinct,
-                        filter_condition=filter_condition,
-                    )
+                self._apply_running_aggregate(
+                    function_name,
+                    arg,
+                    ordered_rows,
+                    # ROWS frames end at the current row; the default RANGE
+                    # frame ends at its last ORDER BY peer.
+                    None if expression.get("frame") == "ROWS" else ordered_keys,
+                    target_column,
+                    distinct=distinct,
+                    filter_condition=filter_condition,
+                )
                 continue
 
             raise ProgrammingError(f"Unsupported window function: {function_name}")
 
+    def _apply_running_aggregate(
+        self,
+        function_name: str,
+        arg: str,
+        ordered_rows: list[dict[str, Any]],
+        peer_keys: list[tuple[Any, ...]] | None,
+        target_column: str,
+        *,
+        distinct: bool,
+        filter_condition: dict[str, Any] | None,
+    ) -> None:
+        """Store the running aggregate of *ordered_rows* in *target_column*.
+
+        With *peer_keys*, rows with equal keys are peers: they enter the
+        aggregate together and all receive the value after the last of them.
+        """
+        sort_key: Callable[[Any], Any] = self._sort_key
+        if function_name in {"MIN", "MAX"}:
+            sort_key = self._sort_key_function(
+                self._column_affinity(
+                    [self._resolve_row_value(row, arg) for row in ordered_rows]
+                )
+            )
+        aggregate = _RunningAggregate(
+            self, function_name, arg, distinct=distinct, sort_key=sort_key
+        )
+        row_count = len(ordered_rows)
+        start = 0
+        while start < row_count:
+            end = start + 1
+            if peer_keys is not None:
+                while end < row_count and peer_keys[end] == peer_keys[start]:
+                    end += 1
+            peers = ordered_rows[start:end]
+            for row in peers:
+                if filter_condition is None or self._matches_where(
+                    row, filter_condition
+                ):
+                    aggregate.add(row)
+            value = aggregate.value()
+            for row in peers:
+                row[target_column] = value
+            start = end
+
     @staticmethod
     def _resolve_pagination(parsed: dict[str, Any]) -> tuple[int, int | None]:
         raw_offset = parsed.get("offset")
@@ -1769,6 +2294,7 @@ class SharedExecutor:
             raise SqlSemanticError(f"Unsupported compound operator: {operator}")
 
         # Apply compound-level ORDER BY / LIMIT / OFFSET.
+        compound_offset, compound_limit = self._resolve_pagination(parsed)
         order_by = self._normalize_order_by(parsed.get("order_by"))
         if order_by:
             desc_names = [d[0] for d in first_result.description]
@@ -1791,9 +2317,11 @@ class SharedExecutor:
                 rows,
                 order_by,
                 value_getter=lambda r, col: r[resolved_indexes[col]],
+                limit=None
+                if compound_limit is None
+                else compound_offset + compound_limit,
             )
 
-        compound_offset, compound_limit = self._resolve_pagination(parsed)
         if compound_offset:
             rows = rows[compound_offset:]
         if compound_limit is not None:
@@ -2037,6 +2565,7 @@ class SharedExecutor:
         left_ns: dict[str, dict[str, Any]],
         right_ns: dict[str, dict[str, Any]],
         on_condition: dict[str, Any] | None,
+        predicate: Callable[[Any], bool | None] | None = None,
     ) -> bool:
         if on_condition is None:
             return True
@@ -2045,8 +2574,123 @@ class SharedExecutor:
         combined_row.update(left_ns)
         combined_row.update(right_ns)
         flattened = self._build_scoped_row(self._flatten_join_row(combined_row))
+        if predicate is not None:
+            return predicate(flattened) is True
         return self._matches_where(flattened, on_condition)
 
+    def _plan_hash_join(
+        self,
+        left_rows: list[dict[str, dict[str, Any]]],
+        left_sources: set[str],
+        right_rows: list[dict[str, dict[str, Any]]],
+        right_sources: set[str],
+        on_condition: dict[str, Any] | None,
+    ) -> tuple[list[Any], dict[tuple[Any, ...], list[int]], bool] | None:
+        """Build a hash table over the right rows for equality ON conditions.
+
+        Returns the per-left-row probe keys, the build table mapping join keys
+        to right row indices, and whether the full ON condition still has to
+        be checked for candidate pairs (non-equality conjuncts).  ``None``
+        means the join must use the nested loop.
+        """
+        if on_condition is None or not left_rows or not right_rows:
+            return None
+        conjuncts: list[dict[str, Any]] = []
+        self._collect_and_conjuncts(on_condition, conjuncts)
+        left_operands: list[dict[str, Any]] = []
+        right_operands: list[dict[str, Any]] = []
+        has_residual = False
+        for conjunct in conjuncts:
+            pair = self._equi_join_operands(conjunct, left_sources, right_sources)
+            if pair is None:
+                has_residual = True
+                continue
+            left_operands.append(pair[0])
+            right_operands.append(pair[1])
+        if not left_operands:
+            return None
+
+        build_table: dict[tuple[Any, ...], list[int]] = {}
+        for right_index, right_ns in enumerate(right_rows):
+            build_key = self._join_row_key(right_ns, right_operands)
+            if build_key is _AMBIGUOUS_KEY:
+                return None
+            if build_key is not None:
+                build_table.setdefault(build_key, []).append(right_index)
+
+        probe_keys: list[Any] = []
+        for left_ns in left_rows:
+            probe_key = self._join_row_key(left_ns, left_operands)
+            if probe_key is _AMBIGUOUS_KEY:
+                return None
+            probe_keys.append(probe_key)
+        return probe_keys, build_table, has_residual
+
+    def _collect_and_conjuncts(
+        self, node: dict[str, Any], conjuncts: list[dict[str, Any]]
+    ) -> None:
+        if (
+            node.get("type") != "not"
+            and "conditions" in node
+            and all(conj == "AND" for conj in node["conjunctions"])
+        ):
+            for child in node["conditions"]:
+                self._collect_and_conjuncts(child, conjuncts)
+            return
+        conjuncts.append(node)
+
+    @staticmethod
+    def _equi_join_operands(
+        condition: dict[str, Any],
+        left_sources: set[str],
+        right_sources: set[str],
+    ) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        """Return (left operand, right operand) for a left = right column test."""
+        if condition.get("operator") not in {"=", "=="}:
+            return None
+        column = condition.get("column")
+        value = condition.get("value")
+        if not (
+            isinstance(column, dict)
+            and isinstance(value, dict)
+            and column.get("type") == "column"
+            and value.get("type") == "column"
+        ):
+            return None
+        column_source = column.get("source")
+        value_source = value.get("source")
+        if column_source in left_sources and value_source in right_sources:
+            left_operand, right_operand = column, value
+        elif column_source in right_sources and value_source in left_sources:
+            left_operand, right_operand = value, column
+        else:
+            return None
+        if left_operand.get("source") in right_sources or right_operand.get(
+            "source"
+        ) in left_sources:
+            return None
+        return left_operand, right_operand
+
+    def _join_row_key(
+        self,
+        source_row: dict[str, dict[str, Any]],
+        operands: list[dict[str, Any]],
+    ) -> Any:
+        """Join key for one side of an equi-join; ``None`` if it cannot match."""
+        scoped_row = self._build_scoped_row(self._flatten_join_row(source_row))
+        key_parts: list[Any] = []
+        for operand in operands:
+            value = self._eval_expression(
+                operand,
+                scoped_row,
+                lambda col_name: self._resolve_row_value(scoped_row, col_name),
+            )
+            part = self._equality_key(value)
+            if part is None or part is _AMBIGUOUS_KEY:
+                return part
+            key_parts.append(part)
+        return tuple(key_parts)
+
     def _join_two_sources(
         self,
         left_rows: list[dict[str, dict[str, Any]]],
@@ -2084,12 +2728,34 @@ class SharedExecutor:
                     joined_rows.append(combined_row)
         else:
             matched_right_indices: set[int] = set()
+            hash_join = self._plan_hash_join(
+                left_rows,
+                set(left_headers_map),
+                right_rows,
+                right_sources,
+                on_condition,
+            )
+            all_right_indices = range(len(right_rows))
+            check_condition = True
+            on_predicate = (
+                ExpressionCompiler(self, self._dict_getter).where(on_condition)
+                if on_condition is not None
+                else None
+            )
 
-            for left_ns in left_rows:
+            for left_index, left_ns in enumerate(left_rows):
                 left_matched = False
-                for right_index, right_ns in enumerate(right_rows):
-                    if not self._matches_join_on_condition(
-                        left_ns, right_ns, on_condition
+                candidate_indices: Iterable[int] = all_right_indices
+                if hash_join is not None:
+                    probe_keys, build_table, check_condition = hash_join
+                    probe_key = probe_keys[left_index]
+                    candidate_indices = (
+                        build_table.get(probe_key, ()) if probe_key is not None else ()
+                    )
+                for right_index in candidate_indices:
+                    right_ns = right_rows[right_index]
+                    if check_condition and not self._matches_join_on_condition(
+                        left_ns, right_ns, on_condition, on_predicate
                     ):
                         continue
 
@@ -2387,9 +3053,16 @@ class SharedExecutor:
 
         where = parsed.get("where")
         if where:
-            joined_rows_flat = [
-                row for row in joined_rows_flat if self._matches_where(row, where)
-            ]
+            where_predicate = ExpressionCompiler(self, self._dict_getter).where(where)
+            if where_predicate is not None:
+                compiled_where = where_predicate
+                joined_rows_flat = [
+                    row for row in joined_rows_flat if compiled_where(row) is True
+                ]
+            else:
+                joined_rows_flat = [
+                    row for row in joined_rows_flat if self._matches_where(row, where)
+                ]
 
         window_columns = self._apply_window_functions(
             joined_rows_flat, parsed["columns"], order_by
@@ -2430,6 +3103,7 @@ class SharedExecutor:
             )
 
         distinct = bool(parsed.get("distinct", False))
+        offset, limit = self._resolve_pagination(parsed)
         selected_columns: list[str] = []
         output_names: list[str] = []
         if columns == ["*"]:
@@ -2462,9 +3136,9 @@ class SharedExecutor:
                     order_by,
                     value_getter=lambda r, col: self._resolve_row_value(r, col),
                     available_columns=available_cols,
+                    limit=None if limit is None else offset + limit,
                 )
 
-            offset, limit = self._resolve_pagination(parsed)
             if offset:
                 rows_for_output = rows_for_output[offset:]
             if limit is not None:
@@ -2516,9 +3190,9 @@ class SharedExecutor:
                     order_by,
                     value_getter=lambda r, col: self._resolve_row_value(r, col),
                     available_columns=available_columns,
+                    limit=None if limit is None else offset + limit,
                 )
 
-            offset, limit = self._resolve_pagination(parsed)
             if offset:
                 projected_rows = projected_rows[offset:]
             if limit is not None:
@@ -2548,14 +3222,24 @@ class SharedExecutor:
         action: str,
         parsed: dict[str, Any],
         headers: list[str],
-        rows: list[dict[str, Any]],
+        source_rows: Iterable[dict[str, Any]],
     ) -> ExecutionResult:
         columns = parsed["columns"]
         where = parsed.get("where")
+        filtered_rows: Iterable[dict[str, Any]] = source_rows
         if where:
             where = copy.deepcopy(where)
             self._resolve_subqueries(where)
-            rows = [row for row in rows if self._matches_where(row, where)]
+            predicate = ExpressionCompiler(self, self._dict_getter).where(where)
+            if predicate is not None:
+                compiled_predicate = predicate
+                filtered_rows = (
+                    row for row in source_rows if compiled_predicate(row) is True
+                )
+            else:
+                filtered_rows = (
+                    row for row in source_rows if self._matches_where(row, where)
+                )
 
         group_by: list[Any] | None = parsed.get("group_by")
         having = parsed.get("having")
@@ -2568,7 +3252,7 @@ class SharedExecutor:
 
         if aggregate_query or group_by is not None:
             return self._execute_aggregate_select(
-                action, parsed, headers, rows, columns, group_by, having
+                action, parsed, headers, list(filtered_rows), columns, group_by, having
             )
 
         # --- Non-aggregate path ---
@@ -2620,14 +3304,37 @@ class SharedExecutor:
                 resolved_order_by.append(resolved_item)
             order_by = resolved_order_by
 
+        distinct = parsed.get("distinct", False)
+        offset, limit = self._resolve_pagination(parsed)
+        if (
+            limit is not None
+            and not order_by
+            and not distinct
+            and not self._select_window_expressions(columns, order_by)
+        ):
+            # Nothing below reorders or drops rows, so the scan can stop as
+            # soon as the requested page is filled.
+            filtered_rows = itertools.islice(filtered_rows, offset, offset + limit)
+            offset, limit = 0, None
+        rows = list(filtered_rows)
+
         window_columns = self._apply_window_functions(rows, columns, order_by)
 
         projected_rows: list[dict[str, Any]]
         if needs_expression_projection and columns != ["*"]:
+            compiler = ExpressionCompiler(self, self._dict_getter)
+            projectors = [
+                compiler.expression(self._unwrap_alias(column)) for column in columns
+            ]
             projected_rows = []
             for row in rows:
                 projected_row = dict(row)
-                for column, key in zip(columns, selected_columns):
+                for column, key, projector in zip(
+                    columns, selected_columns, projectors
+                ):
+                    if projector is not None:
+                        projected_row[key] = projector(row)
+                        continue
                     inner = self._unwrap_alias(column)
                     projected_row[key] = self._eval_expression(
                         inner,
@@ -2638,7 +3345,6 @@ class SharedExecutor:
         else:
             projected_rows = rows
 
-        distinct = parsed.get("distinct", False)
         if distinct:
             self._validate_distinct_order_by_columns(order_by, selected_columns)
             projected_rows = self._dedupe_projected_rows(
@@ -2659,9 +3365,9 @@ class SharedExecutor:
                 order_by,
                 value_getter=lambda r, col: self._resolve_row_value(r, col),
                 available_columns=available_columns,
+                limit=None if limit is None else offset + limit,
             )
 
-        offset, limit = self._resolve_pagination(parsed)
         if offset:
             projected_rows = projected_rows[offset:]
         if limit is not None:
@@ -2685,6 +3391,430 @@ class SharedExecutor:
             lastrowid=None,
         )
 
+    def _execute_scan_select(
+        self,
+        action: str,
+        parsed: dict[str, Any],
+        table: str,
+        columns: set[str] | None = None,
+    ) -> ExecutionResult:
+        """Run a SELECT over a single sheet or CTE.
+
+        *columns* is forwarded to backends that can skip unreferenced columns.
+        """
+        source_refs: set[str] = set()
+        from_entry = parsed.get("from")
+        if isinstance(from_entry, dict):
+            table_name = from_entry.get("table")
+            if isinstance(table_name, str):
+                source_refs.add(table_name)
+            ref_name = from_entry.get("ref")
+            if isinstance(ref_name, str):
+                source_refs.add(ref_name)
+
+        where = parsed.get("where")
+        pushdown: _PushdownFilter | None = None
+        if where and self._can_push_down(table, where):
+            pushdown = _PushdownFilter(self, where, source_refs)
+            # The backend only returns matching rows.
+            parsed = dict(parsed, where=None)
+            where = None
+        selected_table, selected_headers, selected_rows = self._scan_table(
+            table, pushdown, columns
+        )
+        if selected_table is None or selected_headers is None:
+            self._raise_table_not_found(table)
+        if not selected_headers:
+            if parsed.get("columns") != ["*"]:
+                raise SqlSemanticError(
+                    f"No columns defined in sheet '{selected_table}' — cannot resolve column references"
+                )
+            return ExecutionResult(
+                action=action, rows=[], description=[], rowcount=0, lastrowid=None
+            )
+        headers = list(selected_headers)
+        if where:
+            # Resolve uncorrelated subqueries once so the filters below
+            # can treat them as literal value lists.
+            where = copy.deepcopy(where)
+            self._resolve_subqueries(where)
+            parsed = dict(parsed, where=where)
+
+        if isinstance(selected_rows, ColumnarTableData):
+            columnar_result = self._execute_columnar_select(
+                action, parsed, headers, source_refs, selected_rows
+            )
+            if columnar_result is not None:
+                return columnar_result
+            selected_rows = selected_rows.iter_rows()
+
+        if where:
+            predicate = self._row_values_compiler(headers, source_refs).where(where)
+            if predicate is not None:
+                # Filter raw values so rejected rows never become dicts.
+                compiled_predicate = predicate
+                selected_rows = (
+                    row_values
+                    for row_values in selected_rows
+                    if compiled_predicate(row_values) is True
+                )
+                parsed = dict(parsed, where=None)
+
+        # Scoped rows are built lazily so streaming backends are only read
+        # as far as the query needs.
+        rows = (
+            self._build_scoped_row(
+                self._row_from_values(headers, list(row_values)),
+                headers=headers,
+                source_refs=source_refs,
+            )
+            for row_values in selected_rows
+        )
+        return self._execute_select(action, parsed, headers, rows)
+
+    def _projection_columns(
+        self, parsed: dict[str, Any], table: str
+    ) -> set[str] | None:
+        """Names a single-source SELECT may read, for projection pushdown.
+
+        Every string in the statement that could name a column is included,
+        so the set over-approximates the columns the query touches.  Returns
+        ``None`` when the backend cannot skip columns, for CTEs, for ``*`` and
+        for statements with subqueries (which can reference any column).
+        """
+        if not self.backend.supports_projection_pushdown:
+            return None
+        if self._resolve_cte_name(table) is not None:
+            return None
+        if "*" in parsed.get("columns", []):
+            return None
+        names: set[str] = set()
+        for key in ("columns", "where", "group_by", "having", "order_by"):
+            if not self._collect_projection_names(parsed.get(key), names):
+                return None
+        for name in list(names):
+            if "." in name:
+                names.add(name.partition(".")[2])
+        return names
+
+    def _collect_projection_names(self, node: Any, names: set[str]) -> bool:
+        """Add candidate column names under *node*; ``False`` on subqueries."""
+        if isinstance(node, str):
+            names.add(node)
+            if "(" in node:
+                # HAVING refers to aggregates by label, e.g. ``SUM(total)``.
+                try:
+                    expression = _parse_column_expression(
+                        node,
+                        allow_wildcard=False,
+                        allow_aggregates=True,
+                        allow_subqueries=False,
+                    )
+                except SqlParseError:
+                    return True
+                return self._collect_projection_names(expression, names)
+            return True
+        if isinstance(node, dict):
+            if node.get("type") in {"subquery", "exists"}:
+                return False
+            return all(
+                self._collect_projection_names(value, names)
+                for key, value in node.items()
+                if key not in {"type", "func", "operator", "direction"}
+            )
+        if isinstance(node, (list, tuple)):
+            return all(self._collect_projection_names(item, names) for item in node)
+        return True
+
+    def _execute_columnar_select(
+        self,
+        action: str,
+        parsed: dict[str, Any],
+        headers: list[str],
+        source_refs: set[str],
+        data: ColumnarTableData,
+    ) -> ExecutionResult | None:
+        """Run a single-sheet SELECT against column arrays.
+
+        WHERE is evaluated one column at a time into a list of matching row
+        positions and plain column projections are gathered straight from the
+        arrays, so no per-row dicts are built.  Returns ``None`` when the
+        query needs the row-based path.
+        """
+        columns_data = data.columns
+        if columns_data is None or self._outer_row_stack:
+            return None
+
+        selection: Sequence[int] = range(data.row_count)
+        where = parsed.get("where")
+        if where:
+            ordinals = self._scoped_column_ordinals(headers, source_refs)
+            predicate = self._compile_columnar_where(
+                where, columns_data.__getitem__, ordinals
+            )
+            if predicate is None:
+                return None
+            positions = list(selection)
+            selection = [
+                position
+                for position, matched in zip(positions, predicate(positions))
+                if matched is True
+            ]
+
+        projection = self._columnar_projection(parsed, headers)
+        if projection is None:
+            if not where:
+                return None
+            # Only the rows that survived the filter are turned into dicts.
+            rows = (
+                self._build_scoped_row(
+                    self._row_from_values(
+                        headers, [column[position] for column in columns_data]
+                    ),
+                    headers=headers,
+                    source_refs=source_refs,
+                )
+                for position in selection
+            )
+            return self._execute_select(
+                action, dict(parsed, where=None), headers, rows
+            )
+
+        projected_ordinals, output_names = projection
+        offset, limit = self._resolve_pagination(parsed)
+        stop = None if limit is None else offset + limit
+        gathered: list[Sequence[Any]]
+        if isinstance(selection, range):
+            gathered = [columns_data[ordinal][offset:stop] for ordinal in projected_ordinals]
+        else:
+            page = selection[offset:stop]
+            gathered = [
+                [columns_data[ordinal][position] for position in page]
+                for ordinal in projected_ordinals
+            ]
+        rows_out = list(zip(*gathered))
+
+        description: Description = [
+            (col, None, None, None, None, None, None) for col in output_names
+        ]
+        return ExecutionResult(
+            action=action,
+            rows=rows_out,
+            description=description,
+            rowcount=len(rows_out),
+            lastrowid=None,
+        )
+
+    def _columnar_projection(
+        self, parsed: dict[str, Any], headers: list[str]
+    ) -> tuple[list[int], list[str]] | None:
+        """Column ordinals and output names for a plain column projection."""
+        if (
+            parsed.get("group_by") is not None
+            or parsed.get("having")
+            or parsed.get("distinct")
+            or parsed.get("order_by")
+        ):
+            return None
+        columns = parsed["columns"]
+        if columns == ["*"]:
+            return list(range(len(headers))), list(headers)
+
+        header_index = self._build_header_index(headers)
+        ordinals: list[int] = []
+        output_names: list[str] = []
+        for column in columns:
+            inner = self._unwrap_alias(column)
+            is_plain_column = (isinstance(inner, str) and inner != "*") or (
+                isinstance(inner, dict) and inner.get("type") == "column"
+            )
+            if not is_plain_column:
+                return None
+            ordinal = self._resolve_header_index(self._source_key(column), header_index)
+            if ordinal is None:
+                return None
+            ordinals.append(ordinal)
+            output_names.append(self._output_name(column))
+        return ordinals, output_names
+
+    @staticmethod
+    def _scoped_column_ordinals(
+        headers: list[str], source_refs: set[str]
+    ) -> dict[str, int]:
+        """Map the keys of a scoped row (see ``_build_scoped_row``) to ordinals."""
+        ordinals = {header: index for index, header in enumerate(headers)}
+        for source_ref in source_refs:
+            for index, header in enumerate(headers):
+                ordinals.setdefault(f"{source_ref}.{header}", index)
+        return ordinals
+
+    @staticmethod
+    def _columnar_ordinal(key: str, ordinals: dict[str, int]) -> int | None:
+        """Column lookup with the same rules as ``_resolve_row_value``."""
+        if key in ordinals:
+            return ordinals[key]
+        lowered = key.casefold()
+        for name, ordinal in ordinals.items():
+            if name.casefold() == lowered:
+                return ordinal
+        return None
+
+    def _value_getter(
+        self,
+        name: str,
+        ordinals: dict[str, int],
+        outer_row: dict[str, Any] | None,
+    ) -> Callable[[Sequence[Any]], Any] | None:
+        """Reader for *name* on a raw row value list laid out by *ordinals*.
+
+        Resolves like ``_resolve_row_value`` on the scoped row, including the
+        columns an enclosing query contributes; ``None`` means the name never
+        resolves to a value.
+        """
+        ordinal = ordinals.get(name)
+        if ordinal is None and outer_row is not None and name in outer_row:
+            exact_outer_value = outer_row[name]
+            return lambda values: exact_outer_value
+        if ordinal is None:
+            ordinal = self._columnar_ordinal(name, ordinals)
+        if ordinal is None:
+            outer_value = (
+                self._resolve_row_value(outer_row, name) if outer_row is not None else None
+            )
+            if outer_value is None:
+                return None
+            return lambda values: outer_value
+        position = ordinal
+        return lambda values: values[position] if position < len(values) else None
+
+    @staticmethod
+    def _dict_getter(name: str) -> Callable[[dict[str, Any]], Any]:
+        """Reader for *name* on a row dict, equivalent to ``_resolve_row_value``."""
+        lowered = name.casefold()
+
+        def read(row: dict[str, Any]) -> Any:
+            if name in row:
+                return row[name]
+            for column, value in row.items():
+                if isinstance(column, str) and column.casefold() == lowered:
+                    return value
+            return None
+
+        return read
+
+    def _row_values_compiler(
+        self, headers: list[str], source_refs: set[str]
+    ) -> ExpressionCompiler:
+        """Compiler for raw row value lists of a single-sheet scan."""
+        ordinals = self._scoped_column_ordinals(headers, source_refs)
+        outer_row = self._current_outer_row()
+        return ExpressionCompiler(
+            self, lambda name: self._value_getter(name, ordinals, outer_row)
+        )
+
+    def _compile_columnar_where(
+        self,
+        where: dict[str, Any],
+        column: Callable[[int], Sequence[Any]],
+        ordinals: dict[str, int],
+    ) -> Callable[[list[int]], list[bool | None]] | None:
+        """Build a column-wise evaluator for a WHERE tree.
+
+        ``column`` returns the values of the column at an ordinal and is only
+        called for columns the tree references.  The evaluator maps row
+        positions to three-valued results with the semantics of
+        ``_eval_where_tv``.  Returns ``None`` for trees that depend on
+        anything but literals and this sheet's columns.
+        """
+        if where.get("type") == "exists":
+            return None
+        if where.get("type") == "not":
+            inner = self._compile_columnar_where(where["operand"], column, ordinals)
+            if inner is None:
+                return None
+            compiled_inner = inner
+
+            def negate(positions: list[int]) -> list[bool | None]:
+                return [
+                    None if result is None else not result
+                    for result in compiled_inner(positions)
+                ]
+
+            return negate
+        if "conditions" in where:
+            parts = [
+                self._compile_columnar_where(condition, column, ordinals)
+                for condition in where["conditions"]
+            ]
+            compiled_parts = [part for part in parts if part is not None]
+            if len(compiled_parts) != len(parts):
+                return None
+            conjunctions = list(where["conjunctions"])
+
+            def combine(positions: list[int]) -> list[bool | None]:
+                results = compiled_parts[0](positions)
+                for conjunction, part in zip(conjunctions, compiled_parts[1:]):
+                    is_and = conjunction == "AND"
+                    # FALSE AND x and TRUE OR x are settled; skip those rows.
+                    settled = not is_and
+                    pending = [
+                        index
+                        for index, result in enumerate(results)
+                        if result is not settled
+                    ]
+                    if not pending:
+                        continue
+                    combiner = _tv_and if is_and else _tv_or
+                    values = part([positions[index] for index in pending])
+                    for index, value in zip(pending, values):
+                        results[index] = combiner(results[index], value)
+                return results
+
+            return combine
+        return self._compile_columnar_condition(where, column, ordinals)
+
+    def _compile_columnar_condition(
+        self,
+        condition: dict[str, Any],
+        column: Callable[[int], Sequence[Any]],
+        ordinals: dict[str, int],
+    ) -> Callable[[list[int]], list[bool | None]] | None:
+        """Column-wise counterpart of ``_evaluate_condition`` for literal operands."""
+        column_name = condition.get("column")
+        if not isinstance(column_name, str):
+            return None
+        ordinal = self._columnar_ordinal(column_name, ordinals)
+        if ordinal is None:
+            return None
+        values = column(ordinal)
+
+        operator = condition.get("operator")
+        value = condition.get("value")
+        compare = (
+            COMPARISON_OPERATORS.get(operator) if isinstance(operator, str) else None
+        )
+        if (
+            compare is not None
+            and isinstance(values, array)
+            and isinstance(value, (int, float))
+        ):
+            # Typed arrays hold non-NULL numbers (integers no wider than
+            # 2**53), which compare with a number literal as floats.
+            form = self._literal_comparison(value, NUMERIC)
+            if form is not None and form[0] == NUMERIC:
+                bound = form[1]
+                return lambda positions: [
+                    compare(values[position], bound) for position in positions
+                ]
+
+        compiler = ExpressionCompiler(
+            self, lambda name: self._value_getter(name, ordinals, None)
+        )
+        test = compiler.literal_test(condition, self._column_affinity(values))
+        if test is None:
+            return None
+        return lambda positions: [test(values[position]) for position in positions]
+
     def _resolve_subqueries(self, where: dict[str, Any]) -> None:
         """Recursively resolve subqueries in the WHERE tree."""
         for condition in where.get("conditions", []):
@@ -3026,6 +4156,7 @@ class SharedExecutor:
                     deduped.append(row)
             grouped_rows = deduped
 
+        offset, limit = self._resolve_pagination(parsed)
         if order_by_clause:
             order_expression_columns = self._materialize_order_expression_columns(
                 grouped_rows,
@@ -3040,9 +4171,9 @@ class SharedExecutor:
                 order_by_clause,
                 value_getter=lambda r, col: self._resolve_row_value(r, col),
                 available_columns=available_order_columns,
+                limit=None if limit is None else offset + limit,
             )
 
-        offset, limit = self._resolve_pagination(parsed)
         if offset:
             grouped_rows = grouped_rows[offset:]
         if limit is not None:
@@ -3164,10 +4295,11 @@ class SharedExecutor:
             if not numeric_values:
                 return None
             return sum(numeric_values) / len(numeric_values)
-        if aggregate == "MIN":
-            return min(values, key=lambda v: self._sort_key(v))
-        if aggregate == "MAX":
-            return max(values, key=lambda v: self._sort_key(v))
+        if aggregate in {"MIN", "MAX"}:
+            sort_key = self._sort_key_function(self._column_affinity(values))
+            if aggregate == "MIN":
+                return min(values, key=sort_key)
+            return max(values, key=sort_key)
         raise SqlSemanticError(f"Unsupported aggregate function: {func}")
 
     def _call_function(self, name: str, args: list[Any]) -> Any:
@@ -3578,6 +4710,116 @@ class SharedExecutor:
             right if right is not None else ""
         )
 
+    def _literal_comparison(
+        self, right: Any, affinity: str = MIXED
+    ) -> tuple[str, Any] | None:
+        """How :meth:`_coerce_for_compare` pairs values of *affinity* with *right*.
+
+        Returns ``(NUMERIC, float)``, ``(TEMPORAL, datetime)`` or ``(TEXT,
+        str)``: the form every non-NULL left value of *affinity* is compared
+        in, and *right* in that form.  ``TEXT`` compares ``str(left)``.
+        Returns ``None`` when the form depends on the left value.  Evaluators
+        that compare a whole column at once use this to stay in step with
+        the row-by-row coercion.
+        """
+        if isinstance(right, bool) and affinity == MIXED:
+            return None  # bool = bool compares as int, anything else as text.
+        right_text = str(right if right is not None else "")
+        right_temporal = self._coerce_temporal_value(right)
+        right_num = self._to_number(right)
+        if affinity == NUMERIC and right_num is not None:
+            return NUMERIC, right_num
+        if affinity == TEMPORAL and right_temporal is not None:
+            return TEMPORAL, right_temporal
+        if affinity != MIXED or (right_temporal is None and right_num is None):
+            return TEXT, right_text
+        return None
+
+    def _compare_coercer(
+        self, right: Any, affinity: str = MIXED
+    ) -> Callable[[Any], tuple[Any, Any]]:
+        """Specialize :meth:`_coerce_for_compare` for a fixed right operand.
+
+        The right operand's temporal/numeric forms are computed once, and the
+        left operand is only parsed for the forms the right one can pair with.
+        When the left operands come from a column of known *affinity* (see
+        :func:`infer_affinity`), the forms they cannot take are not tried;
+        see :meth:`_literal_comparison`.
+        """
+        right_text = str(right if right is not None else "")
+        coerce_temporal = self._coerce_temporal_value
+        to_number = self._to_number
+
+        form = self._literal_comparison(right, affinity)
+        if form is not None:
+            kind, bound = form
+            if kind == NUMERIC:
+                return lambda left: (
+                    (float(left), bound) if left is not None else ("", right_text)
+                )
+            if kind == TEMPORAL:
+                return lambda left: (
+                    (coerce_temporal(left), bound)
+                    if left is not None
+                    else ("", right_text)
+                )
+            if affinity == TEXT:
+                return lambda left: (left if left is not None else "", bound)
+            return lambda left: (str(left) if left is not None else "", bound)
+
+        right_is_bool = isinstance(right, bool)
+        right_temporal = self._coerce_temporal_value(right)
+        right_num = self._to_number(right)
+
+        def coerce(left: Any) -> tuple[Any, Any]:
+            if right_is_bool and isinstance(left, bool):
+                return int(left), int(right)
+            if right_temporal is not None:
+                left_temporal = coerce_temporal(left)
+                if left_temporal is not None:
+                    return left_temporal, right_temporal
+            if right_num is not None:
+                left_num = to_number(left)
+                if left_num is not None:
+                    return left_num, right_num
+            return str(left if left is not None else ""), right_text
+
+        return coerce
+
+    def _equality_key(self, value: Any) -> Any:
+        """Hashable key that mirrors ``=`` under :meth:`_coerce_for_compare`.
+
+        Two non-NULL values compare equal exactly when their keys are equal.
+        Returns ``None`` for values that never compare equal (NULL, NaN) and
+        ``_AMBIGUOUS_KEY`` for values whose comparison class depends on the
+        other operand (e.g. ``"20240101"`` is both a date and a number).
+        """
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            # bool = bool compares as int; bool = anything else as text.
+            return ("s", str(value))
+        if isinstance(value, (int, float)):
+            numeric = float(value)
+            return None if numeric != numeric else ("n", numeric)
+        if isinstance(value, (datetime, date)):
+            return ("t", self._coerce_temporal_value(value))
+        text = value if isinstance(value, str) else str(value)
+        temporal = self._parse_datetime_string(text)
+        numeric_text = self._to_number(text)
+        if isinstance(value, str):
+            if temporal is not None and numeric_text is not None:
+                return _AMBIGUOUS_KEY
+            if temporal is not None:
+                return ("t", temporal)
+            if numeric_text is not None:
+                return None if numeric_text != numeric_text else ("n", numeric_text)
+            return ("s", text)
+        if temporal is not None or numeric_text is not None:
+            # Other objects compare by their text, which could look numeric.
+            return _AMBIGUOUS_KEY
+        return ("s", text)
+
     def _sort_key(self, value: Any) -> tuple[int, Any]:
         if value is None:
             return (1, (0, ""))
@@ -3598,6 +4840,25 @@ class SharedExecutor:
 
         return (0, (4, str(value)))
 
+    def _sort_key_function(self, affinity: str) -> Callable[[Any], tuple[int, Any]]:
+        """:meth:`_sort_key` specialized for values of a known *affinity*."""
+        if affinity == NUMERIC:
+            return lambda value: (
+                (1, (0, "")) if value is None else (0, (0, float(value)))
+            )
+        if affinity == TEXT:
+            return lambda value: (1, (0, "")) if value is None else (0, (3, value))
+        if affinity == TEMPORAL:
+            coerce_temporal = self._coerce_temporal_value
+            return lambda value: (
+                (1, (0, "")) if value is None else (0, (2, coerce_temporal(value)))
+            )
+        return self._sort_key
+
+    def _column_affinity(self, values: Iterable[Any]) -> str:
+        """Type affinity of a column's values (see :func:`infer_affinity`)."""
+        return infer_affinity(values, self._to_number, self._parse_datetime_string)
+
     @staticmethod
     def _coerce_temporal_value(value: Any) -> datetime | None:
         if isinstance(value, datetime):
@@ -3691,7 +4952,81 @@ class SharedExecutor:
         resolved_sheet = self._resolve_sheet_name(requested_name)
         if resolved_sheet is None:
             return None, None
-        return resolved_sheet, self.backend.read_sheet(resolved_sheet)
+        return resolved_sheet, self.read_sheet(resolved_sheet)
+
+    def _can_push_down(self, requested_name: str, where: dict[str, Any]) -> bool:
+        """Whether *where* can be evaluated by the backend while it reads.
+
+        Requires backend support, a sheet (not a CTE) and a WHERE tree the
+        compiler handles, which rules out subqueries and EXISTS.
+        """
+        if not self.backend.supports_predicate_pushdown:
+            return False
+        if self._resolve_cte_name(requested_name) is not None:
+            return False
+        return ExpressionCompiler(self, lambda name: None).where(where) is not None
+
+    def _scan_table(
+        self,
+        requested_name: str,
+        predicate: _PushdownFilter | None = None,
+        columns: set[str] | None = None,
+    ) -> tuple[
+        str | None, list[str] | None, Iterable[list[Any]] | ColumnarTableData
+    ]:
+        """Resolve a table for a single-source scan.
+
+        Sheets are read through ``iter_sheet`` when the backend streams rows,
+        so callers can stop consuming early without materializing the sheet.
+        Column-oriented sheets are returned as-is for column-wise filtering.
+        A *predicate* is passed to the backend, which then returns only the
+        matching rows; *columns* lets it leave out the other columns.  A
+        sheet already read in full by the running statement is not read again.
+        """
+        cte_name = self._resolve_cte_name(requested_name)
+        if cte_name is not None:
+            cte_data = self._cte_tables[cte_name]
+            return cte_name, cte_data.headers, cte_data.rows
+
+        resolved_sheet = self._resolve_sheet_name(requested_name)
+        if resolved_sheet is None:
+            return None, None, ()
+        options: dict[str, Any] = {}
+        if predicate is not None:
+            options["predicate"] = predicate
+        if columns is not None:
+            options["columns"] = columns
+        data = self._cached_sheet(resolved_sheet)
+        if data is None and self._scanned_before(resolved_sheet):
+            data = self.read_sheet(resolved_sheet)
+        if data is not None:
+            # Reuse the statement's earlier full read; the caller copes with
+            # columns it did not ask for, but the filter must run here.
+            if predicate is not None:
+                test = predicate.bind(data.headers)
+                rows = (
+                    data.iter_rows()
+                    if isinstance(data, ColumnarTableData)
+                    else iter(data.rows)
+                )
+                return resolved_sheet, data.headers, (row for row in rows if test(row))
+        elif self.backend.supports_streaming:
+            headers, row_iter = self.backend.iter_sheet(resolved_sheet, **options)
+            return resolved_sheet, headers, row_iter
+        elif options:
+            data = self.backend.read_sheet(resolved_sheet, **options)
+        else:
+            data = self.read_sheet(resolved_sheet)
+        if isinstance(data, ColumnarTableData) and data.columns is not None:
+            return resolved_sheet, data.headers, data
+        return resolved_sheet, data.headers, data.rows
+
+    def _raise_table_not_found(self, table: str) -> NoReturn:
+        available = self._available_table_names()
+        msg = f"Sheet '{table}' not found in Excel."
+        if available:
+            msg += f" Available sheets: {available}"
+        raise SqlSemanticError(msg)
 
     def _available_table_names(self) -> list[str]:
         names = list(self.backend.list_sheets())
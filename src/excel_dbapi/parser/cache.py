@@ -0,0 +1,171 @@
+"""LRU cache of parsed statements with late parameter binding.
+
+The parser binds ``?`` values directly into the AST, so a statement cannot be
+reused across parameter sets as-is.  :class:`StatementCache` parses each SQL
+text once with placeholder slots in place of the parameters and binds the
+real values into a fresh copy of that template on every execution.
+"""
+
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+from ..exceptions import ProgrammingError, SqlParseError
+from .select import _validate_non_negative_pagination
+from .tokenizer import _count_unquoted_placeholders
+
+_SLOT_MARKER = "\x00excel_dbapi_param_slot\x00"
+
+
+class _ParamSlot(int):
+    """Stand-in for the parameter at ``index`` while a template is parsed.
+
+    It subclasses ``int`` so parse-time checks such as ``LIMIT ?`` accept it;
+    its text form is a marker so templates that embed a parameter into a
+    string (and therefore cannot be re-bound) are detected and not cached.
+    """
+
+    index: int
+
+    def __new__(cls, index: int) -> "_ParamSlot":
+        slot = super().__new__(cls, 0)
+        slot.index = index
+        return slot
+
+    def __repr__(self) -> str:
+        return f"{_SLOT_MARKER}{self.index}"
+
+    __str__ = __repr__
+
+    def __format__(self, format_spec: str) -> str:
+        return repr(self)
+
+
+class _Template(NamedTuple):
+    parsed: dict[str, Any]
+    param_count: int
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_UNCACHEABLE = object()
+
+
+class StatementCache:
+    """Per-connection LRU cache mapping SQL text to parsed statement templates."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if isinstance(maxsize, bool) or not isinstance(maxsize, int) or maxsize <= 0:
+            raise ProgrammingError(
+                "statement_cache_size must be a positive integer (0 disables the cache)"
+            )
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+    def parse(
+        self, query: str, params: Optional[tuple[Any, ...]] = None
+    ) -> dict[str, Any]:
+        """Return the parsed form of *query* with *params* bound."""
+        from . import parse_sql
+
+        entry = self._entries.get(query)
+        if entry is None:
+            entry = self._build_template(query)
+            self._entries[query] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self.misses += 1
+        else:
+            self._entries.move_to_end(query)
+            if entry is _UNCACHEABLE:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if entry is _UNCACHEABLE:
+            # Remembered so the template parse is not retried on every call.
+            return parse_sql(query, params)
+        template: _Template = entry
+        supplied = len(params) if params is not None else 0
+        if supplied != template.param_count:
+            # Let the parser produce its usual placeholder-count error.
+            return parse_sql(query, params)
+        bound: dict[str, Any] = _bind(template.parsed, params or ())
+        bound["params"] = params
+        return bound
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _build_template(query: str) -> Any:
+        from . import parse_sql
+
+        param_count = _count_unquoted_placeholders(query)
+        slots = tuple(_ParamSlot(index) for index in range(param_count))
+        try:
+            parsed = parse_sql(query, slots or None)
+        except Exception:
+            return _UNCACHEABLE
+        parsed.pop("params", None)
+        found: list[int] = []
+        if not _collect_slots(parsed, found) or set(found) != set(range(param_count)):
+            return _UNCACHEABLE
+        return _Template(parsed, param_count)
+
+
+def _collect_slots(node: Any, found: list[int]) -> bool:
+    """Record slot positions; return False if the template cannot be re-bound."""
+    if type(node) is _ParamSlot:
+        found.append(node.index)
+        return True
+    if isinstance(node, str):
+        return _SLOT_MARKER not in node
+    if isinstance(node, dict):
+        return all(
+            _collect_slots(key, found) and _collect_slots(value, found)
+            for key, value in node.items()
+        )
+    if isinstance(node, list) or type(node) is tuple:
+        return all(_collect_slots(item, found) for item in node)
+    if isinstance(node, tuple):
+        # Tuple subclasses (named tuples) cannot be rebuilt generically.
+        return not any(type(item) is _ParamSlot for item in node)
+    return True
+
+
+def _bind(node: Any, params: tuple[Any, ...]) -> Any:
+    if type(node) is _ParamSlot:
+        return params[node.index]
+    if isinstance(node, dict):
+        bound = {key: _bind(value, params) for key, value in node.items()}
+        if "action" in node:
+            _validate_bound_pagination(node, bound)
+        return bound if type(node) is dict else type(node)(bound)
+    if isinstance(node, list):
+        items = [_bind(item, params) for item in node]
+        return items if type(node) is list else type(node)(items)
+    if type(node) is tuple:
+        return tuple(_bind(item, params) for item in node)
+    return node
+
+
+def _validate_bound_pagination(template: dict[str, Any], bound: dict[str, Any]) -> None:
+    for key, clause_name in (("limit", "LIMIT"), ("offset", "OFFSET")):
+        if type(template.get(key)) is not _ParamSlot:
+            continue
+        value = bound[key]
+        if not isinstance(value, int):
+            raise SqlParseError(f"{clause_name} must be an integer")
+        _validate_non_negative_pagination(value, clause_name)
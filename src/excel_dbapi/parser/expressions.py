@@ -570,7 +570,7 @@ def _find_top_level_window_clause_index(
                 and index + 1 < len(tokens)
                 and tokens[index + 1].upper() == "BY"
             )
-            or upper == "ROWS"
+            or upper in {"ROWS", "RANGE"}
         ):
             return index
         index += 1
@@ -582,7 +582,13 @@ def _parse_window_spec_tokens(
     start_index: int,
     *,
     outer_sources: set[str] | None,
-) -> tuple[list[Any], list[dict[str, Any]], int]:
+) -> tuple[list[Any], list[dict[str, Any]], str | None, int]:
+    """Parse ``OVER (...)`` into PARTITION BY, ORDER BY, frame and the next index.
+
+    The frame is ``"ROWS"`` for ``ROWS BETWEEN UNBOUNDED PRECEDING AND
+    CURRENT ROW`` and ``None`` for the default ``RANGE`` frame, which can also
+    be spelled out; other frames are rejected.
+    """
     if start_index >= len(tokens) or tokens[start_index].upper() != "OVER":
         raise SqlParseError("Invalid window function: missing OVER")
     if start_index + 1 >= len(tokens) or tokens[start_index + 1] != "(":
@@ -638,10 +644,10 @@ def _parse_window_spec_tokens(
         )
         index = order_end
 
+    frame: str | None = None
     if index < len(spec_tokens):
         frame_tokens = [token.upper() for token in spec_tokens[index:]]
-        if frame_tokens != [
-            "ROWS",
+        if frame_tokens[0] not in {"ROWS", "RANGE"} or frame_tokens[1:] != [
             "BETWEEN",
             "UNBOUNDED",
             "PRECEDING",
@@ -650,8 +656,10 @@ def _parse_window_spec_tokens(
             "ROW",
         ]:
             raise SqlParseError("Unsupported window frame specification")
+        if frame_tokens[0] == "ROWS":
+            frame = "ROWS"
 
-    return partition_by, order_by, spec_end + 1
+    return partition_by, order_by, frame, spec_end + 1
 
 
 def _parse_window_or_aggregate_expression_tokens(
@@ -677,7 +685,7 @@ def _parse_window_or_aggregate_expression_tokens(
             aggregate_expression["filter"] = filter_clause
 
         if index < len(tokens) and tokens[index].upper() == "OVER":
-            partition_by, order_by, index = _parse_window_spec_tokens(
+            partition_by, order_by, frame, index = _parse_window_spec_tokens(
                 tokens,
                 index,
                 outer_sources=outer_sources,
@@ -695,6 +703,8 @@ def _parse_window_or_aggregate_expression_tokens(
                 window_function["distinct"] = True
             if filter_clause is not None:
                 window_function["filter"] = filter_clause
+            if frame is not None:
+                window_function["frame"] = frame
             return window_function
 
         if index == len(tokens):
@@ -718,7 +728,7 @@ def _parse_window_or_aggregate_expression_tokens(
             ):
                 return None
 
-            partition_by, order_by, next_index = _parse_window_spec_tokens(
+            partition_by, order_by, _, next_index = _parse_window_spec_tokens(
                 tokens,
                 function_end + 1,
                 outer_sources=outer_sources,
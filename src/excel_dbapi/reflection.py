@@ -33,6 +33,17 @@ def _resolve_sheet_name(connection: Any, table_name: str) -> str | None:
     return None
 
 
+def _read_sheet(connection: Any, sheet_name: str) -> TableData:
+    """Read *sheet_name* through the connection's executor when it has one.
+
+    Reads made while a statement runs then share the executor's sheet cache.
+    """
+    executor = getattr(connection, "_executor", None)
+    if executor is not None:
+        return cast(TableData, executor.read_sheet(sheet_name))
+    return cast(TableData, connection.engine.read_sheet(sheet_name))
+
+
 def get_columns(
     connection: Any, table_name: str, sample_size: int | None = 100
 ) -> list[dict[str, Any]]:
@@ -41,7 +52,7 @@ def get_columns(
     if resolved_table_name is None:
         raise BackendOperationError(f"Sheet '{table_name}' not found in Excel")
 
-    data = connection.engine.read_sheet(resolved_table_name)
+    data = _read_sheet(connection, resolved_table_name)
     columns: list[dict[str, Any]] = []
     sampled_rows = data.rows if sample_size is None else data.rows[:sample_size]
     for index, header in enumerate(data.headers):
@@ -119,7 +130,7 @@ def write_table_metadata(
             ],
         )
 
-    existing = engine.read_sheet(METADATA_SHEET)
+    existing = _read_sheet(connection, METADATA_SHEET)
     table_name_key = table_name.casefold()
     new_rows = [
         row
@@ -164,7 +175,7 @@ def read_table_metadata(
     if METADATA_SHEET not in sheets:
         return None
 
-    data = connection.engine.read_sheet(METADATA_SHEET)
+    data = _read_sheet(connection, METADATA_SHEET)
     table_name_key = table_name.casefold()
     entries = [
         row for row in data.rows if row and str(row[0]).casefold() == table_name_key
@@ -191,7 +202,7 @@ def remove_table_metadata(connection: Any, table_name: str) -> None:
     if METADATA_SHEET not in sheets:
         return
 
-    data = connection.engine.read_sheet(METADATA_SHEET)
+    data = _read_sheet(connection, METADATA_SHEET)
     table_name_key = table_name.casefold()
     new_rows = [
         row for row in data.rows if not row or str(row[0]).casefold() != table_name_key
@@ -0,0 +1,56 @@
+"""Serve Graph JSON ``$batch`` calls from a per-request mock handler."""
+
+from typing import Any, Callable
+
+import httpx
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+BATCH_PATH = "/v1.0/$batch"
+
+
+def batch_aware(handler: Handler) -> Handler:
+    """Wrap *handler* so each ``$batch`` entry is dispatched to it.
+
+    Entries run in order, like Graph does for a ``dependsOn`` chain; an entry
+    whose dependency failed gets ``424 Failed Dependency`` without reaching
+    *handler*.
+    """
+
+    def wrapper(request: httpx.Request) -> httpx.Response:
+        if request.url.path != BATCH_PATH:
+            return handler(request)
+        payload = httpx.Response(200, content=request.content).json()
+        statuses: dict[str, int] = {}
+        responses: list[dict[str, Any]] = []
+        for entry in payload["requests"]:
+            if any(
+                not 200 <= statuses[dependency] < 300
+                for dependency in entry.get("dependsOn", [])
+            ):
+                statuses[entry["id"]] = 424
+                responses.append({"id": entry["id"], "status": 424})
+                continue
+            kwargs: dict[str, Any] = {"headers": entry.get("headers", {})}
+            if entry.get("body") is not None:
+                kwargs["json"] = entry["body"]
+            sub_request = httpx.Request(
+                entry["method"], f"https://graph.microsoft.com/v1.0{entry['url']}", **kwargs
+            )
+            sub_response = handler(sub_request)
+            sub_response.read()
+            statuses[entry["id"]] = sub_response.status_code
+            item: dict[str, Any] = {
+                "id": entry["id"],
+                "status": sub_response.status_code,
+                "headers": dict(sub_response.headers),
+            }
+            if sub_response.content:
+                try:
+                    item["body"] = sub_response.json()
+                except ValueError:
+                    item["body"] = sub_response.text
+            responses.append(item)
+        return httpx.Response(200, json={"responses": responses})
+
+    return wrapper
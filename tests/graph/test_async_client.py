@@ -0,0 +1,151 @@
+"""Tests for AsyncGraphClient and AsyncWorkbookSession."""
+
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from excel_dbapi.engines.graph import AsyncGraphClient, AsyncWorkbookSession
+from excel_dbapi.engines.graph.auth import StaticTokenProvider
+from excel_dbapi.engines.graph.locator import parse_msgraph_dsn
+from excel_dbapi.exceptions import InterfaceError, OperationalError
+
+
+def _client(handler: Any, **kwargs: Any) -> AsyncGraphClient:
+    return AsyncGraphClient(
+        StaticTokenProvider("test-tok"), transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+def _statuses(statuses: list[int]) -> Any:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses[min(calls["n"], len(statuses) - 1)]
+        calls["n"] += 1
+        return httpx.Response(status, json={"attempt": calls["n"]})
+
+    handler.calls = calls  # type: ignore[attr-defined]
+    return handler
+
+
+def test_get_sends_auth_and_session_headers() -> None:
+    captured: dict[str, Any] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.update(request.headers)
+        return httpx.Response(200, json={"ok": True})
+
+    async def main() -> Any:
+        async with _client(handler) as client:
+            client.session_id = "sess-7"
+            return (await client.get("/test")).json()
+
+    assert asyncio.run(main()) == {"ok": True}
+    assert captured["authorization"] == "Bearer test-tok"
+    assert captured["workbook-session-id"] == "sess-7"
+
+
+def test_retry_backs_off_with_asyncio_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("excel_dbapi.engines.graph.client.asyncio.sleep", fake_sleep)
+    monkeypatch.setattr(
+        "excel_dbapi.engines.graph.client.time.sleep",
+        lambda _: pytest.fail("blocking sleep in async client"),
+    )
+    handler = _statuses([503, 429, 200])
+
+    async def main() -> Any:
+        async with _client(handler, backoff_factor=0.25) as client:
+            return (await client.get("/test")).json()
+
+    assert asyncio.run(main()) == {"attempt": 3}
+    assert sleeps == [0.25, 0.5]
+
+
+def test_unsafe_method_is_not_retried() -> None:
+    handler = _statuses([503, 200])
+
+    async def main() -> None:
+        async with _client(handler) as client:
+            await client.post("/create", json={})
+
+    with pytest.raises(OperationalError, match="not retried"):
+        asyncio.run(main())
+    assert handler.calls["n"] == 1
+
+
+def test_error_statuses_are_translated() -> None:
+    async def fetch(status: int) -> None:
+        async with _client(_statuses([status])) as client:
+            await client.get("/test")
+
+    with pytest.raises(InterfaceError, match="401"):
+        asyncio.run(fetch(401))
+    with pytest.raises(OperationalError, match="Workbook not found"):
+        asyncio.run(fetch(404))
+
+
+def test_batch_returns_responses_in_request_order() -> None:
+    captured: dict[str, Any] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["body"] = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={
+                "responses": [
+                    {"id": "2", "status": 424},
+                    {"id": "1", "status": 200, "body": {"ok": True}},
+                ]
+            },
+        )
+
+    async def main() -> list[httpx.Response]:
+        async with _client(handler) as client:
+            client.session_id = "sess-7"
+            return await client.batch(
+                [
+                    {"id": "1", "method": "GET", "url": "/a"},
+                    {"id": "2", "method": "GET", "url": "/b", "dependsOn": ["1"]},
+                ]
+            )
+
+    responses = asyncio.run(main())
+    assert [r.status_code for r in responses] == [200, 424]
+    assert responses[0].json() == {"ok": True}
+    assert captured["body"]["requests"][1]["headers"] == {"workbook-session-id": "sess-7"}
+
+
+def test_session_opens_and_closes() -> None:
+    calls: list[tuple[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(
+            (request.url.path.rsplit("/", 1)[-1], request.headers.get("workbook-session-id"))
+        )
+        if request.url.path.endswith("/createSession"):
+            assert json.loads(request.content) == {"persistChanges": True}
+            return httpx.Response(201, json={"id": "sess-async"})
+        return httpx.Response(204)
+
+    locator = parse_msgraph_dsn("msgraph://drives/drv-a/items/itm-a")
+
+    async def main() -> None:
+        async with _client(handler) as client:
+            session = AsyncWorkbookSession(client, locator, persist_changes=True)
+            async with session:
+                assert session.is_open
+                assert client.session_id == "sess-async"
+                await session.ensure_open()
+            assert not session.is_open
+            assert client.session_id is None
+
+    asyncio.run(main())
+    assert calls == [("createSession", None), ("closeSession", "sess-async")]
@@ -9,6 +9,8 @@ from excel_dbapi.exceptions import DatabaseError
 
 from excel_dbapi.engines.graph.backend import GraphBackend, _col_letter
 from excel_dbapi.exceptions import NotSupportedError
+from tests.graph.batch_transport import batch_aware
+from tests.graph.used_range import used_range_response
 
 
 DSN = "msgraph://drives/drv-1/items/itm-1"
@@ -138,8 +140,8 @@ def _writable_handler_factory():
         if "usedRange" in path and method == "GET":
             for ws_id, ws_data in state["worksheets"].items():
                 if ws_id in path:
-                    return httpx.Response(200, json={"values": ws_data["values"]})
-            return httpx.Response(200, json={"values": []})
+                    return used_range_response(request, ws_data["values"])
+            return used_range_response(request, [])
 
         # PATCH range (write data)
         if "/range(" in path and method == "PATCH":
@@ -160,7 +162,7 @@ def _writable_handler_factory():
 def _make_writable_backend(**kwargs: Any):
     """Create a writable backend + its state tracker."""
     handler, state = _writable_handler_factory()
-    transport = httpx.MockTransport(handler)
+    transport = httpx.MockTransport(batch_aware(handler))
     backend = GraphBackend(
         DSN,
         credential="test-token",
@@ -274,8 +276,10 @@ class TestGraphBackendReadSheet:
 
         assert data.headers == ["id"]
         used_range_paths = [raw for path, raw in requests if "usedRange" in path]
-        assert len(used_range_paths) == 1
-        assert b"/worksheets/%7Bws-1%7D/usedRange" in used_range_paths[0]
+        # A size probe, then the values.
+        assert len(used_range_paths) == 2
+        for raw_path in used_range_paths:
+            assert b"/worksheets/%7Bws-1%7D/usedRange" in raw_path
 
     def test_read_unknown_sheet(self):
         backend = _make_backend()
@@ -451,6 +455,35 @@ class TestGraphBackendAppendRow:
         backend.close()
 
 
+class TestGraphBackendAppendRows:
+    def test_append_rows_single_patch(self):
+        backend, state = _make_writable_backend()
+        rows = [[3, "Carol", "carol@example.com"], [4, "Dan"], [5, "Eve", "e", "extra"]]
+        assert backend.append_rows("Users", rows) == (4, 6)
+        patch_reqs = [r for r in state["requests"] if r[0] == "PATCH"]
+        assert len(patch_reqs) == 1
+        assert "address='A4:C6'" in patch_reqs[0][1]
+        assert patch_reqs[0][2]["values"] == [
+            [3, "Carol", "carol@example.com"],
+            [4, "Dan", None],
+            [5, "Eve", "e"],
+        ]
+        backend.close()
+
+    def test_append_rows_rejects_empty_batch(self):
+        backend, state = _make_writable_backend()
+        with pytest.raises(DatabaseError, match="at least one row"):
+            backend.append_rows("Users", [])
+        assert not [r for r in state["requests"] if r[0] == "PATCH"]
+        backend.close()
+
+    def test_append_rows_read_only(self):
+        backend = _make_backend()
+        backend.load()
+        with pytest.raises(NotSupportedError, match="read-only"):
+            backend.append_rows("Users", [[3, "Carol", "carol@example.com"]])
+
+
 class TestGraphBackendWriteSheet:
     def test_write_sheet_full_overwrite(self):
         from excel_dbapi.engines.base import TableData
@@ -0,0 +1,250 @@
+"""Tests for GraphBackend reads of tall worksheets in concurrent row blocks."""
+
+import re
+import threading
+from typing import Any
+
+import httpx
+import pytest
+
+from excel_dbapi.connection import ExcelConnection
+from excel_dbapi.engines.graph.backend import GraphBackend
+from excel_dbapi.exceptions import BackendOperationError, OperationalError
+from tests.graph.used_range import used_range_response
+
+
+DSN = "msgraph://drives/drv-blk/items/itm-blk"
+VALUES: list[list[Any]] = [["id", "name", "score"]] + [
+    [index, f"user-{index}", index * 10] for index in range(1, 23)
+]
+
+
+def _block_handler(
+    barrier: threading.Barrier | None = None,
+    address: str = "Sheet!A1:C23",
+) -> tuple[httpx.MockTransport, dict[str, Any]]:
+    """Serve ``VALUES`` as usedRange and as ``range(address=...)`` blocks.
+
+    The used range is at *address*.  Block requests wait on *barrier*, if
+    given, so a test can require that several of them are in flight at
+    once.  Requests in another session than ``state["session"]`` fail as
+    expired, as do all once ``state["expire_at_block"]`` is set and the
+    first block is requested.  Each block request is answered with
+    ``state["etag"]()``.
+    """
+    state: dict[str, Any] = {
+        "blocks": [],
+        "selects": [],
+        "in_flight": 0,
+        "peak": 0,
+        "sessions": 0,
+        "session": "sess-blk-1",
+        "etag": lambda: '"v1"',
+    }
+    lock = threading.Lock()
+    headers = {"ETag": '"v1"'}
+    # Blocks of an address without rows are served as if it started at A1.
+    origin = re.search(r"!([A-Z]+)(\d+):([A-Z]+)", address) or re.search(
+        r"([A-Z]+)(\d+):([A-Z]+)", "A1:C"
+    )
+    assert origin is not None
+    columns = f"{origin.group(1)}(\\d+):{origin.group(3)}(\\d+)"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/createSession"):
+            with lock:
+                state["sessions"] += 1
+                state["session"] = f"sess-blk-{state['sessions']}"
+            return httpx.Response(201, json={"id": state["session"]})
+        if path.endswith("/closeSession"):
+            return httpx.Response(204)
+        with lock:
+            if "range(" in path and state.pop("expire_at_block", False):
+                state["session"] = "sess-expired"
+        if request.headers.get("workbook-session-id") != state["session"]:
+            return httpx.Response(404, json={"error": {"code": "invalidSessionId"}})
+        if path.endswith("/worksheets"):
+            return httpx.Response(200, json={"value": [{"id": "ws-1", "name": "Users"}]})
+        if "usedRange" in path:
+            state["selects"].append(request.url.params.get("$select"))
+            if request.headers.get("If-None-Match") == headers["ETag"]:
+                return httpx.Response(304, headers=headers)
+            return used_range_response(request, VALUES, address, headers=headers)
+        match = re.search(rf"range\(address='{columns}'\)", path)
+        if match is None or request.method != "GET":
+            return httpx.Response(404)
+        with lock:
+            state["blocks"].append(match.group(0))
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            if barrier is not None:
+                barrier.wait(timeout=5)
+            offset = int(origin.group(2)) - 1
+            first, last = int(match.group(1)) - offset, int(match.group(2)) - offset
+            return httpx.Response(
+                200,
+                json={"values": VALUES[first - 1 : last]},
+                headers={"ETag": state["etag"]()},
+            )
+        finally:
+            with lock:
+                state["in_flight"] -= 1
+
+    return httpx.MockTransport(handler), state
+
+
+def _make_backend(
+    barrier: threading.Barrier | None = None,
+    address: str = "Sheet!A1:C23",
+    **kwargs: Any,
+) -> tuple[GraphBackend, dict[str, Any]]:
+    transport, state = _block_handler(barrier, address)
+    backend = GraphBackend(DSN, credential="tok", transport=transport, **kwargs)
+    return backend, state
+
+
+def test_tall_sheet_is_read_in_row_blocks() -> None:
+    backend, state = _make_backend(read_block_rows=5, read_workers=2)
+
+    data = backend.read_sheet("Users")
+
+    assert data.headers == ["id", "name", "score"]
+    assert data.rows == VALUES[1:]
+    assert state["selects"] == ["address,rowCount,columnCount"]
+    assert len(state["blocks"]) == 5
+    assert set(state["blocks"]) == {
+        "range(address='A1:C5')",
+        "range(address='A6:C10')",
+        "range(address='A11:C15')",
+        "range(address='A16:C20')",
+        "range(address='A21:C23')",
+    }
+    assert state["peak"] <= 2
+    backend.close()
+
+
+def test_blocks_are_downloaded_concurrently() -> None:
+    backend, state = _make_backend(
+        threading.Barrier(3), read_block_rows=8, read_workers=3
+    )
+
+    assert backend.read_sheet("Users").rows == VALUES[1:]
+    assert state["peak"] == 3
+    backend.close()
+
+
+def test_unchanged_block_read_is_revalidated_from_cache() -> None:
+    backend, state = _make_backend(read_block_rows=5)
+    backend.read_sheet("Users")
+    state["blocks"].clear()
+
+    assert backend.read_sheet("Users").rows == VALUES[1:]
+    assert state["blocks"] == []
+    assert state["selects"] == ["address,rowCount,columnCount"] * 2
+    backend.close()
+
+
+def test_blocks_are_offset_by_the_used_range_origin() -> None:
+    backend, state = _make_backend(address="Data!B3:D25", read_block_rows=10)
+
+    assert backend.read_sheet("Users").rows == VALUES[1:]
+    assert set(state["blocks"]) == {
+        "range(address='B3:D12')",
+        "range(address='B13:D22')",
+        "range(address='B23:D25')",
+    }
+    backend.close()
+
+
+def test_unparsable_used_range_address_is_read_in_one_request() -> None:
+    backend, state = _make_backend(address="Data!B:D", read_block_rows=5)
+
+    assert backend.read_sheet("Users").rows == VALUES[1:]
+    assert state["blocks"] == []
+    assert state["selects"] == ["address,rowCount,columnCount", "values"]
+    backend.close()
+
+
+def test_expired_session_is_reopened_once_for_concurrent_blocks() -> None:
+    backend, state = _make_backend(read_block_rows=5, read_workers=3)
+    state["expire_at_block"] = True
+
+    assert backend.read_sheet("Users").rows == VALUES[1:]
+    assert state["sessions"] == 2
+    backend.close()
+
+
+def test_blocks_read_across_a_change_are_read_again() -> None:
+    backend, state = _make_backend(read_block_rows=5)
+    etags = iter(['"v1"', '"v2"'])
+    state["etag"] = lambda: next(etags, '"v1"')
+
+    assert backend.read_sheet("Users").rows == VALUES[1:]
+    assert len(state["blocks"]) == 10
+    backend.close()
+
+
+def test_sheet_that_keeps_changing_raises() -> None:
+    backend, state = _make_backend(read_block_rows=5, read_workers=1)
+    versions = iter(range(100))
+    state["etag"] = lambda: f'"v{next(versions)}"'
+
+    with pytest.raises(OperationalError, match="kept changing"):
+        backend.read_sheet("Users")
+    backend.close()
+
+
+def test_short_sheet_is_read_in_one_request() -> None:
+    backend, state = _make_backend(read_block_rows=50)
+    backend.read_sheet("Users")
+    backend.read_sheet("Users")
+
+    assert state["blocks"] == []
+    # The probe shows the sheet fits one block; later reads skip it.
+    assert state["selects"] == ["address,rowCount,columnCount", "values", "values"]
+    backend.close()
+
+
+def test_read_ahead_streams_blocks_into_the_executor() -> None:
+    transport, state = _block_handler()
+    conn = ExcelConnection(
+        DSN,
+        credential="tok",
+        transport=transport,
+        read_block_rows=4,
+        read_workers=1,
+        read_ahead=True,
+    )
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT id, name FROM Users LIMIT 2")
+    assert cursor.fetchall() == [(1, "user-1"), (2, "user-2")]
+    # The first block, and at most one block read ahead of it.
+    assert len(state["blocks"]) <= 2
+
+    cursor.execute("SELECT name FROM Users WHERE score > 180 ORDER BY id DESC")
+    assert cursor.fetchall() == [("user-22",), ("user-21",), ("user-20",), ("user-19",)]
+    conn.close()
+
+
+def test_read_ahead_raises_when_blocks_disagree() -> None:
+    transport, state = _block_handler()
+    versions = iter(range(100))
+    state["etag"] = lambda: f'"v{next(versions)}"'
+    conn = ExcelConnection(
+        DSN, credential="tok", transport=transport, read_block_rows=4, read_ahead=True
+    )
+
+    with pytest.raises(OperationalError, match="changed while it was read"):
+        conn.cursor().execute("SELECT id FROM Users ORDER BY id")
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    "options", [{"read_block_rows": -1}, {"read_workers": 0}]
+)
+def test_invalid_block_read_options(options: dict[str, Any]) -> None:
+    with pytest.raises(BackendOperationError, match="read_block_rows"):
+        GraphBackend(DSN, credential="tok", **options)
@@ -0,0 +1,231 @@
+"""Tests for GraphBackend full rewrites sent as row-block PATCHes."""
+
+import json
+import re
+import threading
+from typing import Any
+
+import httpx
+import pytest
+
+from excel_dbapi.connection import ExcelConnection
+from excel_dbapi.engines.base import TableData
+from excel_dbapi.engines.graph.backend import GraphBackend
+from excel_dbapi.exceptions import OperationalError
+from tests.graph.batch_transport import batch_aware
+from tests.graph.used_range import used_range_response
+
+
+DSN = "msgraph://drives/drv-wblk/items/itm-wblk"
+
+
+def _initial_values() -> list[list[Any]]:
+    return [["id", "name", "score"]] + [
+        [index, f"user-{index}", index] for index in range(1, 22)
+    ]
+
+
+def _block_write_handler(
+    *,
+    failures: dict[str, list[int]] | None = None,
+    barrier: threading.Barrier | None = None,
+) -> tuple[httpx.MockTransport, dict[str, Any]]:
+    """Stateful sheet that records writes and serves them from several threads.
+
+    *failures* maps a range address to statuses returned by its first PATCHes.
+    The first PATCHes without ``If-Match`` wait on *barrier*, if given.  Writes
+    honour ``If-Match`` and return the new ETag; after writing the range in
+    ``state["foreign_after"]`` another session changes the workbook too.
+    """
+    state: dict[str, Any] = {
+        "values": _initial_values(),
+        "writes": [],
+        "in_flight": 0,
+        "peak": 0,
+        "version": 1,
+        "waiting": 0,
+        "foreign_after": None,
+    }
+    pending = {address: list(statuses) for address, statuses in (failures or {}).items()}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        method = request.method
+        path = request.url.path
+        if path.endswith("/createSession"):
+            return httpx.Response(201, json={"id": "sess-wblk"})
+        if path.endswith("/closeSession"):
+            return httpx.Response(204)
+        if path.endswith("/workbook") and method == "GET":
+            state["writes"].append(("GET", "workbook", None))
+            return httpx.Response(200, json={"@odata.etag": f'"v{state["version"]}"'})
+        if path.endswith("/worksheets"):
+            return httpx.Response(200, json={"value": [{"id": "ws-1", "name": "Users"}]})
+        if "usedRange" in path:
+            return used_range_response(request, [list(row) for row in state["values"]])
+
+        match = re.search(r"address='([A-Z]+)(\d+):([A-Z]+)(\d+)'", path)
+        if match is None:
+            return httpx.Response(404)
+        address = f"{match.group(1)}{match.group(2)}:{match.group(3)}{match.group(4)}"
+        first, last = int(match.group(2)) - 1, int(match.group(4)) - 1
+        if_match = request.headers.get("if-match")
+        with lock:
+            state["writes"].append((method, address, if_match))
+            statuses = pending.get(address)
+            if statuses:
+                status = statuses.pop(0)
+                error = "invalidSessionId" if status == 404 else "injected"
+                return httpx.Response(status, json={"error": error})
+            if if_match is not None and if_match != f'"v{state["version"]}"':
+                return httpx.Response(412, json={"error": "precondition failed"})
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            wait = (
+                barrier is not None
+                and method == "PATCH"
+                and if_match is None
+                and state["waiting"] < barrier.parties
+            )
+            if wait:
+                state["waiting"] += 1
+        try:
+            if wait:
+                assert barrier is not None
+                barrier.wait(timeout=5)
+            with lock:
+                values: list[list[Any]] = state["values"]
+                if path.endswith("/clear"):
+                    for row in values[first : last + 1]:
+                        row[:] = [""] * len(row)
+                elif method == "PATCH":
+                    body = json.loads(request.content)
+                    while len(values) <= last:
+                        values.append([""] * 3)
+                    for offset, row in enumerate(body["values"]):
+                        values[first + offset] = list(row)
+                else:
+                    return httpx.Response(404)
+                state["version"] += 1
+                etag = f'"v{state["version"]}"'
+                if address == state["foreign_after"]:
+                    state["version"] += 1
+            return httpx.Response(200, json={}, headers={"ETag": etag})
+        finally:
+            with lock:
+                state["in_flight"] -= 1
+
+    return httpx.MockTransport(batch_aware(handler)), state
+
+
+def _connect(transport: httpx.MockTransport, **kwargs: Any) -> ExcelConnection:
+    options: dict[str, Any] = {"write_block_cells": 12, "backoff_factor": 0.0}
+    options.update(kwargs)
+    return ExcelConnection(
+        DSN, credential="tok", transport=transport, readonly=False, **options
+    )
+
+
+def _patches(state: dict[str, Any]) -> list[tuple[str, str, Any]]:
+    return [write for write in state["writes"] if write[0] == "PATCH"]
+
+
+def test_full_rewrite_is_sent_in_row_blocks() -> None:
+    transport, state = _block_write_handler()
+    conn = _connect(transport)
+
+    conn.cursor().execute("UPDATE Users SET score = 0")
+
+    # 22 rows of 3 cells in blocks of 12 cells: 4 rows per block, each
+    # conditional on the ETag the one before returned.
+    assert _patches(state) == [
+        ("PATCH", "A1:C4", '"v1"'),
+        ("PATCH", "A5:C8", '"v2"'),
+        ("PATCH", "A9:C12", '"v3"'),
+        ("PATCH", "A13:C16", '"v4"'),
+        ("PATCH", "A17:C20", '"v5"'),
+        ("PATCH", "A21:C22", '"v6"'),
+    ]
+    assert state["values"][0] == ["id", "name", "score"]
+    assert [row[2] for row in state["values"][1:]] == [0] * 21
+    conn.close()
+
+
+def test_change_between_blocks_raises() -> None:
+    transport, state = _block_write_handler()
+    state["foreign_after"] = "A5:C8"
+    conn = _connect(transport)
+
+    with pytest.raises(OperationalError, match="Concurrent modification"):
+        conn.cursor().execute("UPDATE Users SET score = 0")
+
+    assert [address for _, address, _ in _patches(state)] == ["A1:C4", "A5:C8", "A9:C12"]
+    conn.close()
+
+
+def test_expired_session_is_reopened_between_blocks() -> None:
+    transport, state = _block_write_handler(failures={"A9:C12": [404]})
+    conn = _connect(transport)
+
+    conn.cursor().execute("UPDATE Users SET score = 0")
+
+    assert len([write for write in _patches(state) if write[1] == "A9:C12"]) == 2
+    assert [row[2] for row in state["values"][1:]] == [0] * 21
+    conn.close()
+
+
+def test_unconditional_blocks_are_written_concurrently() -> None:
+    transport, state = _block_write_handler(barrier=threading.Barrier(3))
+    conn = _connect(transport, write_workers=3, conflict_strategy="force")
+
+    conn.cursor().execute("UPDATE Users SET score = 0")
+
+    assert state["peak"] == 3
+    assert all(if_match is None for _, _, if_match in _patches(state))
+    assert [row[2] for row in state["values"][1:]] == [0] * 21
+    conn.close()
+
+
+def test_clears_follow_the_blocks_in_the_etag_chain() -> None:
+    transport, state = _block_write_handler()
+    backend = GraphBackend(
+        DSN, credential="tok", transport=transport, readonly=False, write_block_cells=12
+    )
+    rows = [[index, f"new-{index}", 0] for index in range(1, 6)]
+
+    backend.write_sheet("Users", TableData(["id", "name", "score"], rows))
+
+    writes = state["writes"]
+    last_patch = max(index for index, write in enumerate(writes) if write[0] == "PATCH")
+    clear = next(index for index, write in enumerate(writes) if write[0] == "POST")
+    assert [write[1] for write in _patches(state)] == ["A1:C4", "A5:C6"]
+    assert last_patch < clear
+    assert writes[clear][1] == "A7:C22"
+    # The clear is conditional on the ETag the last block returned.
+    assert writes[clear][2] == '"v3"'
+    assert state["values"][1:6] == rows
+    assert all(row == ["", "", ""] for row in state["values"][6:])
+    backend.close()
+
+
+def test_transient_block_failures_are_retried() -> None:
+    transport, state = _block_write_handler(failures={"A9:C12": [503, 429]})
+    conn = _connect(transport)
+
+    conn.cursor().execute("UPDATE Users SET score = 0")
+
+    attempts = [write for write in _patches(state) if write[1] == "A9:C12"]
+    assert len(attempts) == 3
+    assert [row[2] for row in state["values"][1:]] == [0] * 21
+    conn.close()
+
+
+def test_failed_block_raises_operational_error() -> None:
+    transport, state = _block_write_handler(failures={"A13:C16": [400]})
+    conn = _connect(transport)
+
+    with pytest.raises(OperationalError, match="400"):
+        conn.cursor().execute("UPDATE Users SET score = 0")
+
+    assert len([write for write in _patches(state) if write[1] == "A13:C16"]) == 1
+    conn.close()
@@ -161,6 +161,20 @@ class TestGraphClient:
         assert handler.call_count["n"] == 1
         client.close()
 
+    def test_idempotent_patch_retried_on_503(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("excel_dbapi.engines.graph.client.time.sleep", lambda _: None)
+        handler = _make_handler(
+            [
+                (503, None),
+                (200, {"ok": True}),
+            ]
+        )
+        client = self._client(handler)
+        resp = client.patch("/update", json={}, idempotent=True)
+        assert resp.json()["ok"] is True
+        assert handler.call_count["n"] == 2
+        client.close()
+
     def test_delete_not_retried(self):
         """DELETE is not a safe method — should NOT be retried."""
         handler = _make_handler(
@@ -191,6 +205,66 @@ class TestGraphClient:
         assert resp.json()["ok"] is True
         client.close()
 
+    def test_not_modified_is_returned(self):
+        captured: dict[str, Any] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            captured["if_none_match"] = request.headers.get("if-none-match")
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+
+        client = self._client(handler)
+        resp = client.get("/test", headers={"If-None-Match": '"v1"'})
+        assert resp.status_code == 304
+        assert captured["if_none_match"] == '"v1"'
+        client.close()
+
+    def test_batch_returns_responses_in_request_order(self):
+        captured: dict[str, Any] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            captured["path"] = request.url.path
+            captured["body"] = json.loads(request.content)
+            return httpx.Response(
+                200,
+                json={
+                    "responses": [
+                        {"id": "2", "status": 424},
+                        {
+                            "id": "1",
+                            "status": 200,
+                            "headers": {"ETag": '"v2"'},
+                            "body": {"ok": True},
+                        },
+                    ]
+                },
+            )
+
+        client = self._client(handler)
+        client.session_id = "sess-42"
+        responses = client.batch(
+            [
+                {"id": "1", "method": "PATCH", "url": "/a", "body": {"values": [[1]]}},
+                {"id": "2", "method": "POST", "url": "/b", "dependsOn": ["1"]},
+            ]
+        )
+        assert captured["path"] == "/v1.0/$batch"
+        first, second = captured["body"]["requests"]
+        assert first["headers"] == {
+            "workbook-session-id": "sess-42",
+            "Content-Type": "application/json",
+        }
+        assert second["headers"] == {"workbook-session-id": "sess-42"}
+        assert [r.status_code for r in responses] == [200, 424]
+        assert responses[0].headers["etag"] == '"v2"'
+        assert responses[0].json() == {"ok": True}
+        client.close()
+
+    def test_batch_missing_response_raises(self):
+        client = self._client(_make_handler([(200, {"responses": []})]))
+        with pytest.raises(OperationalError, match="missing request 1"):
+            client.batch([{"id": "1", "method": "GET", "url": "/a"}])
+        client.close()
+
 
 class TestParseRetryAfter:
     def test_none(self):
@@ -0,0 +1,258 @@
+"""Tests for the GraphBackend usedRange cache revalidated with ETags."""
+
+import json
+import re
+from typing import Any
+
+import httpx
+import pytest
+
+from excel_dbapi.connection import ExcelConnection
+from excel_dbapi.engines.graph.backend import GraphBackend
+from excel_dbapi.exceptions import OperationalError
+from tests.graph.batch_transport import batch_aware
+from tests.graph.used_range import used_range_response
+
+
+DSN = "msgraph://drives/drv-etag/items/itm-etag"
+
+
+def _col_index(letters: str) -> int:
+    value = 0
+    for char in letters:
+        value = value * 26 + (ord(char) - ord("A") + 1)
+    return value - 1
+
+
+def _versioned_handler() -> tuple[httpx.MockTransport, dict[str, Any]]:
+    """Workbook whose ETag changes with every write, like the Graph service.
+
+    Writes honour ``If-Match``, ``null`` in a PATCH leaves the cell unchanged,
+    and ``usedRange`` answers ``304`` to a current ``If-None-Match``.  The
+    statuses of ``usedRange`` value reads are recorded in ``range_responses``.
+    """
+    state: dict[str, Any] = {
+        "version": 1,
+        "values": [
+            ["id", "name", "dept"],
+            [1, "Alice", "Eng"],
+            [2, "Bob", "Sales"],
+            [3, "Carol", "Eng"],
+        ],
+        "range_responses": [],
+        "range_selects": [],
+    }
+
+    def etag() -> str:
+        return f'"v{state["version"]}"'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        method = request.method
+        path = request.url.path
+        headers = {"ETag": etag()}
+        if path.endswith("/createSession"):
+            return httpx.Response(201, json={"id": "sess-etag"})
+        if path.endswith("/closeSession"):
+            return httpx.Response(204)
+        if path.endswith("/workbook") and method == "GET":
+            return httpx.Response(200, json={}, headers=headers)
+        if "/worksheets" in path and "usedRange" not in path and "range(" not in path:
+            return httpx.Response(
+                200, json={"value": [{"id": "ws-emp", "name": "Employees"}]}
+            )
+        if "usedRange" in path:
+            select = request.url.params.get("$select")
+            state["range_selects"].append(select)
+            if request.headers.get("If-None-Match") == etag():
+                if select == "values":
+                    state["range_responses"].append(304)
+                return httpx.Response(304, headers=headers)
+            if select == "values":
+                state["range_responses"].append(200)
+            return used_range_response(
+                request, json.loads(json.dumps(state["values"])), headers=headers
+            )
+
+        if_match = request.headers.get("If-Match")
+        if if_match is not None and if_match != etag():
+            return httpx.Response(412, json={"error": "precondition failed"})
+        match = re.search(r"address='([A-Z]+)(\d+):([A-Z]+)(\d+)'", path)
+        assert match is not None
+        first_row = int(match.group(2)) - 1
+        last_row = int(match.group(4)) - 1
+        first_col = _col_index(match.group(1))
+        values: list[list[Any]] = state["values"]
+        if method == "PATCH":
+            body = json.loads(request.content)
+            while len(values) <= last_row:
+                values.append([""] * len(values[0]))
+            for offset, row in enumerate(body["values"]):
+                for col_offset, value in enumerate(row):
+                    if value is not None:
+                        values[first_row + offset][first_col + col_offset] = value
+        elif path.endswith("/delete"):
+            del values[first_row : last_row + 1]
+        else:
+            return httpx.Response(404)
+        state["version"] += 1
+        return httpx.Response(200, json={}, headers={"ETag": etag()})
+
+    return httpx.MockTransport(batch_aware(handler)), state
+
+
+def _make_backend(**kwargs: Any) -> tuple[GraphBackend, dict[str, Any]]:
+    transport, state = _versioned_handler()
+    backend = GraphBackend(
+        DSN, credential="tok", transport=transport, readonly=False, **kwargs
+    )
+    return backend, state
+
+
+def test_unchanged_sheet_is_revalidated_not_downloaded() -> None:
+    backend, state = _make_backend()
+
+    first = backend.read_sheet("Employees")
+    second = backend.read_sheet("Employees")
+
+    assert state["range_responses"] == [200, 304]
+    assert second.rows == first.rows
+    second.rows[0][1] = "changed"
+    assert backend.read_sheet("Employees").rows[0][1] == "Alice"
+    backend.close()
+
+
+def test_remote_change_is_downloaded() -> None:
+    backend, state = _make_backend()
+    backend.read_sheet("Employees")
+
+    state["values"][1][1] = "Alicia"
+    state["version"] += 1
+
+    assert backend.read_sheet("Employees").rows[0] == [1, "Alicia", "Eng"]
+    assert state["range_responses"] == [200, 200]
+    backend.close()
+
+
+def test_own_writes_update_the_cached_values() -> None:
+    transport, state = _versioned_handler()
+    conn = ExcelConnection(DSN, credential="tok", transport=transport, readonly=False)
+    cursor = conn.cursor()
+
+    cursor.execute("INSERT INTO Employees VALUES (4, 'Dave', NULL)")
+    cursor.execute("UPDATE Employees SET dept = 'HR' WHERE id = 1")
+    cursor.execute("DELETE FROM Employees WHERE id = 2")
+    cursor.execute("SELECT id, name, dept FROM Employees")
+
+    assert cursor.fetchall() == [
+        (1, "Alice", "HR"),
+        (3, "Carol", "Eng"),
+        (4, "Dave", ""),
+    ]
+    # One download; every later read, including those made by the writes,
+    # was answered with 304.
+    assert state["range_responses"].count(200) == 1
+    conn.close()
+
+
+@pytest.mark.parametrize("text", ["42", "TRUE", "=1+1", "2024-01-01"])
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "INSERT INTO Employees VALUES (4, ?, 'Eng')",
+        "UPDATE Employees SET name = ? WHERE id = 1",
+    ],
+)
+def test_writes_excel_may_coerce_drop_the_cache(statement: str, text: str) -> None:
+    transport, state = _versioned_handler()
+    conn = ExcelConnection(DSN, credential="tok", transport=transport, readonly=False)
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM Employees")
+
+    cursor.execute(statement, (text,))
+    state["range_responses"].clear()
+    cursor.execute("SELECT id FROM Employees")
+
+    # What Excel stored is read back rather than the text that was sent.
+    assert state["range_responses"] == [200]
+    conn.close()
+
+
+def test_unconditional_writes_drop_the_cache() -> None:
+    backend, state = _make_backend(conflict_strategy="force")
+
+    backend.read_sheet("Employees")
+    backend.append_row("Employees", [4, "Dave", "Ops"])
+    assert backend.read_sheet("Employees").rows[-1] == [4, "Dave", "Ops"]
+
+    assert state["range_responses"] == [200, 200]
+    backend.close()
+
+
+@pytest.mark.parametrize("row", [["", "", ""], [None, None, None]])
+def test_append_that_may_not_extend_the_range_drops_the_cache(row: list[Any]) -> None:
+    backend, state = _make_backend()
+    backend.read_sheet("Employees")
+    # An empty row does not grow the used range, so the cache cannot follow.
+    backend.append_row("Employees", row)
+    backend.read_sheet("Employees")
+
+    assert state["range_responses"] == [200, 200]
+    backend.close()
+
+
+EXTENT = "address,rowCount,columnCount"
+
+
+def test_appends_track_the_extent_without_downloading() -> None:
+    backend, state = _make_backend()
+
+    assert backend.append_row("Employees", [4, "Dave", "Ops"]) == 5
+    assert backend.append_rows("Employees", [[5, "Eve", "Ops"], [6, "Finn", ""]]) == (
+        6,
+        7,
+    )
+    assert backend.append_row("Employees", [7, "Gail", "HR"]) == 8
+
+    # One size probe; later appends advance the extent locally.
+    assert state["range_selects"] == [EXTENT]
+    assert [row[0] for row in state["values"]] == ["id", 1, 2, 3, 4, 5, 6, 7]
+    backend.close()
+
+
+def test_read_then_append_uses_the_read_extent() -> None:
+    backend, state = _make_backend()
+    backend.read_sheet("Employees")
+    backend.append_row("Employees", [4, "Dave", "Ops"])
+    assert backend.read_sheet("Employees").rows[-1] == [4, "Dave", "Ops"]
+
+    assert state["range_selects"] == [EXTENT, "values", "values"]
+    assert state["range_responses"] == [200, 304]
+    backend.close()
+
+
+def test_stale_extent_cannot_overwrite_remote_rows() -> None:
+    backend, state = _make_backend()
+    backend.append_row("Employees", [4, "Dave", "Ops"])
+
+    state["values"].append([5, "Remote", "Ops"])
+    state["version"] += 1
+
+    # The append is conditional on the ETag the extent was recorded at.
+    with pytest.raises(OperationalError, match="Concurrent modification"):
+        backend.append_row("Employees", [5, "Eve", "Ops"])
+    assert state["values"][-1] == [5, "Remote", "Ops"]
+    backend.close()
+
+
+def test_unconditional_appends_revalidate_the_extent() -> None:
+    backend, state = _make_backend(conflict_strategy="force")
+    backend.append_row("Employees", [4, "Dave", "Ops"])
+    backend.append_row("Employees", [5, "Eve", "Ops"])
+
+    state["values"].append([6, "Remote", "Ops"])
+    state["version"] += 1
+    assert backend.append_row("Employees", [7, "Gail", "HR"]) == 8
+
+    assert state["range_selects"] == [EXTENT, EXTENT, EXTENT]
+    assert [row[0] for row in state["values"][-3:]] == [5, 6, 7]
+    backend.close()
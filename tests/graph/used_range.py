@@ -0,0 +1,30 @@
+"""Answer mocked ``usedRange`` requests the way Graph does."""
+
+from typing import Any
+
+import httpx
+
+from excel_dbapi.engines.graph.backend import _col_letter
+
+
+def used_range_response(
+    request: httpx.Request,
+    values: list[list[Any]],
+    address: str | None = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Return the ``usedRange`` of *values* with the fields in ``$select``.
+
+    The range starts at ``A1`` unless its *address* is given.
+    """
+    fields = request.url.params.get("$select", "values").split(",")
+    rows = len(values)
+    cols = len(values[0]) if values else 0
+    available = {
+        "values": values,
+        "address": address or f"Sheet!A1:{_col_letter(max(cols, 1) - 1)}{max(rows, 1)}",
+        "rowCount": rows,
+        "columnCount": cols,
+    }
+    body = {field: available[field] for field in fields if field in available}
+    return httpx.Response(200, json=body, **kwargs)
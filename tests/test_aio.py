@@ -0,0 +1,175 @@
+import asyncio
+import shutil
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from excel_dbapi import aio
+from excel_dbapi.exceptions import InterfaceError, ProgrammingError
+from tests.graph.used_range import used_range_response
+
+
+def test_async_execute_and_fetch() -> None:
+    async def main() -> None:
+        conn = await aio.connect("tests/data/sample.xlsx")
+        async with conn:
+            cursor = conn.cursor()
+            assert await cursor.execute("SELECT * FROM Sheet1") is cursor
+            assert [column[0] for column in cursor.description or []] == ["id", "name"]
+            assert cursor.rowcount == 3
+            assert await cursor.fetchone() == (1, "Alice")
+            assert await cursor.fetchmany(1) == [(2, "Bob")]
+            assert await cursor.fetchall() == [(3, "Eve")]
+        assert conn.closed
+
+    asyncio.run(main())
+
+
+def test_async_iteration() -> None:
+    async def main() -> list[tuple[Any, ...]]:
+        async with await aio.connect("tests/data/sample.xlsx") as conn:
+            cursor = conn.cursor()
+            await cursor.execute("SELECT name FROM Sheet1 WHERE id > ?", (1,))
+            return [row async for row in cursor]
+
+    assert asyncio.run(main()) == [("Bob",), ("Eve",)]
+
+
+def test_async_writes_and_commit(tmp_path: Path) -> None:
+    path = tmp_path / "sample.xlsx"
+    shutil.copy("tests/data/sample.xlsx", path)
+
+    async def main() -> None:
+        async with await aio.connect(str(path), autocommit=False, data_only=False) as conn:
+            cursor = conn.cursor()
+            await cursor.executemany(
+                "INSERT INTO Sheet1 (id, name) VALUES (?, ?)", [(4, "Dan"), (5, "Fay")]
+            )
+            assert cursor.rowcount == 2
+            await conn.commit()
+
+    asyncio.run(main())
+
+    async def count() -> Any:
+        async with await aio.connect(str(path)) as conn:
+            cursor = await conn.cursor().execute("SELECT COUNT(*) FROM Sheet1")
+            return await cursor.fetchone()
+
+    assert asyncio.run(count()) == (5,)
+
+
+def test_async_errors_propagate() -> None:
+    async def main() -> None:
+        conn = await aio.connect("tests/data/sample.xlsx")
+        cursor = conn.cursor()
+        with pytest.raises(ProgrammingError, match="Nope"):
+            await cursor.execute("SELECT * FROM Nope")
+        await conn.close()
+        with pytest.raises(InterfaceError):
+            await cursor.execute("SELECT * FROM Sheet1")
+        with pytest.raises(InterfaceError):
+            conn.cursor()
+
+    asyncio.run(main())
+
+
+def _graph_transport(
+    readers: int = 1, statuses: list[int] | None = None
+) -> tuple[httpx.MockTransport, dict[str, Any]]:
+    """Graph workbook served from the event loop with an ``async`` handler.
+
+    Value reads wait until *readers* of them are in flight.  The first value
+    reads are answered with *statuses*, if given.
+    """
+    values = [["id", "name"], [1, "Alice"], [2, "Bob"]]
+    state: dict[str, Any] = {"threads": set(), "reading": 0}
+    pending = list(statuses or [])
+    all_reading = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["threads"].add(threading.get_ident())
+        path = request.url.path
+        if path.endswith("/createSession"):
+            return httpx.Response(201, json={"id": "sess-aio"})
+        if path.endswith("/closeSession"):
+            return httpx.Response(204)
+        if path.endswith("/worksheets"):
+            return httpx.Response(200, json={"value": [{"id": "ws-1", "name": "Users"}]})
+        if "usedRange" in path:
+            if request.url.params.get("$select") == "values":
+                if pending:
+                    return httpx.Response(pending.pop(0))
+                state["reading"] += 1
+                if state["reading"] == readers:
+                    all_reading.set()
+                await asyncio.wait_for(all_reading.wait(), timeout=5)
+            return used_range_response(request, values)
+        return httpx.Response(404)
+
+    return httpx.MockTransport(handler), state
+
+
+def test_one_loop_drives_several_workbooks_concurrently() -> None:
+    transport, state = _graph_transport(readers=2)
+
+    async def query(item: str) -> list[tuple[Any, ...]]:
+        conn = await aio.connect(
+            f"msgraph://drives/drv-aio/items/{item}",
+            credential="tok",
+            transport=transport,
+        )
+        async with conn:
+            assert conn.engine_name == "graph"
+            cursor = await conn.cursor().execute("SELECT name FROM Users")
+            return await cursor.fetchall()
+
+    async def main() -> list[list[tuple[Any, ...]]]:
+        return await asyncio.gather(query("itm-1"), query("itm-2"))
+
+    assert asyncio.run(main()) == [[("Alice",), ("Bob",)]] * 2
+    # Every request was sent from the event loop's thread.
+    assert state["threads"] == {threading.get_ident()}
+
+
+def test_graph_retries_back_off_on_the_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("excel_dbapi.engines.graph.client.asyncio.sleep", fake_sleep)
+    monkeypatch.setattr(
+        "excel_dbapi.engines.graph.client.time.sleep",
+        lambda _: pytest.fail("blocking sleep in asyncio connection"),
+    )
+    transport, _ = _graph_transport(statuses=[503])
+
+    async def main() -> Any:
+        async with await aio.connect(
+            "msgraph://drives/drv-aio/items/itm-1",
+            credential="tok",
+            transport=transport,
+            backoff_factor=0.25,
+        ) as conn:
+            cursor = await conn.cursor().execute("SELECT COUNT(*) FROM Users")
+            return await cursor.fetchone()
+
+    assert asyncio.run(main()) == (2,)
+    assert sleeps == [0.25]
+
+
+def test_graph_connection_cannot_block_the_loop() -> None:
+    transport, _ = _graph_transport()
+
+    async def main() -> None:
+        conn = await aio.connect(
+            "msgraph://drives/drv-aio/items/itm-1", credential="tok", transport=transport
+        )
+        with pytest.raises(InterfaceError, match="event loop"):
+            conn.sync_connection.cursor().execute("SELECT * FROM Users")
+        await conn.close()
+
+    asyncio.run(main())
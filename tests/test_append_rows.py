@@ -0,0 +1,102 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.engines.base import WorkbookBackend
+from excel_dbapi.engines.openpyxl.backend import OpenpyxlBackend
+from excel_dbapi.engines.pandas.backend import PandasBackend
+from excel_dbapi.exceptions import NotSupportedError
+
+
+def _create_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "users"
+    ws.append(["id", "name", "score"])
+    ws.append([1, "Alice", 10])
+    source = wb.create_sheet("source")
+    source.append(["id", "name"])
+    for index in range(2, 6):
+        source.append([index, f"user-{index}"])
+    wb.save(path)
+
+
+@pytest.mark.parametrize("backend_class", [OpenpyxlBackend, PandasBackend])
+def test_append_rows_returns_row_range(
+    tmp_path: Path, backend_class: type[WorkbookBackend]
+) -> None:
+    file_path = tmp_path / "append.xlsx"
+    _create_workbook(file_path)
+    backend = backend_class(str(file_path))
+
+    assert backend.append_row("users", [2, "Bob", 20]) == 3
+    assert backend.append_rows("users", [[3, "Carol"], [4, "Dan", 40, "extra"]]) == (4, 5)
+    assert backend.append_row("users", [5, "Eve", 50]) == 6
+
+    assert backend.read_sheet("users").rows == [
+        [1, "Alice", 10],
+        [2, "Bob", 20],
+        [3, "Carol", None],
+        [4, "Dan", 40],
+        [5, "Eve", 50],
+    ]
+    backend.close()
+
+
+def test_openpyxl_append_rows_read_only(tmp_path: Path) -> None:
+    file_path = tmp_path / "append.xlsx"
+    _create_workbook(file_path)
+    backend = OpenpyxlBackend(str(file_path), readonly=True)
+
+    with pytest.raises(NotSupportedError):
+        backend.append_rows("users", [[2, "Bob", 20]])
+    backend.close()
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "pandas"])
+@pytest.mark.parametrize(
+    ("query", "rowcount", "lastrowid"),
+    [
+        ("INSERT INTO users VALUES (2, 'Bob', 20), (3, 'Carol', 30)", 2, 4),
+        ("INSERT INTO users (id, name) SELECT id, name FROM source", 4, 6),
+        ("INSERT INTO users (id, name) SELECT id, name FROM source WHERE id > 9", 0, None),
+    ],
+)
+def test_insert_appends_rows_in_one_batch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    engine: str,
+    query: str,
+    rowcount: int,
+    lastrowid: int | None,
+) -> None:
+    file_path = tmp_path / "append.xlsx"
+    _create_workbook(file_path)
+    batches: list[int] = []
+    backend_class = OpenpyxlBackend if engine == "openpyxl" else PandasBackend
+    original = backend_class.append_rows
+
+    def tracking(self: Any, sheet_name: str, rows: list[list[Any]]) -> tuple[int, int]:
+        batches.append(len(rows))
+        return original(self, sheet_name, rows)
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("append_row used")
+
+    monkeypatch.setattr(backend_class, "append_rows", tracking)
+    monkeypatch.setattr(backend_class, "append_row", fail)
+
+    with connect(str(file_path), engine=engine) as conn:
+        cursor = conn.cursor()
+        cursor.execute(query)
+        assert (cursor.rowcount, cursor.lastrowid) == (rowcount, lastrowid)
+        cursor.executemany(
+            "INSERT INTO users (id, name) VALUES (?, ?)", [(10, "a"), (11, "b")]
+        )
+        assert cursor.lastrowid == (lastrowid or 2) + 2
+
+    assert batches == ([rowcount] if rowcount else []) + [2]
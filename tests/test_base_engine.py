@@ -124,3 +124,11 @@ def test_base_abstract_method_bodies_are_executable() -> None:
     WorkbookBackend.append_row(backend, "T", [2])
     WorkbookBackend.create_sheet(backend, "U", ["id"])
     WorkbookBackend.drop_sheet(backend, "U")
+
+
+def test_default_append_rows_appends_one_row_at_a_time() -> None:
+    backend = MemoryBackend({"T": TableData(headers=["id"], rows=[[1]])})
+    assert backend.append_rows("T", [[2], [3], [4]]) == (3, 5)
+    assert backend.read_sheet("T").rows == [[1], [2], [3], [4]]
+    with pytest.raises(Exception, match="at least one row"):
+        backend.append_rows("T", [])
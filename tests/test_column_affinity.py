@@ -0,0 +1,152 @@
+from array import array
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.executor import SharedExecutor
+from excel_dbapi.executor._affinity import MIXED, NUMERIC, TEMPORAL, TEXT
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        ([1, 2.5, None, -3], NUMERIC),
+        (array("d", [1.0, 2.0]), NUMERIC),
+        ([date(2024, 1, 1), None, datetime(2024, 1, 2, 3, 4)], TEMPORAL),
+        (["abc", None, "Bob", "abc"], TEXT),
+        ([1, True], MIXED),
+        ([1, "abc"], MIXED),
+        (["abc", "12"], MIXED),
+        (["abc", "2024-01-05"], MIXED),
+        ([b"raw"], MIXED),
+        ([None, None], MIXED),
+        ([], MIXED),
+    ],
+)
+def test_infer_affinity(values: Any, expected: str) -> None:
+    executor = SharedExecutor(object())  # type: ignore[arg-type]
+    assert executor._column_affinity(values) == expected
+
+
+COLUMNS: dict[str, list[Any]] = {
+    NUMERIC: [None, 0, -1, 2.5, 3, 1e20, float("inf")],
+    TEXT: [None, "", "abc", "Abc", "zz top", "x1"],
+    TEMPORAL: [None, date(2024, 1, 5), datetime(2024, 1, 5), datetime(2023, 12, 31, 8)],
+}
+
+LITERALS: list[Any] = [
+    0,
+    2.5,
+    "3",
+    "abc",
+    "",
+    "2024-01-05",
+    "20240105",
+    True,
+    date(2024, 1, 5),
+    datetime(2024, 1, 5, 12),
+]
+
+
+@pytest.mark.parametrize("affinity", sorted(COLUMNS))
+def test_specialized_coercion_matches_generic(affinity: str) -> None:
+    executor = SharedExecutor(object())  # type: ignore[arg-type]
+    values = COLUMNS[affinity]
+    assert executor._column_affinity(values) == affinity
+
+    for literal in LITERALS:
+        coerce = executor._compare_coercer(literal, affinity)
+        for value in values:
+            if value is None:
+                continue
+            assert coerce(value) == executor._coerce_for_compare(value, literal), (
+                value,
+                literal,
+            )
+
+    sort_key = executor._sort_key_function(affinity)
+    assert [sort_key(value) for value in values] == [
+        executor._sort_key(value) for value in values
+    ]
+
+
+@pytest.mark.parametrize("affinity", sorted(COLUMNS) + [MIXED])
+def test_literal_comparison_matches_generic(affinity: str) -> None:
+    executor = SharedExecutor(object())  # type: ignore[arg-type]
+    values = COLUMNS.get(affinity, [None, True, 1, "abc", "12", date(2024, 1, 5)])
+    coerce_as = {
+        NUMERIC: float,
+        TEMPORAL: executor._coerce_temporal_value,
+        TEXT: str,
+    }
+
+    for literal in LITERALS:
+        form = executor._literal_comparison(literal, affinity)
+        if form is None:
+            assert affinity == MIXED
+            continue
+        kind, bound = form
+        for value in values:
+            if value is None:
+                continue
+            assert (coerce_as[kind](value), bound) == executor._coerce_for_compare(
+                value, literal
+            ), (value, literal)
+
+
+def _create_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "Sheet1"
+    ws.append(["id", "score", "name", "joined", "mixed"])
+    names = ["alice", "Bob", None, "carol"]
+    mixed: list[Any] = [1, "2", None, "abc", "2024-01-03", 4.5]
+    for index in range(1, 41):
+        ws.append(
+            [
+                index,
+                index % 6 if index % 5 else None,
+                names[index % len(names)],
+                datetime(2024, 1, index % 28 + 1),
+                mixed[index % len(mixed)],
+            ]
+        )
+    wb.save(path)
+
+
+QUERIES = [
+    "SELECT id FROM Sheet1 WHERE score >= '3'",
+    "SELECT id FROM Sheet1 WHERE score = 'abc' OR score BETWEEN 1 AND 2",
+    "SELECT id FROM Sheet1 WHERE name > 'Bob' AND name IN ('carol', 3)",
+    "SELECT id FROM Sheet1 WHERE joined < '2024-01-10'",
+    "SELECT id FROM Sheet1 WHERE joined NOT BETWEEN '2024-01-05' AND '2024-01-20'",
+    "SELECT id FROM Sheet1 WHERE mixed > 2 OR mixed = 'abc'",
+    "SELECT id, name FROM Sheet1 ORDER BY name DESC, joined, id",
+    "SELECT id FROM Sheet1 ORDER BY mixed, id",
+    "SELECT MIN(joined), MAX(name), MIN(score), MAX(mixed) FROM Sheet1",
+]
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "pandas"])
+@pytest.mark.parametrize("query", QUERIES)
+def test_affinity_matches_generic_coercion(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, engine: str, query: str
+) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    _create_workbook(file_path)
+
+    with connect(str(file_path), engine=engine) as conn:
+        specialized = conn.execute(query).rows
+
+    monkeypatch.setattr(
+        SharedExecutor, "_column_affinity", lambda self, values: MIXED
+    )
+    with connect(str(file_path), engine=engine) as conn:
+        generic = conn.execute(query).rows
+
+    assert specialized == generic
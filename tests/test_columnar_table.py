@@ -0,0 +1,214 @@
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.engines import ColumnarTableData
+from excel_dbapi.engines.base import _pack_column
+from excel_dbapi.engines.pandas.backend import PandasBackend
+from excel_dbapi.exceptions import BackendOperationError
+from excel_dbapi.executor import SharedExecutor
+
+
+def _create_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "Sheet1"
+    ws.append(["id", "score", "name", "flag", "joined", "code"])
+    names = ["alice", "Bob", None, "carol", "dave", "Eve"]
+    codes: list[Any] = ["10", 7, None, "abc", "2.5", 10]
+    for index in range(1, 31):
+        ws.append(
+            [
+                index,
+                index * 1.5,
+                names[index % len(names)],
+                index % 3 == 0,
+                datetime(2024, 1, index % 28 + 1),
+                codes[index % len(codes)],
+            ]
+        )
+    wb.save(path)
+
+
+def test_pack_column_uses_typed_arrays_for_homogeneous_numbers() -> None:
+    ints = _pack_column([1, 2, 3])
+    floats = _pack_column([1.5, 2.0])
+    assert isinstance(ints, array) and ints.typecode == "q"
+    assert isinstance(floats, array) and floats.typecode == "d"
+
+    assert _pack_column([1, None]) == [1, None]
+    assert _pack_column([1, True]) == [1, True]
+    assert _pack_column([1, 2.5]) == [1, 2.5]
+    assert _pack_column([2**60]) == [2**60]
+    assert isinstance(_pack_column([1.0, float("nan")]), list)
+
+
+def test_columnar_rows_materialize_once_and_stay_authoritative() -> None:
+    data = ColumnarTableData(["a", "b"], [array("q", [1, 2]), ["x", None]])
+    assert data.row_count == 2
+    assert list(data.iter_rows()) == [[1, "x"], [2, None]]
+    assert data.columns is not None
+
+    data.rows[0][1] = "changed"
+    assert data.columns is None
+    assert data.rows == [[1, "changed"], [2, None]]
+    assert list(data.iter_rows()) == [[1, "changed"], [2, None]]
+
+    data.rows = [[3, "y"]]
+    assert data.row_count == 1
+
+
+def test_columnar_from_rows_pads_short_rows() -> None:
+    data = ColumnarTableData.from_rows(["a", "b"], [[1], [2, "x"]])
+    assert data.columns is not None
+    assert list(data.columns[0]) == [1, 2]
+    assert data.rows == [[1, None], [2, "x"]]
+
+
+def test_columnar_rejects_ragged_columns() -> None:
+    with pytest.raises(BackendOperationError):
+        ColumnarTableData(["a", "b"], [[1, 2], [1]])
+    with pytest.raises(BackendOperationError):
+        ColumnarTableData(["a", "b"], [[1, 2]])
+
+
+def test_pandas_read_sheet_returns_typed_columns(tmp_path: Path) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    _create_workbook(file_path)
+    backend = PandasBackend(str(file_path))
+
+    data = backend.read_sheet("Sheet1")
+
+    assert isinstance(data, ColumnarTableData)
+    assert data.columns is not None
+    assert isinstance(data.columns[0], array) and data.columns[0].typecode == "q"
+    assert isinstance(data.columns[1], array) and data.columns[1].typecode == "d"
+    assert data.rows[1] == [2, 3.0, None, False, datetime(2024, 1, 3), None]
+
+
+QUERIES = [
+    "SELECT * FROM Sheet1",
+    "SELECT id, name FROM Sheet1 WHERE score > 10",
+    "SELECT id FROM Sheet1 WHERE id >= 5 AND id < 9 OR name = 'Eve'",
+    "SELECT id FROM Sheet1 WHERE NOT (score <= 12.5 OR name IS NULL)",
+    "SELECT id FROM Sheet1 WHERE name IN ('alice', NULL, 'Bob')",
+    "SELECT id FROM Sheet1 WHERE name NOT IN ('alice', NULL)",
+    "SELECT id FROM Sheet1 WHERE code IN (10, 'abc')",
+    "SELECT id FROM Sheet1 WHERE code > 5",
+    "SELECT id FROM Sheet1 WHERE id BETWEEN 3 AND 7",
+    "SELECT id FROM Sheet1 WHERE score NOT BETWEEN 3 AND 30",
+    "SELECT id FROM Sheet1 WHERE name LIKE 'a%' OR name ILIKE 'E_E'",
+    "SELECT id FROM Sheet1 WHERE name NOT LIKE '%o%'",
+    "SELECT id FROM Sheet1 WHERE joined >= '2024-01-20'",
+    "SELECT id FROM Sheet1 WHERE flag = TRUE",
+    "SELECT id FROM Sheet1 WHERE name <> 'carol' AND name IS NOT NULL",
+    "SELECT id FROM Sheet1 WHERE score = NULL",
+    "SELECT id FROM Sheet1 WHERE id = '12'",
+    "SELECT Sheet1.id, name AS who FROM Sheet1 WHERE Sheet1.score > 40 LIMIT 2",
+    "SELECT id FROM Sheet1 WHERE id > 2 LIMIT 3 OFFSET 2",
+    "SELECT id, score FROM Sheet1 LIMIT 4 OFFSET 27",
+    "SELECT DISTINCT name FROM Sheet1 WHERE id > 20 ORDER BY name",
+    "SELECT name, COUNT(*) FROM Sheet1 WHERE flag = FALSE GROUP BY name",
+    "SELECT id, score * 2 FROM Sheet1 WHERE id < 4",
+    "SELECT id FROM Sheet1 WHERE score > id",
+    "SELECT id FROM Sheet1 WHERE id IN (SELECT id FROM Sheet1 WHERE id < 3)",
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_columnar_select_matches_row_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, query: str
+) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    _create_workbook(file_path)
+
+    with connect(str(file_path), engine="pandas") as conn:
+        result = conn.execute(query)
+        columnar = (result.rows, result.description)
+
+    monkeypatch.setattr(
+        SharedExecutor, "_execute_columnar_select", lambda self, *args: None
+    )
+    with connect(str(file_path), engine="pandas") as conn:
+        result = conn.execute(query)
+        expected = (result.rows, result.description)
+
+    assert columnar == expected
+
+
+def test_simple_columnar_select_builds_no_row_dicts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    _create_workbook(file_path)
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("row dict built")
+
+    with connect(str(file_path), engine="pandas") as conn:
+        monkeypatch.setattr(SharedExecutor, "_row_from_values", fail)
+        result = conn.execute(
+            "SELECT id, name FROM Sheet1 WHERE score >= 15 AND name LIKE '%a%' LIMIT 2"
+        )
+
+    assert result.rows == [(10, "dave"), (12, "alice")]
+
+
+def test_columnar_filter_only_builds_dicts_for_matches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    _create_workbook(file_path)
+    built: list[Any] = []
+    original = SharedExecutor._row_from_values
+
+    def tracking(self: SharedExecutor, headers: list[str], values: list[Any]) -> Any:
+        built.append(values[0])
+        return original(self, headers, values)
+
+    # The pandas engine's own executor never builds row dicts for this query.
+    executor = SharedExecutor(PandasBackend(str(file_path)))
+    monkeypatch.setattr(SharedExecutor, "_row_from_values", tracking)
+    result = executor.execute_with_params(
+        "SELECT id FROM Sheet1 WHERE id > 27 ORDER BY id DESC"
+    )
+
+    assert result.rows == [(30,), (29,), (28,)]
+    assert built == [28, 29, 30]
+
+
+def test_pandas_update_after_columnar_read(tmp_path: Path) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    _create_workbook(file_path)
+
+    with connect(str(file_path), engine="pandas") as conn:
+        conn.execute("UPDATE Sheet1 SET name = 'zed' WHERE id = 2")
+        assert conn.execute("SELECT name FROM Sheet1 WHERE id = 2").rows == [("zed",)]
+
+
+def test_compare_coercer_matches_coerce_for_compare() -> None:
+    executor = SharedExecutor(object())  # type: ignore[arg-type]
+    values: list[Any] = [
+        None,
+        True,
+        False,
+        0,
+        7,
+        2.5,
+        "7",
+        "abc",
+        "",
+        "2024-01-05",
+        "20240105",
+        datetime(2024, 1, 5),
+    ]
+    for right in values:
+        coerce = executor._compare_coercer(right)
+        for left in values:
+            assert coerce(left) == executor._coerce_for_compare(left, right)
@@ -762,3 +762,53 @@ def test_executemany_iterator_failure_partial_write_warning(
             bad_iterator(),
         )
     conn.close()
+
+
+def test_executemany_iterator_failure_keeps_consumed_inserts(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    """Without a snapshot, queued INSERT rows are appended before the error is raised."""
+    file_path = tmp_path / "iter_fail_insert.xlsx"
+    _xlsx(file_path)
+    conn = ExcelConnection(str(file_path), autocommit=True)
+    monkeypatch.setattr(
+        type(conn.engine), "supports_transactions", property(lambda self: False)
+    )
+
+    def bad_iterator():
+        yield (2, "Bob")
+        yield (3, "Cara")
+        raise ValueError("generator exploded")
+
+    cursor = conn.cursor()
+    with pytest.raises(ProgrammingError, match="partial writes may have occurred"):
+        cursor.executemany(
+            "INSERT INTO Sheet1 (id, name) VALUES (?, ?)",
+            bad_iterator(),
+        )
+    cursor.execute("SELECT id FROM Sheet1")
+    assert cursor.fetchall() == [(1,), (2,), (3,)]
+    conn.close()
+
+
+def test_executemany_update_iterator_failure_partial_write_warning(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    file_path = tmp_path / "iter_fail_update.xlsx"
+    _xlsx(file_path)
+    conn = ExcelConnection(str(file_path), autocommit=True)
+    monkeypatch.setattr(
+        type(conn.engine), "supports_transactions", property(lambda self: False)
+    )
+
+    def bad_iterator():
+        yield ("Bob", 1)
+        raise ValueError("generator exploded")
+
+    cursor = conn.cursor()
+    with pytest.raises(ProgrammingError, match="partial writes may have occurred"):
+        cursor.executemany(
+            "UPDATE Sheet1 SET name = ? WHERE id = ?",
+            bad_iterator(),
+        )
+    conn.close()
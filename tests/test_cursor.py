@@ -516,6 +516,59 @@ class TestExceptionMappingDirect:
             cursor.executemany("INSERT INTO users VALUES (?, ?)", [(1, "a")])
         conn.close()
 
+    def test_key_error_maps_to_programming_error_executemany_update(
+        self, tmp_path: Path
+    ) -> None:
+        fpath = _make_xlsx(tmp_path / "test.xlsx", rows=[[1, "Original"]])
+        conn = ExcelConnection(fpath, engine="openpyxl", autocommit=True)
+        original = conn._executor.execute_with_params
+        call_count = 0
+
+        def raising_on_second(query: str, params: Any = None) -> Any:
+            nonlocal call_count
+            call_count += 1
+            if call_count >= 2:
+                raise KeyError("missing key")
+            return original(query, params)
+
+        conn._executor.execute_with_params = raising_on_second  # type: ignore[assignment]
+        cursor = conn.cursor()
+        with pytest.raises(ProgrammingError, match="missing key"):
+            cursor.executemany(
+                "UPDATE users SET name = ? WHERE id = ?", [("a", 1), ("b", 1)]
+            )
+        conn.close()
+
+    def test_os_error_maps_to_operational_error_executemany_update(
+        self, tmp_path: Path
+    ) -> None:
+        fpath = _make_xlsx(tmp_path / "test.xlsx")
+        conn = ExcelConnection(fpath, engine="openpyxl", autocommit=True)
+
+        def raising_execute(query: str, params: Any = None) -> Any:
+            raise OSError("permission denied")
+
+        conn._executor.execute_with_params = raising_execute  # type: ignore[assignment]
+        cursor = conn.cursor()
+        with pytest.raises(OperationalError, match="permission denied"):
+            cursor.executemany("UPDATE users SET name = ? WHERE id = ?", [("a", 1)])
+        conn.close()
+
+    def test_generic_exception_maps_to_database_error_executemany_update(
+        self, tmp_path: Path
+    ) -> None:
+        fpath = _make_xlsx(tmp_path / "test.xlsx")
+        conn = ExcelConnection(fpath, engine="openpyxl", autocommit=True)
+
+        def raising_execute(query: str, params: Any = None) -> Any:
+            raise RuntimeError("boom")
+
+        conn._executor.execute_with_params = raising_execute  # type: ignore[assignment]
+        cursor = conn.cursor()
+        with pytest.raises(DatabaseError, match="boom"):
+            cursor.executemany("UPDATE users SET name = ? WHERE id = ?", [("a", 1)])
+        conn.close()
+
 class TestExecutemanyMidBatchRestore:
     """Gap 3: Mid-batch executemany failure restores snapshot after partial mutation."""
 
@@ -547,6 +600,32 @@ class TestExecutemanyMidBatchRestore:
         assert result.rows[0] == (1, "Original")
         conn.close()
 
+    def test_mid_batch_update_failure_restores_snapshot(self, tmp_path: Path) -> None:
+        """After 1 successful UPDATE, a failure in batch 2 restores original state."""
+        fpath = _make_xlsx(tmp_path / "test.xlsx", rows=[[1, "Original"]])
+        conn = ExcelConnection(fpath, engine="openpyxl", autocommit=False)
+        original = conn._executor.execute_with_params
+        call_count = 0
+
+        def fail_on_second(query: str, params: Any = None) -> Any:
+            nonlocal call_count
+            call_count += 1
+            if call_count == 2:
+                raise ValueError("bad value")
+            return original(query, params)
+
+        conn._executor.execute_with_params = fail_on_second  # type: ignore[assignment]
+        cursor = conn.cursor()
+        with pytest.raises(ProgrammingError, match="bad value"):
+            cursor.executemany(
+                "UPDATE users SET name = ? WHERE id = ?",
+                [("Second", 1), ("Third", 1)],
+            )
+        conn._executor.execute_with_params = original  # type: ignore[assignment]
+        result = conn.execute("SELECT * FROM users")
+        assert result.rows == [(1, "Original")]
+        conn.close()
+
 class TestExecutemanyAutocommitRestore:
     """Regression: executemany with autocommit=True must also restore on failure."""
 
@@ -582,6 +661,32 @@ class TestExecutemanyAutocommitRestore:
         assert result.rows[0] == (1, "Original")
         conn.close()
 
+    def test_autocommit_true_mid_batch_update_failure_restores(self, tmp_path: Path) -> None:
+        """After 1 successful UPDATE, a failure in batch 2 restores original state."""
+        fpath = _make_xlsx(tmp_path / "test.xlsx", rows=[[1, "Original"]])
+        conn = ExcelConnection(fpath, engine="openpyxl", autocommit=True)
+        original = conn._executor.execute_with_params
+        call_count = 0
+
+        def fail_on_second(query: str, params: Any = None) -> Any:
+            nonlocal call_count
+            call_count += 1
+            if call_count == 2:
+                raise ValueError("bad value")
+            return original(query, params)
+
+        conn._executor.execute_with_params = fail_on_second  # type: ignore[assignment]
+        cursor = conn.cursor()
+        with pytest.raises(ProgrammingError, match="bad value"):
+            cursor.executemany(
+                "UPDATE users SET name = ? WHERE id = ?",
+                [("Second", 1), ("Third", 1)],
+            )
+        conn._executor.execute_with_params = original  # type: ignore[assignment]
+        result = conn.execute("SELECT * FROM users")
+        assert result.rows == [(1, "Original")]
+        conn.close()
+
 
 
 def test_cursor_paths_for_executemany_and_fetch() -> None:
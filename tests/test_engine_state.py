@@ -5,6 +5,7 @@ import pytest
 from excel_dbapi.exceptions import DatabaseError
 from openpyxl import Workbook
 
+from excel_dbapi.engines.base import TableData
 from excel_dbapi.engines.openpyxl.backend import OpenpyxlBackend
 from excel_dbapi.engines.pandas.backend import PandasBackend
 
@@ -42,6 +43,18 @@ def test_pandas_snapshot_restore(tmp_path: Path) -> None:
     assert engine.data["Sheet1"].loc[0, "name"] == "Alice"
 
 
+def test_pandas_snapshot_restore_write_sheet(tmp_path: Path) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    df = pd.DataFrame([{"id": 1, "name": "Alice"}])
+    df.to_excel(file_path, index=False, sheet_name="Sheet1")
+
+    engine = PandasBackend(str(file_path))
+    snapshot = engine.snapshot()
+    engine.write_sheet("Sheet1", TableData(headers=["id", "name"], rows=[[1, "Bob"]]))
+    engine.restore(snapshot)
+    assert engine.read_sheet("Sheet1").rows == [[1, "Alice"]]
+
+
 def test_openpyxl_save_without_workbook(tmp_path: Path) -> None:
     file_path = tmp_path / "sample.xlsx"
     _create_workbook(file_path)
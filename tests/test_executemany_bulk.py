@@ -0,0 +1,151 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi.connection import ExcelConnection
+from excel_dbapi.engines.openpyxl.backend import OpenpyxlBackend
+from excel_dbapi.exceptions import OperationalError, ProgrammingError
+
+
+def _create_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "users"
+    ws.append(["id", "name", "score"])
+    ws.append([1, "Alice", 10])
+    wb.save(path)
+
+
+def _rows(path: Path) -> list[tuple[Any, ...]]:
+    with ExcelConnection(str(path), engine="openpyxl") as conn:
+        return conn.execute("SELECT id, name, score FROM users").rows
+
+
+def test_executemany_insert_reads_once_and_saves_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "bulk.xlsx"
+    _create_workbook(file_path)
+    calls: list[str] = []
+    for name in ("read_sheet", "append_rows", "save"):
+        original = getattr(OpenpyxlBackend, name)
+
+        def tracking(
+            self: Any, *args: Any, _name: str = name, _original: Any = original, **kwargs: Any
+        ) -> Any:
+            calls.append(_name)
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(OpenpyxlBackend, name, tracking)
+
+    with ExcelConnection(str(file_path), engine="openpyxl", autocommit=True) as conn:
+        cursor = conn.cursor()
+        cursor.executemany(
+            "INSERT INTO users (id, name) VALUES (?, ?)",
+            ((index, f"user-{index}") for index in range(2, 502)),
+        )
+        assert cursor.rowcount == 500
+        assert cursor.lastrowid == 502
+
+    assert calls == ["read_sheet", "append_rows", "save"]
+    rows = _rows(file_path)
+    assert len(rows) == 501
+    assert rows[-1] == (501, "user-501", None)
+
+
+def test_executemany_insert_sanitizes_every_row(tmp_path: Path) -> None:
+    file_path = tmp_path / "bulk.xlsx"
+    _create_workbook(file_path)
+
+    with ExcelConnection(str(file_path), engine="openpyxl", autocommit=True) as conn:
+        conn.executemany(
+            "INSERT INTO users VALUES (?, ?, ?)",
+            [(2, "=1+1", 5), (3, "Carol", "@SUM(A1)")],
+        )
+
+    assert _rows(file_path)[1:] == [(2, "'=1+1", 5), (3, "Carol", "'@SUM(A1)")]
+
+
+def test_executemany_insert_validates_all_sets_before_writing(tmp_path: Path) -> None:
+    file_path = tmp_path / "bulk.xlsx"
+    _create_workbook(file_path)
+
+    with ExcelConnection(str(file_path), engine="openpyxl", autocommit=False) as conn:
+        with pytest.raises(ProgrammingError):
+            conn.executemany(
+                "INSERT INTO users VALUES (?, ?, ?)",
+                [(2, "Bob", 1), (3, "Carol", 2), (4, "Dan")],
+            )
+        assert conn.execute("SELECT id FROM users").rows == [(1,)]
+
+
+def test_executemany_insert_failure_without_transactions_keeps_earlier_sets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "bulk.xlsx"
+    _create_workbook(file_path)
+
+    with ExcelConnection(str(file_path), engine="openpyxl", autocommit=False) as conn:
+        monkeypatch.setattr(
+            OpenpyxlBackend, "supports_transactions", property(lambda self: False)
+        )
+        with pytest.raises(ProgrammingError, match="partial writes may have occurred"):
+            conn.executemany(
+                "INSERT INTO users VALUES (?, ?, ?)",
+                [(2, "Bob", 1), (3, "Carol", 2), (4, "Dan"), (5, "Eve", 3)],
+            )
+        # The queued rows of the sets before the failing one are appended.
+        assert conn.execute("SELECT id FROM users").rows == [(1,), (2,), (3,)]
+
+
+def test_executemany_insert_restores_snapshot_on_append_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "bulk.xlsx"
+    _create_workbook(file_path)
+
+    def failing(
+        self: OpenpyxlBackend, sheet_name: str, rows: list[list[Any]]
+    ) -> tuple[int, int]:
+        for row in rows[:2]:
+            self.append_row(sheet_name, row)
+        raise OSError("disk full")
+
+    with ExcelConnection(str(file_path), engine="openpyxl", autocommit=False) as conn:
+        monkeypatch.setattr(OpenpyxlBackend, "append_rows", failing)
+        with pytest.raises(OperationalError, match="disk full"):
+            conn.executemany(
+                "INSERT INTO users (id) VALUES (?)", [(2,), (3,), (4,)]
+            )
+        assert conn.execute("SELECT id FROM users").rows == [(1,)]
+
+
+@pytest.mark.parametrize(
+    ("query", "params"),
+    [
+        (
+            "INSERT INTO users (id, name) VALUES (?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET name = excluded.name",
+            [(1, "Alicia"), (2, "Bob"), (2, "Bobby")],
+        ),
+        ("INSERT INTO users SELECT id + ?, name, score FROM users", [(10,), (100,)]),
+        ("UPDATE users SET score = ? WHERE id = ?", [(5, 1), (6, 1)]),
+    ],
+)
+def test_executemany_other_statements_run_per_parameter_set(
+    tmp_path: Path, query: str, params: list[tuple[Any, ...]]
+) -> None:
+    file_path = tmp_path / "bulk.xlsx"
+    _create_workbook(file_path)
+    with ExcelConnection(str(file_path), engine="openpyxl", autocommit=False) as conn:
+        batch = conn.executemany(query, params)
+        batch_rows = conn.execute("SELECT id, name, score FROM users").rows
+        conn.rollback()
+        rowcount = 0
+        for param_set in params:
+            rowcount += conn.execute(query, param_set).rowcount
+        assert conn.execute("SELECT id, name, score FROM users").rows == batch_rows
+        assert batch.rowcount == rowcount
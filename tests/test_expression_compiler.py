@@ -0,0 +1,148 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.executor import SharedExecutor
+from excel_dbapi.executor._compiler import ExpressionCompiler
+from excel_dbapi.parser import parse_sql
+
+
+def _create_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "items"
+    ws.append(["id", "qty", "price", "name", "tag", "seen"])
+    tags: list[Any] = ["a", "b", None, "10", 5, "name"]
+    for index in range(1, 25):
+        ws.append(
+            [
+                index,
+                index % 5 if index % 7 else None,
+                round(index * 1.25, 2),
+                f"item-{index}" if index % 4 else None,
+                tags[index % len(tags)],
+                datetime(2024, index % 12 + 1, 1),
+            ]
+        )
+    orders = wb.create_sheet("orders")
+    orders.append(["order_id", "item_id", "amount"])
+    for index in range(1, 16):
+        orders.append([index, index % 9 + 1, index * 3])
+    wb.save(path)
+
+
+def _outcome(path: Path, query: str) -> tuple[Any, ...]:
+    with connect(str(path)) as conn:
+        try:
+            result = conn.execute(query)
+        except Exception as exc:  # noqa: BLE001 - compared across both paths
+            return ("error", type(exc), str(exc))
+        rows = list(result.rows)
+        if query.lstrip().upper().startswith(("UPDATE", "DELETE")):
+            rows = conn.execute("SELECT * FROM items ORDER BY id").rows
+        return ("ok", rows, result.description, result.rowcount)
+
+
+QUERIES = [
+    "SELECT id FROM items WHERE qty > 2 AND price < 20",
+    "SELECT id FROM items WHERE qty = 0 OR name IS NULL",
+    "SELECT id FROM items WHERE NOT (qty >= 3) OR qty IS NULL",
+    "SELECT id FROM items WHERE qty + 1 > price / 4",
+    "SELECT id FROM items WHERE -qty < -2",
+    "SELECT id FROM items WHERE name || '!' LIKE '%1!'",
+    "SELECT id FROM items WHERE UPPER(name) = 'ITEM-3'",
+    "SELECT id FROM items WHERE CAST(price AS INTEGER) = 5",
+    "SELECT id FROM items WHERE tag IN ('a', 5, NULL)",
+    "SELECT id FROM items WHERE tag NOT IN ('a', 5)",
+    "SELECT id FROM items WHERE tag = name",
+    "SELECT id FROM items WHERE tag = 10",
+    "SELECT id FROM items WHERE id BETWEEN qty AND 10",
+    "SELECT id FROM items WHERE price NOT BETWEEN 5 AND qty * 10",
+    "SELECT id FROM items WHERE seen >= '2024-06-01' AND seen < '2024-09-01'",
+    "SELECT id FROM items WHERE name ILIKE 'ITEM-1_'",
+    "SELECT id FROM items WHERE name LIKE tag",
+    "SELECT id FROM items WHERE CASE WHEN qty > 2 THEN 'hi' ELSE 'lo' END = 'hi'",
+    "SELECT id FROM items WHERE CASE qty WHEN 1 THEN 'one' WHEN 2 THEN 'two' END = 'two'",
+    "SELECT id FROM items WHERE COALESCE(qty, 99) = 99",
+    "SELECT id FROM items WHERE items.qty = 3",
+    "SELECT id FROM items WHERE id IN (SELECT item_id FROM orders WHERE amount > 20)",
+    "SELECT id FROM items i WHERE EXISTS (SELECT 1 FROM orders o WHERE o.item_id = i.id)",
+    "SELECT id, (SELECT COUNT(*) FROM orders o WHERE o.item_id = items.id) FROM items",
+    "SELECT id, qty * price, name || '-' || tag FROM items WHERE id < 6",
+    "SELECT id, CASE WHEN qty IS NULL THEN 'none' ELSE 'some' END AS kind FROM items",
+    "SELECT id FROM items WHERE tag + 1 > 3",
+    "SELECT id FROM items WHERE price / (qty - qty) > 1",
+    "SELECT id FROM items WHERE name LIKE 5",
+    "SELECT o.order_id, i.name FROM orders o JOIN items i ON o.item_id = i.id AND o.amount > i.price WHERE i.qty > 1",
+    "SELECT o.order_id FROM orders o LEFT JOIN items i ON o.item_id = i.id WHERE i.name IS NULL OR o.amount < 10",
+    "UPDATE items SET qty = qty + 10 WHERE price > 20 AND name IS NOT NULL",
+    "DELETE FROM items WHERE qty IS NULL OR tag = 'a'",
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_compiled_evaluation_matches_interpreter(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, query: str
+) -> None:
+    compiled_path = tmp_path / "compiled.xlsx"
+    interpreted_path = tmp_path / "interpreted.xlsx"
+    _create_workbook(compiled_path)
+    _create_workbook(interpreted_path)
+
+    compiled = _outcome(compiled_path, query)
+
+    monkeypatch.setattr(ExpressionCompiler, "where", lambda self, node: None)
+    monkeypatch.setattr(ExpressionCompiler, "expression", lambda self, expr: None)
+    interpreted = _outcome(interpreted_path, query)
+
+    assert compiled == interpreted
+
+
+def test_compiled_where_skips_per_row_dicts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "items.xlsx"
+    _create_workbook(file_path)
+    built: list[Any] = []
+    original = SharedExecutor._row_from_values
+
+    def tracking(self: SharedExecutor, headers: list[str], values: list[Any]) -> Any:
+        built.append(values[0])
+        return original(self, headers, values)
+
+    monkeypatch.setattr(SharedExecutor, "_row_from_values", tracking)
+    with connect(str(file_path)) as conn:
+        rows = conn.execute("SELECT id FROM items WHERE qty * 2 = 8").rows
+
+    assert rows == [(4,), (9,), (19,), (24,)]
+    assert built == [4, 9, 19, 24]
+
+
+def test_subqueries_are_left_to_the_interpreter() -> None:
+    executor = SharedExecutor.__new__(SharedExecutor)
+    compiler = ExpressionCompiler(executor, executor._dict_getter)
+    parsed = parse_sql(
+        "SELECT id FROM t WHERE id = 1 AND EXISTS (SELECT 1 FROM u WHERE u.id = t.id)"
+    )
+
+    assert compiler.where(parsed["where"]) is None
+    assert compiler.where(parse_sql("SELECT id FROM t WHERE id = 1")["where"]) is not None
+
+
+def test_literal_test_requires_literal_operands() -> None:
+    executor = SharedExecutor.__new__(SharedExecutor)
+    ordinals = {"a": 0, "b": 1}
+    compiler = ExpressionCompiler(
+        executor, lambda name: executor._value_getter(name, ordinals, None)
+    )
+
+    test = compiler.literal_test({"column": "a", "operator": ">=", "value": 3})
+    assert test is not None
+    assert [test(value) for value in (2, 3, "4", None)] == [False, True, True, None]
+    assert compiler.literal_test({"column": "a", "operator": "=", "value": "b"}) is None
+    assert compiler.literal_test({"column": "a", "operator": "=", "value": "zz"}) is not None
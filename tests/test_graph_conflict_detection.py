@@ -3,8 +3,10 @@ from typing import Any
 import httpx
 import pytest
 
+from excel_dbapi.engines.base import TableData
 from excel_dbapi.engines.graph.backend import GraphBackend
 from excel_dbapi.exceptions import OperationalError
+from tests.graph.batch_transport import batch_aware
 
 DSN = "msgraph://drives/drv-1/items/itm-1"
 
@@ -14,6 +16,7 @@ def _build_conflict_handler(
     fail_on_patch: bool = False,
     initial_etag: str = '"v1"',
     updated_etag: str = '"v2"',
+    used_range: list[list[Any]] | None = None,
 ) -> tuple[Any, dict[str, Any]]:
     state: dict[str, Any] = {
         "request_headers": [],
@@ -41,7 +44,8 @@ def _build_conflict_handler(
             )
 
         if "usedRange" in path and method == "GET":
-            return httpx.Response(200, json={"values": [["id"], [1], [2]]})
+            values = used_range if used_range is not None else [["id"], [1], [2]]
+            return httpx.Response(200, json={"values": values})
 
         if "/range(" in path and method == "PATCH":
             if fail_on_patch:
@@ -56,13 +60,18 @@ def _build_conflict_handler(
 
 
 def _make_backend(
-    *, conflict_strategy: str = "fail", fail_on_patch: bool = False
+    *,
+    conflict_strategy: str = "fail",
+    fail_on_patch: bool = False,
+    used_range: list[list[Any]] | None = None,
 ) -> tuple[GraphBackend, dict[str, Any]]:
-    handler, state = _build_conflict_handler(fail_on_patch=fail_on_patch)
+    handler, state = _build_conflict_handler(
+        fail_on_patch=fail_on_patch, used_range=used_range
+    )
     backend = GraphBackend(
         DSN,
         credential="test-token",
-        transport=httpx.MockTransport(handler),
+        transport=httpx.MockTransport(batch_aware(handler)),
         readonly=False,
         conflict_strategy=conflict_strategy,
     )
@@ -117,3 +126,30 @@ def test_conflict_strategy_force_bypasses_if_match() -> None:
     assert len(patch_headers) == 1
     assert patch_headers[0].get("if-match") is None
     backend.close()
+
+
+SCATTERED = [["id"], [1], [2], [3], [4]]
+SCATTERED_UPDATE = TableData(["id"], [[10], [2], [30], [4]])
+
+
+def test_batched_writes_send_if_match_on_first_request() -> None:
+    backend, state = _make_backend(used_range=SCATTERED)
+    backend.write_sheet("Users", SCATTERED_UPDATE)
+    patch_headers = _patch_headers(state)
+    assert len(patch_headers) == 2
+    assert patch_headers[0].get("if-match") == '"v1"'
+    # The second request depends on the first, which checked the ETag.
+    assert patch_headers[1].get("if-match") is None
+    assert backend._etag == '"v2"'
+    backend.close()
+
+
+def test_precondition_failed_in_batch_raises_operational_error() -> None:
+    backend, state = _make_backend(used_range=SCATTERED, fail_on_patch=True)
+    with pytest.raises(
+        OperationalError,
+        match="Concurrent modification detected: workbook was modified by another session",
+    ):
+        backend.write_sheet("Users", SCATTERED_UPDATE)
+    assert len(_patch_headers(state)) == 1
+    backend.close()
@@ -5,8 +5,12 @@ import re
 from typing import Any
 
 import httpx
+import pytest
 
 from excel_dbapi.connection import ExcelConnection
+from excel_dbapi.exceptions import OperationalError
+from tests.graph.batch_transport import batch_aware
+from tests.graph.used_range import used_range_response
 
 
 DSN = "msgraph://drives/drv-opt/items/itm-opt"
@@ -30,7 +34,9 @@ def _parse_address(path: str) -> tuple[int, int, int, int]:
     return start_row, end_row, start_col, end_col
 
 
-def _build_handler() -> tuple[httpx.MockTransport, dict[str, Any]]:
+def _build_handler(
+    fail_path: str | None = None,
+) -> tuple[httpx.MockTransport, dict[str, Any]]:
     state: dict[str, Any] = {
         "worksheets": {
             "ws-emp": {
@@ -55,6 +61,8 @@ def _build_handler() -> tuple[httpx.MockTransport, dict[str, Any]]:
 
         state["requests"].append((method, path, body))
 
+        if fail_path is not None and fail_path in path:
+            return httpx.Response(500, json={"error": {"code": "generalException"}})
         if path.endswith("/createSession"):
             return httpx.Response(201, json={"id": "sess-opt"})
         if path.endswith("/closeSession"):
@@ -76,8 +84,8 @@ def _build_handler() -> tuple[httpx.MockTransport, dict[str, Any]]:
         if "usedRange" in path and method == "GET":
             for ws_id, ws_data in state["worksheets"].items():
                 if ws_id in path:
-                    return httpx.Response(200, json={"values": ws_data["values"]})
-            return httpx.Response(200, json={"values": []})
+                    return used_range_response(request, ws_data["values"])
+            return used_range_response(request, [])
 
         if "/range(" in path and method == "PATCH":
             if body is None:
@@ -123,7 +131,7 @@ def _build_handler() -> tuple[httpx.MockTransport, dict[str, Any]]:
 
         return httpx.Response(404)
 
-    return httpx.MockTransport(handler), state
+    return httpx.MockTransport(batch_aware(handler)), state
 
 
 def _make_connection() -> tuple[ExcelConnection, dict[str, Any]]:
@@ -132,6 +140,26 @@ def _make_connection() -> tuple[ExcelConnection, dict[str, Any]]:
     return conn, state
 
 
+def _make_tracked_connection(
+    fail_path: str | None = None,
+) -> tuple[ExcelConnection, dict[str, Any], list[str]]:
+    """Connection whose HTTP round trips are recorded by path."""
+    transport, state = _build_handler(fail_path)
+    round_trips: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        round_trips.append(request.url.path)
+        return transport.handle_request(request)
+
+    conn = ExcelConnection(
+        DSN,
+        credential="tok",
+        transport=httpx.MockTransport(handler),
+        readonly=False,
+    )
+    return conn, state, round_trips
+
+
 def test_single_row_update_uses_targeted_patch() -> None:
     conn, state = _make_connection()
     cursor = conn.cursor()
@@ -224,3 +252,83 @@ def test_data_integrity_after_optimized_update_and_delete() -> None:
         [3, "Carol", "Eng"],
     ]
     conn.close()
+
+
+def test_self_join_downloads_used_range_once() -> None:
+    conn, state = _make_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(
+        "SELECT a.name, b.name FROM Employees a JOIN Employees b "
+        "ON a.dept = b.dept AND a.id < b.id"
+    )
+    assert cursor.fetchall() == [("Alice", "Carol")]
+
+    used_range_reads = [
+        r for r in state["requests"] if r[0] == "GET" and "usedRange" in r[1]
+    ]
+    # A size probe, then one download of the values.
+    assert len(used_range_reads) == 2
+    conn.close()
+
+
+def _extend_employees(state: dict[str, Any], count: int) -> None:
+    state["worksheets"]["ws-emp"]["values"].extend(
+        [index, f"emp-{index}", "Ops"] for index in range(4, count + 1)
+    )
+
+
+def test_scattered_update_is_sent_in_batches() -> None:
+    conn, state, round_trips = _make_tracked_connection()
+    _extend_employees(state, 90)
+    cursor = conn.cursor()
+
+    even_ids = ", ".join(str(index) for index in range(2, 91, 2))
+    cursor.execute(f"UPDATE Employees SET dept = 'HR' WHERE id IN ({even_ids})")
+    assert cursor.rowcount == 45
+
+    # 45 separate row groups in three $batch calls of at most 20 requests.
+    assert round_trips.count("/v1.0/$batch") == 3
+    patch_requests = [r for r in state["requests"] if r[0] == "PATCH"]
+    assert len(patch_requests) == 45
+    assert "A3:C3" in patch_requests[0][1]
+    assert "A91:C91" in patch_requests[-1][1]
+    values = state["worksheets"]["ws-emp"]["values"]
+    assert [row[2] for row in values[1:7]] == ["Eng", "HR", "Eng", "HR", "Ops", "HR"]
+    conn.close()
+
+
+def test_scattered_delete_is_sent_bottom_up_in_one_batch() -> None:
+    conn, state, round_trips = _make_tracked_connection()
+    _extend_employees(state, 12)
+    cursor = conn.cursor()
+
+    cursor.execute("DELETE FROM Employees WHERE id IN (2, 5, 6, 9)")
+    assert cursor.rowcount == 4
+
+    assert round_trips.count("/v1.0/$batch") == 1
+    delete_requests = [
+        r[1] for r in state["requests"] if r[0] == "POST" and r[1].endswith("/delete")
+    ]
+    assert len(delete_requests) == 3
+    assert "A10:C10" in delete_requests[0]
+    assert "A6:C7" in delete_requests[1]
+    assert "A3:C3" in delete_requests[2]
+    assert [row[0] for row in state["worksheets"]["ws-emp"]["values"][1:]] == [
+        1, 3, 4, 7, 8, 10, 11, 12,
+    ]
+    conn.close()
+
+
+def test_failed_batch_request_raises_and_skips_the_rest() -> None:
+    conn, state, _ = _make_tracked_connection(fail_path="A5:C5")
+    _extend_employees(state, 10)
+    cursor = conn.cursor()
+
+    with pytest.raises(OperationalError, match="Graph API error 500 in \\$batch request 2"):
+        cursor.execute("UPDATE Employees SET dept = 'HR' WHERE id IN (2, 4, 6)")
+
+    depts = [row[2] for row in state["worksheets"]["ws-emp"]["values"][1:8]]
+    # The first group was written; the one after the failure never ran.
+    assert depts == ["Eng", "HR", "Eng", "Ops", "Ops", "Ops", "Ops"]
+    conn.close()
@@ -12,6 +12,7 @@ from excel_dbapi.engines.graph.auth import StaticTokenProvider
 from excel_dbapi.engines.graph.backend import GraphBackend
 from excel_dbapi.engines.graph.client import GraphClient
 from excel_dbapi.exceptions import OperationalError
+from tests.graph.used_range import used_range_response
 
 
 DSN = "msgraph://drives/drv-stress/items/itm-stress"
@@ -64,7 +65,7 @@ def _build_backend(
                 200, json={"value": [{"id": "ws-1", "name": "Users"}]}
             )
         if "usedRange" in path and method == "GET":
-            return httpx.Response(200, json={"values": state["values"]})
+            return used_range_response(request, state["values"])
 
         if "/range(" in path and method == "PATCH":
             if conflict_on_if_match and request.headers.get("if-match"):
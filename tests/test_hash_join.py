@@ -0,0 +1,130 @@
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from openpyxl import Workbook
+import pytest
+
+from excel_dbapi.connection import ExcelConnection
+from excel_dbapi.executor import SharedExecutor
+from excel_dbapi.executor.core import _AMBIGUOUS_KEY
+
+
+_MIXED_VALUES: list[Any] = [
+    1,
+    1.0,
+    "1",
+    " 1 ",
+    2,
+    "2.50",
+    2.5,
+    True,
+    "True",
+    False,
+    0,
+    "abc",
+    "ABC",
+    None,
+    "",
+    datetime(2024, 1, 1),
+    "2024-01-01",
+    "2024/01/01",
+    date(2024, 1, 2),
+    20240101,
+    "nan",
+]
+
+
+def _create_workbook(path: Path) -> None:
+    workbook = Workbook()
+    left = workbook.active
+    assert left is not None
+    left.title = "l"
+    left.append(["id", "k", "g"])
+    right = workbook.create_sheet("r")
+    right.append(["id", "k", "g"])
+    for index, value in enumerate(_MIXED_VALUES):
+        left.append([index, value, index % 2])
+        right.append([index, value, index % 3 % 2])
+    workbook.save(path)
+
+
+def _run(path: Path, query: str) -> list[tuple[Any, ...]]:
+    with ExcelConnection(str(path), engine="openpyxl") as conn:
+        return conn.execute(query).rows
+
+
+@pytest.mark.parametrize("join_type", ["INNER", "LEFT", "RIGHT", "FULL"])
+@pytest.mark.parametrize(
+    "on_clause",
+    [
+        "l.k = r.k",
+        "r.k = l.k AND l.g = r.g",
+        "l.k = r.k AND l.id < r.id",
+        "(l.k = r.k AND l.g = r.g) AND l.id <> r.id",
+        "l.k = r.k OR l.id = r.id",
+    ],
+)
+def test_hash_join_matches_nested_loop(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    join_type: str,
+    on_clause: str,
+) -> None:
+    path = tmp_path / "join.xlsx"
+    _create_workbook(path)
+    query = f"SELECT l.id, r.id FROM l {join_type} JOIN r ON {on_clause}"
+
+    hashed = _run(path, query)
+    monkeypatch.setattr(SharedExecutor, "_plan_hash_join", lambda *args: None)
+    nested = _run(path, query)
+
+    assert hashed == nested
+
+
+def test_equi_join_builds_hash_table_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "join.xlsx"
+    workbook = Workbook()
+    facts = workbook.active
+    assert facts is not None
+    facts.title = "facts"
+    facts.append(["id", "code"])
+    lookup = workbook.create_sheet("lookup")
+    lookup.append(["code", "label"])
+    for index in range(200):
+        facts.append([index, f"c{index % 10}"])
+    for code in range(10):
+        lookup.append([f"c{code}", f"label-{code}"])
+    workbook.save(path)
+
+    calls = 0
+    original = SharedExecutor._matches_join_on_condition
+
+    def counting(self: SharedExecutor, *args: Any) -> bool:
+        nonlocal calls
+        calls += 1
+        return original(self, *args)
+
+    monkeypatch.setattr(SharedExecutor, "_matches_join_on_condition", counting)
+    rows = _run(
+        path,
+        "SELECT f.id, l.label FROM facts f JOIN lookup l ON f.code = l.code ORDER BY f.id",
+    )
+
+    assert len(rows) == 200
+    assert rows[13] == (13, "label-3")
+    assert calls == 0
+
+
+def test_equality_key_mirrors_coerced_comparison() -> None:
+    executor = SharedExecutor.__new__(SharedExecutor)
+    assert executor._equality_key("20240101") is _AMBIGUOUS_KEY
+    assert executor._equality_key(None) is None
+    assert executor._equality_key(float("nan")) is None
+    assert executor._equality_key(True) == executor._equality_key("True")
+    assert executor._equality_key(1) == executor._equality_key("1.0")
+    assert executor._equality_key(date(2024, 1, 1)) == executor._equality_key(
+        "2024-01-01 00:00:00"
+    )
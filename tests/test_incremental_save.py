@@ -0,0 +1,204 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+import zipfile
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from excel_dbapi import connect
+from excel_dbapi.engines.openpyxl.backend import OpenpyxlBackend
+
+
+def _create_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "users"
+    ws.append(["id", "name", "joined"])
+    ws.append([1, "Alice", datetime(2024, 1, 1)])
+    for title in ("orders", "notes"):
+        sheet = wb.create_sheet(title)
+        sheet.append(["id", "text"])
+        for index in range(1, 50):
+            sheet.append([index, f"{title}-{index}"])
+    wb.save(path)
+
+
+def _members(path: Path) -> dict[str, tuple[int, int]]:
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+        return {
+            info.filename: (info.CRC, info.compress_size)
+            for info in archive.infolist()
+        }
+
+
+def _values(path: Path) -> dict[str, list[tuple[Any, ...]]]:
+    wb = load_workbook(path)
+    return {ws.title: list(ws.iter_rows(values_only=True)) for ws in wb.worksheets}
+
+
+@pytest.fixture
+def file_path(tmp_path: Path) -> Path:
+    path = tmp_path / "splice.xlsx"
+    _create_workbook(path)
+    return path
+
+
+@pytest.fixture
+def full_saves(file_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Paths passed to ``Workbook.save``; snapshots into buffers are ignored."""
+    calls: list[str] = []
+    original = Workbook.save
+
+    def tracking(self: Workbook, filename: Any) -> None:
+        if isinstance(filename, str):
+            calls.append(filename)
+        original(self, filename)
+
+    monkeypatch.setattr(Workbook, "save", tracking)
+    return calls
+
+
+def test_insert_rewrites_only_the_changed_sheet(
+    file_path: Path, full_saves: list[str]
+) -> None:
+    before = _members(file_path)
+
+    with connect(str(file_path), engine="openpyxl", autocommit=True) as conn:
+        conn.execute(
+            "INSERT INTO users VALUES (2, 'Bob', NULL), (3, '=1+1', NULL)"
+        )
+        conn.execute("UPDATE users SET name = 'Alicia' WHERE id = 1")
+
+    assert full_saves == []
+    after = _members(file_path)
+    changed = {name for name in before if before[name] != after[name]}
+    assert changed == {"xl/worksheets/sheet1.xml"}
+    assert list(after) == list(before)
+
+    values = _values(file_path)
+    assert values["users"] == [
+        ("id", "name", "joined"),
+        (1, "Alicia", datetime(2024, 1, 1)),
+        (2, "Bob", None),
+        (3, "'=1+1", None),
+    ]
+    assert values["orders"][-1] == (49, "orders-49")
+    frame = pd.read_excel(file_path, sheet_name="users")
+    assert frame["name"].tolist() == ["Alicia", "Bob", "'=1+1"]
+
+
+def test_spliced_file_matches_full_save(
+    tmp_path: Path, file_path: Path, full_saves: list[str]
+) -> None:
+    spliced = file_path
+    query = "DELETE FROM orders WHERE id > 10"
+
+    with connect(str(spliced), engine="openpyxl", autocommit=True) as conn:
+        conn.execute(query)
+    assert full_saves == []
+
+    full = tmp_path / "full.xlsx"
+    _create_workbook(full)
+    backend = OpenpyxlBackend(str(full))
+    backend.execute(query)
+    backend.get_workbook().save(str(full))
+
+    assert _values(spliced) == _values(full)
+
+
+def test_clean_save_leaves_file_untouched(file_path: Path, full_saves: list[str]) -> None:
+    content = file_path.read_bytes()
+
+    with connect(str(file_path), engine="openpyxl", autocommit=False) as conn:
+        conn.execute("SELECT * FROM users")
+        conn.commit()
+
+    assert full_saves == []
+    assert file_path.read_bytes() == content
+
+
+@pytest.mark.parametrize(
+    "statements",
+    [
+        ["CREATE TABLE extra (id INTEGER)"],
+        ["DROP TABLE notes"],
+    ],
+)
+def test_structural_changes_fall_back_to_full_save(
+    file_path: Path, full_saves: list[str], statements: list[str]
+) -> None:
+    with connect(str(file_path), engine="openpyxl", autocommit=False) as conn:
+        for statement in statements:
+            conn.execute(statement)
+        conn.execute("INSERT INTO users VALUES (5, 'Eve', NULL)")
+        conn.commit()
+
+    assert len(full_saves) == 1
+    assert _values(file_path)["users"][-1] == (5, "Eve", None)
+
+
+def test_new_cell_style_falls_back_to_full_save(
+    file_path: Path, full_saves: list[str]
+) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "events"
+    ws.append(["id", "at"])
+    wb.save(file_path)
+    full_saves.clear()
+
+    backend = OpenpyxlBackend(str(file_path))
+    backend.append_row("events", [1, datetime(2024, 5, 6, 7, 8)])
+    backend.save()
+
+    assert len(full_saves) == 1
+    assert _values(file_path)["events"][-1] == (1, datetime(2024, 5, 6, 7, 8))
+
+    backend.append_row("events", [2, datetime(2024, 5, 7)])
+    backend.save()
+    assert len(full_saves) == 1
+    assert _values(file_path)["events"][-1] == (2, datetime(2024, 5, 7))
+
+
+def test_calculation_chain_falls_back_to_full_save(
+    file_path: Path, full_saves: list[str]
+) -> None:
+    with zipfile.ZipFile(file_path, "a") as archive:
+        archive.writestr("xl/calcChain.xml", "<calcChain/>")
+
+    backend = OpenpyxlBackend(str(file_path))
+    backend.append_row("users", [2, "Bob"])
+    backend.save()
+
+    assert len(full_saves) == 1
+
+
+def test_direct_workbook_access_falls_back_to_full_save(
+    file_path: Path, full_saves: list[str]
+) -> None:
+    with connect(str(file_path), engine="openpyxl", autocommit=False) as conn:
+        conn.workbook["notes"]["B2"] = "edited"
+        conn.commit()
+
+    assert len(full_saves) == 1
+    assert _values(file_path)["notes"][1] == (1, "edited")
+
+
+@pytest.mark.parametrize("attribute", ["workbook", "data"])
+@pytest.mark.parametrize("statement", [None, "UPDATE users SET name = 'Al'"])
+def test_edits_through_engine_attributes_are_saved(
+    file_path: Path, attribute: str, statement: str | None
+) -> None:
+    with connect(str(file_path), engine="openpyxl", autocommit=False) as conn:
+        if statement is not None:
+            conn.execute(statement)
+        sheets = getattr(conn.engine, attribute)
+        sheets["notes"]["B2"].value = "edited"
+        conn.commit()
+
+    assert _values(file_path)["notes"][1] == (1, "edited")
@@ -0,0 +1,132 @@
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.engines.openpyxl.backend import OpenpyxlBackend
+from excel_dbapi.exceptions import NotSupportedError
+
+
+def _create_workbook(path: Path, rows: int) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "Sheet1"
+    ws.append(["id", "name", "score"])
+    for index in range(1, rows + 1):
+        ws.append([index, f"user-{index}", index % 7])
+    wb.save(path)
+
+
+def test_readonly_select_matches_full_mode(tmp_path: Path) -> None:
+    file_path = tmp_path / "report.xlsx"
+    _create_workbook(file_path, rows=50)
+    query = "SELECT id, name FROM Sheet1 WHERE score = 3 ORDER BY id DESC"
+
+    with connect(str(file_path)) as conn:
+        expected = conn.execute(query).rows
+    with connect(str(file_path), readonly=True) as conn:
+        assert conn.engine.readonly is True
+        assert conn.execute(query).rows == expected
+
+
+def test_readonly_aggregate_query(tmp_path: Path) -> None:
+    file_path = tmp_path / "report.xlsx"
+    _create_workbook(file_path, rows=14)
+
+    with connect(str(file_path), readonly=True) as conn:
+        result = conn.execute(
+            "SELECT score, COUNT(*) FROM Sheet1 GROUP BY score ORDER BY score"
+        )
+        assert result.rows == [(score, 2) for score in range(7)]
+
+
+def test_limit_without_order_by_stops_scan_early(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "report.xlsx"
+    _create_workbook(file_path, rows=100)
+    consumed: list[int] = []
+    original = OpenpyxlBackend.iter_sheet
+
+    def tracking_iter_sheet(
+        self: OpenpyxlBackend, sheet_name: str, **kwargs: Any
+    ) -> tuple[list[str], Iterator[list[Any]]]:
+        headers, rows = original(self, sheet_name, **kwargs)
+
+        def counting() -> Iterator[list[Any]]:
+            for row in rows:
+                consumed.append(row[0])
+                yield row
+
+        return headers, counting()
+
+    monkeypatch.setattr(OpenpyxlBackend, "iter_sheet", tracking_iter_sheet)
+
+    with connect(str(file_path), readonly=True) as conn:
+        result = conn.execute("SELECT id FROM Sheet1 WHERE score = 1 LIMIT 2 OFFSET 1")
+
+    assert result.rows == [(8,), (15,)]
+    # The WHERE is pushed into the scan, so only matching rows come back.
+    assert consumed == [1, 8, 15]
+
+
+def test_limit_with_order_by_reads_every_row(tmp_path: Path) -> None:
+    file_path = tmp_path / "report.xlsx"
+    _create_workbook(file_path, rows=20)
+
+    with connect(str(file_path), readonly=True) as conn:
+        result = conn.execute("SELECT id FROM Sheet1 ORDER BY id DESC LIMIT 2")
+
+    assert result.rows == [(20,), (19,)]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "INSERT INTO Sheet1 (id, name, score) VALUES (99, 'x', 1)",
+        "UPDATE Sheet1 SET name = 'x' WHERE id = 1",
+        "DELETE FROM Sheet1 WHERE id = 1",
+        "DROP TABLE Sheet1",
+    ],
+)
+def test_readonly_rejects_writes(tmp_path: Path, query: str) -> None:
+    file_path = tmp_path / "report.xlsx"
+    _create_workbook(file_path, rows=3)
+
+    with connect(str(file_path), readonly=True) as conn:
+        with pytest.raises(NotSupportedError):
+            conn.execute(query)
+        assert not Path(f"{file_path}.lock").exists()
+
+
+def test_readonly_rejects_transactions_and_create(tmp_path: Path) -> None:
+    file_path = tmp_path / "report.xlsx"
+    _create_workbook(file_path, rows=3)
+
+    with pytest.raises(NotSupportedError):
+        connect(str(file_path), readonly=True, autocommit=False)
+    with pytest.raises(NotSupportedError):
+        connect(str(tmp_path / "new.xlsx"), readonly=True, create=True)
+
+
+def test_readonly_pads_short_rows(tmp_path: Path) -> None:
+    file_path = tmp_path / "ragged.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "Sheet1"
+    ws.append(["id", "name", "note"])
+    ws.append([1, "a"])
+    ws.append([2, "b", "c"])
+    wb.save(file_path)
+
+    backend = OpenpyxlBackend(str(file_path), readonly=True)
+    try:
+        headers, rows = backend.iter_sheet("Sheet1")
+        assert headers == ["id", "name", "note"]
+        assert list(rows) == [[1, "a", None], [2, "b", "c"]]
+    finally:
+        backend.close()
@@ -0,0 +1,117 @@
+import random
+from datetime import date, datetime
+from typing import Any
+
+import pytest
+
+from excel_dbapi.executor import SharedExecutor
+
+
+def _multi_pass_sort(
+    executor: SharedExecutor, rows: list[dict[str, Any]], order_by: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """The per-item stable sorts ORDER BY used to run, kept as the reference."""
+    for item in reversed(order_by):
+        col = str(item["column"])
+        rows = sorted(
+            rows,
+            key=lambda row: executor._sort_key(row[col]),
+            reverse=item["direction"] == "DESC",
+        )
+    return rows
+
+
+VALUES: list[Any] = [
+    None,
+    True,
+    False,
+    0,
+    3,
+    2.5,
+    "3",
+    "abc",
+    "",
+    "2024-01-05",
+    datetime(2024, 1, 5),
+    date(2023, 12, 31),
+]
+
+
+@pytest.mark.parametrize(
+    "directions",
+    [("ASC",), ("DESC",), ("ASC", "ASC"), ("DESC", "DESC"), ("ASC", "DESC", "ASC"), ("DESC", "ASC")],
+)
+def test_single_pass_sort_matches_multi_pass(directions: tuple[str, ...]) -> None:
+    executor = SharedExecutor(object())  # type: ignore[arg-type]
+    generator = random.Random(len(directions))
+    columns = [f"c{index}" for index in range(len(directions))]
+    rows = [
+        {"id": index, **{col: generator.choice(VALUES) for col in columns}}
+        for index in range(200)
+    ]
+    order_by = [
+        {"column": col, "direction": direction}
+        for col, direction in zip(columns, directions)
+    ]
+
+    ordered = executor._apply_order_by(
+        rows, order_by, value_getter=lambda row, col: row[col]
+    )
+
+    assert [row["id"] for row in ordered] == [
+        row["id"] for row in _multi_pass_sort(executor, rows, order_by)
+    ]
+    for limit in (0, 1, 17, 199):
+        top = executor._apply_order_by(
+            rows, order_by, value_getter=lambda row, col: row[col], limit=limit
+        )
+        assert [row["id"] for row in top] == [row["id"] for row in ordered[:limit]]
+
+
+def test_string_sort_keys_are_parsed_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    executor = SharedExecutor(object())  # type: ignore[arg-type]
+    parsed: list[str] = []
+    original = SharedExecutor._parse_datetime_string
+
+    def tracking(value: str) -> datetime | None:
+        parsed.append(value)
+        return original(value)
+
+    monkeypatch.setattr(SharedExecutor, "_parse_datetime_string", staticmethod(tracking))
+    rows = [{"day": f"2024-01-{index % 5 + 1:02d}", "n": index % 3} for index in range(300)]
+
+    executor._apply_order_by(
+        rows,
+        [{"column": "n", "direction": "DESC"}, {"column": "day", "direction": "ASC"}],
+        value_getter=lambda row, col: row[col],
+    )
+
+    # Affinity detection stops at the first date-like string; the sort keys
+    # then parse each distinct string once.
+    assert parsed[0] == "2024-01-01"
+    assert sorted(parsed[1:]) == [f"2024-01-{day:02d}" for day in range(1, 6)]
+
+
+def test_window_rank_uses_sorted_keys() -> None:
+    executor = SharedExecutor(object())  # type: ignore[arg-type]
+    rows: list[dict[str, Any]] = [
+        {"g": "a", "v": value} for value in ["2024-01-02", 5, None, 5, "2024-01-02", 1]
+    ]
+    expression = {
+        "type": "window_function",
+        "func": "RANK",
+        "args": [],
+        "partition_by": ["g"],
+        "order_by": [{"column": "v", "direction": "DESC"}],
+    }
+
+    executor._evaluate_window_expression(rows, expression, target_column="r")
+
+    assert [(row["v"], row["r"]) for row in rows] == [
+        ("2024-01-02", 2),
+        (5, 4),
+        (None, 1),
+        (5, 4),
+        ("2024-01-02", 2),
+        (1, 6),
+    ]
@@ -0,0 +1,165 @@
+from pathlib import Path
+import random
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.engines.pandas._executor import PandasExecutor
+from excel_dbapi.engines.pandas.backend import PandasBackend
+from excel_dbapi.engines.result import ExecutionResult
+from excel_dbapi.executor import SharedExecutor
+
+
+def _create_workbook(path: Path) -> None:
+    rng = random.Random(7)
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "data"
+    ws.append(["id", "score", "amount", "name", "grp", "code", "big"])
+    names = ["alice", "Bob", "carol", "zed", "mallory", "=cmd", None]
+    for index in range(1, 201):
+        ws.append(
+            [
+                index,
+                rng.choice([None, 10, 20, 30, 40, 50, 60, 70, -5]),
+                rng.choice([None, 0.5, 10.5, 2.25, -3.75, 100.0, 7]),
+                rng.choice(names),
+                rng.choice(["a", "b", "c", None]),
+                rng.choice(["x1", "10", "9", "2024-01-02"]),
+                2**60 + index,
+            ]
+        )
+    mixed = wb.create_sheet("mixed")
+    mixed.append(["id", "value"])
+    for index, value in enumerate([1, 1.5, "x", None, 2], start=1):
+        mixed.append([index, value])
+    wb.save(path)
+
+
+def _typed(rows: list[Any]) -> list[list[tuple[str, Any]]]:
+    """Rows with each value's type, so ``1`` and ``1.0`` differ."""
+    return [
+        [("str" if isinstance(value, str) else type(value).__name__, value) for value in row]
+        for row in rows
+    ]
+
+
+def _outcome(backend: PandasBackend, result: ExecutionResult) -> Any:
+    sheets = {
+        name: _typed(backend.read_sheet(name).rows) for name in backend.list_sheets()
+    }
+    return (
+        _typed(result.rows),
+        result.description,
+        result.rowcount,
+        result.lastrowid,
+        sheets,
+    )
+
+
+VECTORIZED = [
+    "SELECT * FROM data WHERE score > 50",
+    "SELECT id, name FROM data WHERE amount <= 10.5 OR score IS NULL "
+    "ORDER BY score DESC, id LIMIT 7 OFFSET 2",
+    "SELECT id, amount FROM data WHERE NOT (score BETWEEN 20 AND 60) ORDER BY amount",
+    "SELECT id, d.name AS n FROM data d WHERE d.grp IN ('a', 'b', NULL) "
+    "ORDER BY id DESC",
+    "SELECT id FROM data WHERE score NOT IN (10, 20, NULL)",
+    "SELECT id FROM data WHERE score NOT IN (10, 20) AND NOT amount IS NULL",
+    "SELECT id, name FROM data WHERE name >= 'm' AND name <> 'zed' ORDER BY name",
+    "SELECT id FROM data WHERE score > 40 LIMIT 3",
+    "SELECT id FROM data WHERE score >= '30' AND amount <> '10.5'",
+    "SELECT grp, COUNT(*), COUNT(score), SUM(id) AS total, AVG(id), MIN(amount), "
+    "MAX(score) FROM data GROUP BY grp ORDER BY total DESC",
+    "SELECT grp, score, COUNT(*) AS n FROM data WHERE id > 10 GROUP BY grp, score "
+    "ORDER BY grp, score DESC LIMIT 5",
+    "SELECT COUNT(*), MIN(id), MAX(id), SUM(id), AVG(id) FROM data WHERE id > 1000",
+    "SELECT grp, COUNT(*) FROM data WHERE id > 1000 GROUP BY grp",
+    "SELECT MAX(amount), MIN(score), COUNT(name) FROM data",
+    "SELECT id, value FROM mixed WHERE id > 1",
+    "UPDATE data SET score = NULL WHERE score < 30",
+    "UPDATE data SET score = 2.5, name = '=cmd' WHERE grp = 'a'",
+    "UPDATE data SET id = 0 WHERE id > 100 OR amount IS NULL",
+    "UPDATE data SET name = NULL, amount = 1",
+    "UPDATE data SET id = NULL, id = 4",
+    "UPDATE data SET id = NULL",
+    "UPDATE data SET id = NULL WHERE id < 5",
+    "UPDATE data SET grp = 'z' WHERE grp IS NULL AND name IN ('Bob', 'zed')",
+    "DELETE FROM data WHERE score IS NULL OR id BETWEEN 5 AND 9",
+    "DELETE FROM data WHERE amount > 0",
+    "DELETE FROM data",
+]
+
+FALLBACK = [
+    "SELECT SUM(amount) FROM data",
+    "SELECT SUM(big), MIN(big) FROM data",
+    "SELECT id FROM data WHERE name = '10'",
+    "SELECT id FROM data WHERE name LIKE 'a%'",
+    "SELECT id FROM data WHERE code = 'x1' ORDER BY code, id",
+    "SELECT DISTINCT grp FROM data",
+    "SELECT grp, COUNT(*) FROM data GROUP BY grp HAVING COUNT(*) > 40",
+    "SELECT id * 2 FROM data WHERE id < 3",
+    "SELECT id FROM data WHERE id IN (SELECT id FROM mixed)",
+    "UPDATE data SET score = score + 1 WHERE id < 10",
+    "UPDATE data SET score = 'high' WHERE id < 10",
+    "DELETE FROM mixed WHERE id = 2",
+]
+
+
+@pytest.mark.parametrize("query", VECTORIZED + FALLBACK)
+def test_results_match_shared_executor(tmp_path: Path, query: str) -> None:
+    file_path = tmp_path / "data.xlsx"
+    _create_workbook(file_path)
+    vectorized = PandasBackend(str(file_path))
+    interpreted = PandasBackend(str(file_path))
+
+    expected = SharedExecutor(interpreted).execute_with_params(query)
+    actual = PandasExecutor(vectorized).execute_with_params(query)
+
+    assert _outcome(vectorized, actual) == _outcome(interpreted, expected)
+
+
+def test_statement_sequence_matches_shared_executor(tmp_path: Path) -> None:
+    file_path = tmp_path / "data.xlsx"
+    _create_workbook(file_path)
+    vectorized = PandasBackend(str(file_path))
+    interpreted = PandasBackend(str(file_path))
+
+    for query in VECTORIZED[14:-1] + VECTORIZED[:14]:
+        expected = SharedExecutor(interpreted).execute_with_params(query)
+        actual = PandasExecutor(vectorized).execute_with_params(query)
+        assert _outcome(vectorized, actual) == _outcome(interpreted, expected), query
+
+
+@pytest.mark.parametrize("query", VECTORIZED)
+def test_vectorized_statements_skip_row_conversion(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, query: str
+) -> None:
+    file_path = tmp_path / "data.xlsx"
+    _create_workbook(file_path)
+    backend = PandasBackend(str(file_path))
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("statement fell back to the row interpreter")
+
+    monkeypatch.setattr(PandasBackend, "read_sheet", fail)
+    monkeypatch.setattr(PandasBackend, "write_sheet", fail)
+    PandasExecutor(backend).execute_with_params(query)
+
+
+def test_connection_uses_vectorized_executor(tmp_path: Path) -> None:
+    file_path = tmp_path / "data.xlsx"
+    _create_workbook(file_path)
+
+    with connect(str(file_path), engine="pandas", autocommit=False) as conn:
+        cursor = conn.cursor()
+        cursor.execute("UPDATE data SET score = ? WHERE id <= ?", (99, 3))
+        assert cursor.rowcount == 3
+        cursor.execute("SELECT id FROM data WHERE score = 99 ORDER BY id DESC")
+        assert cursor.fetchall() == [(3,), (2,), (1,)]
+        conn.rollback()
+        cursor.execute("SELECT COUNT(*) FROM data WHERE score = 99")
+        assert cursor.fetchall() == [(0,)]
@@ -0,0 +1,169 @@
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.engines.base import TableData
+from excel_dbapi.engines.graph.backend import GraphBackend
+from excel_dbapi.engines.openpyxl.backend import OpenpyxlBackend
+from excel_dbapi.engines.pandas.backend import PandasBackend
+from excel_dbapi.exceptions import OperationalError
+from excel_dbapi.executor import SharedExecutor
+
+
+def _create_workbook(path: Path, rows: int = 40) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "Sheet1"
+    ws.append(["id", "score", "name", "notes"])
+    names = ["alice", "Bob", None, "carol"]
+    for index in range(1, rows + 1):
+        ws.append(
+            [
+                index,
+                index % 6 if index % 5 else None,
+                names[index % len(names)],
+                "x" * 200,
+            ]
+        )
+    other = wb.create_sheet("Other")
+    other.append(["ref"])
+    for index in (2, 3, 5, 7):
+        other.append([index])
+    wb.save(path)
+
+
+QUERIES = [
+    "SELECT id FROM Sheet1 WHERE score > 3",
+    "SELECT id, name FROM Sheet1 WHERE name IS NULL OR score = 0",
+    "SELECT id FROM Sheet1 WHERE NOT (score < 2) AND name LIKE '%o%'",
+    "SELECT id FROM Sheet1 WHERE score * 2 = id",
+    "SELECT id FROM Sheet1 s WHERE s.score IN (1, 2) ORDER BY id DESC LIMIT 3",
+    "SELECT name, COUNT(*) FROM Sheet1 WHERE score IS NOT NULL GROUP BY name",
+    "SELECT id FROM Sheet1 WHERE id IN (SELECT ref FROM Other)",
+    "SELECT id FROM Sheet1 WHERE id = 'zz'",
+    "SELECT id FROM Sheet1 WHERE score / (id - id) > 1",
+]
+
+
+def _outcome(path: Path, engine: str, query: str) -> tuple[Any, ...]:
+    with connect(str(path), engine=engine) as conn:
+        try:
+            result = conn.execute(query)
+        except Exception as exc:  # noqa: BLE001 - compared across both paths
+            return ("error", type(exc), str(exc))
+        return ("ok", result.rows, result.description)
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "pandas"])
+@pytest.mark.parametrize("query", QUERIES)
+def test_pushdown_matches_executor_filtering(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, engine: str, query: str
+) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    _create_workbook(file_path)
+
+    pushed = _outcome(file_path, engine, query)
+
+    for backend_class in (OpenpyxlBackend, PandasBackend):
+        monkeypatch.setattr(
+            backend_class,
+            "supports_predicate_pushdown",
+            property(lambda self: False),
+        )
+    filtered = _outcome(file_path, engine, query)
+
+    assert pushed == filtered
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "pandas"])
+def test_pushdown_keeps_memory_limit_to_matching_rows(
+    tmp_path: Path, engine: str
+) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    _create_workbook(file_path, rows=2000)
+
+    with connect(str(file_path), engine=engine, max_memory_mb=0.1) as conn:
+        assert conn.execute("SELECT * FROM Sheet1 WHERE id = 7").rows[0][0] == 7
+        with pytest.raises(OperationalError):
+            conn.execute("SELECT * FROM Sheet1 WHERE id > 0")
+
+
+def test_subquery_where_is_not_pushed_down(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    _create_workbook(file_path)
+    received: list[Any] = []
+    original = PandasBackend.read_sheet
+
+    def tracking(self: PandasBackend, sheet_name: str, **kwargs: Any) -> TableData:
+        received.append((sheet_name, kwargs.get("predicate") is not None))
+        return original(self, sheet_name, **kwargs)
+
+    monkeypatch.setattr(PandasBackend, "read_sheet", tracking)
+    executor = SharedExecutor(PandasBackend(str(file_path)))
+    executor.execute_with_params(
+        "SELECT id FROM Sheet1 WHERE id IN (SELECT ref FROM Other)"
+    )
+    executor.execute_with_params("SELECT ref FROM Other o WHERE o.ref > 4")
+
+    assert received == [("Sheet1", False), ("Other", False), ("Other", True)]
+
+
+def test_pandas_pushdown_converts_only_filtered_columns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "sample.xlsx"
+    _create_workbook(file_path)
+    converted: list[int] = []
+    original = PandasBackend._column_values
+
+    def tracking(series: Any) -> Any:
+        converted.append(len(series))
+        return original(series)
+
+    monkeypatch.setattr(PandasBackend, "_column_values", staticmethod(tracking))
+    executor = SharedExecutor(PandasBackend(str(file_path)))
+    rows = executor.execute_with_params("SELECT id FROM Sheet1 WHERE id > 37").rows
+
+    assert rows == [(38,), (39,), (40,)]
+    # Only the id column is read: once in full for the filter, then the matches.
+    assert converted == [40, 3]
+
+
+def _graph_handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path.endswith("/createSession"):
+        return httpx.Response(201, json={"id": "sess-mock"})
+    if path.endswith("/closeSession"):
+        return httpx.Response(204)
+    if path.endswith("/worksheets"):
+        return httpx.Response(200, json={"value": [{"id": "ws-1", "name": "Users"}]})
+    if "usedRange" in path:
+        values: list[list[Any]] = [["id", "name"]]
+        values.extend([index, f"user-{index}"] for index in range(1, 51))
+        return httpx.Response(200, json={"values": values})
+    return httpx.Response(404)
+
+
+def test_graph_pushdown_filters_used_range_rows() -> None:
+    backend = GraphBackend(
+        "msgraph://drives/drv-1/items/itm-1",
+        credential="test-token",
+        transport=httpx.MockTransport(_graph_handler),
+        max_memory_mb=0.001,
+    )
+    executor = SharedExecutor(backend)
+
+    result = executor.execute_with_params(
+        "SELECT name FROM Users WHERE id > 45", None
+    )
+
+    assert result.rows == [(f"user-{index}",) for index in range(46, 51)]
+    with pytest.raises(OperationalError):
+        executor.execute_with_params("SELECT name FROM Users", None)
@@ -0,0 +1,157 @@
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.engines.base import _projected_ordinals
+from excel_dbapi.engines.graph.backend import GraphBackend
+from excel_dbapi.engines.openpyxl.backend import OpenpyxlBackend
+from excel_dbapi.engines.pandas.backend import PandasBackend
+from excel_dbapi.exceptions import OperationalError
+
+
+def _create_workbook(path: Path, rows: int = 30, padding: int = 20) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "Sheet1"
+    ws.append(
+        ["id", "Name", "score", "a.b"] + [f"pad{index}" for index in range(padding)]
+    )
+    names = ["alice", "Bob", None, "carol"]
+    for index in range(1, rows + 1):
+        ws.append(
+            [index, names[index % len(names)], index % 7, index * 10]
+            + ["x" * 50] * padding
+        )
+    wb.save(path)
+
+
+QUERIES = [
+    "SELECT id, name FROM Sheet1 WHERE score > 3",
+    "SELECT NAME AS who FROM Sheet1 ORDER BY who DESC, id",
+    "SELECT s.id, S.SCORE FROM Sheet1 s WHERE s.Name IS NOT NULL",
+    "SELECT Sheet1.a.b FROM Sheet1 WHERE id < 4",
+    "SELECT name, COUNT(*), SUM(score) FROM Sheet1 GROUP BY name HAVING SUM(score) > 10",
+    "SELECT name, MAX(id) FROM Sheet1 GROUP BY name HAVING COUNT(DISTINCT score) > 2",
+    "SELECT COUNT(*) FROM Sheet1",
+    "SELECT 1 FROM Sheet1 LIMIT 2",
+    "SELECT id, ROW_NUMBER() OVER (PARTITION BY name ORDER BY score DESC) FROM Sheet1",
+    "SELECT id FROM Sheet1 WHERE name = pad3",
+    "SELECT UPPER(name) || '-' || CAST(score AS TEXT) FROM Sheet1 WHERE id = 5",
+    "SELECT DISTINCT score FROM Sheet1 ORDER BY score",
+    "SELECT id, missing FROM Sheet1",
+    "SELECT id FROM Sheet1 ORDER BY missing",
+    "SELECT name, COUNT(*) FROM Sheet1 GROUP BY missing",
+    "SELECT id FROM Sheet1 WHERE id IN (SELECT score FROM Sheet1 WHERE score > 5)",
+]
+
+
+def _outcome(path: Path, query: str, **kwargs: Any) -> tuple[Any, ...]:
+    with connect(str(path), **kwargs) as conn:
+        try:
+            result = conn.execute(query)
+        except Exception as exc:  # noqa: BLE001 - compared across both paths
+            return ("error", type(exc), str(exc))
+        return ("ok", result.rows, result.description)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"engine": "openpyxl"}, {"engine": "openpyxl", "readonly": True}, {"engine": "pandas"}],
+    ids=["openpyxl", "openpyxl-readonly", "pandas"],
+)
+@pytest.mark.parametrize("query", QUERIES)
+def test_projection_matches_full_read(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    options: dict[str, Any],
+    query: str,
+) -> None:
+    file_path = tmp_path / "wide.xlsx"
+    _create_workbook(file_path)
+
+    projected = _outcome(file_path, query, **options)
+
+    for backend_class in (OpenpyxlBackend, PandasBackend):
+        monkeypatch.setattr(
+            backend_class,
+            "supports_projection_pushdown",
+            property(lambda self: False),
+        )
+    full = _outcome(file_path, query, **options)
+
+    assert projected == full
+
+
+def test_projected_ordinals_match_case_insensitively() -> None:
+    headers = ["id", "Name", "score"]
+    assert _projected_ordinals(headers, {"NAME", "id", "other"}) == [0, 1]
+    assert _projected_ordinals(headers, set()) == [0]
+    assert _projected_ordinals([], {"id"}) == []
+
+
+@pytest.mark.parametrize("readonly", [False, True])
+def test_openpyxl_reads_only_requested_columns(tmp_path: Path, readonly: bool) -> None:
+    file_path = tmp_path / "wide.xlsx"
+    _create_workbook(file_path, rows=3)
+    backend = OpenpyxlBackend(str(file_path), readonly=readonly)
+
+    data = backend.read_sheet("Sheet1", columns={"score", "name"})
+
+    assert data.headers == ["Name", "score"]
+    assert data.rows == [["Bob", 1], [None, 2], ["carol", 3]]
+    backend.close()
+
+
+def test_pandas_reads_only_requested_columns(tmp_path: Path) -> None:
+    file_path = tmp_path / "wide.xlsx"
+    _create_workbook(file_path, rows=3)
+    backend = PandasBackend(str(file_path))
+
+    data = backend.read_sheet("Sheet1", columns={"id", "pad19"})
+
+    assert data.headers == ["id", "pad19"]
+    assert data.rows == [[1, "x" * 50], [2, "x" * 50], [3, "x" * 50]]
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "pandas"])
+def test_memory_limit_counts_only_projected_columns(
+    tmp_path: Path, engine: str
+) -> None:
+    file_path = tmp_path / "wide.xlsx"
+    _create_workbook(file_path, rows=1000)
+
+    with connect(str(file_path), engine=engine, max_memory_mb=0.5) as conn:
+        assert conn.execute("SELECT MAX(id) FROM Sheet1").rows == [(1000,)]
+        with pytest.raises(OperationalError):
+            conn.execute("SELECT * FROM Sheet1")
+
+
+def test_graph_read_sheet_drops_unrequested_columns() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/createSession"):
+            return httpx.Response(201, json={"id": "sess-mock"})
+        if path.endswith("/worksheets"):
+            return httpx.Response(200, json={"value": [{"id": "ws-1", "name": "Users"}]})
+        if "usedRange" in path:
+            return httpx.Response(
+                200,
+                json={"values": [["id", "name", "email"], [1, "Ada", "a@x"], [2, "Bob", "b@x"]]},
+            )
+        return httpx.Response(404)
+
+    backend = GraphBackend(
+        "msgraph://drives/drv-1/items/itm-1",
+        credential="test-token",
+        transport=httpx.MockTransport(handler),
+    )
+
+    data = backend.read_sheet("Users", columns={"EMAIL", "id"})
+
+    assert data.headers == ["id", "email"]
+    assert data.rows == [[1, "a@x"], [2, "b@x"]]
@@ -0,0 +1,205 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.engines.base import TableData, WorkbookBackend
+from excel_dbapi.engines.openpyxl.backend import OpenpyxlBackend
+from excel_dbapi.engines.pandas.backend import PandasBackend
+from excel_dbapi.executor import SharedExecutor
+
+
+def _create_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "users"
+    ws.append(["id", "name", "score"])
+    for index in range(1, 6):
+        ws.append([index, f"user-{index}", index * 10])
+    archive = wb.create_sheet("archive")
+    archive.append(["id", "name", "score"])
+    wb.save(path)
+
+
+@pytest.fixture
+def file_path(tmp_path: Path) -> Path:
+    path = tmp_path / "cache.xlsx"
+    _create_workbook(path)
+    return path
+
+
+@pytest.fixture
+def sheet_reads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Sheets converted by the openpyxl backend, one entry per read."""
+    reads: list[str] = []
+    original = OpenpyxlBackend.iter_sheet
+
+    def tracking(self: OpenpyxlBackend, sheet_name: str, **kwargs: Any) -> Any:
+        reads.append(sheet_name)
+        return original(self, sheet_name, **kwargs)
+
+    monkeypatch.setattr(OpenpyxlBackend, "iter_sheet", tracking)
+    return reads
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "pandas"])
+def test_writes_change_only_their_sheet_version(file_path: Path, engine: str) -> None:
+    with connect(str(file_path), engine=engine, autocommit=False) as conn:
+        backend = conn.engine
+        users = backend.sheet_version("users")
+        archive = backend.sheet_version("archive")
+
+        conn.execute("INSERT INTO archive VALUES (9, 'old', 0)")
+        assert backend.sheet_version("users") == users
+        assert backend.sheet_version("archive") > archive
+
+        archive = backend.sheet_version("archive")
+        conn.execute("UPDATE users SET score = 0 WHERE id = 1")
+        assert backend.sheet_version("users") > users
+        assert backend.sheet_version("archive") == archive
+
+        users = backend.sheet_version("users")
+        conn.rollback()
+        assert backend.sheet_version("users") > users
+        assert backend.sheet_version("archive") > archive
+
+
+def test_self_join_reads_sheet_once(file_path: Path, sheet_reads: list[str]) -> None:
+    with connect(str(file_path), engine="openpyxl") as conn:
+        rows = conn.execute(
+            "SELECT a.id, b.name FROM users a JOIN users b ON a.id = b.id "
+            "WHERE a.score > 30"
+        ).rows
+
+    assert rows == [(4, "user-4"), (5, "user-5")]
+    assert sheet_reads == ["users"]
+
+
+def test_subquery_reuses_outer_read(
+    file_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reads: list[str] = []
+    original = PandasBackend.read_sheet
+
+    def tracking(self: PandasBackend, sheet_name: str, **kwargs: Any) -> Any:
+        reads.append(sheet_name)
+        return original(self, sheet_name, **kwargs)
+
+    monkeypatch.setattr(PandasBackend, "read_sheet", tracking)
+    executor = SharedExecutor(PandasBackend(str(file_path)))
+    rows = executor.execute_with_params(
+        "SELECT id FROM users WHERE id IN "
+        "(SELECT id FROM users WHERE score >= 40) ORDER BY id"
+    ).rows
+    assert rows == [(4,), (5,)]
+    assert reads == ["users"]
+
+    executor.execute_with_params("SELECT * FROM users")
+    assert reads == ["users", "users"]
+
+
+def test_executemany_reads_source_until_it_is_written(
+    file_path: Path, sheet_reads: list[str]
+) -> None:
+    with connect(str(file_path), engine="openpyxl") as conn:
+        conn.executemany(
+            "INSERT INTO archive SELECT * FROM users WHERE id = ?",
+            [(1,), (2,), (3,), (4,)],
+        )
+        assert conn.execute("SELECT id FROM archive").rows == [(1,), (2,), (3,), (4,)]
+        # A filtered scan first, then one full read shared by the rest.
+        assert sheet_reads.count("users") == 2
+
+        conn.executemany(
+            "INSERT INTO archive SELECT id + ?, name, score FROM archive",
+            [(10,), (20,)],
+        )
+        assert len(conn.execute("SELECT id FROM archive").rows) == 16
+
+
+def test_insert_select_from_target_sees_rows_before_the_insert(file_path: Path) -> None:
+    with connect(str(file_path), engine="openpyxl") as conn:
+        conn.execute("INSERT INTO users SELECT id + 10, name, score FROM users")
+        conn.execute("INSERT INTO users SELECT id + 100, name, score FROM users")
+        assert len(conn.execute("SELECT id FROM users").rows) == 20
+
+
+def test_cache_only_lives_during_statements(file_path: Path) -> None:
+    executor = SharedExecutor(PandasBackend(str(file_path)))
+    first = executor.read_sheet("users")
+    assert executor.read_sheet("users") is not first
+
+    with executor.sheet_cache():
+        shared = executor.read_sheet("users")
+        assert executor.read_sheet("users") is shared
+        executor.backend.write_sheet("users", TableData(shared.headers, []))
+        assert executor.read_sheet("users").rows == []
+
+
+class _UnversionedBackend(WorkbookBackend):
+    """Third-party style backend that never calls ``_sheet_changed``."""
+
+    def __init__(self, sheets: dict[str, TableData]) -> None:
+        super().__init__("memory.xlsx")
+        self.sheets = sheets
+
+    @property
+    def readonly(self) -> bool:
+        return False
+
+    @property
+    def supports_transactions(self) -> bool:
+        return False
+
+    def load(self) -> None:
+        return None
+
+    def save(self) -> None:
+        return None
+
+    def snapshot(self) -> Any:
+        return None
+
+    def restore(self, snapshot: Any) -> None:
+        return None
+
+    def list_sheets(self) -> list[str]:
+        return list(self.sheets)
+
+    def read_sheet(self, sheet_name: str, **kwargs: Any) -> TableData:
+        data = self.sheets[sheet_name]
+        return TableData(list(data.headers), [list(row) for row in data.rows])
+
+    def write_sheet(self, sheet_name: str, data: TableData) -> None:
+        self.sheets[sheet_name] = data
+
+    def append_row(self, sheet_name: str, row: list[Any]) -> int:
+        self.sheets[sheet_name].rows.append(list(row))
+        return len(self.sheets[sheet_name].rows) + 1
+
+    def create_sheet(self, name: str, headers: list[str]) -> None:
+        self.sheets[name] = TableData(headers, [])
+
+    def drop_sheet(self, name: str) -> None:
+        del self.sheets[name]
+
+
+def test_built_in_backends_support_versioning(file_path: Path) -> None:
+    assert OpenpyxlBackend(str(file_path)).supports_versioning
+    assert PandasBackend(str(file_path)).supports_versioning
+
+
+def test_unversioned_backend_is_read_every_time() -> None:
+    backend = _UnversionedBackend({"users": TableData(["id"], [[1]])})
+    executor = SharedExecutor(backend)
+    assert not backend.supports_versioning
+
+    with executor.sheet_cache():
+        assert executor.read_sheet("users").rows == [[1]]
+        # A write the executor cannot see through sheet_version().
+        backend.sheets["users"] = TableData(["id"], [[1], [2]])
+        assert executor.read_sheet("users").rows == [[1], [2]]
+        assert executor.execute_with_params("SELECT id FROM users").rows == [(1,), (2,)]
@@ -0,0 +1,113 @@
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.exceptions import ProgrammingError, SqlParseError
+from excel_dbapi.parser import parse_sql
+from excel_dbapi.parser.cache import StatementCache
+
+
+def _create_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "Sheet1"
+    ws.append(["id", "name"])
+    for index in range(1, 6):
+        ws.append([index, f"name-{index}"])
+    wb.save(path)
+
+
+@pytest.mark.parametrize(
+    ("query", "params"),
+    [
+        ("SELECT * FROM t WHERE id = ? AND name IN (?, ?)", (1, "a", "b")),
+        ("SELECT id FROM t WHERE id BETWEEN ? AND ? ORDER BY id LIMIT ? OFFSET ?", (1, 5, 2, 1)),
+        ("SELECT UPPER(name), id + ? AS bumped FROM t", (10,)),
+        ("INSERT INTO t (id, name) VALUES (?, ?)", (7, "x")),
+        ("INSERT INTO t (id, name) VALUES (?, ?) ON CONFLICT (id) DO UPDATE SET name = ?", (7, "x", "y")),
+        ("UPDATE t SET name = ? WHERE id = ?", ("z", 3)),
+        ("DELETE FROM t WHERE name LIKE ?", ("n%",)),
+        ("SELECT id FROM t WHERE name = ? AND id IN (SELECT id FROM u WHERE name = 'q')", ("q",)),
+        ("SELECT * FROM t", None),
+    ],
+)
+def test_bound_template_matches_direct_parse(query: str, params: tuple[object, ...] | None) -> None:
+    cache = StatementCache()
+    first = cache.parse(query, params)
+    second = cache.parse(query, params)
+    expected = parse_sql(query, params)
+    assert first == expected
+    assert second == expected
+    assert second is not first
+    assert cache.cache_info().hits == 1
+
+
+def test_rebinding_does_not_leak_previous_values() -> None:
+    cache = StatementCache()
+    query = "SELECT * FROM t WHERE id = ?"
+    first = cache.parse(query, (1,))
+    second = cache.parse(query, (2,))
+    assert first["where"]["conditions"][0]["value"] == 1
+    assert second["where"]["conditions"][0]["value"] == 2
+
+
+def test_parameter_errors_match_parser() -> None:
+    cache = StatementCache()
+    query = "SELECT * FROM t WHERE id = ? LIMIT ?"
+    cache.parse(query, (1, 2))
+    with pytest.raises(SqlParseError, match="Not enough parameters"):
+        cache.parse(query, (1,))
+    with pytest.raises(SqlParseError, match="Too many parameters"):
+        cache.parse(query, (1, 2, 3))
+    with pytest.raises(SqlParseError, match="LIMIT must be an integer"):
+        cache.parse(query, (1, "ten"))
+    with pytest.raises(SqlParseError, match="LIMIT must be a non-negative integer"):
+        cache.parse(query, (1, -1))
+
+
+def test_lru_eviction_and_counters() -> None:
+    cache = StatementCache(maxsize=2)
+    cache.parse("SELECT * FROM a")
+    cache.parse("SELECT * FROM b")
+    cache.parse("SELECT * FROM a")
+    cache.parse("SELECT * FROM c")
+    cache.parse("SELECT * FROM b")
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 4, 2, 2)
+
+
+def test_invalid_cache_size() -> None:
+    with pytest.raises(ProgrammingError):
+        StatementCache(0)
+
+
+def test_connection_uses_statement_cache_for_executemany(tmp_path: Path) -> None:
+    file_path = tmp_path / "cache.xlsx"
+    _create_workbook(file_path)
+
+    with connect(str(file_path)) as conn:
+        assert conn.statement_cache is not None
+        cursor = conn.cursor()
+        cursor.executemany(
+            "INSERT INTO Sheet1 (id, name) VALUES (?, ?)",
+            [(index, f"new-{index}") for index in range(6, 11)],
+        )
+        cursor.execute("SELECT name FROM Sheet1 WHERE id = ?", (10,))
+        assert cursor.fetchall() == [("new-10",)]
+        cursor.execute("SELECT name FROM Sheet1 WHERE id = ?", (6,))
+        assert cursor.fetchall() == [("new-6",)]
+        info = conn.statement_cache.cache_info()
+        assert info.misses == 2
+        assert info.hits == 5
+
+
+def test_statement_cache_can_be_disabled(tmp_path: Path) -> None:
+    file_path = tmp_path / "cache.xlsx"
+    _create_workbook(file_path)
+
+    with connect(str(file_path), statement_cache_size=0) as conn:
+        assert conn.statement_cache is None
+        assert conn.execute("SELECT COUNT(*) FROM Sheet1").rows == [(5,)]
@@ -0,0 +1,92 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+
+from excel_dbapi import connect
+from excel_dbapi.executor import SharedExecutor
+
+
+def _create_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "sales"
+    ws.append(["id", "region", "revenue", "closed", "note"])
+    regions = ["north", "South", None, "east", "west"]
+    notes: list[Any] = ["b", 3, None, "2024-02-01", True, "a"]
+    for index in range(1, 61):
+        ws.append(
+            [
+                index,
+                regions[index % len(regions)],
+                (index * 37) % 23 if index % 9 else None,
+                datetime(2024, index % 12 + 1, index % 28 + 1),
+                notes[index % len(notes)],
+            ]
+        )
+    regions_sheet = wb.create_sheet("regions")
+    regions_sheet.append(["name", "manager"])
+    for name, manager in [("north", "ann"), ("South", "bo"), ("east", "cy")]:
+        regions_sheet.append([name, manager])
+    wb.save(path)
+
+
+QUERIES = [
+    "SELECT id, revenue FROM sales ORDER BY revenue DESC LIMIT 5",
+    "SELECT id FROM sales ORDER BY revenue LIMIT 7 OFFSET 3",
+    "SELECT id FROM sales ORDER BY region DESC, revenue, id DESC LIMIT 10",
+    "SELECT id FROM sales ORDER BY note LIMIT 12",
+    "SELECT id FROM sales ORDER BY note DESC LIMIT 12",
+    "SELECT id FROM sales ORDER BY closed DESC LIMIT 4 OFFSET 2",
+    "SELECT id, revenue * 2 AS double FROM sales ORDER BY double DESC LIMIT 6",
+    "SELECT id FROM sales ORDER BY revenue DESC LIMIT 0",
+    "SELECT id FROM sales ORDER BY revenue LIMIT 500",
+    "SELECT DISTINCT region FROM sales ORDER BY region DESC LIMIT 2",
+    "SELECT region, SUM(revenue) AS total FROM sales GROUP BY region ORDER BY total DESC LIMIT 2",
+    "SELECT region, COUNT(*) FROM sales GROUP BY region ORDER BY COUNT(*), region LIMIT 3 OFFSET 1",
+    "SELECT s.id, r.manager FROM sales s JOIN regions r ON s.region = r.name ORDER BY s.revenue DESC, s.id LIMIT 5",
+    "SELECT s.id FROM sales s LEFT JOIN regions r ON s.region = r.name ORDER BY r.manager DESC LIMIT 8",
+    "SELECT id FROM sales WHERE id < 20 UNION SELECT id FROM sales WHERE id > 50 ORDER BY id DESC LIMIT 4",
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_top_k_matches_full_sort(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, query: str
+) -> None:
+    file_path = tmp_path / "sales.xlsx"
+    _create_workbook(file_path)
+
+    with connect(str(file_path)) as conn:
+        top_k = conn.execute(query).rows
+
+    original = SharedExecutor._apply_order_by
+
+    def full_sort(self: SharedExecutor, rows: list[Any], order_by: Any, **kwargs: Any) -> Any:
+        kwargs.pop("limit", None)
+        return original(self, rows, order_by, **kwargs)
+
+    monkeypatch.setattr(SharedExecutor, "_apply_order_by", full_sort)
+    with connect(str(file_path)) as conn:
+        expected = conn.execute(query).rows
+
+    assert top_k == expected
+
+
+def test_order_by_limit_does_not_sort_every_row(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "sales.xlsx"
+    _create_workbook(file_path)
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("full sort used")
+
+    with connect(str(file_path)) as conn:
+        monkeypatch.setattr("builtins.sorted", fail)
+        rows = conn.execute("SELECT id FROM sales ORDER BY id DESC LIMIT 3").rows
+
+    assert rows == [(60,), (59,), (58,)]
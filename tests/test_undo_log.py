@@ -0,0 +1,219 @@
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from excel_dbapi.connection import ExcelConnection
+from excel_dbapi.engines.openpyxl import backend as openpyxl_backend
+from excel_dbapi.engines.openpyxl.backend import OpenpyxlBackend
+from excel_dbapi.engines.pandas.backend import PandasBackend
+from excel_dbapi.exceptions import BackendOperationError, ProgrammingError
+
+
+def _create_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "users"
+    ws.append(["id", "name", "score"])
+    for index in range(1, 6):
+        ws.append([index, f"user-{index}", index * 10])
+    ws["B3"].font = Font(bold=True)
+    notes = wb.create_sheet("notes")
+    notes.append(["id", "text"])
+    notes.append([1, "hello"])
+    wb.create_sheet("empty")
+    wb.save(path)
+
+
+def _state(backend: OpenpyxlBackend) -> dict[str, Any]:
+    # ``backend.data`` would count as direct workbook access.
+    return {
+        title: [
+            [(cell.value, cell.font.b, cell.number_format) for cell in row]
+            for row in ws.iter_rows()
+        ]
+        for title, ws in backend._data.items()
+    }
+
+
+@pytest.fixture
+def no_copies(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail if a snapshot serializes or a rollback reloads the workbook."""
+    original_save = Workbook.save
+    original_load = openpyxl_backend.load_workbook
+
+    def save(self: Workbook, filename: Any) -> None:
+        if isinstance(filename, BytesIO):
+            raise AssertionError("workbook serialized for a snapshot")
+        original_save(self, filename)
+
+    def reload(filename: Any, **kwargs: Any) -> Any:
+        if isinstance(filename, BytesIO):
+            raise AssertionError("workbook reloaded for a rollback")
+        return original_load(filename, **kwargs)
+
+    monkeypatch.setattr(Workbook, "save", save)
+    monkeypatch.setattr(openpyxl_backend, "load_workbook", reload)
+
+
+def test_rollback_replays_inverses(tmp_path: Path, no_copies: None) -> None:
+    file_path = tmp_path / "undo.xlsx"
+    _create_workbook(file_path)
+
+    with ExcelConnection(str(file_path), engine="openpyxl", autocommit=False) as conn:
+        before = _state(conn.engine)
+        conn.execute("INSERT INTO users VALUES (6, 'Frank', 60), (7, 'Grace', 70)")
+        conn.execute("DELETE FROM users WHERE id IN (2, 4)")
+        conn.execute("UPDATE users SET score = score + 1, name = '2024-01-02'")
+        conn.executemany("INSERT INTO notes VALUES (?, ?)", [(2, "a"), (3, "b")])
+        conn.execute("CREATE TABLE extra (id INTEGER)")
+        conn.execute("INSERT INTO extra VALUES (1)")
+        conn.execute("DROP TABLE notes")
+        conn.execute("ALTER TABLE users ADD COLUMN email TEXT")
+        assert _state(conn.engine) != before
+
+        conn.rollback()
+        assert _state(conn.engine) == before
+        assert conn.execute("SELECT id FROM users").rows == [(i,) for i in range(1, 6)]
+        assert conn.engine.list_sheets() == ["users", "notes", "empty"]
+
+        conn.execute("INSERT INTO users (id) VALUES (8)")
+        conn.commit()
+
+    wb = load_workbook(file_path)
+    assert wb.sheetnames == ["users", "notes", "empty"]
+    ids = [row[0] for row in wb["users"].iter_rows(min_row=2, values_only=True)]
+    assert ids == [1, 2, 3, 4, 5, 8]
+    assert wb["users"]["B3"].font.b
+
+
+def test_executemany_failure_undoes_only_the_batch(
+    tmp_path: Path, no_copies: None
+) -> None:
+    file_path = tmp_path / "undo.xlsx"
+    _create_workbook(file_path)
+
+    with ExcelConnection(str(file_path), engine="openpyxl", autocommit=False) as conn:
+        before = _state(conn.engine)
+        conn.execute("UPDATE users SET score = 0 WHERE id = 1")
+        with pytest.raises(ProgrammingError):
+            conn.executemany(
+                "UPDATE users SET name = ? WHERE id = ?", [("a", 1), ("b", 2), ("c",)]
+            )
+        assert conn.execute("SELECT name, score FROM users WHERE id <= 2").rows == [
+            ("user-1", 0),
+            ("user-2", 20),
+        ]
+        conn.rollback()
+        assert _state(conn.engine) == before
+
+
+def test_commit_starts_a_new_log(tmp_path: Path, no_copies: None) -> None:
+    file_path = tmp_path / "undo.xlsx"
+    _create_workbook(file_path)
+    backend = OpenpyxlBackend(str(file_path))
+
+    marker = backend.snapshot()
+    backend.append_row("notes", [2, "kept"])
+    backend.save()
+    with pytest.raises(BackendOperationError, match="no longer valid"):
+        backend.restore(marker)
+
+    marker = backend.snapshot()
+    backend.append_rows("notes", [[3, "dropped"], [4, "dropped"]])
+    backend.restore(marker)
+    assert backend.read_sheet("notes").rows == [[1, "hello"], [2, "kept"]]
+    assert backend.append_row("notes", [3, "again"]) == 4
+
+
+def test_exposed_workbook_uses_full_snapshots(tmp_path: Path) -> None:
+    file_path = tmp_path / "undo.xlsx"
+    _create_workbook(file_path)
+
+    with ExcelConnection(str(file_path), engine="openpyxl", autocommit=True) as conn:
+        workbook = conn.workbook
+        conn.autocommit = False
+        workbook["notes"]["B2"] = "edited"
+        conn.execute("DELETE FROM users")
+        conn.rollback()
+        assert conn.execute("SELECT text FROM notes").rows == [("hello",)]
+        assert len(conn.execute("SELECT id FROM users").rows) == 5
+
+
+def _frames(backend: PandasBackend) -> dict[str, list[list[Any]]]:
+    return {name: backend.read_sheet(name).rows for name in backend.list_sheets()}
+
+
+def test_pandas_rollback_shares_untouched_sheets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "undo.xlsx"
+    _create_workbook(file_path)
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("DataFrame copied")
+
+    with ExcelConnection(str(file_path), engine="pandas", autocommit=False) as conn:
+        backend = conn.engine
+        assert isinstance(backend, PandasBackend)
+        before = _frames(backend)
+        # ``backend.data`` would make snapshots copy every frame.
+        notes = backend._data["notes"]
+        monkeypatch.setattr(pd.DataFrame, "copy", fail)
+
+        conn.execute("INSERT INTO users VALUES (6, 'Frank', 60)")
+        conn.execute("DELETE FROM users WHERE id IN (2, 4)")
+        conn.execute("CREATE TABLE extra (id INTEGER)")
+        conn.execute("DROP TABLE empty")
+        conn.execute("UPDATE users SET score = 0")
+        with pytest.raises(ProgrammingError):
+            conn.executemany("INSERT INTO notes VALUES (?, ?)", [(2, "a"), (3,)])
+        assert backend._data["notes"] is notes
+
+        conn.rollback()
+        monkeypatch.undo()
+        assert backend.list_sheets() == ["users", "notes", "empty"]
+        assert _frames(backend) == before
+        assert backend._data["notes"] is notes
+
+
+def test_pandas_rollback_keeps_rows_pending_at_snapshot(tmp_path: Path) -> None:
+    file_path = tmp_path / "undo.xlsx"
+    _create_workbook(file_path)
+    backend = PandasBackend(str(file_path))
+
+    backend.append_row("notes", [2, "before"])
+    marker = backend.snapshot()
+    backend.append_row("notes", [3, "after"])
+    assert backend.read_sheet("notes").rows[-1] == [3, "after"]
+    backend.append_row("notes", [4, "after"])
+    backend.restore(marker)
+
+    assert backend.read_sheet("notes").rows == [[1, "hello"], [2, "before"]]
+    assert backend.append_row("notes", [3, "again"]) == 4
+
+
+def test_pandas_rollback_reverts_edits_through_data(tmp_path: Path) -> None:
+    file_path = tmp_path / "undo.xlsx"
+    _create_workbook(file_path)
+
+    with ExcelConnection(str(file_path), engine="pandas", autocommit=False) as conn:
+        backend = conn.engine
+        assert isinstance(backend, PandasBackend)
+        frames = backend.data
+        conn.execute("INSERT INTO notes VALUES (2, 'kept')")
+        conn.commit()
+        before = _frames(backend)
+
+        # The reference predates the snapshot taken by commit().
+        frames["notes"].loc[0, "text"] = "edited"
+        conn.execute("INSERT INTO notes VALUES (3, 'dropped')")
+        backend.data["notes"].loc[1, "text"] = "edited"
+        conn.rollback()
+
+        assert _frames(backend) == before
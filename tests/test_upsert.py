@@ -1,3 +1,4 @@
+from datetime import datetime
 from pathlib import Path
 
 from openpyxl import Workbook
@@ -5,6 +6,7 @@ import pytest
 
 from excel_dbapi.connection import ExcelConnection
 from excel_dbapi.exceptions import DatabaseError, ProgrammingError
+from excel_dbapi.executor.core import _ConflictIndex
 from excel_dbapi.parser import parse_sql
 
 
@@ -621,3 +623,73 @@ def test_upsert_update_set_supports_expression_nodes(tmp_path: Path) -> None:
 
         cursor.execute("SELECT a, b, c FROM t WHERE id = 1")
         assert cursor.fetchone() == (10, 11, "9")
+
+
+def test_upsert_matches_rows_inserted_and_updated_in_same_statement(
+    tmp_path: Path,
+) -> None:
+    file_path = tmp_path / "upsert_same_statement.xlsx"
+    _create_items_workbook(
+        file_path,
+        [[1, "Old1", 30, "active", "A", 10], [1, "Dup1", 31, "active", "B", 11]],
+    )
+
+    with ExcelConnection(str(file_path), engine="openpyxl", autocommit=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO items (id, name) VALUES "
+            "(2, 'New2'), ('2', 'Again2'), (1.0, 'Moved'), (7, 'Lands on 7') "
+            "ON CONFLICT (id) DO UPDATE SET name = excluded.name, id = id + 6"
+        )
+        assert cursor.rowcount == 4
+
+    # '2' matches the row inserted just before it; 1.0 updates the first of the
+    # two id=1 rows and moves it to id 7, where the last row then conflicts.
+    assert _fetch_rows(file_path, "SELECT id, name FROM items") == [
+        (13, "Lands on 7"),
+        (1, "Dup1"),
+        (8, "Again2"),
+    ]
+
+
+def test_upsert_index_matches_scan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    existing: list[list[object]] = [
+        [1, "int", 0, "a", "x", 0],
+        [2.5, "float", 0, "a", "x", 0],
+        ["3", "numeric text", 0, "a", "x", 0],
+        ["abc", "text", 0, "A", "x", 0],
+        [True, "bool", 0, "a", "x", 0],
+        [datetime(2024, 1, 5), "datetime", 0, "a", "x", 0],
+        [None, "null", 0, "a", "x", 0],
+        ["20240105", "ambiguous", 0, "a", "x", 0],
+    ]
+    incoming = (
+        "(1.0, 'a'), (3, 'a'), ('2.5', 'a'), ('abc', 'A'), ('ABC', 'A'), "
+        "(TRUE, 'a'), ('True', 'a'), ('2024-01-05', 'a'), (NULL, 'a'), "
+        "(20240105, 'a'), ('2024-01-05 00:00:00', 'a'), (4, 'b'), (4, 'b')"
+    )
+    query = (
+        f"INSERT INTO items (id, status) VALUES {incoming} "
+        "ON CONFLICT (id, status) DO UPDATE SET value = value + 1"
+    )
+
+    def run(name: str, rows: list[list[object]]) -> list[tuple[object, ...]]:
+        file_path = tmp_path / name
+        _create_items_workbook(file_path, rows)
+        with ExcelConnection(str(file_path), engine="openpyxl", autocommit=True) as conn:
+            conn.cursor().execute(query)
+        return _fetch_rows(file_path, "SELECT id, name, status, value FROM items")
+
+    for rows in (existing[:-1], existing):
+        indexed = run("indexed.xlsx", rows)
+        with monkeypatch.context() as patched:
+            patched.setattr(_ConflictIndex, "_positions", None, raising=False)
+            patched.setattr(
+                _ConflictIndex,
+                "add",
+                lambda self, position: setattr(self, "_positions", None),
+            )
+            scanned = run("scanned.xlsx", rows)
+        assert indexed == scanned
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Any
 
 import pytest
 from excel_dbapi.exceptions import DatabaseError
@@ -204,3 +205,130 @@ def test_window_function_in_order_by(tmp_path: Path) -> None:
             "SELECT id FROM scores "
             "ORDER BY ROW_NUMBER() OVER (ORDER BY points DESC) ASC"
         )
+
+
+def test_running_sum_includes_order_by_peers(tmp_path: Path) -> None:
+    file_path = tmp_path / "window_running_peers.xlsx"
+    _create_window_workbook(file_path)
+
+    engine = OpenpyxlBackend(str(file_path))
+    range_results = SharedExecutor(engine).execute(
+        parse_sql(
+            "SELECT id, SUM(points) OVER (PARTITION BY team ORDER BY points) AS total, "
+            "COUNT(*) OVER (ORDER BY team) AS seen FROM scores ORDER BY id"
+        )
+    )
+    rows_results = SharedExecutor(engine).execute(
+        parse_sql(
+            "SELECT id, SUM(points) OVER (PARTITION BY team ORDER BY points, id "
+            "ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS total "
+            "FROM scores ORDER BY id"
+        )
+    )
+
+    assert range_results.rows == [(1, 10, 3), (2, 50, 3), (3, 50, 3), (4, 5, 5), (5, 20, 5)]
+    assert rows_results.rows == [(1, 10), (2, 30), (3, 50), (4, 5), (5, 20)]
+
+
+def test_running_aggregates_match_prefix_aggregates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "window_running.xlsx"
+    workbook = Workbook()
+    sheet = workbook.active
+    assert sheet is not None
+    sheet.title = "ledger"
+    sheet.append(["id", "account", "amount", "memo"])
+    memos = ["rent", None, "12", "food", "2024-01-02", "rent"]
+    for index in range(1, 61):
+        amount = None if index % 7 == 0 else (index * 37) % 23 - 8 + index / 4
+        sheet.append([index, index % 3, amount, memos[index % len(memos)]])
+    workbook.save(file_path)
+    engine = OpenpyxlBackend(str(file_path))
+
+    functions = [
+        "COUNT(*)",
+        "COUNT(memo)",
+        "COUNT(DISTINCT memo)",
+        "SUM(amount)",
+        "AVG(amount)",
+        "MIN(amount)",
+        "MAX(memo)",
+        "SUM(amount) FILTER (WHERE memo = 'rent')",
+        "MIN(memo) FILTER (WHERE amount > 0)",
+    ]
+    select = ", ".join(
+        f"{function} OVER (PARTITION BY account ORDER BY id "
+        f"ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS c{index}"
+        for index, function in enumerate(functions)
+    )
+    query = f"SELECT id, {select} FROM ledger ORDER BY id"
+    running = SharedExecutor(engine).execute(parse_sql(query)).rows
+
+    def prefix_aggregates(
+        self: SharedExecutor,
+        function_name: str,
+        arg: str,
+        ordered_rows: list[dict[str, Any]],
+        peer_keys: Any,
+        target_column: str,
+        *,
+        distinct: bool,
+        filter_condition: dict[str, Any] | None,
+    ) -> None:
+        for position, row in enumerate(ordered_rows):
+            row[target_column] = self._compute_aggregate(
+                function_name,
+                arg,
+                ordered_rows[: position + 1],
+                distinct=distinct,
+                filter_condition=filter_condition,
+            )
+
+    monkeypatch.setattr(SharedExecutor, "_apply_running_aggregate", prefix_aggregates)
+    expected = SharedExecutor(engine).execute(parse_sql(query)).rows
+
+    assert running == expected
+
+
+def test_running_aggregate_is_single_pass(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    file_path = tmp_path / "window_single_pass.xlsx"
+    workbook = Workbook()
+    sheet = workbook.active
+    assert sheet is not None
+    sheet.title = "ledger"
+    sheet.append(["id", "amount"])
+    for index in range(1, 30001):
+        sheet.append([index, 1])
+    workbook.save(file_path)
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("aggregate recomputed per row")
+
+    monkeypatch.setattr(SharedExecutor, "_compute_aggregate", fail)
+    engine = OpenpyxlBackend(str(file_path))
+    results = SharedExecutor(engine).execute(
+        parse_sql(
+            "SELECT id, SUM(amount) OVER (ORDER BY id) AS balance FROM ledger "
+            "ORDER BY id DESC LIMIT 1"
+        )
+    )
+
+    assert results.rows == [(30000, 30000)]
+
+
+def test_window_range_frame_is_default() -> None:
+    default = parse_sql("SELECT SUM(points) OVER (ORDER BY id) AS s FROM scores")
+    spelled_out = parse_sql(
+        "SELECT SUM(points) OVER (ORDER BY id RANGE BETWEEN UNBOUNDED PRECEDING "
+        "AND CURRENT ROW) AS s FROM scores"
+    )
+    rows = parse_sql(
+        "SELECT SUM(points) OVER (ORDER BY id ROWS BETWEEN UNBOUNDED PRECEDING "
+        "AND CURRENT ROW) AS s FROM scores"
+    )
+
+    assert default["columns"] == spelled_out["columns"]
+    assert rows["columns"][0]["expression"]["frame"] == "ROWS"